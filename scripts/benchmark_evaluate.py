@@ -0,0 +1,133 @@
+"""Time `fides evaluate`'s policy evaluation over generated taxonomies.
+
+Usage:
+    python scripts/benchmark_evaluate.py [--systems 100 1000 3000] [--declarations 3]
+        [--datasets 50] [--rules 5]
+
+Each generated taxonomy extends the default taxonomy with a nested data category under
+each of its data categories, and has `--systems` systems with `--declarations` privacy
+declarations each. Declarations reference one of `--datasets` datasets, whose
+collections and fields declare data categories of their own. There is one policy
+with `--rules` rules, which reject marketing uses of user data. Only
+`execute_evaluation` is timed; parsing and merging the taxonomy isn't.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from fideslang.default_taxonomy import DEFAULT_TAXONOMY
+from fideslang.models import (
+    DataCategory,
+    Dataset,
+    DatasetCollection,
+    DatasetField,
+    MatchesEnum,
+    Policy,
+    PolicyRule,
+    PrivacyDeclaration,
+    System,
+    Taxonomy,
+)
+
+from fides.core.evaluate import execute_evaluation
+
+
+def generate_taxonomy(
+    num_systems: int, declarations: int, num_datasets: int, rules: int
+) -> Taxonomy:
+    """A copy of the default taxonomy extended with generated resources"""
+    rand = random.Random(num_systems)
+    taxonomy = DEFAULT_TAXONOMY.copy(deep=True)
+    taxonomy.data_category += [
+        DataCategory(
+            fides_key=f"{category.fides_key}.custom", parent_key=category.fides_key
+        )
+        for category in DEFAULT_TAXONOMY.data_category
+    ]
+    categories = [category.fides_key for category in taxonomy.data_category]
+    uses = [use.fides_key for use in taxonomy.data_use or []]
+    subjects = [subject.fides_key for subject in taxonomy.data_subject or []]
+
+    qualifier = "aggregated.anonymized.unlinked_pseudonymized.pseudonymized.identified"
+    taxonomy.dataset = [
+        Dataset(
+            fides_key=f"dataset_{i}",
+            data_categories=rand.sample(categories, 2),
+            data_qualifier=qualifier,
+            collections=[
+                DatasetCollection(
+                    name=f"collection_{j}",
+                    fields=[
+                        DatasetField(
+                            name=f"field_{k}", data_categories=[rand.choice(categories)]
+                        )
+                        for k in range(10)
+                    ],
+                )
+                for j in range(3)
+            ],
+        )
+        for i in range(num_datasets)
+    ]
+    taxonomy.system = [
+        System(
+            fides_key=f"system_{i}",
+            system_type="Service",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name=f"declaration_{j}",
+                    data_categories=rand.sample(categories, 3),
+                    data_use=rand.choice(uses),
+                    data_subjects=rand.sample(subjects, 2),
+                    data_qualifier=qualifier,
+                    dataset_references=[f"dataset_{rand.randrange(num_datasets)}"],
+                )
+                for j in range(declarations)
+            ],
+        )
+        for i in range(num_systems)
+    ]
+    taxonomy.policy = [
+        Policy(
+            fides_key="benchmark_policy",
+            rules=[
+                PolicyRule(
+                    name=f"rule_{i}",
+                    data_categories={"values": ["user"], "matches": MatchesEnum.ANY},
+                    data_uses={"values": ["marketing"], "matches": MatchesEnum.ANY},
+                    data_subjects={
+                        "values": rand.sample(subjects, 3),
+                        "matches": MatchesEnum.ANY,
+                    },
+                    data_qualifier="aggregated.anonymized",
+                )
+                for i in range(rules)
+            ],
+        )
+    ]
+    return taxonomy
+
+
+def run(sizes: List[int], declarations: int, num_datasets: int, rules: int) -> None:
+    """Time an evaluation of a generated taxonomy of each size"""
+    print(f"{'systems':>8} {'declarations':>13} {'violations':>11} {'seconds':>8}")
+    for size in sizes:
+        taxonomy = generate_taxonomy(size, declarations, num_datasets, rules)
+        start = time.perf_counter()
+        evaluation = execute_evaluation(taxonomy)
+        duration = time.perf_counter() - start
+        print(
+            f"{size:>8} {size * declarations:>13} "
+            f"{len(evaluation.violations):>11} {duration:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--systems", nargs="+", type=int, default=[100, 1000, 3000])
+    parser.add_argument("--declarations", type=int, default=3)
+    parser.add_argument("--datasets", type=int, default=50)
+    parser.add_argument("--rules", type=int, default=5)
+    args = parser.parse_args()
+    run(args.systems, args.declarations, args.datasets, args.rules)
@@ -0,0 +1,112 @@
+"""Time looking up provided identities by their bcrypt hash and by their lookup hash.
+
+Usage:
+    python scripts/benchmark_identity_hash.py [--rows 10000 1000000] [--lookups 20]
+
+Each lookup hashes an identity value and queries an indexed SQLite table of `--rows`
+identities for it, as `_filter_privacy_request_queryset` and
+`get_fides_user_device_id_provided_identity` do:
+
+* bcrypt: the legacy blind index, searched before lookup hashes were added
+* dual-read: while the backfill runs, either the lookup hash or, for identities
+  without one, the bcrypt hash matches
+* lookup hash: the HMAC-SHA256 blind index, once every identity is backfilled
+
+Rows other than the ones searched for hold random hashes, since bcrypt hashing a
+large table takes too long. The times are per lookup, in milliseconds.
+"""
+import argparse
+import secrets
+import sqlite3
+import time
+from typing import Callable, List, Tuple
+
+from fides.api.models.privacy_request import ProvidedIdentity
+
+LookupQuery = Callable[[sqlite3.Connection, str], List[Tuple]]
+
+
+def create_table(num_rows: int, values: List[str]) -> sqlite3.Connection:
+    """An indexed table of identities, with a row for each of the values"""
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE providedidentity "
+        "(id INTEGER PRIMARY KEY, hashed_value TEXT, lookup_hash TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO providedidentity (hashed_value, lookup_hash) VALUES (?, ?)",
+        (
+            (secrets.token_hex(60), secrets.token_hex(32))
+            for _ in range(num_rows - len(values))
+        ),
+    )
+    connection.executemany(
+        "INSERT INTO providedidentity (hashed_value, lookup_hash) VALUES (?, ?)",
+        (
+            (
+                ProvidedIdentity.hash_value(value),
+                ProvidedIdentity.lookup_hash_value(value),
+            )
+            for value in values
+        ),
+    )
+    connection.execute(
+        "CREATE INDEX ix_hashed_value ON providedidentity (hashed_value)"
+    )
+    connection.execute("CREATE INDEX ix_lookup_hash ON providedidentity (lookup_hash)")
+    return connection
+
+
+def bcrypt_lookup(connection: sqlite3.Connection, value: str) -> List[Tuple]:
+    return connection.execute(
+        "SELECT id FROM providedidentity WHERE hashed_value = ?",
+        (ProvidedIdentity.hash_value(value),),
+    ).fetchall()
+
+
+def dual_read_lookup(connection: sqlite3.Connection, value: str) -> List[Tuple]:
+    return connection.execute(
+        "SELECT id FROM providedidentity WHERE lookup_hash = ? "
+        "OR (lookup_hash IS NULL AND hashed_value = ?)",
+        (ProvidedIdentity.lookup_hash_value(value), ProvidedIdentity.hash_value(value)),
+    ).fetchall()
+
+
+def lookup_hash_lookup(connection: sqlite3.Connection, value: str) -> List[Tuple]:
+    return connection.execute(
+        "SELECT id FROM providedidentity WHERE lookup_hash = ?",
+        (ProvidedIdentity.lookup_hash_value(value),),
+    ).fetchall()
+
+
+def time_lookups(
+    connection: sqlite3.Connection, lookup: LookupQuery, values: List[str]
+) -> float:
+    """The mean time of a lookup of each of the values, in milliseconds"""
+    start = time.perf_counter()
+    for value in values:
+        assert lookup(connection, value)
+    return (time.perf_counter() - start) * 1000 / len(values)
+
+
+def run(sizes: List[int], num_lookups: int) -> None:
+    """Time lookups of identities in a table of each size"""
+    values = [f"customer_{i}@example.com" for i in range(num_lookups)]
+    print(f"{'rows':>10} {'bcrypt':>10} {'dual-read':>10} {'lookup hash':>12}")
+    for size in sizes:
+        connection = create_table(size, values)
+        print(
+            f"{size:>10} "
+            f"{time_lookups(connection, bcrypt_lookup, values):>10.3f} "
+            f"{time_lookups(connection, dual_read_lookup, values):>10.3f} "
+            f"{time_lookups(connection, lookup_hash_lookup, values):>12.3f}"
+        )
+        connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", nargs="+", type=int, default=[10000, 1000000])
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.lookups)
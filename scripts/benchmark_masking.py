@@ -0,0 +1,77 @@
+"""Time the masking strategies, masking values one at a time and in bulk.
+
+Usage:
+    python scripts/benchmark_masking.py [--values 10000] [--repeat 3]
+        [--strategies hash hmac aes_encrypt]
+
+Masks `--values` random email addresses with each strategy, first with one call to
+`mask` per value, as erasures used to, and then with a single call for all of them,
+as erasures now do for each rule and field. No privacy request is given, so the
+strategies generate their secrets instead of reading them from Redis. The best of
+`--repeat` runs is reported.
+"""
+import argparse
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Tuple
+
+from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
+
+STRATEGY_CONFIGURATIONS: Dict[str, Dict[str, Any]] = {
+    "aes_encrypt": {"mode": "GCM", "format_preservation": {"suffix": "@masked.com"}},
+    "hash": {"algorithm": "SHA-256", "format_preservation": {"suffix": "@masked.com"}},
+    "hmac": {"algorithm": "SHA-256", "format_preservation": {"suffix": "@masked.com"}},
+    "null_rewrite": {},
+    "random_string_rewrite": {"length": 20},
+    "string_rewrite": {"rewrite_value": "MASKED"},
+}
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """The shortest duration of the calls, in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return min(durations)
+
+
+def time_strategy(
+    strategy: MaskingStrategy, values: List[str], repeat: int
+) -> Tuple[float, float]:
+    """Time masking the values one at a time, and then all at once"""
+    per_value = best_of(
+        repeat, lambda: [strategy.mask([value], None) for value in values]
+    )
+    bulk = best_of(repeat, lambda: strategy.mask(values, None))
+    return per_value, bulk
+
+
+def run(num_values: int, repeat: int, strategies: List[str]) -> None:
+    """Time each strategy and print the results"""
+    values = [f"{uuid.uuid4().hex[:12]}@example.com" for _ in range(num_values)]
+
+    print(f"{'strategy':<22} {'per value':>10} {'bulk':>10} {'speedup':>8}")
+    for name in strategies:
+        per_value, bulk = time_strategy(
+            MaskingStrategy.get_strategy(name, STRATEGY_CONFIGURATIONS[name]),
+            values,
+            repeat,
+        )
+        print(f"{name:<22} {per_value:>10.1f} {bulk:>10.1f} {per_value / bulk:>7.1f}x")
+    print(f"ms to mask {num_values} values")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=sorted(STRATEGY_CONFIGURATIONS),
+        default=sorted(STRATEGY_CONFIGURATIONS),
+    )
+    args = parser.parse_args()
+    run(args.values, args.repeat, args.strategies)
@@ -0,0 +1,77 @@
+"""Load test the public privacy experience endpoint and report its latency percentiles.
+
+Usage:
+    python scripts/benchmark_privacy_experience.py [--server-url http://localhost:8080]
+        [--requests 2000] [--concurrency 20] [--region us_ca]
+
+Runs against a running Fides webserver, typically with TCF enabled and a data map of
+TCF systems loaded. Each request asks for the TCF overlay with its meta, like the
+banner served on every page view. The first request is timed on its own, since it
+may have to build the TCF contents, and the remaining requests are sent by
+`--concurrency` concurrent clients.
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import httpx
+
+from fides.common.api.v1.urn_registry import PRIVACY_EXPERIENCE, V1_URL_PREFIX
+
+
+def timed_get(client: httpx.Client, url: str, params: Dict[str, str]) -> float:
+    """Send one request, returning its latency in milliseconds"""
+    start = time.perf_counter()
+    response = client.get(url, params=params)
+    elapsed = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return elapsed
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    ordered = sorted(latencies)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(server_url: str, num_requests: int, concurrency: int, region: str) -> None:
+    """Time the requests and print the latency distribution"""
+    url = f"{server_url}{V1_URL_PREFIX}{PRIVACY_EXPERIENCE}"
+    params = {
+        "region": region,
+        "component": "overlay",
+        "include_meta": "true",
+        "include_gvl": "true",
+    }
+
+    with httpx.Client(timeout=60) as client:
+        print(f"first request: {timed_get(client, url, params):.1f} ms")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(
+                executor.map(
+                    lambda _: timed_get(client, url, params), range(num_requests)
+                )
+            )
+        duration = time.perf_counter() - start
+
+    print(f"{'requests':>10} {'req/s':>8} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    print(
+        f"{num_requests:>10} {num_requests / duration:>8.1f} "
+        f"{statistics.mean(latencies):>8.1f} {percentile(latencies, 50):>8.1f} "
+        f"{percentile(latencies, 95):>8.1f} {percentile(latencies, 99):>8.1f}"
+    )
+    print("latencies in ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--server-url", default="http://localhost:8080")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--region", default="us_ca")
+    args = parser.parse_args()
+    run(args.server_url, args.requests, args.concurrency, args.region)
@@ -0,0 +1,85 @@
+"""Benchmark encoding and decoding cached access request results with each cache codec.
+
+Usage:
+    python scripts/benchmark_result_cache_codec.py [--rows 100 1000 10000] [--repeat 5]
+
+Each synthetic result is a list of rows shaped like collection results: strings,
+numbers, datetimes, Mongo ObjectIds, bytes and nested arrays. Throughput is reported
+in rows per second, and size is the length of the value stored in Redis.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from bson.objectid import ObjectId
+
+from fides.api.util.cache import FidesopsRedis
+from fides.api.util.cache_codec import CACHE_CODECS, CacheCodec
+from fides.api.util.collection_util import Row
+
+
+def generate_rows(num_rows: int) -> List[Row]:
+    """Generate `num_rows` rows of collection results"""
+    rand = random.Random(num_rows)
+    start = datetime(2023, 1, 1)
+    return [
+        {
+            "id": i,
+            "_id": ObjectId(),
+            "email": f"customer-{i}@example.com",
+            "name": f"Customer {rand.randint(0, 10**6)}",
+            "created": start + timedelta(seconds=rand.randint(0, 10**7)),
+            "balance": rand.random() * 1000,
+            "active": rand.random() > 0.5,
+            "token": bytes(rand.getrandbits(8) for _ in range(16)),
+            "addresses": [
+                {"street": f"{rand.randint(1, 999)} Main St", "zip": "12345"}
+                for _ in range(rand.randint(0, 3))
+            ],
+            "tags": ["FIDESOPS_DO_NOT_MASK", "vip"] if i % 10 == 0 else [],
+        }
+        for i in range(num_rows)
+    ]
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """The fastest of `repeat` runs of func, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    """Time encoding and decoding results with JSON and each registered codec"""
+    codecs: Dict[str, Optional[CacheCodec]] = {"json": None, **CACHE_CODECS}
+    print(
+        f"{'rows':>8} {'codec':>14} {'bytes':>12} {'encode (rows/s)':>16} {'decode (rows/s)':>16}"
+    )
+    for size in sizes:
+        rows = generate_rows(size)
+        for name, codec in codecs.items():
+            encoded = FidesopsRedis.encode_obj(rows, codec)
+            assert len(FidesopsRedis.decode_obj(encoded)) == size  # type: ignore
+
+            encode_time = best_time(
+                partial(FidesopsRedis.encode_obj, rows, codec), repeat
+            )
+            decode_time = best_time(partial(FidesopsRedis.decode_obj, encoded), repeat)
+            print(
+                f"{size:>8} {name:>14} {len(encoded):>12} "
+                f"{size / encode_time:>16.0f} {size / decode_time:>16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
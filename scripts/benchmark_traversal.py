@@ -0,0 +1,89 @@
+"""Benchmark building and running a DSR graph traversal over synthetic graphs.
+
+Usage:
+    python scripts/benchmark_traversal.py [--sizes 1000 5000 10000] [--references 4]
+
+Each synthetic graph has one collection per dataset. The first collection holds the
+email identity, and every other collection references a handful of randomly chosen
+earlier collections, so that every collection is reachable from the identity.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from loguru import logger
+
+from fides.api.graph.config import Collection as GraphCollection
+from fides.api.graph.config import (
+    CollectionAddress,
+    FieldAddress,
+    GraphDataset,
+    ScalarField,
+)
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+
+
+def generate_datasets(num_collections: int, references: int) -> List[GraphDataset]:
+    """Generate a connected graph of `num_collections` collections"""
+    rand = random.Random(num_collections)
+    datasets: List[GraphDataset] = []
+    for i in range(num_collections):
+        refs = []
+        if i:
+            for parent in rand.sample(range(i), min(i, references)):
+                refs.append(
+                    (FieldAddress(f"dataset_{parent}", "collection", "id"), "from")
+                )
+        fields = [
+            ScalarField(name="id", primary_key=True),
+            ScalarField(
+                name="parent_id",
+                references=refs,
+                identity="email" if i == 0 else None,
+            ),
+        ]
+        datasets.append(
+            GraphDataset(
+                name=f"dataset_{i}",
+                collections=[GraphCollection(name="collection", fields=fields)],
+                connection_key=f"connection_{i}",
+            )
+        )
+    return datasets
+
+
+def run(sizes: List[int], references: int) -> None:
+    """Time graph construction, traversal verification and a full traversal run"""
+    print(f"{'collections':>12} {'edges':>8} {'graph (s)':>10} {'traversal (s)':>14}")
+    for size in sizes:
+        datasets = generate_datasets(size, references)
+
+        start = time.perf_counter()
+        graph = DatasetGraph(*datasets)
+        graph_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        traversal = Traversal(graph, {"email": "customer-1@example.com"})
+        end_nodes = traversal.traverse(
+            {CollectionAddress("__ROOT__", "__ROOT__"): []}, lambda n, m: None
+        )
+        traversal_time = time.perf_counter() - start
+
+        assert end_nodes, "Expected the synthetic traversal to have end nodes"
+        print(
+            f"{size:>12} {len(graph.edges):>8} {graph_time:>10.3f} {traversal_time:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1000, 2500, 5000, 10000]
+    )
+    parser.add_argument("--references", type=int, default=4)
+    args = parser.parse_args()
+    # the traversal logs every node it visits, which would dominate the timings
+    logger.remove()
+    run(args.sizes, args.references)
@@ -0,0 +1,36 @@
+"""add provided identity lookup hash
+
+Revision ID: 4b2eade4353d
+Revises: c5a218831820
+Create Date: 2023-10-12 09:14:52.381604
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b2eade4353d"
+down_revision = "c5a218831820"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing identities are given lookup hashes by a background backfill once the
+    # server starts, since hashing them needs the app encryption key
+    op.add_column(
+        "providedidentity", sa.Column("lookup_hash", sa.String(), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_providedidentity_lookup_hash"),
+        "providedidentity",
+        ["lookup_hash"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_providedidentity_lookup_hash"), table_name="providedidentity"
+    )
+    op.drop_column("providedidentity", "lookup_hash")
@@ -98,12 +98,11 @@ def _filter_consent(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
-                conditions=(ProvidedIdentity.hashed_value == hashed_identity),
+                conditions=ProvidedIdentity.lookup_condition(db, identity),
             ).values(column("id"))
         }
         query = query.filter(Consent.provided_identity_id.in_(identities))
@@ -240,7 +239,7 @@ def consent_request_verify(
         verification_code=data.code,
     )
 
-    if not provided_identity.hashed_value:
+    if not provided_identity.has_hash:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -301,7 +300,7 @@ def get_consent_preferences_no_id(
         verification_code=None,
     )
 
-    if not provided_identity.hashed_value:
+    if not provided_identity.has_hash:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -332,7 +331,7 @@ def get_consent_preferences(
     identity = ProvidedIdentity.filter(
         db,
         conditions=(
-            (ProvidedIdentity.hashed_value == ProvidedIdentity.hash_value(str(lookup)))
+            ProvidedIdentity.lookup_condition(db, str(lookup))
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -434,7 +433,7 @@ def set_consent_preferences(
     consent_request.preferences = [schema.dict() for schema in data.consent]
     consent_request.save(db=db)
 
-    if not provided_identity.hashed_value:
+    if not provided_identity.has_hash:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -494,10 +493,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.email)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.email)
-                )
+                & ProvidedIdentity.lookup_condition(db, identity_data.email)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -507,7 +503,6 @@ def _get_or_create_provided_identity(
                 data={
                     "privacy_request_id": None,
                     "field_name": ProvidedIdentityType.email.value,
-                    "hashed_value": ProvidedIdentity.hash_value(identity_data.email),
                     "encrypted_value": {"value": identity_data.email},
                 },
             )
@@ -519,10 +514,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.phone_number)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.phone_number)
-                )
+                & ProvidedIdentity.lookup_condition(db, identity_data.phone_number)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -532,9 +524,6 @@ def _get_or_create_provided_identity(
                 data={
                     "privacy_request_id": None,
                     "field_name": ProvidedIdentityType.phone_number.value,
-                    "hashed_value": ProvidedIdentity.hash_value(
-                        identity_data.phone_number
-                    ),
                     "encrypted_value": {"value": identity_data.phone_number},
                 },
             )
@@ -1,11 +1,12 @@
-import asyncio
 import uuid
 from html import escape, unescape
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from fastapi import Depends, HTTPException
 from fastapi import Query as FastAPIQuery
 from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination import paginate as fastapi_paginate
 from fastapi_pagination.bases import AbstractPage
@@ -34,12 +35,18 @@ from fides.api.util.consent_util import (
     get_fides_user_device_id_provided_identity,
 )
 from fides.api.util.endpoint_utils import fides_limiter, transform_fields
+from fides.api.util.privacy_experience_snapshot import (
+    ExperienceSnapshot,
+    experience_snapshot_response,
+    get_experience_snapshot,
+    get_experience_snapshot_key,
+    save_experience_snapshot,
+)
 from fides.api.util.tcf.experience_meta import build_experience_tcf_meta
-from fides.api.util.tcf.tcf_experience_contents import (
-    TCF_SECTION_MAPPING,
-    TCFExperienceContents,
-    get_tcf_contents,
-    load_gvl,
+from fides.api.util.tcf.tcf_experience_contents import TCF_SECTION_MAPPING, load_gvl
+from fides.api.util.tcf.tcf_experience_contents_cache import (
+    CachedTCFContents,
+    get_cached_tcf_contents,
 )
 from fides.common.api.v1 import urn_registry as urls
 from fides.config import CONFIG
@@ -125,7 +132,7 @@ def _filter_experiences_by_region_or_country(
     response_model=Page[PrivacyExperienceResponse],
 )
 @fides_limiter.limit(CONFIG.security.public_request_rate_limit)
-async def privacy_experience_list(
+def privacy_experience_list(
     *,
     db: Session = Depends(deps.get_db),
     params: Params = Depends(),
@@ -140,7 +147,7 @@ async def privacy_experience_list(
     include_meta: Optional[bool] = False,
     request: Request,  # required for rate limiting
     response: Response,  # required for rate limiting
-) -> AbstractPage[PrivacyExperience]:
+) -> Union[Response, AbstractPage[PrivacyExperience]]:
     """
     Public endpoint that returns a list of PrivacyExperience records for individual regions with
     relevant privacy notices or tcf contents embedded in the response.
@@ -148,6 +155,9 @@ async def privacy_experience_list(
     'show_disabled' query params are passed along to further filter
     notices as well.
 
+    Responses without a 'fides_user_device_id' are served from a snapshot that's rebuilt
+    when experiences, notices or systems change, with an ETag so they can be revalidated.
+
     :param db:
     :param params:
     :param show_disabled: If False, returns only enabled Experiences and Notices
@@ -164,7 +174,8 @@ async def privacy_experience_list(
     :return:
     """
     logger.info("Finding all Privacy Experiences with pagination params '{}'", params)
-    fides_user_provided_identity: Optional[ProvidedIdentity] = None
+    should_unescape: Optional[str] = request.headers.get(UNESCAPE_SAFESTR_HEADER)
+
     if fides_user_device_id:
         try:
             uuid.UUID(fides_user_device_id, version=4)
@@ -173,11 +184,91 @@ async def privacy_experience_list(
                 status_code=HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid fides user device id format",
             )
-        fides_user_provided_identity = get_fides_user_device_id_provided_identity(
+        fides_user_provided_identity: Optional[
+            ProvidedIdentity
+        ] = get_fides_user_device_id_provided_identity(
             db=db, fides_user_device_id=fides_user_device_id
         )
+        return _build_privacy_experience_page(
+            db,
+            params=params,
+            show_disabled=show_disabled,
+            region=region,
+            component=component,
+            content_required=content_required,
+            has_config=has_config,
+            systems_applicable=systems_applicable,
+            include_gvl=include_gvl,
+            include_meta=include_meta,
+            fides_user_provided_identity=fides_user_provided_identity,
+            should_unescape=should_unescape,
+        )
 
-    await asyncio.sleep(delay=0.001)
+    snapshot_key: Optional[str] = get_experience_snapshot_key(
+        {
+            "page": params.page,
+            "size": params.size,
+            "show_disabled": show_disabled,
+            "region": region,
+            "component": component.value if component else None,
+            "content_required": content_required,
+            "has_config": has_config,
+            "systems_applicable": systems_applicable,
+            "include_gvl": include_gvl,
+            "include_meta": include_meta,
+            "should_unescape": should_unescape,
+        }
+    )
+    snapshot: Optional[ExperienceSnapshot] = (
+        get_experience_snapshot(snapshot_key) if snapshot_key else None
+    )
+    if snapshot:
+        return experience_snapshot_response(request, snapshot, response)
+
+    page: AbstractPage[PrivacyExperience] = _build_privacy_experience_page(
+        db,
+        params=params,
+        show_disabled=show_disabled,
+        region=region,
+        component=component,
+        content_required=content_required,
+        has_config=has_config,
+        systems_applicable=systems_applicable,
+        include_gvl=include_gvl,
+        include_meta=include_meta,
+        fides_user_provided_identity=None,
+        should_unescape=should_unescape,
+    )
+    if not snapshot_key:
+        return page
+
+    # Render the page the way FastAPI would have, with the response model
+    body: bytes = JSONResponse(
+        jsonable_encoder(
+            Page[PrivacyExperienceResponse].parse_obj(page.dict()), by_alias=True
+        )
+    ).body
+    return experience_snapshot_response(
+        request, save_experience_snapshot(snapshot_key, body), response
+    )
+
+
+def _build_privacy_experience_page(
+    db: Session,
+    *,
+    params: Params,
+    show_disabled: Optional[bool],
+    region: Optional[str],
+    component: Optional[ComponentType],
+    content_required: Optional[bool],
+    has_config: Optional[bool],
+    systems_applicable: Optional[bool],
+    include_gvl: Optional[bool],
+    include_meta: Optional[bool],
+    fides_user_provided_identity: Optional[ProvidedIdentity],
+    should_unescape: Optional[str],
+) -> AbstractPage[PrivacyExperience]:
+    """Query the Privacy Experiences matching the query params and embed their contents"""
     experience_query = db.query(PrivacyExperience)
 
     if show_disabled is False:
@@ -188,13 +279,11 @@ async def privacy_experience_list(
             PrivacyExperienceConfig.id == PrivacyExperience.experience_config_id,
         ).filter(PrivacyExperienceConfig.disabled.is_(False))
 
-    await asyncio.sleep(delay=0.001)
     if region is not None:
         experience_query = _filter_experiences_by_region_or_country(
             db=db, region=region, experience_query=experience_query
         )
 
-    await asyncio.sleep(delay=0.001)
     if component is not None:
         # Intentionally relaxes what is returned when querying for "overlay", by returning both types of overlays.
         # This way the frontend doesn't have to know which type of overlay, regular or tcf, just that it is an overlay.
@@ -206,28 +295,23 @@ async def privacy_experience_list(
                 component_search_map.get(component, [component])
             )
         )
-    await asyncio.sleep(delay=0.001)
     if has_config is True:
         experience_query = experience_query.filter(
             PrivacyExperience.experience_config_id.isnot(None)
         )
-    await asyncio.sleep(delay=0.001)
     if has_config is False:
         experience_query = experience_query.filter(
             PrivacyExperience.experience_config_id.is_(None)
         )
 
     results: List[PrivacyExperience] = []
-    should_unescape: Optional[str] = request.headers.get(UNESCAPE_SAFESTR_HEADER)
 
-    # Builds TCF Experience Contents once here, in case multiple TCF Experiences are requested
-    base_tcf_contents: TCFExperienceContents = get_tcf_contents(db)
+    # Loads TCF Experience Contents once here, in case multiple TCF Experiences are requested
+    base_tcf_contents: CachedTCFContents = get_cached_tcf_contents(db)
 
-    await asyncio.sleep(delay=0.001)
     for privacy_experience in experience_query.order_by(
         PrivacyExperience.created_at.desc()
     ):
-        await asyncio.sleep(delay=0.001)
         content_exists: bool = embed_experience_details(
             db,
             privacy_experience=privacy_experience,
@@ -244,7 +328,6 @@ async def privacy_experience_list(
             continue
 
         # Temporarily save "show_banner" on the privacy experience object
-        await asyncio.sleep(delay=0.001)
         privacy_experience.show_banner = privacy_experience.get_should_show_banner(
             db, show_disabled
         )
@@ -271,7 +354,7 @@ def embed_experience_details(
     should_unescape: Optional[str],
     include_gvl: Optional[bool],
     include_meta: Optional[bool],
-    base_tcf_contents: TCFExperienceContents,
+    base_tcf_contents: CachedTCFContents,
 ) -> bool:
     """
     Embed the contents of the PrivacyExperience at runtime. Adds Privacy Notices or TCF contents if applicable.
@@ -289,12 +372,14 @@ def embed_experience_details(
     # Updates Privacy Experience in-place with TCF Contents if applicable, and then returns
     # if TCF contents exist
     has_tcf_contents: bool = privacy_experience.update_with_tcf_contents(
-        db, base_tcf_contents, fides_user_provided_identity
+        db, base_tcf_contents.contents, fides_user_provided_identity
     )
 
     if has_tcf_contents:
         if include_meta:
-            privacy_experience.meta = build_experience_tcf_meta(base_tcf_contents)
+            privacy_experience.meta = build_experience_tcf_meta(
+                base_tcf_contents.contents, base_tcf_contents.version_hash
+            )
         if include_gvl:
             privacy_experience.gvl = load_gvl()
 
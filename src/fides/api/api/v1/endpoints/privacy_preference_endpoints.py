@@ -85,10 +85,8 @@ from fides.api.util.consent_util import (
 from fides.api.util.endpoint_utils import fides_limiter, validate_start_and_end_filters
 from fides.api.util.tcf.tc_mobile_data import convert_tc_string_to_mobile_data
 from fides.api.util.tcf.tc_string import decode_tc_string_to_preferences
-from fides.api.util.tcf.tcf_experience_contents import (
-    TCFExperienceContents,
-    get_tcf_contents,
-)
+from fides.api.util.tcf.tcf_experience_contents import TCFExperienceContents
+from fides.api.util.tcf.tcf_experience_contents_cache import get_cached_tcf_contents
 from fides.common.api.scope_registry import (
     CURRENT_PRIVACY_PREFERENCE_READ,
     PRIVACY_PREFERENCE_HISTORY_READ,
@@ -151,7 +149,7 @@ def consent_request_verify_for_privacy_preferences(
         verification_code=data.code,
     )
 
-    if not provided_identity.hashed_value:
+    if not provided_identity.has_hash:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -213,13 +211,16 @@ def verify_privacy_notice_and_historical_records(
 def extract_identity_from_provided_identity(
     identity: Optional[ProvidedIdentity], identity_type: ProvidedIdentityType
 ) -> Tuple[Optional[str], Optional[str]]:
-    """Pull the identity data off of the ProvidedIdentity given that it's the correct type"""
+    """Pull the identity data off of the ProvidedIdentity given that it's the correct type.
+    The legacy bcrypt hash is only copied while `security.identity_legacy_hash_writes` is enabled.
+    """
     value: Optional[str] = None
     hashed_value: Optional[str] = None
 
     if identity and identity.encrypted_value and identity.field_name == identity_type:
         value = identity.encrypted_value["value"]
-        hashed_value = identity.hashed_value
+        if CONFIG.security.identity_legacy_hash_writes:
+            hashed_value = identity.hashed_value
 
     return value, hashed_value
 
@@ -705,9 +706,7 @@ def update_request_with_decoded_tc_string_fields(
 ) -> PrivacyPreferencesRequest:
     """Update the request body with the decoded values of the TC string if applicable"""
     if request_body.fides_string:
-        tcf_contents: TCFExperienceContents = get_tcf_contents(
-            db
-        )  # TODO cache this so we're not building each time privacy preference is saved
+        tcf_contents: TCFExperienceContents = get_cached_tcf_contents(db).contents
         try:
             decoded_preference_request_body: TCStringFidesPreferences = (
                 decode_tc_string_to_preferences(request_body.fides_string, tcf_contents)
@@ -928,7 +927,7 @@ def classify_identity_type_for_privacy_center_consent_reporting(
     We want to classify the "provided_identity" as an identifier saved against an email or phone,
     and the "fides_user_provided_identity" as an identifier saved against the fides user device id.
     """
-    if not provided_identity.hashed_value:
+    if not provided_identity.has_hash:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
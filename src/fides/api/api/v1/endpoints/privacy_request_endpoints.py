@@ -1,10 +1,19 @@
 # pylint: disable=too-many-branches,too-many-lines, too-many-statements
 
-import csv
-import io
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, DefaultDict, Dict, List, Literal, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import sqlalchemy
 from fastapi import Body, Depends, HTTPException, Security
@@ -66,7 +75,10 @@ from fides.api.models.privacy_request import (
 )
 from fides.api.oauth.utils import verify_callback_oauth, verify_oauth_client
 from fides.api.schemas.dataset import CollectionAddressResponse, DryRunDatasetResponse
-from fides.api.schemas.external_https import PrivacyRequestResumeFormat
+from fides.api.schemas.external_https import (
+    FidesChildRequestCallback,
+    PrivacyRequestResumeFormat,
+)
 from fides.api.schemas.messaging.messaging import (
     FidesopsMessage,
     MessagingActionType,
@@ -81,6 +93,7 @@ from fides.api.schemas.privacy_request import (
     ExecutionLogDetailResponse,
     ManualWebhookData,
     PrivacyRequestCreate,
+    PrivacyRequestExportFormat,
     PrivacyRequestNotificationInfo,
     PrivacyRequestResponse,
     PrivacyRequestVerboseResponse,
@@ -94,6 +107,14 @@ from fides.api.service.messaging.message_dispatch_service import (
     EMAIL_JOIN_STRING,
     check_and_dispatch_error_notifications,
     dispatch_message_task,
+    queue_messages,
+)
+from fides.api.service.privacy_request.fides_child_request_service import (
+    request_child_status_check,
+)
+from fides.api.service.privacy_request.privacy_request_export import (
+    EXPORT_MEDIA_TYPES,
+    stream_privacy_request_export,
 )
 from fides.api.service.privacy_request.request_runner_service import (
     queue_privacy_request,
@@ -107,7 +128,7 @@ from fides.api.task.graph_task import EMPTY_REQUEST, collect_queries
 from fides.api.task.task_resources import TaskResources
 from fides.api.tasks import MESSAGING_QUEUE_NAME
 from fides.api.util.api_router import APIRouter
-from fides.api.util.cache import FidesopsRedis
+from fides.api.util.cache import FidesopsRedis, get_privacy_request_cache_index
 from fides.api.util.collection_util import Row
 from fides.api.util.endpoint_utils import validate_start_and_end_filters
 from fides.api.util.enums import ColumnSort
@@ -128,6 +149,7 @@ from fides.common.api.v1.urn_registry import (
     PRIVACY_REQUEST_AUTHENTICATED,
     PRIVACY_REQUEST_BULK_RETRY,
     PRIVACY_REQUEST_DENY,
+    PRIVACY_REQUEST_FIDES_CHILD_CALLBACK,
     PRIVACY_REQUEST_MANUAL_ERASURE,
     PRIVACY_REQUEST_MANUAL_INPUT,
     PRIVACY_REQUEST_MANUAL_WEBHOOK_ACCESS_INPUT,
@@ -208,98 +230,87 @@ def create_privacy_request_authenticated(
     return create_privacy_request_func(db, config_proxy, data, True)
 
 
-def _send_privacy_request_receipt_message_to_user(
+def _get_privacy_request_receipt(
     policy: Optional[Policy],
     to_identity: Optional[Identity],
-    service_type: Optional[str],
-) -> None:
-    """Helper function to send request receipt message to the user"""
+) -> Optional[Tuple[Identity, RequestReceiptBodyParams]]:
+    """Helper function to build the request receipt message to the user"""
     if not to_identity:
         logger.error(
             IdentityNotFoundException(
                 "Identity was not found, so request receipt message could not be sent."
             )
         )
-        return
+        return None
     if not policy:
         logger.error(
             PolicyNotFoundException(
                 "Policy was not found, so request receipt message could not be sent."
             )
         )
-        return
+        return None
     request_types: Set[str] = set()
     for action_type in ActionType:
         if policy.get_rules_for_action(action_type=ActionType(action_type)):
             request_types.add(action_type)
+    return to_identity, RequestReceiptBodyParams(request_types=request_types)
+
+
+def _send_privacy_request_receipt_message_to_user(
+    policy: Optional[Policy],
+    to_identity: Optional[Identity],
+    service_type: Optional[str],
+) -> None:
+    """Helper function to send request receipt message to the user"""
+    receipt: Optional[
+        Tuple[Identity, RequestReceiptBodyParams]
+    ] = _get_privacy_request_receipt(policy, to_identity)
+    if not receipt:
+        return
     dispatch_message_task.apply_async(
         queue=MESSAGING_QUEUE_NAME,
         kwargs={
             "message_meta": FidesopsMessage(
                 action_type=MessagingActionType.PRIVACY_REQUEST_RECEIPT,
-                body_params=RequestReceiptBodyParams(request_types=request_types),
+                body_params=receipt[1],
             ).dict(),
             "service_type": service_type,
-            "to_identity": to_identity.dict(),
+            "to_identity": receipt[0].dict(),
         },
     )
 
 
 def privacy_request_csv_download(
-    db: Session, privacy_request_query: Query
+    db: Session,
+    privacy_request_query: Query,
+    sort_field: str = "created_at",
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    export_format: PrivacyRequestExportFormat = PrivacyRequestExportFormat.csv,
+    gzip: bool = False,
 ) -> StreamingResponse:
-    """Download privacy requests as CSV for Admin UI"""
-    f = io.StringIO()
-    csv_file = csv.writer(f)
+    """Download privacy requests as CSV, or newline delimited JSON, for Admin UI.
 
-    csv_file.writerow(
-        [
-            "Status",
-            "Request Type",
-            "Subject Identity",
-            "Custom Privacy Request Fields",
-            "Time Received",
-            "Reviewed By",
-            "Request ID",
-            "Time Approved/Denied",
-            "Denial Reason",
-        ]
-    )
-    privacy_request_ids: List[str] = [r.id for r in privacy_request_query]
-    denial_audit_log_query: Query = db.query(AuditLog).filter(
-        AuditLog.action == AuditLogAction.denied,
-        AuditLog.privacy_request_id.in_(privacy_request_ids),
+    Rows are streamed to the client as they are read, rather than building the
+    whole file in memory first.
+    """
+    filename = f"privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.{export_format.value}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    response = StreamingResponse(
+        stream_privacy_request_export(
+            db,
+            privacy_request_query,
+            sort_field,
+            sort_direction,
+            export_format,
+            gzip,
+        ),
+        media_type=media_type,
     )
-    denial_audit_logs: Dict[str, str] = {
-        r.privacy_request_id: r.message for r in denial_audit_log_query
-    }
-
-    for pr in privacy_request_query:
-        denial_reason = (
-            denial_audit_logs[pr.id]
-            if pr.status == PrivacyRequestStatus.denied and pr.id in denial_audit_logs
-            else None
-        )
-
-        csv_file.writerow(
-            [
-                pr.status.value if pr.status else None,
-                pr.policy.rules[0].action_type if len(pr.policy.rules) > 0 else None,
-                pr.get_persisted_identity().dict(),
-                pr.get_persisted_custom_privacy_request_fields(),
-                pr.created_at,
-                pr.reviewed_by,
-                pr.id,
-                pr.reviewed_at,
-                denial_reason,
-            ]
-        )
-
-    f.seek(0)
-    response = StreamingResponse(f, media_type="text/csv")
-    response.headers[
-        "Content-Disposition"
-    ] = f"attachment; filename=privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.csv"
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
     return response
 
 
@@ -381,12 +392,15 @@ def _filter_privacy_request_queryset(
     errored_gt: Optional[datetime] = None,
     external_id: Optional[str] = None,
     action_type: Optional[ActionType] = None,
+    request_ids: Optional[List[str]] = None,
 ) -> Query:
     """
     Utility method to apply filters to our privacy request query.
 
     Status supports "or" filtering:
     ?status=approved&status=pending will be translated into an "or" query.
+    Request ids are matched exactly, so several requests can be fetched at once:
+    ?request_ids=pri_1&request_ids=pri_2
     """
     if any([completed_lt, completed_gt]) and any([errored_lt, errored_gt]):
         raise HTTPException(
@@ -404,13 +418,12 @@ def _filter_privacy_request_queryset(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
                 conditions=(
-                    (ProvidedIdentity.hashed_value == hashed_identity)
+                    ProvidedIdentity.lookup_condition(db, identity)
                     & (ProvidedIdentity.privacy_request_id.isnot(None))
                 ),
             ).values(column("privacy_request_id"))
@@ -419,6 +432,8 @@ def _filter_privacy_request_queryset(
     # Further restrict all PrivacyRequests by query params
     if request_id:
         query = query.filter(PrivacyRequest.id.ilike(f"{request_id}%"))
+    if request_ids:
+        query = query.filter(PrivacyRequest.id.in_(request_ids))
     if external_id:
         query = query.filter(PrivacyRequest.external_id.ilike(f"{external_id}%"))
     if status:
@@ -538,6 +553,7 @@ def get_request_status(
     db: Session = Depends(deps.get_db),
     params: Params = Depends(),
     request_id: Optional[str] = None,
+    request_ids: Optional[List[str]] = FastAPIQuery(default=None),  # type:ignore
     identity: Optional[str] = None,
     status: Optional[List[PrivacyRequestStatus]] = FastAPIQuery(
         default=None
@@ -556,13 +572,18 @@ def get_request_status(
     include_identities: Optional[bool] = False,
     include_custom_privacy_request_fields: Optional[bool] = False,
     download_csv: Optional[bool] = False,
+    download_format: Optional[PrivacyRequestExportFormat] = None,
+    download_gzip: Optional[bool] = False,
     sort_field: str = "created_at",
     sort_direction: ColumnSort = ColumnSort.DESC,
 ) -> Union[StreamingResponse, AbstractPage[PrivacyRequest]]:
     """Returns PrivacyRequest information. Supports a variety of optional query params.
 
     To fetch a single privacy request, use the request_id query param `?request_id=`.
+    To fetch several, repeat the request_ids query param `?request_ids=&request_ids=`.
     To see individual execution logs, use the verbose query param `?verbose=True`.
+    To download the requests, use `?download_csv=True` or `?download_format=ndjson`,
+    adding `&download_gzip=True` to compress the download.
     """
     logger.info("Finding all request statuses with pagination params {}", params)
 
@@ -583,6 +604,7 @@ def get_request_status(
         errored_gt,
         external_id,
         action_type,
+        request_ids,
     )
 
     logger.info(
@@ -590,10 +612,18 @@ def get_request_status(
     )
     query = _sort_privacy_request_queryset(query, sort_field, sort_direction)
 
-    if download_csv:
-        # Returning here if download_csv param was specified
-        logger.info("Downloading privacy requests as csv")
-        return privacy_request_csv_download(db, query)
+    if download_csv or download_format:
+        # Returning here if a download param was specified
+        export_format = download_format or PrivacyRequestExportFormat.csv
+        logger.info("Downloading privacy requests as {}", export_format.value)
+        return privacy_request_csv_download(
+            db,
+            query,
+            sort_field,
+            sort_direction,
+            export_format,
+            bool(download_gzip),
+        )
 
     # Conditionally embed execution log details in the response.
     if verbose:
@@ -857,6 +887,32 @@ def resume_privacy_request(
     return privacy_request  # type: ignore[return-value]
 
 
+@router.post(
+    PRIVACY_REQUEST_FIDES_CHILD_CALLBACK,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[PRIVACY_REQUEST_CALLBACK_RESUME])
+    ],
+)
+def fides_child_request_callback(
+    *,
+    cache: FidesopsRedis = Depends(deps.get_cache),
+    callback: FidesChildRequestCallback,
+) -> None:
+    """Called by a child Fides server's post-execution webhook when a privacy request
+    a Fides connector created on it finishes, so that the child server is polled for
+    its status right away, rather than once its connector's polling interval passes.
+
+    The callback isn't trusted for the request's status, and unknown requests are
+    ignored, since a failing post-execution webhook would fail the child's request.
+    """
+    if not request_child_status_check(cache, callback.privacy_request_id):
+        logger.info(
+            "Ignoring callback for privacy request '{}', which isn't outstanding on a child Fides server",
+            callback.privacy_request_id,
+        )
+
+
 def validate_manual_input(
     manual_rows: List[Row],
     collection: CollectionAddress,
@@ -1157,13 +1213,12 @@ def review_privacy_request(
     )
 
 
-def _send_privacy_request_review_message_to_user(
+def _get_privacy_request_review_message(
     action_type: MessagingActionType,
     identity_data: Dict[str, Any],
     rejection_reason: Optional[str],
-    service_type: Optional[str],
-) -> None:
-    """Helper method to send review notification message to user, shared between approve and deny"""
+) -> Tuple[Identity, Optional[RequestReviewDenyBodyParams]]:
+    """Helper method to build the review notification message to the user, shared between approve and deny"""
     if not identity_data:
         logger.error(
             IdentityNotFoundException(
@@ -1174,20 +1229,10 @@ def _send_privacy_request_review_message_to_user(
         email=identity_data.get(ProvidedIdentityType.email.value),
         phone_number=identity_data.get(ProvidedIdentityType.phone_number.value),
     )
-    dispatch_message_task.apply_async(
-        queue=MESSAGING_QUEUE_NAME,
-        kwargs={
-            "message_meta": FidesopsMessage(
-                action_type=action_type,
-                body_params=RequestReviewDenyBodyParams(
-                    rejection_reason=rejection_reason
-                )
-                if action_type is MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY
-                else None,
-            ).dict(),
-            "service_type": service_type,
-            "to_identity": to_identity.dict(),
-        },
+    return to_identity, (
+        RequestReviewDenyBodyParams(rejection_reason=rejection_reason)
+        if action_type is MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY
+        else None
     )
 
 
@@ -1263,6 +1308,8 @@ def approve_privacy_request(
 ) -> BulkReviewResponse:
     """Approve and dispatch a list of privacy requests and/or report failure"""
     user_id = client.user_id
+    # The review messages are queued together, so they can be sent in batches
+    review_messages: List[Tuple[Identity, Optional[RequestReviewDenyBodyParams]]] = []
 
     def _approve_request(privacy_request: PrivacyRequest) -> None:
         """Method for how to process requests - approved"""
@@ -1286,20 +1333,28 @@ def approve_privacy_request(
             },
         )
         if config_proxy.notifications.send_request_review_notification:
-            _send_privacy_request_review_message_to_user(
-                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
-                identity_data=privacy_request.get_cached_identity_data(),
-                rejection_reason=None,
-                service_type=config_proxy.notifications.notification_service_type,
+            review_messages.append(
+                _get_privacy_request_review_message(
+                    action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+                    identity_data=privacy_request.get_cached_identity_data(),
+                    rejection_reason=None,
+                )
             )
 
         queue_privacy_request(privacy_request_id=privacy_request.id)
 
-    return review_privacy_request(
+    response: BulkReviewResponse = review_privacy_request(
         db=db,
         request_ids=privacy_requests.request_ids,
         process_request_function=_approve_request,
     )
+    if review_messages:
+        queue_messages(
+            MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+            config_proxy.notifications.notification_service_type,
+            review_messages,
+        )
+    return response
 
 
 @router.patch(
@@ -1319,6 +1374,8 @@ def deny_privacy_request(
 ) -> BulkReviewResponse:
     """Deny a list of privacy requests and/or report failure"""
     user_id = client.user_id
+    # The review messages are queued together, so they can be sent in batches
+    review_messages: List[Tuple[Identity, Optional[RequestReviewDenyBodyParams]]] = []
 
     def _deny_request(
         privacy_request: PrivacyRequest,
@@ -1338,18 +1395,26 @@ def deny_privacy_request(
             },
         )
         if config_proxy.notifications.send_request_review_notification:
-            _send_privacy_request_review_message_to_user(
-                action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
-                identity_data=privacy_request.get_cached_identity_data(),
-                rejection_reason=privacy_requests.reason,
-                service_type=config_proxy.notifications.notification_service_type,
+            review_messages.append(
+                _get_privacy_request_review_message(
+                    action_type=MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+                    identity_data=privacy_request.get_cached_identity_data(),
+                    rejection_reason=privacy_requests.reason,
+                )
             )
 
-    return review_privacy_request(
+    response: BulkReviewResponse = review_privacy_request(
         db=db,
         request_ids=privacy_requests.request_ids,
         process_request_function=_deny_request,
     )
+    if review_messages:
+        queue_messages(
+            MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+            config_proxy.notifications.notification_service_type,
+            review_messages,
+        )
+    return response
 
 
 def _handle_manual_webhook_input(
@@ -1475,7 +1540,8 @@ def privacy_request_data_transfer(
         )
 
     value_dict: Dict[str, Optional[List[Row]]] = cache.get_encoded_objects_by_prefix(
-        f"{privacy_request_id}__access_request"
+        f"{privacy_request_id}__access_request",
+        index=get_privacy_request_cache_index(privacy_request_id),
     )
 
     if not value_dict:
@@ -1713,6 +1779,8 @@ def create_privacy_request_func(
 
     created = []
     failed = []
+    # The receipts are queued together, so they can be sent in batches
+    receipts: List[Tuple[Identity, RequestReceiptBodyParams]] = []
     # Optional fields to validate here are those that are both nullable in the DB, and exist
     # on the Pydantic schema
 
@@ -1806,11 +1874,11 @@ def create_privacy_request_func(
                 not authenticated
                 and config_proxy.notifications.send_request_receipt_notification
             ):
-                _send_privacy_request_receipt_message_to_user(
-                    policy,
-                    privacy_request_data.identity,
-                    config_proxy.notifications.notification_service_type,
-                )
+                receipt: Optional[
+                    Tuple[Identity, RequestReceiptBodyParams]
+                ] = _get_privacy_request_receipt(policy, privacy_request_data.identity)
+                if receipt:
+                    receipts.append(receipt)
             if not config_proxy.execution.require_manual_request_approval:
                 AuditLog.create(
                     db=db,
@@ -1849,6 +1917,13 @@ def create_privacy_request_func(
         else:
             created.append(privacy_request)
 
+    if receipts:
+        queue_messages(
+            MessagingActionType.PRIVACY_REQUEST_RECEIPT,
+            config_proxy.notifications.notification_service_type,
+            receipts,
+        )
+
     # TODO: Don't return a 200 if there are failed requests, or at least not
     # if there are zero successful ones
     return BulkPostPrivacyRequests(
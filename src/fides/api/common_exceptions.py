@@ -45,6 +45,10 @@ class InsufficientDataException(FidesopsException):
     """Exception class when there is not sufficient data to proceed"""
 
 
+class RowLimitExceededException(FidesopsException):
+    """Exception class when a collection returns more rows than are allowed to be retrieved"""
+
+
 class SkippingConsentPropagation(BaseException):
     """Skipping consent propagation for collection. Used to trigger "skipped" execution logs being created where applicable
     for Privacy Preference requests on saas connectors.
@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import secrets
 from base64 import b64decode, b64encode
 from binascii import Error
@@ -22,6 +24,12 @@ def hash_with_salt(text: bytes, salt: bytes) -> str:
     return bcrypt.hashpw(text, salt).hex()
 
 
+def hmac_sha256(text: bytes, key: bytes) -> str:
+    """Hashes the text using HMAC-SHA256 keyed with the provided key and returns the hex
+    string representation"""
+    return hmac.new(key, text, hashlib.sha256).hexdigest()
+
+
 def generate_secure_random_string(length: int) -> str:
     """Generates a securely random string using Python secrets library
     that is twice the length of the specified input"""
@@ -1,7 +1,19 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from fideslang.validation import FidesKey
 from loguru import logger
@@ -18,6 +30,9 @@ from fides.api.graph.config import (
     SeedAddress,
 )
 
+if TYPE_CHECKING:
+    from fides.api.graph.traversal import TraversalSkeleton
+
 DataCategoryFieldMapping = Dict[CollectionAddress, Dict[FidesKey, List[FieldPath]]]
 
 
@@ -191,12 +206,12 @@ class DatasetGraph:
 
         # build nodes
         nodes = [Node(dr, ds) for dr in datasets for ds in dr.collections]
-        self.nodes: dict[CollectionAddress, Node] = {
+        self.nodes: Mapping[CollectionAddress, Node] = {
             node.address: node for node in nodes
         }
 
         # build links
-        self.edges: Set[Edge] = set()
+        edges: Set[Edge] = set()
 
         for node_address, node in self.nodes.items():
             for field_path, ref_list in node.collection.references().items():
@@ -211,14 +226,15 @@ class DatasetGraph:
                         raise ValidationError(
                             f"Referred to object {dest_field_address} does not exist"
                         )
-                    self.edges.add(
+                    edges.add(
                         Edge.create_edge(
                             source_field_address, dest_field_address, direction
                         )
                     )
+        self.edges: AbstractSet[Edge] = edges
 
         # collect all seed references
-        self.identity_keys: dict[FieldAddress, SeedAddress] = {
+        self.identity_keys: Mapping[FieldAddress, SeedAddress] = {
             FieldAddress(
                 node.address.dataset,
                 node.address.collection,
@@ -228,6 +244,29 @@ class DatasetGraph:
             for field_path, seed_address in node.collection.identities().items()
         }
 
+        # Verified traversals of this graph, by the seed keys they start from. This is
+        # only populated once the graph is frozen, since otherwise the graph could
+        # change underneath them.
+        self.traversal_skeletons: Optional[
+            Dict[FrozenSet[SeedAddress], TraversalSkeleton]
+        ] = None
+
+    def freeze(self) -> None:
+        """Make this graph read-only so it can be shared between traversals.
+
+        Frozen graphs keep the traversal skeleton built for each set of seed keys,
+        so that later traversals from the same seed keys don't need to be verified again.
+        """
+        self.nodes = MappingProxyType(dict(self.nodes))
+        self.edges = frozenset(self.edges)
+        self.identity_keys = MappingProxyType(dict(self.identity_keys))
+        self.traversal_skeletons = {}
+
+    @property
+    def frozen(self) -> bool:
+        """Whether this graph has been made read-only"""
+        return self.traversal_skeletons is not None
+
     @property
     def data_category_field_mapping(
         self,
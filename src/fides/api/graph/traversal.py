@@ -1,8 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Set, Tuple, cast
+from collections import Counter, defaultdict
+from typing import (
+    Any,
+    Callable,
+    Container,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import pydash.collections
 from loguru import logger
 
 from fides.api.common_exceptions import TraversalError
@@ -120,16 +131,28 @@ class TraversalNode:
                     out[key] = filtered
         return out
 
-    def can_run_given(self, remaining_node_keys: Set[CollectionAddress]) -> bool:
+    def can_run_given(
+        self,
+        remaining_node_keys: Set[CollectionAddress],
+        remaining_dataset_keys: Optional[Container[str]] = None,
+    ) -> bool:
         """True if finished_node_keys covers all the nodes that this traversal_node is waiting for.  If
         all nodes this traversal_node is waiting for have finished, it's ok for this traversal_node to run.
+
+        The datasets of the remaining nodes may be passed in directly by callers that already
+        track them, to avoid rebuilding that set on each call.
         """
-        if self.node.collection.after.intersection(
-            remaining_node_keys
-        ) or self.node.dataset.after.intersection(
-            {k.dataset for k in remaining_node_keys}
+        if any(
+            address in remaining_node_keys for address in self.node.collection.after
         ):
             return False
+        if self.node.dataset.after:
+            if remaining_dataset_keys is None:
+                remaining_dataset_keys = {k.dataset for k in remaining_node_keys}
+            if any(
+                dataset in remaining_dataset_keys for dataset in self.node.dataset.after
+            ):
+                return False
         return True
 
     def is_root_node(self) -> bool:
@@ -195,12 +218,23 @@ class Traversal:
         self.graph = graph
         self.seed_data = data
         self.traversal_node_dict = {k: TraversalNode(v) for k, v in graph.nodes.items()}
-        self.edges: Set[Edge] = graph.edges.copy()
         self.root_node = artificial_traversal_node(ROOT_COLLECTION_ADDRESS)
-        for (
-            start_field_address,
-            seed_key,
-        ) in self.extract_seed_field_addresses().items():
+        seed_field_addresses = self.extract_seed_field_addresses()
+        seed_keys = frozenset(seed_field_addresses.values())
+
+        # A frozen graph may have already verified a traversal from these seed keys
+        skeleton = (
+            graph.traversal_skeletons.get(seed_keys)
+            if graph.traversal_skeletons is not None
+            else None
+        )
+        if skeleton:
+            self.edges: Set[Edge] = set(skeleton.edges)
+            skeleton.apply(self)
+            return
+
+        self.edges = set(graph.edges)
+        for start_field_address, seed_key in seed_field_addresses.items():
             self.edges.add(
                 Edge(
                     FieldAddress(
@@ -212,15 +246,34 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
+        run_order = self.__verify_traversal()
+        if graph.traversal_skeletons is not None:
+            # Only a complete skeleton is shared. Concurrent traversals from the same
+            # seed keys may both verify it, and the first one stored is kept.
+            graph.traversal_skeletons.setdefault(
+                seed_keys, TraversalSkeleton.from_traversal(self, run_order)
+            )
 
-    def __verify_traversal(self) -> None:
+    def __verify_traversal(self) -> List[CollectionAddress]:
         """Verify that a valid traversal exists. This method simply assembles a traversal
-        and raises an error on any traversal failure conditions."""
-        self.traverse(
-            {self.root_node.address: [self.seed_data]},
-            lambda n, m: logger.info("Traverse {}", n.address),
-        )
+        and raises an error on any traversal failure conditions.
+
+        Returns the addresses of the traversal nodes in the order they were first run.
+        """
+        run_order: Dict[CollectionAddress, None] = {}
+
+        def verify_fn(tn: TraversalNode, _: Dict[CollectionAddress, Any]) -> None:
+            logger.info("Traverse {}", tn.address)
+            run_order.setdefault(tn.address, None)
+
+        self.traverse({self.root_node.address: [self.seed_data]}, verify_fn)
+        return list(run_order)
+
+    def get_traversal_node(self, address: CollectionAddress) -> TraversalNode:
+        """Return the traversal_node at the given address, including the artificial root node"""
+        if address == ROOT_COLLECTION_ADDRESS:
+            return self.root_node
+        return self.traversal_node_dict[address]
 
     def traversal_map(
         self,
@@ -246,7 +299,7 @@ class Traversal:
 
         return {str(k): v for k, v in db.items()}, traversal_ends
 
-    def traverse(  # pylint: disable=R0914
+    def traverse(  # pylint: disable=R0912,R0914
         self,
         environment: Dict[CollectionAddress, Any],
         node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
@@ -263,13 +316,16 @@ class Traversal:
         data.
         We start with
         - a queue holding only the root traversal_node.
-        - a (copied) set of all of the edges in the graph.
+        - a (copied) set of all of the edges in the graph, indexed by the collection addresses at either end.
 
         - Pop the first eligible traversal_node from the queue.
         - call the passed in callable node_run_function on this traversal_node. Mark this traversal_node as "finished"
         - Delete all edges from any finished nodes to this traversal_node.
         - put all of this nodes children in the queue.
 
+        Because the remaining edges are indexed by collection address, each traversal_node only ever
+        looks at the edges that touch it, so the traversal as a whole is O(V+E).
+
         Some nodes have conditions, like "don't run me until after traversal_node X". When we pop a value from
         the queue, we are taking this into account. If the queue contains nodes, but none of them are
         eligible (e.g. Node A can't run until after B, and traversal_node B that can't run until after A)
@@ -286,49 +342,63 @@ class Traversal:
         remaining_node_keys: Set[CollectionAddress] = set(
             self.traversal_node_dict.keys()
         )
+        remaining_dataset_counts: Counter[str] = Counter(
+            k.dataset for k in remaining_node_keys
+        )
         finished_nodes: dict[CollectionAddress, TraversalNode] = {}
+        # the order in which nodes first finished, used to add children in a stable order
+        finish_order: Dict[CollectionAddress, int] = {}
         running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
         remaining_edges: Set[Edge] = self.edges.copy()
+        edge_index = _index_edges_by_collection(remaining_edges)
         while not running_node_queue.is_empty():
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
             n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
+                lambda x: x.can_run_given(remaining_node_keys, remaining_dataset_counts)
             )
 
             if n:
                 node_run_fn(n, environment)
                 # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,  # type: ignore[redundant-cast]
+                completed_edges: Dict[CollectionAddress, Set[Edge]] = {}
+                for edge in edge_index[n.address]:
+                    addresses = edge.split_by_address(n.address)
+                    other_address = (
+                        addresses[1].collection_address()
+                        if addresses
+                        else edge.f1.collection_address()
                     )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address  # type: ignore[redundant-cast]
-                        ),
-                        completed_edges,
+                    if other_address in finished_nodes and edge.spans(
+                        other_address, n.address
                     ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
+                        completed_edges.setdefault(other_address, set()).add(edge)
+
+                for finished_node_address in sorted(
+                    completed_edges, key=finish_order.__getitem__
+                ):
+                    finished_node = finished_nodes[finished_node_address]
+                    for edge in completed_edges[finished_node_address]:
+                        _remove_indexed_edge(remaining_edges, edge_index, edge)
+                        # append edges that end in this traversal_node
+                        if edge.ends_with_collection(n.address):
+                            # note, this will not work for self-reference
+                            finished_node.add_child(n, edge)
+
                 # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
                 # in the form (field_address_this, field_address_foreign)
-
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)  # type: ignore[redundant-cast]
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
-                )
+                edges_to_children = [
+                    addresses
+                    for addresses in (
+                        e.split_by_address(n.address) for e in edge_index[n.address]
+                    )
+                    if addresses
+                ]
                 if not edges_to_children:
                     n.is_terminal_node = True
 
                 # child traversal_node addresses are the address portion of the above
                 child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
+                    a[1].collection_address() for a in edges_to_children
                 }
                 for nxt_address in child_node_addresses:
                     # only add the next traversal_node to the queue if it is not already there (no duplicates)
@@ -336,7 +406,12 @@ class Traversal:
                         self.traversal_node_dict[nxt_address]
                     )
                 finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                finish_order.setdefault(n.address, len(finish_order))
+                if n.address in remaining_node_keys:
+                    remaining_node_keys.remove(n.address)
+                    remaining_dataset_counts[n.address.dataset] -= 1
+                    if not remaining_dataset_counts[n.address.dataset]:
+                        del remaining_dataset_counts[n.address.dataset]
             else:
                 # traversal traversal_node dict diff finished nodes
                 logger.error(
@@ -373,3 +448,91 @@ class Traversal:
         if environment:
             logger.debug("Found {} end nodes: {}", len(end_nodes), end_nodes)
         return end_nodes
+
+
+class TraversalSkeleton:
+    """The outcome of verifying a traversal of a graph from a given set of seed keys.
+
+    A traversal only depends on which seed keys are present, not on their values, so a
+    skeleton can be applied to fresh traversal nodes to link them exactly as verifying the
+    traversal would have, without running the traversal again.
+    """
+
+    def __init__(
+        self,
+        edges: FrozenSet[Edge],
+        links: Tuple[
+            Tuple[CollectionAddress, CollectionAddress, FieldPath, FieldPath], ...
+        ],
+        terminal_node_addresses: FrozenSet[CollectionAddress],
+    ):
+        self.edges = edges
+        # (parent address, child address, parent field path, child field path),
+        # in the order the links were made
+        self.links = links
+        self.terminal_node_addresses = terminal_node_addresses
+
+    @classmethod
+    def from_traversal(
+        cls, traversal: Traversal, run_order: List[CollectionAddress]
+    ) -> TraversalSkeleton:
+        """Capture the links of a verified traversal, given the order its nodes first ran in"""
+        links = []
+        terminal_node_addresses = set()
+        for address in run_order:
+            tn = traversal.get_traversal_node(address)
+            if tn.is_terminal_node:
+                terminal_node_addresses.add(address)
+            for parent_address, tuples in tn.parents.items():
+                for _, parent_field_path, field_path in tuples:
+                    links.append(
+                        (parent_address, address, parent_field_path, field_path)
+                    )
+        return cls(
+            frozenset(traversal.edges),
+            tuple(links),
+            frozenset(terminal_node_addresses),
+        )
+
+    def apply(self, traversal: Traversal) -> None:
+        """Link the nodes of a new traversal as this skeleton describes"""
+        for parent_address, child_address, parent_field_path, field_path in self.links:
+            parent = traversal.get_traversal_node(parent_address)
+            child = traversal.get_traversal_node(child_address)
+            append(
+                parent.children,
+                child_address,
+                (child, parent_field_path, field_path),
+            )
+            append(
+                child.parents,
+                parent_address,
+                (parent, parent_field_path, field_path),
+            )
+        for address in self.terminal_node_addresses:
+            traversal.get_traversal_node(address).is_terminal_node = True
+
+
+def _index_edges_by_collection(
+    edges: Set[Edge],
+) -> DefaultDict[CollectionAddress, Dict[Edge, None]]:
+    """Index the given edges under the collection address at each of their ends.
+
+    Each index entry is an insertion-ordered dict rather than a set, so edges touching
+    a collection are visited in the same order as they would be in the full edge set."""
+    index: DefaultDict[CollectionAddress, Dict[Edge, None]] = defaultdict(dict)
+    for edge in edges:
+        index[edge.f1.collection_address()][edge] = None
+        index[edge.f2.collection_address()][edge] = None
+    return index
+
+
+def _remove_indexed_edge(
+    edges: Set[Edge],
+    index: DefaultDict[CollectionAddress, Dict[Edge, None]],
+    edge: Edge,
+) -> None:
+    """Remove an edge from both the edge set and the collection address index"""
+    edges.discard(edge)
+    index[edge.f1.collection_address()].pop(edge, None)
+    index[edge.f2.collection_address()].pop(edge, None)
@@ -32,6 +32,12 @@ from fides.api.schemas.analytics import Event, ExtraData
 from fides.api.service.privacy_request.email_batch_service import (
     initiate_scheduled_batch_email_send,
 )
+from fides.api.service.privacy_request.fides_child_request_service import (
+    initiate_fides_child_request_polling,
+)
+from fides.api.service.privacy_request.identity_lookup_hash_service import (
+    initiate_identity_lookup_hash_backfill,
+)
 from fides.api.tasks.scheduled.scheduler import async_scheduler, scheduler
 from fides.api.ui import (
     get_admin_index_as_response,
@@ -42,6 +48,7 @@ from fides.api.ui import (
 )
 from fides.api.util.endpoint_utils import API_PREFIX
 from fides.api.util.logger import _log_exception
+from fides.api.util.table_cache_version import invalidate_table_cache_versions
 from fides.cli.utils import FIDES_ASCII_ART
 from fides.config import CONFIG, check_required_webserver_config_values
 
@@ -260,12 +267,16 @@ async def setup_server() -> None:
 
     check_redis()
 
+    invalidate_table_cache_versions()
+
     if not scheduler.running:
         scheduler.start()
     if not async_scheduler.running:
         async_scheduler.start()
 
     initiate_scheduled_batch_email_send()
+    initiate_identity_lookup_hash_backfill()
+    initiate_fides_child_request_polling()
 
     logger.debug("Sending startup analytics events...")
     # Avoid circular imports
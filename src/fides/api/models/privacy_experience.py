@@ -337,7 +337,13 @@ class PrivacyExperience(Base):
         of a user being served TCF components and/or consenting to any individual TCF components.
         """
         if self.component == ComponentType.tcf_overlay:
-            tcf_contents = copy(base_tcf_contents)
+            # The base contents are shared between requests, so they're deep copied
+            # before the user's saved and served preferences are added to the records
+            tcf_contents = (
+                base_tcf_contents.copy(deep=True)
+                if fides_user_provided_identity
+                else copy(base_tcf_contents)
+            )
 
             has_tcf_contents = False
             for (
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timedelta
 from enum import Enum as EnumType
 from typing import Any, Dict, List, Optional, Set, Union
@@ -18,11 +19,14 @@ from sqlalchemy import (
     Integer,
     String,
     UniqueConstraint,
+    and_,
+    or_,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Session, backref, relationship
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList
 from sqlalchemy_utils.types.encrypted.encrypted_type import (
     AesGcmEngine,
     StringEncryptedType,
@@ -34,7 +38,11 @@ from fides.api.common_exceptions import (
     NoCachedManualWebhookEntry,
     PrivacyRequestPaused,
 )
-from fides.api.cryptography.cryptographic_util import generate_salt, hash_with_salt
+from fides.api.cryptography.cryptographic_util import (
+    generate_salt,
+    hash_with_salt,
+    hmac_sha256,
+)
 from fides.api.db.base_class import Base  # type: ignore[attr-defined]
 from fides.api.db.base_class import JSONTypeOverride
 from fides.api.db.util import EnumColumn
@@ -72,6 +80,7 @@ from fides.api.util.cache import (
     get_encryption_cache_key,
     get_identity_cache_key,
     get_masking_secret_cache_key,
+    get_privacy_request_cache_index,
 )
 from fides.api.util.collection_util import Row
 from fides.api.util.constants import API_DATE_FORMAT
@@ -315,7 +324,14 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     days=policy.execution_timeframe
                 )
 
-        return super().create(db=db, data=data, check_name=check_name)
+        privacy_request = super().create(db=db, data=data, check_name=check_name)
+        get_cache().create_index(privacy_request.cache_index)
+        return privacy_request
+
+    @property
+    def cache_index(self) -> str:
+        """The key of the index of everything cached for this privacy request"""
+        return get_privacy_request_cache_index(self.id)
 
     def delete(self, db: Session) -> None:
         """
@@ -323,9 +339,13 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         deleting this object from the database
         """
         cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        if cache.is_complete_index(self.cache_index):
+            cache.delete_index(self.cache_index)
+        else:
+            # requests cached before the index existed
+            all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
+            if all_keys:
+                cache.unlink(*all_keys)
 
         for provided_identity in self.provided_identities:  # type: ignore[attr-defined]
             provided_identity.delete(db=db)
@@ -340,6 +360,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 cache.set_with_autoexpire(
                     get_identity_cache_key(self.id, key),
                     value,
+                    index=self.cache_index,
                 )
 
     def cache_custom_privacy_request_fields(
@@ -362,6 +383,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_custom_privacy_request_field_cache_key(self.id, key),
                         item.value,
+                        index=self.cache_index,
                     )
         else:
             logger.info(
@@ -377,7 +399,6 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         identity_dict: Dict[str, Any] = dict(identity)
         for key, value in identity_dict.items():
             if value:
-                hashed_value = ProvidedIdentity.hash_value(value)
                 ProvidedIdentity.create(
                     db=db,
                     data={
@@ -385,7 +406,6 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                         "field_name": key,
                         # We don't need to manually encrypt this field, it's done at the ORM level
                         "encrypted_value": {"value": value},
-                        "hashed_value": hashed_value,
                     },
                 )
 
@@ -462,6 +482,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             get_async_task_tracking_cache_key(self.id),
             task_id,
         )
+        cache.add_to_index(self.cache_index, get_async_task_tracking_cache_key(self.id))
 
     def get_cached_task_id(self) -> Optional[str]:
         """Gets the cached task ID for this privacy request."""
@@ -486,11 +507,13 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         repr(value),
+                        index=self.cache_index,
                     )
                 else:
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         value,
+                        index=self.cache_index,
                     )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
@@ -502,6 +525,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_with_autoexpire(
             get_encryption_cache_key(self.id, "key"),
             encryption_key,
+            index=self.cache_index,
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -516,27 +540,40 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 secret_type=masking_secret.secret_type,
             ),
             FidesopsRedis.encode_obj(masking_secret.secret),
+            index=self.cache_index,
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_prefix(prefix, index=self.cache_index)
+        values = cache.get_values(keys)
+        return {
+            key.split("-")[-1]: value
+            for key, value in values.items()
+            if value is not None
+        }
 
     def get_cached_custom_privacy_request_fields(self) -> Dict[str, Any]:
         """Retrieves any custom fields pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-custom-privacy-request-field-*"
+        prefix = f"id-{self.id}-custom-privacy-request-field-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_prefix(prefix, index=self.cache_index)
+        values = cache.get_values(keys)
+        return {
+            key.split("-")[-1]: value
+            for key, value in values.items()
+            if value is not None
+        }
 
     def get_results(self) -> Dict[str, Any]:
         """Retrieves all cached identity data associated with this Privacy Request"""
         cache: FidesopsRedis = get_cache()
-        result_prefix = f"{self.id}__*"
-        return cache.get_encoded_objects_by_prefix(result_prefix)
+        result_prefix = f"{self.id}__"
+        return cache.get_encoded_objects_by_prefix(
+            result_prefix, index=self.cache_index
+        )
 
     def cache_email_connector_template_contents(
         self,
@@ -639,6 +676,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ACCESS_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index=self.cache_index,
         )
 
     def cache_manual_webhook_erasure_input(
@@ -655,6 +693,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ERASURE_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index=self.cache_index,
         )
 
     def get_manual_webhook_access_input_strict(
@@ -755,6 +794,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_INPUT__{self.id}__{collection.value}",
             manual_rows,
+            index=self.cache_index,
         )
 
     def get_manual_access_input(
@@ -769,7 +809,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cached_results: Optional[
             Dict[str, Optional[List[Row]]]
         ] = cache.get_encoded_objects_by_prefix(
-            f"MANUAL_INPUT__{self.id}__{collection.value}"
+            f"MANUAL_INPUT__{self.id}__{collection.value}", index=self.cache_index
         )
         return list(cached_results.values())[0] if cached_results else None
 
@@ -784,6 +824,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_MASK__{self.id}__{collection.value}",
             count,
+            index=self.cache_index,
         )
 
     def get_manual_erasure_count(self, collection: CollectionAddress) -> Optional[int]:
@@ -795,21 +836,25 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache: FidesopsRedis = get_cache()
         prefix = f"MANUAL_MASK__{self.id}__{collection.value}"
         value_dict: Optional[Dict[str, int]] = cache.get_encoded_objects_by_prefix(  # type: ignore
-            prefix
+            prefix, index=self.cache_index
         )
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_access_graph(self, value: GraphRepr) -> None:
         """Cache a representation of the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"ACCESS_GRAPH__{self.id}", value)
+        cache.set_encoded_object(
+            f"ACCESS_GRAPH__{self.id}", value, index=self.cache_index
+        )
 
     def get_cached_access_graph(self) -> Optional[GraphRepr]:
         """Fetch the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
         value_dict: Optional[
             Dict[str, Optional[GraphRepr]]
-        ] = cache.get_encoded_objects_by_prefix(f"ACCESS_GRAPH__{self.id}")
+        ] = cache.get_encoded_objects_by_prefix(
+            f"ACCESS_GRAPH__{self.id}", index=self.cache_index
+        )
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_data_use_map(self, value: Dict[str, Set[str]]) -> None:
@@ -818,7 +863,9 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         mapped to their associated data uses
         """
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"DATA_USE_MAP__{self.id}", value)
+        cache.set_encoded_object(
+            f"DATA_USE_MAP__{self.id}", value, index=self.cache_index
+        )
 
     def get_cached_data_use_map(self) -> Optional[Dict[str, Set[str]]]:
         """
@@ -827,7 +874,9 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache: FidesopsRedis = get_cache()
         value_dict: Optional[
             Dict[str, Optional[Dict[str, Set[str]]]]
-        ] = cache.get_encoded_objects_by_prefix(f"DATA_USE_MAP__{self.id}")
+        ] = cache.get_encoded_objects_by_prefix(
+            f"DATA_USE_MAP__{self.id}", index=self.cache_index
+        )
         return list(value_dict.values())[0] if value_dict else None
 
     def trigger_policy_webhook(
@@ -975,7 +1024,8 @@ def _get_manual_access_input_from_cache(
     cached_results: Optional[
         Optional[Dict[str, Any]]
     ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_ACCESS_INPUT__{privacy_request.id}__{manual_webhook.id}"
+        f"WEBHOOK_MANUAL_ACCESS_INPUT__{privacy_request.id}__{manual_webhook.id}",
+        index=privacy_request.cache_index,
     )
     if cached_results:
         return list(cached_results.values())[0]
@@ -991,7 +1041,8 @@ def _get_manual_erasure_input_from_cache(
     cached_results: Optional[
         Optional[Dict[str, Any]]
     ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_ERASURE_INPUT__{privacy_request.id}__{manual_webhook.id}"
+        f"WEBHOOK_MANUAL_ERASURE_INPUT__{privacy_request.id}__{manual_webhook.id}",
+        index=privacy_request.cache_index,
     )
     if cached_results:
         return list(cached_results.values())[0]
@@ -1013,6 +1064,26 @@ class ProvidedIdentityType(EnumType):
     fides_user_device_id = "fides_user_device_id"
 
 
+# Distinguishes the key derived from the app encryption key for lookup hashes from
+# other uses of the app encryption key
+IDENTITY_LOOKUP_PEPPER_CONTEXT = b"fides-identity-lookup-hash"
+
+# How long the result of checking whether every identity has a lookup hash is reused
+LOOKUP_HASH_BACKFILL_CHECK_SECONDS = 60
+
+
+def get_identity_lookup_pepper() -> bytes:
+    """The key lookup hashes are keyed with: security.identity_lookup_pepper, or a key
+    derived from the app encryption key if it isn't set"""
+    encoding: str = CONFIG.security.encoding
+    if CONFIG.security.identity_lookup_pepper:
+        return CONFIG.security.identity_lookup_pepper.encode(encoding)
+    return hmac_sha256(
+        IDENTITY_LOOKUP_PEPPER_CONTEXT,
+        CONFIG.security.app_encryption_key.encode(encoding),
+    ).encode(encoding)
+
+
 class ProvidedIdentity(Base):  # pylint: disable=R0904
     """
     A table for storing identity fields and values provided at privacy request
@@ -1039,6 +1110,12 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         unique=False,
         nullable=True,
     )  # This field is used as a blind index for exact match searches
+    lookup_hash = Column(
+        String,
+        index=True,
+        unique=False,
+        nullable=True,
+    )  # A faster blind index that searches use, see lookup_hash_value
     encrypted_value = Column(
         MutableDict.as_mutable(
             StringEncryptedType(
@@ -1059,6 +1136,29 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         cascade="delete, delete-orphan",
     )
 
+    # Whether every identity had a lookup hash when last checked, and when that was
+    _lookup_hashes_backfilled: bool = False
+    _lookup_hashes_checked_at: float = 0.0
+
+    @classmethod
+    def create(
+        cls, db: Session, *, data: Dict[str, Any], check_name: bool = True
+    ) -> ProvidedIdentity:
+        """
+        Sets the lookup hash of the identity's value, if it isn't provided, and the
+        legacy bcrypt hash while `security.identity_legacy_hash_writes` is enabled
+        """
+        value: Optional[str] = (data.get("encrypted_value") or {}).get("value")
+        if data.get("lookup_hash") is None:
+            data["lookup_hash"] = cls.lookup_hash_value(value) if value else ""
+        if (
+            data.get("hashed_value") is None
+            and value
+            and CONFIG.security.identity_legacy_hash_writes
+        ):
+            data["hashed_value"] = cls.hash_value(value)
+        return super().create(db=db, data=data, check_name=check_name)
+
     @classmethod
     def hash_value(
         cls,
@@ -1073,6 +1173,60 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         )
         return hashed_value
 
+    @classmethod
+    def lookup_hash_value(
+        cls,
+        value: str,
+        encoding: str = "UTF-8",
+    ) -> str:
+        """
+        The lookup hash of the value, an HMAC-SHA256 keyed with the identity lookup
+        pepper. While `security.identity_legacy_hash_writes` is enabled, identities
+        keep their bcrypt hashed_value as well, which servers that haven't been
+        upgraded yet and privacy preference records still use.
+        """
+        return hmac_sha256(value.encode(encoding), get_identity_lookup_pepper())
+
+    @property
+    def has_hash(self) -> bool:
+        """Whether the identity can be searched for, by its lookup or bcrypt hash"""
+        return bool(self.lookup_hash or self.hashed_value)
+
+    @classmethod
+    def lookup_hashes_backfilled(cls, db: Session) -> bool:
+        """Whether every identity has a lookup hash. Checked at most every
+        LOOKUP_HASH_BACKFILL_CHECK_SECONDS, since identities without one can still be
+        created by servers that haven't been upgraded."""
+        now: float = time.monotonic()
+        if now - cls._lookup_hashes_checked_at >= LOOKUP_HASH_BACKFILL_CHECK_SECONDS:
+            cls._lookup_hashes_backfilled = not db.query(
+                db.query(cls).filter(cls.lookup_hash.is_(None)).exists()
+            ).scalar()
+            cls._lookup_hashes_checked_at = now
+        return cls._lookup_hashes_backfilled
+
+    @classmethod
+    def lookup_condition(
+        cls, db: Session, value: str
+    ) -> Union[BinaryExpression, BooleanClauseList]:
+        """
+        Matches identities with the value by their lookup hash. Until every identity
+        has been backfilled, identities without a lookup hash are matched by their
+        bcrypt hash. During a rolling deploy, identities created by servers that
+        haven't been upgraded have no lookup hash; they're found by their bcrypt hash
+        once lookup_hashes_backfilled next checks, and backfilled by the next run of
+        the backfill.
+        """
+        if cls.lookup_hashes_backfilled(db):
+            return cls.lookup_hash == cls.lookup_hash_value(value)
+        return or_(
+            cls.lookup_hash == cls.lookup_hash_value(value),
+            and_(
+                cls.lookup_hash.is_(None),
+                cls.hashed_value == cls.hash_value(value),
+            ),
+        )
+
     def as_identity_schema(self) -> Identity:
         """Creates an Identity schema from a ProvidedIdentity record in the application DB."""
         identity = Identity()
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from fides.common.api.scope_registry import (
     CLI_OBJECTS_READ,
@@ -144,7 +145,13 @@ def get_scopes_from_roles(roles: Optional[List[str]]) -> List[str]:
     if not roles:
         return []
 
+    return list(_get_scopes_from_role_set(frozenset(roles)))
+
+
+@lru_cache(maxsize=128)
+def _get_scopes_from_role_set(roles: FrozenSet[str]) -> Tuple[str, ...]:
+    """The scopes granted by a set of roles, which are checked on every request"""
     scope_list: List[str] = []
     for role in roles:
         scope_list += ROLES_TO_SCOPES_MAPPING.get(role, [])
-    return [*set(scope_list)]
+    return tuple(set(scope_list))
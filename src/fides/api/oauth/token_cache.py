@@ -0,0 +1,188 @@
+"""
+A process-level cache of verified API tokens.
+
+Verifying a token decrypts its JWE and loads its client, which every authenticated
+request repeats, even though integrations make many requests with the same few
+tokens. Verified tokens are cached by the SHA-256 digest of the token, with their
+payload and a snapshot of their client's columns, for at most
+`security.oauth_token_cache_ttl_seconds`, in an LRU of
+`security.oauth_token_cache_size` tokens.
+
+Entries are cached under a TableCacheVersion of the client and user permissions
+tables, so they're dropped in every process as soon as a client's scopes, roles or
+systems change, a user's roles change, or a client is deleted, which is how tokens
+are revoked. Checking the version costs one Redis lookup per request; if Redis is
+unavailable, tokens are verified from scratch.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, NamedTuple, Optional
+
+from loguru import logger
+from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.models.client import ClientDetail
+from fides.api.models.fides_user_permissions import FidesUserPermissions
+from fides.api.util.cache import get_cache
+from fides.api.util.table_cache_version import TableCacheVersion
+from fides.config import CONFIG
+
+TOKEN_CACHE_VERSION_KEY = "oauth-token-cache-version"
+# How often the cache's size, hits, misses and hit rate are logged, at most
+TOKEN_CACHE_STATS_LOG_SECONDS = 600
+
+TOKEN_CACHE_VERSION = TableCacheVersion(
+    TOKEN_CACHE_VERSION_KEY,
+    [ClientDetail.__tablename__, FidesUserPermissions.__tablename__],
+)
+
+
+class VerifiedToken(NamedTuple):
+    """A token's payload and its client, as they were when the token was verified"""
+
+    version: str
+    verified_at: float
+    token_data: Dict[str, Any]
+    # None for clients that aren't persisted, like the root client
+    client_columns: Optional[Dict[str, Any]]
+
+    def load_client(self, db: Session) -> Optional[ClientDetail]:
+        """
+        The token's client, attached to the session without querying the database,
+        as if it had just been loaded. Returns None for clients that aren't persisted.
+        """
+        if self.client_columns is None:
+            return None
+        client = ClientDetail(
+            **{
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.client_columns.items()
+            }
+        )
+        make_transient_to_detached(client)
+        return db.merge(client, load=False)
+
+
+def get_token_cache_version() -> Optional[str]:
+    """The version tokens are currently cached under, or None if they can't be cached"""
+    if not CONFIG.security.oauth_token_cache_size:
+        return None
+    try:
+        return TOKEN_CACHE_VERSION.get(get_cache())
+    except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+        # Without the version there's no telling whether a cached token was revoked
+        logger.warning("Unable to read the token cache version: {}", exc)
+        return None
+
+
+def _get_token_digest(authorization: str) -> str:
+    return hashlib.sha256(authorization.encode(CONFIG.security.encoding)).hexdigest()
+
+
+class VerifiedTokenCache:
+    """A bounded LRU of verified tokens, with counts of hits and misses"""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._tokens: OrderedDict[str, VerifiedToken] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._stats_logged_at = time.monotonic()
+
+    def get(
+        self, authorization: str, version: Optional[str]
+    ) -> Optional[VerifiedToken]:
+        """The verified token, if it was verified under the current version within the
+        last `security.oauth_token_cache_ttl_seconds`"""
+        if version is None:
+            return None
+        digest: str = _get_token_digest(authorization)
+        verified_after: float = (
+            time.monotonic() - CONFIG.security.oauth_token_cache_ttl_seconds
+        )
+        with self._lock:
+            verified: Optional[VerifiedToken] = self._tokens.get(digest)
+            if verified and (
+                verified.version != version or verified.verified_at < verified_after
+            ):
+                del self._tokens[digest]
+                verified = None
+            if verified:
+                self._tokens.move_to_end(digest)
+                self._hits += 1
+            else:
+                self._misses += 1
+        self._log_stats_periodically()
+        return verified
+
+    def _log_stats_periodically(self) -> None:
+        """Logs the stats at most every TOKEN_CACHE_STATS_LOG_SECONDS, so the hit rate
+        can be used to tune the cache's size and TTL"""
+        now: float = time.monotonic()
+        with self._lock:
+            if now - self._stats_logged_at < TOKEN_CACHE_STATS_LOG_SECONDS:
+                return
+            self._stats_logged_at = now
+        stats: Dict[str, float] = self.stats()
+        logger.info(
+            "Verified token cache: {} tokens, {} hits, {} misses, {:.1%} hit rate",
+            stats["size"],
+            stats["hits"],
+            stats["misses"],
+            stats["hit_rate"],
+        )
+
+    def set(
+        self,
+        authorization: str,
+        version: Optional[str],
+        token_data: Dict[str, Any],
+        client: ClientDetail,
+    ) -> None:
+        """Caches the token as verified under the version, which must be read before
+        the token's client was loaded"""
+        if version is None:
+            return
+        client_columns: Optional[Dict[str, Any]] = None
+        if inspect(client).has_identity:
+            client_columns = {
+                column.key: getattr(client, column.key)
+                for column in ClientDetail.__table__.columns
+            }
+        verified = VerifiedToken(
+            version, time.monotonic(), dict(token_data), client_columns
+        )
+        digest: str = _get_token_digest(authorization)
+        with self._lock:
+            self._tokens[digest] = verified
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > CONFIG.security.oauth_token_cache_size:
+                self._tokens.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        """The number of cached tokens, hits and misses, and the hit rate"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._tokens),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drops every cached token and resets the stats"""
+        with self._lock:
+            self._tokens.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from functools import update_wrapper
 from types import FunctionType
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import SecurityScopes
@@ -27,6 +27,11 @@ from fides.api.models.client import ClientDetail
 from fides.api.models.fides_user import FidesUser
 from fides.api.models.policy import PolicyPreWebhook
 from fides.api.oauth.roles import get_scopes_from_roles
+from fides.api.oauth.token_cache import (
+    VerifiedToken,
+    get_token_cache_version,
+    verified_token_cache,
+)
 from fides.api.schemas.external_https import WebhookJWE
 from fides.api.schemas.oauth import OAuth2ClientCredentialsBearer
 from fides.common.api.v1.urn_registry import TOKEN, V1_URL_PREFIX
@@ -195,13 +200,22 @@ def extract_token_and_load_client(
         logger.debug("No authorization supplied.")
         raise AuthenticationError(detail="Authentication Failure")
 
-    try:
-        token_data = json.loads(
-            extract_payload(authorization, CONFIG.security.app_encryption_key)
-        )
-    except exceptions.JWEParseError as exc:
-        logger.debug("Unable to parse auth token.")
-        raise AuthorizationError(detail="Not Authorized for this action") from exc
+    # Read before the client is loaded, so a client changed in between isn't cached
+    # as current
+    cache_version: Optional[str] = get_token_cache_version()
+    verified: Optional[VerifiedToken] = verified_token_cache.get(
+        authorization, cache_version
+    )
+    if verified:
+        token_data = dict(verified.token_data)
+    else:
+        try:
+            token_data = json.loads(
+                extract_payload(authorization, CONFIG.security.app_encryption_key)
+            )
+        except exceptions.JWEParseError as exc:
+            logger.debug("Unable to parse auth token.")
+            raise AuthorizationError(detail="Not Authorized for this action") from exc
 
     issued_at = token_data.get(JWE_ISSUED_AT, None)
     if not issued_at:
@@ -219,6 +233,10 @@ def extract_token_and_load_client(
         logger.debug("No client_id included in auth token.")
         raise AuthorizationError(detail="Not Authorized for this action")
 
+    client: Optional[ClientDetail] = verified.load_client(db) if verified else None
+    if client:
+        return token_data, client
+
     # scopes/roles param is only used if client is root client, otherwise we use the client's associated scopes
     client = ClientDetail.get(
         db,
@@ -232,6 +250,8 @@ def extract_token_and_load_client(
         logger.debug("Auth token belongs to an invalid client_id.")
         raise AuthorizationError(detail="Not Authorized for this action")
 
+    if not verified:
+        verified_token_cache.set(authorization, cache_version, token_data, client)
     return token_data, client
 
 
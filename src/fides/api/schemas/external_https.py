@@ -31,6 +31,13 @@ class PrivacyRequestResumeFormat(BaseModel):
         use_enum_values = True
 
 
+class FidesChildRequestCallback(BaseModel):
+    """Expected request body of a child Fides server's post-execution webhook, when a
+    privacy request a Fides connector created on it finishes"""
+
+    privacy_request_id: str
+
+
 class WebhookJWE(BaseModel):
     """Describes JWE that is given to the user that they need to send with their request
     to resume a privacy request"""
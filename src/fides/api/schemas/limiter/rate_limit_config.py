@@ -23,12 +23,18 @@ class RateLimit(BaseModel):
     rate: int
     period: RateLimitPeriod
     custom_key: Optional[str]
+    burst: Optional[int]
 
     @validator("rate")
     def rate_more_than_zero(cls, v: int) -> int:
         assert v > 0, "rate must be more than zero"
         return v
 
+    @validator("burst")
+    def burst_more_than_zero(cls, v: Optional[int]) -> Optional[int]:
+        assert v is None or v > 0, "burst must be more than zero"
+        return v
+
 
 class RateLimitConfig(BaseModel):
     """
@@ -182,6 +182,10 @@ class EmailForActionType(BaseModel):
     subject: str
     body: str
     template_variables: Optional[Dict[str, Any]] = {}
+    # The messaging template the subject and body were rendered from, if any, so
+    # services can send many recipients one template with their own variables
+    subject_template: Optional[str] = None
+    body_template: Optional[str] = None
 
 
 class MessagingServiceDetails(Enum):
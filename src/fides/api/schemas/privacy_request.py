@@ -33,6 +33,13 @@ class PrivacyRequestDRPStatus(EnumType):
     expired = "expired"
 
 
+class PrivacyRequestExportFormat(str, EnumType):
+    """The file formats privacy requests can be downloaded in"""
+
+    csv = "csv"
+    ndjson = "ndjson"
+
+
 class PrivacyRequestDRPStatusResponse(FidesSchema):
     """A Fidesops PrivacyRequest updated to fit the Data Rights Protocol specification."""
 
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 
 from fideslang.models import Dataset
 from pydantic import BaseModel, validator
 
+from fides.api.schemas.policy import ActionType
 from fides.api.schemas.saas.saas_config import SaaSConfig
 from fides.api.util.saas_util import load_config_from_string, load_dataset_from_string
 
@@ -39,3 +40,24 @@ class ConnectorTemplate(BaseModel):
                 "Hard-coded fides_key detected in the dataset, replace all instances of it with <instance_fides_key>"
             )
         return dataset
+
+
+class ConnectorTemplateSummary(BaseModel):
+    """
+    What a SaaS connector template is and what it supports, compiled from its config
+    so templates can be listed and filtered without parsing their configs
+    """
+
+    type: str
+    human_readable: str
+    version: str
+    authorization_required: bool
+    user_guide: Optional[str]
+    supported_actions: List[ActionType]
+    identities: List[str]
+    connector_params: List[str]
+
+    class Config:
+        """Summaries are shared by every lookup of the template"""
+
+        allow_mutation = False
@@ -17,6 +17,7 @@ from fides.api.schemas.connection_configuration.connection_secrets_dynamodb impo
 from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_config import DynamoDBQueryConfig, QueryConfig
 from fides.api.util.collection_util import Row
+from fides.api.util.encryption.secrets_util import SecretsUtil
 from fides.api.util.logger import Pii
 from fides.connectors.models import (
     AWSConfig,
@@ -143,23 +144,24 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         query_config = self.query_config(node)
         collection_name = node.address.collection
         update_ct = 0
-        for row in rows:
-            update_items = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_items is not None:
-                client = self.client()
-                update_result = client.put_item(
-                    TableName=collection_name,
-                    Item=update_items,
-                )
-                if update_result["ResponseMetadata"]["HTTPStatusCode"] == 200:
-                    update_ct += 1
-                logger.info(
-                    "client.put_item({}, {})",
-                    collection_name,
-                    Pii(update_items),
+        with SecretsUtil.cached_secrets():
+            for row in rows:
+                update_items = query_config.generate_update_stmt(
+                    row, policy, privacy_request
                 )
+                if update_items is not None:
+                    client = self.client()
+                    update_result = client.put_item(
+                        TableName=collection_name,
+                        Item=update_items,
+                    )
+                    if update_result["ResponseMetadata"]["HTTPStatusCode"] == 200:
+                        update_ct += 1
+                    logger.info(
+                        "client.put_item({}, {})",
+                        collection_name,
+                        Pii(update_items),
+                    )
 
         return update_ct
 
@@ -0,0 +1,177 @@
+"""
+Checkpoints of the privacy requests Fides connectors create on child Fides servers.
+
+Instead of blocking a worker until a child request finishes, the connector creates
+the child request, checkpoints it in the parent privacy request's cache, registers it
+as outstanding and pauses the parent. A shared poller checks the statuses of the
+outstanding child requests in batches, one batch per child server, records the
+status of each finished request in its checkpoint, and resumes the parent once none
+of its child requests are outstanding. The connector then reads the child request's
+status from the checkpoint, instead of creating another child request.
+"""
+from __future__ import annotations
+
+import json
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from redis.client import Pipeline
+
+from fides.api.models.policy import CurrentStep
+from fides.api.util.cache import (
+    FidesopsRedis,
+    get_cache,
+    get_fides_child_request_cache_key,
+    get_privacy_request_cache_index,
+)
+from fides.config import CONFIG
+
+# A hash of the outstanding child requests of every parent, by child request id
+OUTSTANDING_CHILD_REQUESTS_KEY = "fides-child-requests"
+# The parents whose child requests have finished, which are resumed once paused
+PARENTS_TO_RESUME_KEY = "fides-child-request-parents"
+
+# The checkpoint's other fields are the statuses of its child requests, by id, which
+# are empty while the child request is outstanding
+CHECKPOINT_CREATED_AT_FIELD = "created_at"
+CHECKPOINT_CHILD_PREFIX = "child-"
+
+
+class OutstandingChildRequest(NamedTuple):
+    """A child request that hasn't finished, and the parent waiting on it"""
+
+    parent_id: str
+    connection_key: str
+    step: str
+    created_at: float
+
+    @property
+    def checkpoint_key(self) -> str:
+        return get_fides_child_request_cache_key(
+            self.parent_id, self.connection_key, self.step
+        )
+
+
+class ChildRequestCheckpoint:
+    """The requests a privacy request created on a child Fides server for one step"""
+
+    def __init__(self, privacy_request_id: str, connection_key: str, step: CurrentStep):
+        self.privacy_request_id = privacy_request_id
+        self.connection_key = connection_key
+        self.step = step
+        self.key = get_fides_child_request_cache_key(
+            privacy_request_id, connection_key, step.value
+        )
+        self.created_at: float = 0.0
+        self.statuses: Dict[str, Optional[str]] = {}
+
+    def load(self) -> bool:
+        """Loads the checkpoint, returns whether child requests were created"""
+        checkpoint: Dict[str, str] = get_cache().hgetall(self.key)
+        if CHECKPOINT_CREATED_AT_FIELD not in checkpoint:
+            return False
+        self.created_at = float(checkpoint[CHECKPOINT_CREATED_AT_FIELD])
+        self.statuses = {
+            field[len(CHECKPOINT_CHILD_PREFIX) :]: status or None
+            for field, status in checkpoint.items()
+            if field.startswith(CHECKPOINT_CHILD_PREFIX)
+        }
+        return True
+
+    @property
+    def outstanding(self) -> List[str]:
+        """The ids of the child requests that haven't finished"""
+        return [
+            child_id for child_id, status in self.statuses.items() if status is None
+        ]
+
+    def save(self, child_ids: List[str]) -> None:
+        """Checkpoints newly created child requests and registers them with the poller"""
+        self.created_at = time.time()
+        self.statuses = {child_id: None for child_id in child_ids}
+        cache: FidesopsRedis = get_cache()
+        pipe = cache.pipeline()
+        pipe.hset(
+            self.key,
+            mapping={
+                CHECKPOINT_CREATED_AT_FIELD: str(self.created_at),
+                **{
+                    f"{CHECKPOINT_CHILD_PREFIX}{child_id}": "" for child_id in child_ids
+                },
+            },
+        )
+        pipe.expire(self.key, CONFIG.redis.default_ttl_seconds)
+        cache.add_to_index(
+            get_privacy_request_cache_index(self.privacy_request_id),
+            self.key,
+            pipe=pipe,
+        )
+        self.register_outstanding(pipe)
+        pipe.execute()
+
+    def register_outstanding(self, pipe: Optional[Pipeline] = None) -> None:
+        """Registers the child requests that haven't finished with the poller"""
+        if not self.outstanding:
+            return
+        outstanding = OutstandingChildRequest(
+            self.privacy_request_id,
+            self.connection_key,
+            self.step.value,
+            self.created_at,
+        )
+        client = pipe if pipe is not None else get_cache()
+        client.hset(
+            OUTSTANDING_CHILD_REQUESTS_KEY,
+            mapping={
+                child_id: json.dumps(outstanding._asdict())
+                for child_id in self.outstanding
+            },
+        )
+
+    def discard(self) -> None:
+        """Drops the checkpoint once the child requests' results are used"""
+        cache: FidesopsRedis = get_cache()
+        pipe = cache.pipeline()
+        pipe.delete(self.key)
+        if self.outstanding:
+            pipe.hdel(OUTSTANDING_CHILD_REQUESTS_KEY, *self.outstanding)
+        pipe.execute()
+
+
+def get_outstanding_child_requests(
+    cache: FidesopsRedis,
+) -> Dict[str, OutstandingChildRequest]:
+    """Every outstanding child request, by id"""
+    return {
+        child_id: OutstandingChildRequest(**json.loads(outstanding))
+        for child_id, outstanding in cache.hgetall(
+            OUTSTANDING_CHILD_REQUESTS_KEY
+        ).items()
+    }
+
+
+def get_outstanding_child_request(
+    cache: FidesopsRedis, child_id: str
+) -> Optional[OutstandingChildRequest]:
+    """The outstanding child request with the id, if it's outstanding"""
+    outstanding: Optional[str] = cache.hget(OUTSTANDING_CHILD_REQUESTS_KEY, child_id)
+    return OutstandingChildRequest(**json.loads(outstanding)) if outstanding else None
+
+
+def finish_child_request(
+    pipe: Pipeline,
+    child_id: str,
+    outstanding: OutstandingChildRequest,
+    status: Optional[str],
+) -> None:
+    """
+    Records the status of a finished child request in its checkpoint, and queues its
+    parent to be resumed. Child requests that timed out are finished without a status.
+    """
+    if status:
+        pipe.hset(
+            outstanding.checkpoint_key, f"{CHECKPOINT_CHILD_PREFIX}{child_id}", status
+        )
+        pipe.expire(outstanding.checkpoint_key, CONFIG.redis.default_ttl_seconds)
+    pipe.hdel(OUTSTANDING_CHILD_REQUESTS_KEY, child_id)
+    pipe.sadd(PARENTS_TO_RESUME_KEY, outstanding.parent_id)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import httpx
 from httpx import AsyncClient, Client, HTTPStatusError, Request, RequestError, Timeout
@@ -26,6 +26,9 @@ COMPLETION_STATUSES = [
     PrivacyRequestStatus.denied,
 ]
 
+# The most privacy requests whose statuses are fetched in one call, one page's worth
+STATUS_BATCH_SIZE = 50
+
 
 class FidesClient:
     """
@@ -247,6 +250,53 @@ class FidesClient:
             )
         return response.json()["items"]
 
+    def request_statuses(
+        self, privacy_request_ids: List[str]
+    ) -> Dict[str, PrivacyRequestStatus]:
+        """
+        Return the statuses of the privacy requests with the given IDs, fetching them
+        in batches of `STATUS_BATCH_SIZE` per call. Requests a remote Fides that
+        predates the `request_ids` filter doesn't return are looked up one at a time.
+        """
+        logger.info(
+            "Retrieving request statuses for {} privacy requests on remote fides {}...",
+            len(privacy_request_ids),
+            self.uri,
+        )
+        statuses: Dict[str, PrivacyRequestStatus] = {}
+        for start in range(0, len(privacy_request_ids), STATUS_BATCH_SIZE):
+            batch: List[str] = privacy_request_ids[start : start + STATUS_BATCH_SIZE]
+            request: Request = self.authenticated_request(
+                method="GET",
+                path=urls.V1_URL_PREFIX + urls.PRIVACY_REQUESTS,
+                query_params={"request_ids": batch, "size": STATUS_BATCH_SIZE},
+            )
+            response = self.session.send(request)
+            if not response.is_success:
+                logger.error(
+                    "Error retrieving request statuses on remote Fides {}", self.uri
+                )
+                response.raise_for_status()
+
+            requested: Set[str] = set(batch)
+            for item in response.json()["items"]:
+                if item["id"] in requested:
+                    statuses[item["id"]] = PrivacyRequestStatus(item["status"])
+
+            for privacy_request_id in requested - statuses.keys():
+                for item in self.request_status(privacy_request_id):
+                    if item["id"] == privacy_request_id:
+                        statuses[privacy_request_id] = PrivacyRequestStatus(
+                            item["status"]
+                        )
+
+        logger.info(
+            "Retrieved request statuses for {} privacy requests on remote fides {}",
+            len(statuses),
+            self.uri,
+        )
+        return statuses
+
     def retrieve_request_results(
         self, privacy_request_id: str, rule_key: str
     ) -> Dict[str, List[Row]]:
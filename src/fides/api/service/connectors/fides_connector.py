@@ -1,21 +1,24 @@
-from typing import Any, Dict, List, Optional, Set
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from loguru import logger as log
 
+from fides.api.common_exceptions import PrivacyRequestPaused
 from fides.api.graph.traversal import TraversalNode
 from fides.api.models.connectionconfig import (
     ConnectionConfig,
     ConnectionTestStatus,
     ConnectionType,
 )
-from fides.api.models.policy import Policy
-from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.models.policy import CurrentStep, Policy
+from fides.api.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
 from fides.api.schemas.connection_configuration.connection_secrets_fides import (
     FidesConnectorSchema,
 )
 from fides.api.schemas.policy import ActionType
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.connectors.base_connector import BaseConnector
+from fides.api.service.connectors.fides.child_requests import ChildRequestCheckpoint
 from fides.api.service.connectors.fides.fides_client import FidesClient
 from fides.api.service.connectors.query_config import QueryConfig
 from fides.api.util.collection_util import Row
@@ -24,6 +27,12 @@ from fides.api.util.errors import FidesError
 DEFAULT_POLLING_TIMEOUT: int = 1800
 DEFAULT_POLLING_INTERVAL: int = 30
 
+FAILED_CHILD_REQUEST_STATUSES = [
+    PrivacyRequestStatus.error.value,
+    PrivacyRequestStatus.canceled.value,
+    PrivacyRequestStatus.denied.value,
+]
+
 
 class FidesConnector(BaseConnector[FidesClient]):
     """A connector that forwards requests to other Fides instances"""
@@ -87,7 +96,12 @@ class FidesConnector(BaseConnector[FidesClient]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Execute access request and fetch access data from remote Fides"""
+        """
+        Execute access request and fetch access data from remote Fides.
+
+        The privacy request is paused until the request created on the remote Fides
+        completes, and this is called again once it's resumed.
+        """
         identity_data = privacy_request.get_cached_identity_data()
         if not identity_data:
             raise FidesError(
@@ -97,21 +111,15 @@ class FidesConnector(BaseConnector[FidesClient]):
             f"{self.configuration.key} starting retrieve_data for privacy request {privacy_request.id}..."
         )
 
-        client: FidesClient = self.client()
-
-        # initiate privacy request execution on child
-        pr_id: str = client.create_privacy_request(
-            external_id=privacy_request.external_id or privacy_request.id,
-            identity=Identity(**identity_data),
-            policy_key=policy.key,
-        )
-
-        # block till privacy request completes on child
-        client.poll_for_request_completion(
-            privacy_request_id=pr_id,
-            timeout=self.polling_timeout or None,
-            interval=self.polling_interval or None,
+        checkpoint: ChildRequestCheckpoint = self._await_child_requests(
+            node,
+            privacy_request,
+            CurrentStep.access,
+            lambda: [
+                self._create_child_request(policy, privacy_request, identity_data)
+            ],
         )
+        client: FidesClient = self.client()
 
         # for each rule, get appropriate results from the child
         # store in a dict keyed by rule.key, to be unpacked later by request framework
@@ -119,8 +127,10 @@ class FidesConnector(BaseConnector[FidesClient]):
             rule.key: client.retrieve_request_results(
                 privacy_request_id=pr_id, rule_key=rule.key
             )
+            for pr_id in checkpoint.statuses
             for rule in policy.get_rules_for_action(action_type=ActionType.access)
         }
+        checkpoint.discard()
 
         log.info(
             f"{self.configuration.key} finished retrieve_data for privacy request {privacy_request.id}"
@@ -135,35 +145,96 @@ class FidesConnector(BaseConnector[FidesClient]):
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute an erasure request on remote fides"""
+        """
+        Execute an erasure request on remote fides.
+
+        One request is created on the remote Fides for the privacy request's identity,
+        which erases all of its rows, and the privacy request is paused until it
+        completes.
+        """
         identity_data = privacy_request.get_cached_identity_data()
         if not identity_data:
             raise FidesError(
                 f"No identity data found for privacy request {privacy_request.id}, cannot execute Fides connector!"
             )
+        if not rows:
+            return 0
         log.info(
             f"{self.configuration.key} starting mask_data for privacy request {privacy_request.id}..."
         )
 
-        client: FidesClient = self.client()
-        update_ct = 0
-        for _ in rows:
-            pr_id = client.create_privacy_request(
-                external_id=privacy_request.external_id,
-                identity=Identity(**identity_data),
-                policy_key=policy.key,
-            )
-            client.poll_for_request_completion(
-                privacy_request_id=pr_id,
-                timeout=self.polling_timeout,
-                interval=self.polling_interval,
-            )
-            update_ct += 1
+        checkpoint: ChildRequestCheckpoint = self._await_child_requests(
+            node,
+            privacy_request,
+            CurrentStep.erasure,
+            lambda: [
+                self._create_child_request(policy, privacy_request, identity_data)
+            ],
+        )
+        checkpoint.discard()
 
         log.info(
             f"{self.configuration.key} finished mask_data for privacy request {privacy_request.id}"
         )
-        return update_ct
+        return len(rows)
+
+    def _create_child_request(
+        self,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        identity_data: Dict[str, Any],
+    ) -> str:
+        """Initiates privacy request execution on the child, returns its id"""
+        client: FidesClient = self.client()
+        return client.create_privacy_request(
+            external_id=privacy_request.external_id or privacy_request.id,
+            identity=Identity(**identity_data),
+            policy_key=policy.key,
+        )
+
+    def _await_child_requests(
+        self,
+        node: TraversalNode,
+        privacy_request: PrivacyRequest,
+        step: CurrentStep,
+        create_child_requests: Callable[[], List[str]],
+    ) -> ChildRequestCheckpoint:
+        """
+        Returns the checkpoint of the child requests created for this step once they've
+        all completed.
+
+        Until then, the child requests are created if they haven't been, and the
+        privacy request is paused, releasing its worker, until the shared poller sees
+        they've finished and resumes it.
+        """
+        checkpoint = ChildRequestCheckpoint(
+            privacy_request.id, self.configuration.key, step
+        )
+        if not checkpoint.load():
+            checkpoint.save(create_child_requests())
+
+        for pr_id, status in checkpoint.statuses.items():
+            if status in FAILED_CHILD_REQUEST_STATUSES:
+                checkpoint.discard()
+                raise FidesError(
+                    f"Privacy request [{pr_id}] on remote Fides {self.configuration.key} finished with status {status}. Look at the remote Fides for more information."
+                )
+
+        if checkpoint.outstanding:
+            if time.time() - checkpoint.created_at > self.polling_timeout:
+                checkpoint.discard()
+                raise FidesError(
+                    f"Privacy request(s) {checkpoint.outstanding} on remote Fides {self.configuration.key} did not complete within {self.polling_timeout} seconds."
+                )
+            checkpoint.register_outstanding()
+            privacy_request.cache_paused_collection_details(
+                step=step, collection=node.address
+            )
+            raise PrivacyRequestPaused(
+                f"Collection '{node.address.value}' waiting on privacy request(s) {checkpoint.outstanding} on remote Fides {self.configuration.key} for privacy request '{privacy_request.id}'"
+            )
+
+        return checkpoint
 
     def close(self) -> None:
         """Close any held resources"""
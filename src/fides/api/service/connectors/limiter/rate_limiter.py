@@ -1,12 +1,23 @@
+import math
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import List
+from threading import Lock
+from typing import Dict, Iterator, List, Optional
 
 from loguru import logger
+from redis.client import Script  # type: ignore
+from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 
 from fides.api.common_exceptions import RedisConnectionError
 from fides.api.util.cache import FidesopsRedis, get_cache
 
+MICROSECONDS = 1_000_000
+# Once this many keys are limited in-process, the keys whose limits are fully
+# available again are dropped, since they're no different from keys never used
+MAX_LOCAL_KEYS = 1000
+
 
 class RateLimiterPeriod(Enum):
     """
@@ -26,16 +37,34 @@ class RateLimiterPeriod(Enum):
 class RateLimiterRequest:
     """
     Defines input  object for rate limiter
+
+    Up to `burst` calls can be made back to back, after which calls are spaced
+    evenly across the period at `rate_limit` calls per period. `burst` defaults to
+    `rate_limit`, so the full limit is available at once, as with the per-period
+    buckets of the API being limited; a smaller burst spaces calls out sooner.
     """
 
     key: str
     rate_limit: int
     period: RateLimiterPeriod
+    burst: int
 
-    def __init__(self, key: str, rate_limit: int, period: RateLimiterPeriod):
+    def __init__(
+        self,
+        key: str,
+        rate_limit: int,
+        period: RateLimiterPeriod,
+        burst: Optional[int] = None,
+    ):
         self.key = key
         self.rate_limit = rate_limit
         self.period = period
+        self.burst = burst or rate_limit
+
+    @property
+    def emission_interval(self) -> float:
+        """The number of seconds between two calls"""
+        return self.period.factor / self.rate_limit
 
     def __str__(self) -> str:
         return f"RateLimiterRequest(key={self.key},rate_limit={self.rate_limit},period={self.period})"
@@ -47,120 +76,230 @@ class RateLimiterTimeoutException(Exception):
     """
 
 
+class RateLimiterStats:
+    """
+    Time spent waiting on the rate limiter, per limited key.
+    Used to tune rate limit configs from how often and how long calls are held back.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, requests: List[RateLimiterRequest], wait_seconds: float) -> None:
+        """Records a call made through the given requests after waiting `wait_seconds`"""
+        with self._lock:
+            for request in requests:
+                stats = self._stats.setdefault(
+                    request.key,
+                    {"calls": 0, "delayed_calls": 0, "wait_seconds": 0.0},
+                )
+                stats["calls"] += 1
+                if wait_seconds > 0:
+                    stats["delayed_calls"] += 1
+                    stats["wait_seconds"] += wait_seconds
+
+    def get(self) -> Dict[str, Dict[str, float]]:
+        """Returns a copy of the call count, delayed call count and total wait per key"""
+        with self._lock:
+            return {key: dict(stats) for key, stats in self._stats.items()}
+
+
+_current_stats: ContextVar[Optional[RateLimiterStats]] = ContextVar(
+    "rate_limiter_stats", default=None
+)
+
+
+@contextmanager
+def log_rate_limiter_stats(name: str) -> Iterator[RateLimiterStats]:
+    """
+    Collects the stats of the calls limited within the block, and logs them per key
+    under the given name once it exits. Threads started within the block are
+    included if they run in a copy of its context (`contextvars.copy_context`).
+    """
+    stats = RateLimiterStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        for key, key_stats in stats.get().items():
+            logger.info(
+                "Rate limiter stats for {}, key {}: {} calls, {} delayed, {:.3f} seconds waiting",
+                name,
+                key,
+                int(key_stats["calls"]),
+                int(key_stats["delayed_calls"]),
+                key_stats["wait_seconds"],
+            )
+
+
+# Generic cell rate algorithm (GCRA) over every limit of a call at once.
+#
+# Each key stores the theoretical arrival time (TAT) of the next call in
+# microseconds. A call reserving `cost` calls moves the TAT forward by
+# cost * emission interval, and is allowed once the TAT is no more than the
+# tolerance ahead of now. If any key is over its limit nothing is reserved and
+# the script returns the number of microseconds until all keys allow the call.
+#
+# KEYS: the key of each limit
+# ARGV: the emission interval and tolerance of each limit in microseconds, then the cost
+GCRA_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local redis_time = redis.call('TIME')
+local now = tonumber(redis_time[1]) * 1000000 + tonumber(redis_time[2])
+local cost = tonumber(ARGV[#ARGV])
+local wait = 0
+local new_tats = {}
+for index, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[index * 2 - 1])
+    local tolerance = tonumber(ARGV[index * 2])
+    local tat = math.max(tonumber(redis.call('GET', key)) or now, now)
+    local new_tat = tat + interval * cost
+    new_tats[index] = new_tat
+    wait = math.max(wait, new_tat - tolerance - now)
+end
+if wait > 0 then
+    return math.ceil(wait)
+end
+for index, key in ipairs(KEYS) do
+    redis.call('SET', key, string.format('%d', new_tats[index]),
+        'PX', math.ceil((new_tats[index] - now) / 1000) + 1)
+end
+return 0
+"""
+
+
 class RateLimiter:
     """
     A rate limiter which interacts with Redis to provide a shared state between fidesops instances
+
+    If Redis can't be reached, calls are limited by buckets local to this process instead.
     """
 
-    EXPIRE_AFTER_PERIOD_SECONDS: int = 500
+    _local_tats: Dict[str, float] = {}
+    _local_lock = Lock()
+    _script: Optional[Script] = None
 
-    def build_redis_key(self, current_seconds: int, request: RateLimiterRequest) -> str:
+    def build_redis_key(self, request: RateLimiterRequest) -> str:
         """
         Builds the key to be used for the given request for rate limiting
         """
-        fixed_time_filter = (
-            int(current_seconds / request.period.factor) * request.period.factor
-        )
-        redis_key = f"{request.key}:{request.period.label}:{fixed_time_filter}"
-        return redis_key
+        return f"{request.key}:{request.period.label}"
 
-    def increment_usage(
-        self,
-        redis: FidesopsRedis,
-        current_seconds: int,
-        requests: List[RateLimiterRequest],
-    ) -> List[int]:
+    @staticmethod
+    def tolerance(request: RateLimiterRequest, cost: int) -> float:
         """
-        Increments the call count for the given requests for rate limitting.
+        How far ahead of now, in seconds, the next call for the request may be scheduled.
+        Reservations larger than the burst are allowed once the limit is fully available.
+        """
+        return max(request.burst, cost) * request.emission_interval
 
-        Also sets an expire time on the redis key.
+    def reserve(self, requests: List[RateLimiterRequest], cost: int = 1) -> float:
         """
-        pipe = redis.pipeline()
-        for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.incrby(redis_key, 1)
-            pipe.expire(
-                redis_key, request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
+        Reserves `cost` calls against every request if all of them are within their limits.
+        Returns 0 if the calls were reserved, or else the number of seconds to wait
+        before they can be reserved.
+        """
+        try:
+            redis: FidesopsRedis = get_cache()
+            return self.reserve_redis(redis, requests, cost)
+        except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+            logger.warning(
+                "Failed to connect to redis, limiting requests {} in this process only. {}",
+                ",".join(str(r) for r in requests),
+                exc,
             )
-        response = pipe.execute()
-
-        found_bucket_usages = []
-        for index, request in enumerate(requests):
-            # alternates between incr and expire responses
-            found_bucket_usages.append(response[index * 2])
+            return self.reserve_local(requests, cost)
 
-        return found_bucket_usages
-
-    def decrement_usage(
+    def reserve_redis(
         self,
         redis: FidesopsRedis,
-        current_seconds: int,
         requests: List[RateLimiterRequest],
-    ) -> None:
-        """
-        Decrements the call count for the given requests for rate limitting.
-        """
-        pipe = redis.pipeline()
+        cost: int = 1,
+    ) -> float:
+        """Reserves the calls atomically in Redis, so the limits are shared by every worker"""
+        args: List[int] = []
         for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.decrby(redis_key, 1)
-        pipe.execute()
+            args.append(math.ceil(request.emission_interval * MICROSECONDS))
+            args.append(math.ceil(self.tolerance(request, cost) * MICROSECONDS))
+        args.append(cost)
+
+        script: Optional[Script] = RateLimiter._script
+        if script is None:
+            # Registered once, the script is run by its SHA and only loaded into
+            # Redis again if Redis doesn't have it
+            script = RateLimiter._script = redis.register_script(GCRA_SCRIPT)
+        wait_microseconds = script(
+            keys=[self.build_redis_key(request) for request in requests],
+            args=args,
+            client=redis,
+        )
+        return int(wait_microseconds) / MICROSECONDS
+
+    def reserve_local(self, requests: List[RateLimiterRequest], cost: int = 1) -> float:
+        """Reserves the calls in buckets local to this process, using the same algorithm as Redis"""
+        with self._local_lock:
+            now = time.monotonic()
+            new_tats = {}
+            wait = 0.0
+            for request in requests:
+                key = self.build_redis_key(request)
+                tat = max(self._local_tats.get(key, now), now)
+                new_tats[key] = tat + request.emission_interval * cost
+                wait = max(wait, new_tats[key] - self.tolerance(request, cost) - now)
+            if wait > 0:
+                return wait
+            self._local_tats.update(new_tats)
+            if len(self._local_tats) > MAX_LOCAL_KEYS:
+                for key in [key for key, tat in self._local_tats.items() if tat <= now]:
+                    del self._local_tats[key]
+            return 0
 
     def limit(
-        self, requests: List[RateLimiterRequest], timeout_seconds: int = 30
+        self,
+        requests: List[RateLimiterRequest],
+        timeout_seconds: int = 30,
+        cost: int = 1,
     ) -> None:
         """
-        Increments call count for the current time bucket and verifies that it is within the
-        rate limit provided. If limit is breached it will decrement the count and try again
-        until it can successfully reserve a call, or timeout. Because we rely on optimistic
-        locking for many keys at a time, it is possible that concurrent rate limiters could
-        make the wrong decision in between increment to decrement operations.
+        Reserves `cost` calls against every request, waiting until all of the limits
+        allow them. The limiter returns the exact time until the calls can be
+        reserved, so we sleep for that long instead of polling. If the wait would go
+        past the timeout, a RateLimiterTimeoutException is raised without waiting.
 
-        If connection to the redis cluster fails then rate limiter will be skipped.
+        The reservation is a single atomic script in Redis, so concurrent rate
+        limiters can't overcommit a limit. If connection to the redis cluster fails
+        then calls are limited within this process only.
 
         Expiration is set on any keys which are stored in the cluster
         """
-        try:
-            redis: FidesopsRedis = get_cache()
-        except RedisConnectionError as exc:
-            logger.warning(
-                "Failed to connect to redis, skipping limiter for requests {}. {}",
-                ",".join(str(r) for r in requests),
-                exc,
-            )
+        if not requests:
             return
 
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            current_seconds = int(time.time())
+        start_time = time.monotonic()
+        waited_seconds = 0.0
+        while True:
+            wait_seconds = self.reserve(requests, cost)
+            if wait_seconds <= 0:
+                break
 
-            bucket_usages = self.increment_usage(
-                redis=redis, current_seconds=current_seconds, requests=requests
-            )
+            elapsed = time.monotonic() - start_time
+            if elapsed + wait_seconds > timeout_seconds:
+                error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in requests)}"
+                logger.error(error_message)
+                raise RateLimiterTimeoutException(error_message)
 
-            breached_requests = [
-                request
-                for index, request in enumerate(requests)
-                if bucket_usages[index] > request.rate_limit
-            ]
+            logger.debug(
+                "Rate limits reached for {}, waiting {:.3f} seconds.",
+                ",".join(str(r) for r in requests),
+                wait_seconds,
+            )
+            time.sleep(wait_seconds)
+            waited_seconds += wait_seconds
 
-            if breached_requests:
-                logger.debug(
-                    "Breached rate limits: {}. Decrementing usage and trying again.",
-                    ",".join(str(r) for r in breached_requests),
-                )
-                self.decrement_usage(
-                    redis=redis, current_seconds=current_seconds, requests=requests
-                )
-                time.sleep(0.1)
-            else:
-                # success
-                return
-
-        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in breached_requests)}"
-        logger.error(error_message)
-        raise RateLimiterTimeoutException(error_message)
+        stats = _current_stats.get()
+        if stats:
+            stats.record(requests, waited_seconds)
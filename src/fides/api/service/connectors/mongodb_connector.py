@@ -15,6 +15,7 @@ from fides.api.schemas.connection_configuration.connection_secrets_mongodb impor
 from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_config import MongoQueryConfig, QueryConfig
 from fides.api.util.collection_util import Row
+from fides.api.util.encryption.secrets_util import SecretsUtil
 from fides.api.util.logger import Pii
 
 
@@ -126,22 +127,23 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         collection_name = node.address.collection
         client = self.client()
         update_ct = 0
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
-                logger.info(
-                    "db.{}.update_one({}, {}, upsert=False)",
-                    collection_name,
-                    Pii(query),
-                    Pii(update),
+        with SecretsUtil.cached_secrets():
+            for row in rows:
+                update_stmt = query_config.generate_update_stmt(
+                    row, policy, privacy_request
                 )
+                if update_stmt is not None:
+                    query, update = update_stmt
+                    db = client[node.address.dataset]
+                    collection = db[collection_name]
+                    update_result = collection.update_one(query, update, upsert=False)
+                    update_ct += update_result.modified_count
+                    logger.info(
+                        "db.{}.update_one({}, {}, upsert=False)",
+                        collection_name,
+                        Pii(query),
+                        Pii(update),
+                    )
 
         return update_ct
 
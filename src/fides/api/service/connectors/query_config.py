@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
@@ -5,7 +6,7 @@ from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 import pydash
 from boto3.dynamodb.types import TypeSerializer
 from loguru import logger
-from sqlalchemy import MetaData, Table, text
+from sqlalchemy import MetaData, Table, bindparam, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Executable, Update  # type: ignore
 from sqlalchemy.sql.elements import ColumnElement, TextClause
@@ -30,11 +31,15 @@ from fides.api.task.refine_target_path import (
     join_detailed_path,
 )
 from fides.api.util.collection_util import Row, append, filter_nonempty_values
+from fides.api.util.encryption.secrets_util import SecretsUtil
 from fides.api.util.logger import Pii
 from fides.api.util.querytoken import QueryToken
 
 T = TypeVar("T")
 
+UpdateBatch = Tuple[Executable, List[Dict[str, Any]]]
+"""An update statement, and the parameters for each row it should be executed with"""
+
 
 class QueryConfig(Generic[T], ABC):
     """A wrapper around a resource-type dependent query object that can generate runnable queries
@@ -123,7 +128,7 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
+    def update_value_map(
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Dict[str, Any]:
         """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
@@ -134,55 +139,83 @@ class QueryConfig(Generic[T], ABC):
         workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
         with null values.
 
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Map the relevant fields to be updated on each of the rows with their masked values,
+        as in update_value_map.
+
+        Values are masked in bulk. For each rule and field, the values on every row are
+        collected and masked with one call to the masking strategy, and the masked values
+        are then scattered back to their rows. Masking secrets are only read once.
         """
         rule_to_collection_field_paths: Dict[
             Rule, List[FieldPath]
         ] = self.build_rule_target_field_paths(policy)
+        field_map: Dict[FieldPath, Field] = self.field_map()
 
-        value_map: Dict[str, Any] = {}
-        for rule, field_paths in rule_to_collection_field_paths.items():
-            strategy_config = rule.masking_strategy
-            if not strategy_config:
-                continue
-            strategy: MaskingStrategy = MaskingStrategy.get_strategy(
-                strategy_config["strategy"], strategy_config["configuration"]
-            )
-            for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+        with SecretsUtil.cached_secrets():
+            for rule, field_paths in rule_to_collection_field_paths.items():
+                strategy_config = rule.masking_strategy
+                if not strategy_config:
+                    continue
+                strategy: MaskingStrategy = MaskingStrategy.get_strategy(
+                    strategy_config["strategy"], strategy_config["configuration"]
+                )
                 null_masking: bool = (
                     strategy_config.get("strategy") == NullMaskingStrategy.name
                 )
-                if not self._supported_data_type(
-                    masking_override, null_masking, strategy
-                ):
-                    logger.warning(
-                        "Unable to generate a query for field {}: data_type is either not present on the field or not supported for the {} masking strategy. Received data type: {}",
-                        rule_field_path.string_path,
-                        strategy_config["strategy"],
-                        masking_override.data_type_converter.name,  # type: ignore
-                    )
-                    continue
-
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
-                    for path in build_refined_target_paths(
-                        row, query_paths={rule_field_path: None}
+                for rule_field_path in field_paths:
+                    field: Field = field_map[rule_field_path]
+                    masking_override = MaskingOverride(
+                        field.data_type_converter, field.length
                     )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
+                    if not self._supported_data_type(
+                        masking_override, null_masking, strategy
+                    ):
+                        logger.warning(
+                            "Unable to generate a query for field {}: data_type is either not present on the field or not supported for the {} masking strategy. Received data type: {}",
+                            rule_field_path.string_path,
+                            strategy_config["strategy"],
+                            masking_override.data_type_converter.name,  # type: ignore
+                        )
+                        continue
+
+                    # The value map and detailed path each value to mask belongs to
+                    targets: List[Tuple[Dict[str, Any], str]] = []
+                    values: List[Any] = []
+                    for row, value_map in zip(rows, value_maps):
+                        for path in build_refined_target_paths(
+                            row, query_paths={rule_field_path: None}
+                        ):
+                            detailed_path: str = join_detailed_path(path)
+                            targets.append((value_map, detailed_path))
+                            values.append(pydash.objects.get(row, detailed_path))
+                    if not values:
+                        continue
+
+                    masked_values: List[Any] = self._generate_masked_values(
                         request_id=request.id,
                         strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
+                        values=values,
                         masking_override=masking_override,
                         null_masking=null_masking,
-                        str_field_path=detailed_path,
+                        str_field_path=rule_field_path.string_path,
                     )
-        return value_map
+                    for (value_map, detailed_path), masked_val in zip(
+                        targets, masked_values
+                    ):
+                        logger.debug(
+                            "Generated the following masked val for field {}: {}",
+                            detailed_path,
+                            masked_val,
+                        )
+                        value_map[detailed_path] = masked_val
+        return value_maps
 
     @staticmethod
     def _supported_data_type(
@@ -200,26 +233,19 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(  # pylint: disable=R0913
         request_id: str,
         strategy: MaskingStrategy,
-        val: Any,
+        values: List[Any],
         masking_override: MaskingOverride,
         null_masking: bool,
         str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
-
-        logger.debug(
-            "Generated the following masked val for field {}: {}",
-            str_field_path,
-            masked_val,
-        )
+    ) -> List[Any]:
+        masked_values: List[Any] = strategy.mask(values, request_id)  # type: ignore
 
         # special case for null masking
         if null_masking:
-            return masked_val
+            return masked_values
 
         if masking_override.length:
             logger.warning(
@@ -227,10 +253,13 @@ class QueryConfig(Generic[T], ABC):
                 str_field_path,
             )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(  # type: ignore
-                masking_override.length, masked_val
-            )
-        return masked_val
+            masked_values = [
+                masking_override.data_type_converter.truncate(  # type: ignore
+                    masking_override.length, masked_val
+                )
+                for masked_val in masked_values
+            ]
+        return masked_values
 
     @abstractmethod
     def generate_query(
@@ -340,6 +369,9 @@ class ManualQueryConfig(QueryConfig[Executable]):
 class SQLQueryConfig(QueryConfig[Executable]):
     """Query config that translates parameters into SQL statements."""
 
+    # The most parameters the datastore accepts in a single query, if limited
+    max_query_parameters: Optional[int] = None
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -411,26 +443,79 @@ class SQLQueryConfig(QueryConfig[Executable]):
         )
         return None
 
+    def generate_query_chunks(
+        self,
+        input_data: Dict[str, List[Any]],
+        policy: Optional[Policy] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[TextClause]:
+        """Generate retrieval queries that each bind at most chunk_size input values.
+
+        Small inputs produce the same single query as generate_query. Larger inputs are
+        split across several queries, whose results together match that query. The
+        chunk size is also capped by the number of parameters the datastore accepts.
+        """
+        max_values: Optional[int] = min(
+            filter(None, [chunk_size, self.max_query_parameters]), default=None
+        )
+        values: List[Tuple[str, Any]] = [
+            (string_path, value)
+            for string_path, data in self.node.typed_filtered_values(input_data).items()
+            for value in dict.fromkeys(data)
+        ]
+        if not max_values or len(values) <= max_values:
+            query = self.generate_query(input_data, policy)
+            return [query] if query is not None else []
+
+        queries: List[TextClause] = []
+        for start in range(0, len(values), max_values):
+            chunk_input: Dict[str, List[Any]] = {}
+            for string_path, value in values[start : start + max_values]:
+                append(chunk_input, string_path, value)
+            query = self.generate_query(chunk_input, policy)
+            if query is not None:
+                queries.append(query)
+        logger.info(
+            "Split the query for {} into {} chunks of up to {} values",
+            self.node.address,
+            len(queries),
+            max_values,
+        )
+        return queries
+
     def format_key_map_for_update_stmt(self, fields: List[str]) -> List[str]:
         """Adds the appropriate formatting for update statements in this datastore."""
         fields.sort()
         return [f"{k} = :{k}" for k in fields]
 
-    def generate_update_stmt(
+    def update_and_primary_key_maps(
         self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Optional[TextClause]:
-        """Returns an update statement in generic SQL dialect."""
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the masked values to set on the row, and the non-empty primary key
+        values that identify the row."""
         update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        update_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(update_value_map.keys())
-        )
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
+        return update_value_map, self.non_empty_primary_keys(row)
+
+    def non_empty_primary_keys(self, row: Row) -> Dict[str, Any]:
+        """Returns the non-empty primary key values that identify the row."""
+        return filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
                 for fpath, fld in self.primary_key_field_paths.items()
                 if fpath.string_path in row
             }
         )
+
+    def generate_update_stmt(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[TextClause]:
+        """Returns an update statement in generic SQL dialect."""
+        update_value_map, non_empty_primary_keys = self.update_and_primary_key_maps(
+            row, policy, request
+        )
+        update_clauses: list[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
+        )
         pk_clauses: list[str] = self.format_key_map_for_update_stmt(
             list(non_empty_primary_keys.keys())
         )
@@ -453,6 +538,76 @@ class SQLQueryConfig(QueryConfig[Executable]):
         logger.info("query = {}, params = {}", Pii(query_str), Pii(update_value_map))
         return text(query_str).params(update_value_map)
 
+    def generate_batched_update_stmt(
+        self, update_fields: List[str], pk_fields: List[str], client: Optional[Engine]
+    ) -> Executable:
+        """Returns an update statement, without bound values, that sets the update fields
+        on the row identified by the primary key fields. It is executed once for each
+        row in a batch."""
+        return text(
+            self.get_formatted_update_stmt(
+                self.format_key_map_for_update_stmt(update_fields),
+                self.format_key_map_for_update_stmt(pk_fields),
+            )
+        )
+
+    def format_batched_update_params(
+        self, update_value_map: Dict[str, Any], non_empty_primary_keys: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Returns the parameters to execute a batched update statement with for a
+        single row."""
+        return {**update_value_map, **non_empty_primary_keys}
+
+    def generate_update_batches(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        batch_size: int,
+        client: Optional[Engine] = None,
+    ) -> List[UpdateBatch]:
+        """Returns the update statements to mask the given rows, each with a batch of
+        up to batch_size sets of parameters.
+
+        Rows that mask the same fields share an update statement, so they can be
+        updated together with an executemany. Rows without enough data to build an
+        update statement are skipped.
+        """
+        params_by_fields: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[Row]] = {}
+        update_value_maps: List[Dict[str, Any]] = self.update_value_maps(
+            rows, policy, request
+        )
+        for row, update_value_map in zip(rows, update_value_maps):
+            non_empty_primary_keys: Dict[str, Any] = self.non_empty_primary_keys(row)
+            if not update_value_map or not non_empty_primary_keys:
+                logger.warning(
+                    "There is not enough data to generate a valid update statement for {}",
+                    self.node.address,
+                )
+                continue
+            fields = (
+                tuple(sorted(update_value_map)),
+                tuple(sorted(non_empty_primary_keys)),
+            )
+            params_by_fields.setdefault(fields, []).append(
+                self.format_batched_update_params(
+                    update_value_map, non_empty_primary_keys
+                )
+            )
+
+        batches: List[UpdateBatch] = []
+        for (update_fields, pk_fields), params in params_by_fields.items():
+            update_stmt = self.generate_batched_update_stmt(
+                list(update_fields), list(pk_fields), client
+            )
+            for start in range(0, len(params), batch_size):
+                batch = params[start : start + batch_size]
+                logger.info(
+                    "query = {}, params = {}", Pii(str(update_stmt)), Pii(batch)
+                )
+                batches.append((update_stmt, batch))
+        return batches
+
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
 
@@ -532,14 +687,11 @@ class QueryStringWithoutTuplesOverrideQueryConfig(SQLQueryConfig):
                     )
                     query_data[string_path] = data.pop()
                 elif len(data) > 1:
-                    data_vals = list(data)
                     query_data_keys: List[str] = []
-                    for val in data_vals:
+                    for index, val in enumerate(data):
                         # appending "_in_stmt_generated_" (can be any arbitrary str) so that this name has less change of conflicting with pre-existing column in table
                         query_data_name = (
-                            string_path
-                            + "_in_stmt_generated_"
-                            + str(data_vals.index(val))
+                            string_path + "_in_stmt_generated_" + str(index)
                         )
                         query_data[query_data_name] = val
                         query_data_keys.append(":" + query_data_name)
@@ -563,6 +715,9 @@ class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig)
     Generates SQL valid for SQLServer.
     """
 
+    # SQL Server accepts at most 2100 parameters, leave headroom for other clauses
+    max_query_parameters = 2000
+
 
 class SnowflakeQueryConfig(SQLQueryConfig):
     """Generates SQL in Snowflake's custom dialect."""
@@ -626,6 +781,10 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
     Generates SQL valid for BigQuery
     """
 
+    def __init__(self, node: TraversalNode):
+        super().__init__(node)
+        self.table: Optional[Table] = None
+
     def get_formatted_query_string(
         self,
         field_list: str,
@@ -635,6 +794,15 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         BigQuery reserved words."""
         return f'SELECT {field_list} FROM `{self.node.node.collection.name}` WHERE {" OR ".join(clauses)}'
 
+    def get_table(self, client: Engine) -> Table:
+        """Returns the reflected table for this collection, which is only loaded once
+        per query config."""
+        if self.table is None:
+            self.table = Table(
+                self.node.address.collection, MetaData(bind=client), autoload=True
+            )
+        return self.table
+
     def generate_update(
         self, row: Row, policy: Policy, request: PrivacyRequest, client: Engine
     ) -> Optional[Update]:
@@ -642,13 +810,8 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
         Returns a SQLAlchemy Update object. Does not actually execute the update object.
         """
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
-            {
-                fpath.string_path: fld.cast(row[fpath.string_path])
-                for fpath, fld in self.primary_key_field_paths.items()
-                if fpath.string_path in row
-            }
+        update_value_map, non_empty_primary_keys = self.update_and_primary_key_maps(
+            row, policy, request
         )
 
         valid = len(non_empty_primary_keys) > 0 and update_value_map
@@ -659,14 +822,41 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
             )
             return None
 
-        table = Table(
-            self.node.address.collection, MetaData(bind=client), autoload=True
-        )
+        table = self.get_table(client)
         pk_clauses: List[ColumnElement] = [
             getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
         ]
         return table.update().where(*pk_clauses).values(**update_value_map)
 
+    def generate_batched_update_stmt(
+        self, update_fields: List[str], pk_fields: List[str], client: Optional[Engine]
+    ) -> Update:
+        """
+        Returns a SQLAlchemy Update object with the update and primary key fields as
+        bind parameters, which take their types from the reflected table.
+        """
+        if client is None:
+            raise ValueError("A client is required to build BigQuery update statements")
+        table = self.get_table(client)
+        pk_clauses: List[ColumnElement] = [
+            getattr(table.c, k) == bindparam(f"pk_{k}") for k in pk_fields
+        ]
+        return (
+            table.update()
+            .where(*pk_clauses)
+            .values(**{k: bindparam(f"set_{k}") for k in update_fields})
+        )
+
+    def format_batched_update_params(
+        self, update_value_map: Dict[str, Any], non_empty_primary_keys: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Prefixes the parameters, as SQLAlchemy reserves column names as bind
+        parameter names in update statements."""
+        return {
+            **{f"set_{k}": v for k, v in update_value_map.items()},
+            **{f"pk_{k}": v for k, v in non_empty_primary_keys.items()},
+        }
+
 
 MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
 """A mongo query is expressed in the form of 2 dicts, the first of which represents
@@ -4,12 +4,15 @@ import email
 import re
 import time
 from functools import wraps
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
 from time import sleep
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 from urllib.parse import urlparse
 
 from loguru import logger
 from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import HTTPAdapter
 
 from fides.api.common_exceptions import (
     ClientUnsuccessfulException,
@@ -29,6 +32,27 @@ if TYPE_CHECKING:
     from fides.api.schemas.limiter.rate_limit_config import RateLimitConfig
     from fides.api.schemas.saas.saas_config import ClientConfig
     from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
+    from fides.api.service.authentication.authentication_strategy import (
+        AuthenticationStrategy,
+    )
+
+
+def create_pooled_session(pool_size: int) -> Session:
+    """
+    Returns a Session that keeps up to pool_size connections per host alive,
+    so that TCP and TLS connections are reused across requests. The session
+    doesn't keep cookies.
+    """
+    session = Session()
+    # The session is shared by the requests for every identity and privacy request
+    # the connector handles, so cookies set by one response must not be sent with
+    # another; requests authenticate with their own credentials instead
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # Retries are handled by AuthenticatedClient.send
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class AuthenticatedClient:
@@ -43,12 +67,17 @@ class AuthenticatedClient:
         configuration: ConnectionConfig,
         client_config: ClientConfig,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        session: Optional[Session] = None,
     ):
-        self.session = Session()
+        self.session = session or Session()
         self.uri = uri
         self.configuration = configuration
         self.client_config = client_config
         self.rate_limit_config = rate_limit_config
+        self.auth_strategy: Optional[AuthenticationStrategy] = None
+        # Requests may be sent concurrently, but authentication can refresh and
+        # store tokens, so it is applied to one request at a time
+        self.auth_lock = Lock()
 
     def get_authenticated_request(
         self, request_params: SaaSRequestParams
@@ -70,13 +99,15 @@ class AuthenticatedClient:
             data=request_params.body,
         ).prepare()
 
-        # add authentication if provided
+        # add authentication if provided, reusing the strategy across requests
         if self.client_config.authentication:
-            auth_strategy = AuthenticationStrategy.get_strategy(
-                self.client_config.authentication.strategy,
-                self.client_config.authentication.configuration,
-            )
-            return auth_strategy.add_authentication(req, self.configuration)
+            with self.auth_lock:
+                if not self.auth_strategy:
+                    self.auth_strategy = AuthenticationStrategy.get_strategy(
+                        self.client_config.authentication.strategy,
+                        self.client_config.authentication.configuration,
+                    )
+                return self.auth_strategy.add_authentication(req, self.configuration)
 
         # otherwise just return the prepared request
         return req
@@ -159,6 +190,7 @@ class AuthenticatedClient:
                 key=rate_limit.custom_key or self.configuration.key,
                 rate_limit=rate_limit.rate,
                 period=RateLimiterPeriod[rate_limit.period.name.upper()],
+                burst=rate_limit.burst,
             )
             for rate_limit in (self.rate_limit_config.limits or [])
         ]
@@ -1,7 +1,7 @@
 # pylint: disable=protected-access
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, List, Optional, Type
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Type
 from zipfile import ZipFile
 
 from fideslang.models import Dataset
@@ -23,14 +23,19 @@ from fides.api.models.datasetconfig import DatasetConfig
 from fides.api.schemas.connection_configuration.saas_config_template_values import (
     SaasConnectionTemplateValues,
 )
-from fides.api.schemas.saas.connector_template import ConnectorTemplate
+from fides.api.schemas.saas.connector_template import (
+    ConnectorTemplate,
+    ConnectorTemplateSummary,
+)
 from fides.api.schemas.saas.saas_config import SaaSConfig
-from fides.api.service.authentication.authentication_strategy_oauth2_authorization_code import (
-    OAuth2AuthorizationCodeAuthenticationStrategy,
+from fides.api.service.connectors.saas.connector_template_cache import (
+    ConnectorTemplateCache,
+    LazyConnectorTemplates,
+    get_template_digest,
+    summarize_saas_config,
 )
 from fides.api.util.saas_util import (
     encode_file_contents,
-    load_config,
     load_config_from_string,
     load_dataset_from_string,
     load_yaml_as_string,
@@ -43,18 +48,28 @@ from fides.api.util.unsafe_file_util import verify_svg, verify_zip
 
 class ConnectorTemplateLoader(ABC):
     _instance: Optional["ConnectorTemplateLoader"] = None
+    _templates: Mapping[str, ConnectorTemplate]
+    _summaries: Dict[str, ConnectorTemplateSummary]
 
     def __new__(cls: Type["ConnectorTemplateLoader"]) -> "ConnectorTemplateLoader":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._templates = {}  # type: ignore[attr-defined]
+            cls._instance._templates = {}
+            cls._instance._summaries = {}
             cls._instance._load_connector_templates()
         return cls._instance
 
     @classmethod
-    def get_connector_templates(cls) -> Dict[str, ConnectorTemplate]:
+    def get_connector_templates(cls) -> Mapping[str, ConnectorTemplate]:
         """Returns a map of connection templates."""
-        return cls()._instance._templates  # type: ignore[attr-defined, union-attr]
+        return cls()._templates
+
+    @classmethod
+    def get_connector_template_summaries(
+        cls,
+    ) -> Dict[str, ConnectorTemplateSummary]:
+        """Returns a map of the summaries of the connection templates."""
+        return cls()._summaries
 
     @abstractmethod
     def _load_connector_templates(self) -> None:
@@ -64,48 +79,101 @@ class ConnectorTemplateLoader(ABC):
 class FileConnectorTemplateLoader(ConnectorTemplateLoader):
     """
     Loads SaaS connector templates from the data/saas directory.
+
+    Templates are compiled into summaries, which are cached on disk, and their config,
+    dataset and icon are only read once they're used, see `connector_template_cache`.
     """
 
     def _load_connector_templates(self) -> None:
         logger.info("Loading connectors templates from the data/saas directory")
-        for file in os.listdir("data/saas/config"):
-            if file.endswith(".yml"):
-                config_file = os.path.join("data/saas/config", file)
-                config_dict = load_config(config_file)
-                connector_type = config_dict["type"]
-                human_readable = config_dict["name"]
-                user_guide = config_dict.get("user_guide")
-                authentication = config_dict["client_config"].get("authentication")
-                authorization_required = (
-                    authentication is not None
-                    and authentication.get("strategy")
-                    == OAuth2AuthorizationCodeAuthenticationStrategy.name
-                )
-
+        templates = LazyConnectorTemplates()
+        self._templates = templates
+        cache = ConnectorTemplateCache.load()
+        file_names = sorted(
+            file for file in os.listdir("data/saas/config") if file.endswith(".yml")
+        )
+        for file in file_names:
+            config_file = os.path.join("data/saas/config", file)
+            config = load_yaml_as_string(config_file)
+            summary: Optional[ConnectorTemplateSummary] = None
+            template: Optional[ConnectorTemplate] = None
+
+            cached = cache.get(file)
+            if cached:
                 try:
-                    icon = encode_file_contents(f"data/saas/icon/{connector_type}.svg")
-                except FileNotFoundError:
-                    logger.debug(
-                        f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
+                    dataset = load_yaml_as_string(
+                        _get_dataset_file(cached.summary.type)
                     )
-                    icon = encode_file_contents("data/saas/icon/default.svg")
+                except FileNotFoundError:
+                    dataset = ""
+                if get_template_digest(config, dataset) == cached.digest:
+                    summary = cached.summary
 
-                # store connector template for retrieval
+            if summary is None:
                 try:
-                    FileConnectorTemplateLoader.get_connector_templates()[
-                        connector_type
-                    ] = ConnectorTemplate(
-                        config=load_yaml_as_string(config_file),
-                        dataset=load_yaml_as_string(
-                            f"data/saas/dataset/{connector_type}_dataset.yml"
-                        ),
-                        icon=icon,
-                        human_readable=human_readable,
-                        authorization_required=authorization_required,
-                        user_guide=user_guide,
+                    summary = summarize_saas_config(
+                        SaaSConfig(**load_config_from_string(config))
+                    )
+                    dataset = load_yaml_as_string(_get_dataset_file(summary.type))
+                    # store connector template for retrieval
+                    template = ConnectorTemplate(
+                        config=config,
+                        dataset=dataset,
+                        icon=_load_icon(summary.type),
+                        human_readable=summary.human_readable,
+                        authorization_required=summary.authorization_required,
+                        user_guide=summary.user_guide,
                     )
                 except Exception:
-                    logger.exception("Unable to load {} connector", connector_type)
+                    logger.exception("Unable to load {} connector", file)
+                    continue
+                digest = get_template_digest(config, dataset)
+                cache.set(file, digest, summary)
+
+            self._summaries[summary.type] = summary
+            templates.add(
+                summary.type,
+                _file_template_loader(config_file, summary),
+                template,
+            )
+
+        cache.retain(file_names)
+        cache.save()
+
+
+def _get_dataset_file(connector_type: str) -> str:
+    return f"data/saas/dataset/{connector_type}_dataset.yml"
+
+
+def _load_icon(connector_type: str) -> str:
+    try:
+        return encode_file_contents(f"data/saas/icon/{connector_type}.svg")
+    except FileNotFoundError:
+        logger.debug(
+            f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
+        )
+        return encode_file_contents("data/saas/icon/default.svg")
+
+
+def _file_template_loader(
+    config_file: str, summary: ConnectorTemplateSummary
+) -> Callable[[], ConnectorTemplate]:
+    """
+    Loads the template of a summary, validating it even if its summary was cached,
+    since the template that's served is read from disk again.
+    """
+
+    def load() -> ConnectorTemplate:
+        return ConnectorTemplate(
+            config=load_yaml_as_string(config_file),
+            dataset=load_yaml_as_string(_get_dataset_file(summary.type)),
+            icon=_load_icon(summary.type),
+            human_readable=summary.human_readable,
+            authorization_required=summary.authorization_required,
+            user_guide=summary.user_guide,
+        )
+
+    return load
 
 
 class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
@@ -113,6 +181,8 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
     Loads custom connector templates defined in the custom_connector_template database table.
     """
 
+    _templates: Dict[str, ConnectorTemplate]
+
     def _load_connector_templates(self) -> None:
         logger.info("Loading connectors templates from the database.")
         db = get_api_session()
@@ -137,16 +207,15 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
         Check the connector templates in the FileConnectorTemplateLoader and return if a newer version is available.
         """
         replacement_connector = (
-            FileConnectorTemplateLoader.get_connector_templates().get(template.key)
+            FileConnectorTemplateLoader.get_connector_template_summaries().get(
+                template.key
+            )
         )
         if not replacement_connector:
             return False
 
         custom_saas_config = SaaSConfig(**load_config_from_string(template.config))
-        replacement_saas_config = SaaSConfig(
-            **load_config_from_string(replacement_connector.config)
-        )
-        return parse_version(replacement_saas_config.version) > parse_version(
+        return parse_version(replacement_connector.version) > parse_version(
             custom_saas_config.version
         )
 
@@ -160,27 +229,23 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
         and adding it to the loader's template dictionary.
         """
 
-        config = SaaSConfig(**load_config_from_string(template.config))
-        authentication = config.client_config.authentication
-        authorization_required = (
-            authentication is not None
-            and authentication.strategy
-            == OAuth2AuthorizationCodeAuthenticationStrategy.name
-        )
+        summary = summarize_saas_config(
+            SaaSConfig(**load_config_from_string(template.config))
+        ).copy(update={"human_readable": template.name})
 
         connector_template = ConnectorTemplate(
             config=template.config,
             dataset=template.dataset,
             icon=template.icon,
-            human_readable=template.name,
-            authorization_required=authorization_required,
-            user_guide=config.user_guide,
+            human_readable=summary.human_readable,
+            authorization_required=summary.authorization_required,
+            user_guide=summary.user_guide,
         )
 
         # register the template in the loader's template dictionary
-        CustomConnectorTemplateLoader.get_connector_templates()[
-            template.key
-        ] = connector_template
+        loader = CustomConnectorTemplateLoader()
+        loader._templates[template.key] = connector_template
+        loader._summaries[template.key] = summary
 
     # pylint: disable=too-many-branches
     @classmethod
@@ -249,16 +314,13 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
         # removed once a newer version is bundled with Fides
         if replaceable:
             existing_connector = (
-                FileConnectorTemplateLoader.get_connector_templates().get(
+                FileConnectorTemplateLoader.get_connector_template_summaries().get(
                     connector_type
                 )
             )
             if existing_connector:
-                existing_config = SaaSConfig(
-                    **load_config_from_string(existing_connector.config)
-                )
                 config_contents = replace_version(
-                    config_contents, existing_config.version
+                    config_contents, existing_connector.version
                 )
 
         template = CustomConnectorTemplate(
@@ -289,29 +351,41 @@ class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
 
 
 class ConnectorRegistry:
-    @classmethod
-    def _get_combined_templates(cls) -> Dict[str, ConnectorTemplate]:
-        """
-        Returns a combined map of connector templates from all registered loaders.
-        The resulting map is an aggregation of templates from the file loader and the custom loader,
-        with custom loader templates taking precedence in case of conflicts.
-        """
-        return {
-            **FileConnectorTemplateLoader.get_connector_templates(),  # type: ignore
-            **CustomConnectorTemplateLoader.get_connector_templates(),  # type: ignore
-        }
-
     @classmethod
     def connector_types(cls) -> List[str]:
         """List of registered SaaS connector types"""
-        return list(cls._get_combined_templates().keys())
+        return list(
+            dict.fromkeys(
+                [
+                    *FileConnectorTemplateLoader.get_connector_templates(),
+                    *CustomConnectorTemplateLoader.get_connector_templates(),
+                ]
+            )
+        )
 
     @classmethod
     def get_connector_template(cls, connector_type: str) -> Optional[ConnectorTemplate]:
         """
-        Returns an object containing the various SaaS connector artifacts
+        Returns an object containing the various SaaS connector artifacts,
+        with custom loader templates taking precedence in case of conflicts
         """
-        return cls._get_combined_templates().get(connector_type)
+        return CustomConnectorTemplateLoader.get_connector_templates().get(
+            connector_type
+        ) or FileConnectorTemplateLoader.get_connector_templates().get(connector_type)
+
+    @classmethod
+    def get_connector_template_summary(
+        cls, connector_type: str
+    ) -> Optional[ConnectorTemplateSummary]:
+        """
+        Returns what a SaaS connector is and supports, without loading its artifacts,
+        with custom loader templates taking precedence in case of conflicts
+        """
+        return CustomConnectorTemplateLoader.get_connector_template_summaries().get(
+            connector_type
+        ) or FileConnectorTemplateLoader.get_connector_template_summaries().get(
+            connector_type
+        )
 
 
 def create_connection_config_from_template_no_save(
@@ -387,11 +461,10 @@ def update_saas_configs(db: Session) -> None:
             "Determining if any updates are needed for connectors of type {} based on templates...",
             connector_type,
         )
-        template: ConnectorTemplate = ConnectorRegistry.get_connector_template(  # type: ignore
+        summary: ConnectorTemplateSummary = ConnectorRegistry.get_connector_template_summary(  # type: ignore
             connector_type
         )
-        saas_config = SaaSConfig(**load_config_from_string(template.config))
-        template_version: Version = parse_version(saas_config.version)
+        template_version: Version = parse_version(summary.version)
 
         connection_configs: Iterable[ConnectionConfig] = ConnectionConfig.filter(
             db=db,
@@ -411,7 +484,7 @@ def update_saas_configs(db: Session) -> None:
                     update_saas_instance(
                         db,
                         connection_config,
-                        template,
+                        ConnectorRegistry.get_connector_template(connector_type),  # type: ignore[arg-type]
                         saas_config_instance,
                     )
                 except Exception:
@@ -0,0 +1,236 @@
+"""
+Compiled SaaS connector templates.
+
+Parsing and validating a template's config and dataset is most of the cost of loading
+the templates in data/saas. Each template is compiled once into a
+ConnectorTemplateSummary, its name, version and capabilities: the actions it
+supports, the identities it uses and its connector params. Templates are listed and
+filtered by their summaries, and a template's config, dataset and icon are only read
+once the template itself is used.
+
+Summaries of the file templates are kept in an on-disk cache in
+`execution.saas_template_cache_directory`, keyed by the SHA-256 digest of each
+template's config and dataset, so a cold start doesn't parse and validate the
+templates that haven't changed. The cache is dropped whenever the Fides version
+changes, since validation may have changed with it. Summaries decide which templates
+are offered and replaced, so the cache is only used from a directory no other user
+can write to. A template itself is always validated when it's loaded.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional
+
+from loguru import logger
+from pydantic import ValidationError as PydanticValidationError
+
+from fides import __version__ as fides_version
+from fides.api.schemas.policy import ActionType
+from fides.api.schemas.saas.connector_template import (
+    ConnectorTemplate,
+    ConnectorTemplateSummary,
+)
+from fides.api.schemas.saas.saas_config import SaaSConfig, SaaSRequest
+from fides.api.service.authentication.authentication_strategy_oauth2_authorization_code import (
+    OAuth2AuthorizationCodeAuthenticationStrategy,
+)
+from fides.api.util.storage_util import ensure_private_directory
+from fides.config import CONFIG
+
+TEMPLATE_CACHE_DIRECTORY_NAME = "fides_saas_connector_templates"
+TEMPLATE_CACHE_FILE_NAME = "fides_saas_connector_templates.json"
+
+
+def _get_saas_requests(saas_config: SaaSConfig) -> Iterator[SaaSRequest]:
+    """Every request the config defines"""
+    yield saas_config.test_request
+    for endpoint in saas_config.endpoints:
+        read = endpoint.requests.read
+        yield from read if isinstance(read, list) else [read]
+        if endpoint.requests.update:
+            yield endpoint.requests.update
+        if endpoint.requests.delete:
+            yield endpoint.requests.delete
+    if saas_config.data_protection_request:
+        yield saas_config.data_protection_request
+    if saas_config.consent_requests:
+        yield from saas_config.consent_requests.opt_in  # type: ignore[misc]
+        yield from saas_config.consent_requests.opt_out  # type: ignore[misc]
+
+
+def summarize_saas_config(saas_config: SaaSConfig) -> ConnectorTemplateSummary:
+    """Compiles the summary of a connector template from its config"""
+    requests = [endpoint.requests for endpoint in saas_config.endpoints]
+    supported_actions: List[ActionType] = []
+    if any(request.read for request in requests):
+        supported_actions.append(ActionType.access)
+    if saas_config.data_protection_request or any(
+        request.update or request.delete for request in requests
+    ):
+        supported_actions.append(ActionType.erasure)
+    if saas_config.consent_requests:
+        supported_actions.append(ActionType.consent)
+
+    authentication = saas_config.client_config.authentication
+    return ConnectorTemplateSummary(
+        type=saas_config.type,
+        human_readable=saas_config.name,
+        version=saas_config.version,
+        authorization_required=authentication is not None
+        and authentication.strategy
+        == OAuth2AuthorizationCodeAuthenticationStrategy.name,
+        user_guide=saas_config.user_guide,
+        supported_actions=supported_actions,
+        identities=sorted(
+            {
+                param_value.identity
+                for request in _get_saas_requests(saas_config)
+                for param_value in request.param_values or []
+                if param_value.identity
+            }
+        ),
+        connector_params=[
+            connector_param.name for connector_param in saas_config.connector_params
+        ],
+    )
+
+
+def get_template_digest(config: str, dataset: str) -> str:
+    """The digest the summary of a template with the config and dataset is cached by"""
+    digest = hashlib.sha256(config.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(dataset.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LazyConnectorTemplates(Mapping[str, ConnectorTemplate]):
+    """Connector templates by type, each loaded the first time it's used"""
+
+    def __init__(self) -> None:
+        self._loaders: Dict[str, Callable[[], ConnectorTemplate]] = {}
+        self._templates: Dict[str, ConnectorTemplate] = {}
+
+    def add(
+        self,
+        connector_type: str,
+        loader: Callable[[], ConnectorTemplate],
+        template: Optional[ConnectorTemplate] = None,
+    ) -> None:
+        """Adds a template, with the template itself if it's already loaded"""
+        self._loaders[connector_type] = loader
+        self._templates.pop(connector_type, None)
+        if template is not None:
+            self._templates[connector_type] = template
+
+    def __getitem__(self, connector_type: str) -> ConnectorTemplate:
+        template: Optional[ConnectorTemplate] = self._templates.get(connector_type)
+        if template is None:
+            template = self._loaders[connector_type]()
+            self._templates[connector_type] = template
+        return template
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+
+class CachedSummary(NamedTuple):
+    digest: str
+    summary: ConnectorTemplateSummary
+
+
+class ConnectorTemplateCache:
+    """
+    The on-disk cache of the summaries of the file templates, by file name. A cache
+    without a path isn't read or written.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        self.summaries: Dict[str, CachedSummary] = {}
+        self.changed = False
+
+    @classmethod
+    def load(cls) -> ConnectorTemplateCache:
+        """Loads the cache, or starts an empty one if it's missing or out of date"""
+        try:
+            directory: str = ensure_private_directory(
+                CONFIG.execution.saas_template_cache_directory
+                or os.path.join(tempfile.gettempdir(), TEMPLATE_CACHE_DIRECTORY_NAME)
+            )
+        except OSError as exc:
+            logger.warning(
+                "Not caching the connector templates, the cache directory can't be used: {}",
+                exc,
+            )
+            return cls(None)
+
+        path: str = os.path.join(directory, TEMPLATE_CACHE_FILE_NAME)
+        cache = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                contents = json.load(file)
+            if contents.get("fides_version") == fides_version:
+                cache.summaries = {
+                    file_name: CachedSummary(
+                        cached["digest"],
+                        ConnectorTemplateSummary.parse_obj(cached["summary"]),
+                    )
+                    for file_name, cached in contents["templates"].items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, PydanticValidationError) as exc:
+            logger.warning(
+                "Unable to read the connector template cache {}: {}", path, exc
+            )
+        return cache
+
+    def get(self, file_name: str) -> Optional[CachedSummary]:
+        return self.summaries.get(file_name)
+
+    def set(
+        self, file_name: str, digest: str, summary: ConnectorTemplateSummary
+    ) -> None:
+        self.summaries[file_name] = CachedSummary(digest, summary)
+        self.changed = True
+
+    def retain(self, file_names: List[str]) -> None:
+        """Drops the summaries of templates that no longer exist"""
+        for file_name in set(self.summaries) - set(file_names):
+            del self.summaries[file_name]
+            self.changed = True
+
+    def save(self) -> None:
+        """Writes the cache if it changed, replacing the previous cache atomically"""
+        if not self.path or not self.changed:
+            return
+        contents = {
+            "fides_version": fides_version,
+            "templates": {
+                file_name: {
+                    "digest": cached.digest,
+                    "summary": json.loads(cached.summary.json()),
+                }
+                for file_name, cached in self.summaries.items()
+            },
+        }
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=directory, delete=False
+            ) as file:
+                json.dump(contents, file)
+            os.replace(file.name, self.path)
+            self.changed = False
+        except OSError as exc:
+            # The templates are compiled again on the next start
+            logger.warning(
+                "Unable to write the connector template cache {}: {}", self.path, exc
+            )
@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from json import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 import pydash
 from loguru import logger
 from requests import Response
+from requests import Session as HTTPSession
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import (
@@ -24,7 +28,10 @@ from fides.api.schemas.saas.saas_config import (
 )
 from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
 from fides.api.service.connectors.base_connector import BaseConnector
-from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
+from fides.api.service.connectors.saas.authenticated_client import (
+    AuthenticatedClient,
+    create_pooled_session,
+)
 from fides.api.service.connectors.saas_query_config import SaaSQueryConfig
 from fides.api.service.pagination.pagination_strategy import PaginationStrategy
 from fides.api.service.processors.post_processor_strategy.post_processor_strategy import (
@@ -40,14 +47,29 @@ from fides.api.util.consent_util import (
     cache_initial_status_and_identities_for_consent_reporting,
     should_opt_in_to_service,
 )
+from fides.api.util.encryption.secrets_util import SecretsUtil
 from fides.api.util.saas_util import (
     CUSTOM_PRIVACY_REQUEST_FIELDS,
     assign_placeholders,
     map_param_values,
 )
+from fides.config import CONFIG
+
+T = TypeVar("T")
+
 
+def in_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wraps the function to run in a copy of the current context, so threads it's
+    submitted to record their rate limiter stats against the current node
+    """
+    context = copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
 
-class SaaSConnector(BaseConnector[AuthenticatedClient]):
+
+class SaaSConnector(
+    BaseConnector[AuthenticatedClient]
+):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """A connector type to integrate with third-party SaaS APIs"""
 
     def __init__(self, configuration: ConnectionConfig):
@@ -60,6 +82,10 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         self.current_collection_name: Optional[str] = None
         self.current_privacy_request: Optional[PrivacyRequest] = None
         self.current_saas_request: Optional[SaaSRequest] = None
+        # Pooled session and clients, reused by every request made through this connector
+        self.http_session: Optional[HTTPSession] = None
+        self.clients: Dict[Tuple[str, str, Optional[str]], AuthenticatedClient] = {}
+        self.clients_lock = Lock()
 
     def query_config(self, node: TraversalNode) -> SaaSQueryConfig:
         """
@@ -145,15 +171,39 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         return f"{client_config.protocol}://{assign_placeholders(host, self.secrets)}"
 
     def create_client(self) -> AuthenticatedClient:
-        """Creates an authenticated request builder"""
+        """
+        Returns an authenticated request builder for the current request's client
+        and rate limit config.
+
+        Clients are reused for the lifetime of the connector, and share a pooled
+        session so that connections are kept alive across requests and pages.
+        """
         uri = self.build_uri()
         client_config = self.get_client_config()
         rate_limit_config = self.get_rate_limit_config()
 
-        logger.info("Creating client to {}", uri)
-        return AuthenticatedClient(
-            uri, self.configuration, client_config, rate_limit_config
+        client_key = (
+            uri,
+            client_config.json(),
+            rate_limit_config.json() if rate_limit_config else None,
         )
+        with self.clients_lock:
+            client = self.clients.get(client_key)
+            if client is None:
+                if self.http_session is None:
+                    self.http_session = create_pooled_session(
+                        CONFIG.execution.saas_http_pool_size
+                    )
+                logger.info("Creating client to {}", uri)
+                client = AuthenticatedClient(
+                    uri,
+                    self.configuration,
+                    client_config,
+                    rate_limit_config,
+                    session=self.http_session,
+                )
+                self.clients[client_key] = client
+            return client
 
     def retrieve_data(
         self,
@@ -225,17 +275,16 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 input_data, policy, read_request
             )
 
-            # Iterates through initial list of prepared requests and through subsequent
+            # Executes the initial list of prepared requests and the subsequent
             # requests generated by pagination. The results are added to the output
-            # list of rows after each request.
-            for next_request in prepared_requests:
-                while next_request:
-                    processed_rows, next_request = self.execute_prepared_request(  # type: ignore
-                        next_request,
-                        privacy_request.get_cached_identity_data(),
-                        read_request,
-                    )
-                    rows.extend(processed_rows)
+            # list of rows in the order of the prepared requests and their pages.
+            rows.extend(
+                self.execute_prepared_requests(
+                    prepared_requests,
+                    privacy_request.get_cached_identity_data(),
+                    read_request,
+                )
+            )
         self.unset_connector_state()
         return rows
 
@@ -272,6 +321,110 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             )
         return missing_dataset_reference_values
 
+    def execute_prepared_requests(
+        self,
+        prepared_requests: List[SaaSRequestParams],
+        identity_data: Dict[str, Any],
+        saas_request: SaaSRequest,
+    ) -> List[Row]:
+        """
+        Executes the prepared requests and all of their pages, returning the rows in
+        the order of the prepared requests.
+
+        Independent prepared requests run concurrently, up to
+        execution.saas_request_concurrency at a time. Every request still waits on
+        the rate limits of the client it is sent with. Requests that run concurrently
+        don't prefetch their pages, so a collection never has more than
+        saas_request_concurrency requests in flight.
+        """
+        concurrency = min(
+            CONFIG.execution.saas_request_concurrency, len(prepared_requests)
+        )
+        if concurrency <= 1:
+            return [
+                row
+                for prepared_request in prepared_requests
+                for row in self.execute_paginated_request(
+                    prepared_request, identity_data, saas_request
+                )
+            ]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    in_current_context(self.execute_paginated_request),
+                    prepared_request,
+                    identity_data,
+                    saas_request,
+                    prefetch=False,
+                )
+                for prepared_request in prepared_requests
+            ]
+            try:
+                return [row for future in futures for row in future.result()]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def execute_paginated_request(
+        self,
+        prepared_request: SaaSRequestParams,
+        identity_data: Dict[str, Any],
+        saas_request: SaaSRequest,
+        prefetch: bool = True,
+    ) -> List[Row]:
+        """
+        Executes the prepared request and every page that follows it.
+
+        If prefetch is set, execution.saas_prefetch_pages is set and the pagination
+        strategy can build requests ahead of their responses, up to that many pages
+        are requested concurrently with the current page. Prefetched pages past the
+        last page are discarded, including any errors they raised.
+        """
+        strategy = self._get_pagination_strategy(saas_request)
+        prefetch_pages = CONFIG.execution.saas_prefetch_pages if prefetch else 0
+
+        rows: List[Row] = []
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            window = [next_request]
+            if strategy and prefetch_pages:
+                window.extend(
+                    strategy.get_prefetch_requests(
+                        next_request, self.secrets, prefetch_pages
+                    )
+                )
+            if len(window) == 1:
+                processed_rows, next_request = self.execute_prepared_request(
+                    next_request, identity_data, saas_request
+                )
+                rows.extend(processed_rows)
+                continue
+
+            with ThreadPoolExecutor(max_workers=len(window)) as executor:
+                futures = [
+                    executor.submit(
+                        in_current_context(self.send_prepared_request),
+                        request,
+                        saas_request,
+                    )
+                    for request in window
+                ]
+                for request, future in zip(window, futures):
+                    response = future.result()
+                    rows.extend(
+                        self.process_prepared_response(
+                            response, identity_data, saas_request
+                        )
+                    )
+                    next_request = self.get_next_page_request(
+                        request, response, saas_request, strategy
+                    )
+                    if not next_request:
+                        break
+        return rows
+
     def execute_prepared_request(
         self,
         prepared_request: SaaSRequestParams,
@@ -282,10 +435,31 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         Executes the prepared request and handles response postprocessing and pagination.
         Returns processed data and request_params for next page of data if available.
         """
+        response = self.send_prepared_request(prepared_request, saas_request)
+        rows = self.process_prepared_response(response, identity_data, saas_request)
+        next_request = self.get_next_page_request(
+            prepared_request,
+            response,
+            saas_request,
+            self._get_pagination_strategy(saas_request),
+        )
+        return rows, next_request
 
+    def send_prepared_request(
+        self, prepared_request: SaaSRequestParams, saas_request: SaaSRequest
+    ) -> Response:
+        """Sends the prepared request, clearing the response if its error is ignored"""
         client: AuthenticatedClient = self.create_client()
         response: Response = client.send(prepared_request, saas_request.ignore_errors)
-        response = self._handle_errored_response(saas_request, response)
+        return self._handle_errored_response(saas_request, response)
+
+    def process_prepared_response(
+        self,
+        response: Response,
+        identity_data: Dict[str, Any],
+        saas_request: SaaSRequest,
+    ) -> List[Row]:
+        """Unwraps and postprocesses the response to a prepared request"""
         response_data = self._unwrap_response_data(saas_request, response)
 
         # process response and add to rows
@@ -300,26 +474,41 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             len(rows),
             self.current_collection_name,
         )
+        return rows
 
-        # use the pagination strategy (if available) to get the next request
-        next_request = None
-        if saas_request.pagination:
-            strategy: PaginationStrategy = PaginationStrategy.get_strategy(
-                saas_request.pagination.strategy,
-                saas_request.pagination.configuration,
-            )
-            next_request = strategy.get_next_request(
-                prepared_request, self.secrets, response, saas_request.data_path
-            )
-
+    def get_next_page_request(
+        self,
+        prepared_request: SaaSRequestParams,
+        response: Response,
+        saas_request: SaaSRequest,
+        strategy: Optional[PaginationStrategy],
+    ) -> Optional[SaaSRequestParams]:
+        """Uses the pagination strategy (if available) to get the request for the next page"""
+        if not strategy:
+            return None
+
+        next_request = strategy.get_next_request(
+            prepared_request, self.secrets, response, saas_request.data_path
+        )
         if next_request:
             logger.info(
                 "Using '{}' pagination strategy to get next page for '{}'.",
                 saas_request.pagination.strategy,  # type: ignore
                 self.current_collection_name,
             )
+        return next_request
 
-        return rows, next_request
+    @staticmethod
+    def _get_pagination_strategy(
+        saas_request: SaaSRequest,
+    ) -> Optional[PaginationStrategy]:
+        """Returns the pagination strategy configured for the request, if any"""
+        if not saas_request.pagination:
+            return None
+        return PaginationStrategy.get_strategy(
+            saas_request.pagination.strategy,
+            saas_request.pagination.configuration,
+        )
 
     def process_response_data(
         self,
@@ -419,22 +608,23 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
 
         rows_updated = 0
         client = self.create_client()
-        for row in rows:
-            try:
-                prepared_request = query_config.generate_update_stmt(
-                    row, policy, privacy_request
-                )
-            except ValueError as exc:
-                if masking_request.skip_missing_param_values:
-                    logger.info(
-                        "Skipping optional masking request on node {}: {}",
-                        node.address.value,
-                        exc,
+        with SecretsUtil.cached_secrets():
+            for row in rows:
+                try:
+                    prepared_request = query_config.generate_update_stmt(
+                        row, policy, privacy_request
                     )
-                    continue
-                raise exc
-            client.send(prepared_request, masking_request.ignore_errors)
-            rows_updated += 1
+                except ValueError as exc:
+                    if masking_request.skip_missing_param_values:
+                        logger.info(
+                            "Skipping optional masking request on node {}: {}",
+                            node.address.value,
+                            exc,
+                        )
+                        continue
+                    raise exc
+                client.send(prepared_request, masking_request.ignore_errors)
+                rows_updated += 1
 
         self.unset_connector_state()
         return rows_updated
@@ -550,7 +740,11 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         return True
 
     def close(self) -> None:
-        """Not required for this type"""
+        """Closes the pooled session and its connections"""
+        self.clients = {}
+        if self.http_session:
+            self.http_session.close()
+            self.http_session = None
 
     @staticmethod
     def _handle_errored_response(
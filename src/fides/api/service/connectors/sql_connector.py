@@ -1,6 +1,7 @@
 import io
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Type
 
 import paramiko
 import sshtunnel  # type: ignore
@@ -21,6 +22,7 @@ from sqlalchemy.sql.elements import TextClause
 
 from fides.api.common_exceptions import (
     ConnectionException,
+    RowLimitExceededException,
     SSHTunnelConfigNotFoundException,
 )
 from fides.api.graph.traversal import TraversalNode
@@ -50,6 +52,7 @@ from fides.api.service.connectors.query_config import (
     RedshiftQueryConfig,
     SnowflakeQueryConfig,
     SQLQueryConfig,
+    UpdateBatch,
 )
 from fides.api.util.collection_util import Row
 from fides.config import get_config
@@ -76,25 +79,29 @@ class SQLConnector(BaseConnector[Engine]):
         self.ssh_server: sshtunnel._ForwardServer = None
 
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
+    def cursor_result_to_rows(
+        results: CursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
+        """Convert SQLAlchemy results to a list of dictionaries, reading at most max_rows rows"""
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, max_rows):
             rows.append(
                 {col.name: row_tuple[count] for count, col in enumerate(columns)}
             )
         return rows
 
     @staticmethod
-    def default_cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def default_cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
-        Convert SQLAlchemy results to a list of dictionaries
+        Convert SQLAlchemy results to a list of dictionaries, reading at most max_rows rows
         Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MariaDB
         """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, max_rows):
             rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
         return rows
 
@@ -134,17 +141,67 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve sql data"""
+        """Retrieve sql data
+
+        Large inputs are queried in chunks. Whatever the number of chunks, rows are
+        only included once, identified by their primary keys, or by all of their
+        values if the collection has none.
+        """
         query_config = self.query_config(node)
         client = self.client()
-        stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
-        if stmt is None:
+        stmts: List[TextClause] = query_config.generate_query_chunks(
+            input_data, policy, CONFIG.execution.sql_in_clause_chunk_size
+        )
+        if not stmts:
             return []
         logger.info("Starting data retrieval for {}", node.address)
+        max_rows: Optional[int] = CONFIG.execution.max_rows_per_collection
+        primary_keys: List[str] = [
+            field_path.string_path
+            for field_path in query_config.primary_key_field_paths
+        ]
+        seen_rows: Set[str] = set()
+        rows: List[Row] = []
         with client.connect() as connection:
             self.set_schema(connection)
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            for stmt in stmts:
+                # Stream results with a server-side cursor where the driver supports it,
+                # so only one batch of raw rows is buffered at a time
+                results = connection.execution_options(
+                    stream_results=True,
+                    max_row_buffer=CONFIG.execution.sql_fetch_batch_size,
+                ).execute(stmt)
+                chunk_rows = self.cursor_result_to_rows(
+                    results, max_rows + 1 - len(rows) if max_rows else None
+                )
+                results.close()
+
+                # Rows are deduplicated the same way however many chunks there
+                # are, so the rows retrieved don't depend on the chunk size
+                for row in chunk_rows:
+                    row_key = self.row_identity(row, primary_keys)
+                    if row_key not in seen_rows:
+                        seen_rows.add(row_key)
+                        rows.append(row)
+
+                if max_rows and len(rows) > max_rows:
+                    break
+
+        if max_rows and len(rows) > max_rows:
+            # The rows are also the rows erasures mask, so the request fails
+            # rather than leave the rows past the limit unreported and unmasked
+            raise RowLimitExceededException(
+                f"More than the maximum of {max_rows} rows were retrieved from {node.address}"
+            )
+        return rows
+
+    @staticmethod
+    def row_identity(row: Row, primary_keys: List[str]) -> str:
+        """Returns a key identifying the row, from its primary keys if it has any,
+        otherwise from all of its values"""
+        if primary_keys:
+            return repr([row.get(key) for key in primary_keys])
+        return repr(list(row.items()))
 
     def mask_data(
         self,
@@ -154,21 +211,49 @@ class SQLConnector(BaseConnector[Engine]):
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        Rows are masked in batches within a single transaction for the collection.
+        """
         query_config = self.query_config(node)
-        update_ct = 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        update_batches: List[UpdateBatch] = query_config.generate_update_batches(
+            rows,
+            policy,
+            privacy_request,
+            CONFIG.execution.masking_batch_size,
+            client,
+        )
+        if not update_batches:
+            return 0
+
+        update_ct = 0
+        with client.begin() as connection:
+            self.set_schema(connection)
+            for update_stmt, params in update_batches:
+                update_ct = update_ct + self.execute_update_batch(
+                    connection, update_stmt, params
+                )
         return update_ct
 
+    @staticmethod
+    def execute_update_batch(
+        connection: Connection, update_stmt: Executable, params: List[Dict[str, Any]]
+    ) -> int:
+        """Executes the update statement once for each set of parameters and returns
+        the number of rows updated.
+
+        Uses executemany when the driver reports the number of rows it updated,
+        otherwise executes each update individually so that rowcounts stay accurate.
+        """
+        if len(params) > 1 and connection.dialect.supports_sane_multi_rowcount:
+            results: LegacyCursorResult = connection.execute(update_stmt, params)
+            return results.rowcount
+        return sum(
+            connection.execute(update_stmt, row_params).rowcount
+            for row_params in params
+        )
+
     def close(self) -> None:
         """Close any held resources"""
         if self.db_client:
@@ -302,11 +387,13 @@ class MySQLConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
 
 
 class MariaDBConnector(SQLConnector):
@@ -331,11 +418,13 @@ class MariaDBConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
 
 
 class RedshiftConnector(SQLConnector):
@@ -441,28 +530,6 @@ class BigQueryConnector(SQLConnector):
         """Query wrapper corresponding to the input traversal_node."""
         return BigQueryQueryConfig(node)
 
-    def mask_data(
-        self,
-        node: TraversalNode,
-        policy: Policy,
-        privacy_request: PrivacyRequest,
-        rows: List[Row],
-        input_data: Dict[str, List[Any]],
-    ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
-        query_config = self.query_config(node)
-        update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt: Optional[Executable] = query_config.generate_update(
-                row, policy, privacy_request, client
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
-        return update_ct
-
 
 class SnowflakeConnector(SQLConnector):
     """Connector specific to Snowflake"""
@@ -532,8 +599,10 @@ class MicrosoftSQLServerConnector(SQLConnector):
         return MicrosoftSQLServerQueryConfig(node)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+import hmac
+from typing import Callable, Dict, List, Optional, Type
 
 from fides.api.schemas.masking.masking_configuration import (
     AesEncryptionMaskingConfiguration,
@@ -18,7 +19,8 @@ from fides.api.schemas.masking.masking_strategy_description import (
 from fides.api.service.masking.strategy.format_preservation import FormatPreservation
 from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
 from fides.api.util.encryption.aes_gcm_encryption_scheme import encrypt
-from fides.api.util.encryption.hmac_encryption_scheme import hmac_encrypt_return_bytes
+from fides.api.util.encryption.crypto_executor import map_in_chunks
+from fides.api.util.encryption.hmac_encryption_scheme import build_hmac_function
 from fides.api.util.encryption.secrets_util import SecretsUtil
 
 
@@ -48,26 +50,27 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 SecretType.key_hmac,
                 masking_meta[SecretType.key_hmac],
             )
+            salt_hmac: str | None = SecretsUtil.get_or_generate_secret(
+                request_id,
+                SecretType.salt_hmac,
+                masking_meta[SecretType.salt_hmac],
+            )
+
+            if all(value is None for value in values):
+                return [None] * len(values)
+
+            # Values are encrypted in chunks on the crypto executor
+            encrypted_values: List[Optional[str]] = map_in_chunks(
+                _encrypt_values, values, key, key_hmac, salt_hmac
+            )
+            if self.format_preservation is None:
+                return encrypted_values
 
-            # The nonce is generated deterministically such that the same input val will result in same nonce
-            # and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
-            # implementation loosely based on https://www.vaultproject.io/docs/secrets/transit#convergent-encryption
-
-            masked_values: List[Optional[str]] = []
-            for value in values:
-                if value is None:
-                    masked_values.append(None)
-                    continue
-
-                nonce: bytes | None = self._generate_nonce(
-                    str(value), key_hmac, request_id, masking_meta  # type: ignore
-                )
-                masked: str = encrypt(str(value), key, nonce)  # type: ignore
-                if self.format_preservation is not None:
-                    formatter = FormatPreservation(self.format_preservation)
-                    masked = formatter.format(masked)
-                masked_values.append(masked)
-            return masked_values
+            formatter = FormatPreservation(self.format_preservation)
+            return [
+                formatter.format(encrypted) if encrypted is not None else None
+                for encrypted in encrypted_values
+            ]
 
         raise ValueError(f"aes_mode {self.mode} is not supported")
 
@@ -105,22 +108,6 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         supported_data_types = {"string"}
         return data_type in supported_data_types
 
-    @staticmethod
-    def _generate_nonce(
-        value: str,
-        key: str,
-        privacy_request_id: Optional[str],
-        masking_meta: Dict[SecretType, MaskingSecretMeta],
-    ) -> bytes:
-        salt = SecretsUtil.get_or_generate_secret(
-            privacy_request_id, SecretType.salt_hmac, masking_meta[SecretType.salt_hmac]
-        )
-        # Trim to 12 bytes, which is recommended length from aes gcm lib:
-        # https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
-        return hmac_encrypt_return_bytes(
-            value, key, salt, HmacMaskingConfiguration.Algorithm.sha_256  # type: ignore
-        )[:12]
-
     @classmethod
     def _build_masking_secret_meta(
         cls: Type[MaskingStrategy],
@@ -139,3 +126,33 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 generate_secret_func=SecretsUtil.generate_secret_string,
             ),
         }
+
+
+def _build_nonce_function(key: str, salt: str) -> Callable[[str], bytes]:
+    """Returns a function that generates the nonce for a value from its hmac"""
+    hmac_value: Callable[[str], hmac.HMAC] = build_hmac_function(
+        key, salt, HmacMaskingConfiguration.Algorithm.sha_256
+    )
+
+    def _generate_nonce(value: str) -> bytes:
+        # Trim to 12 bytes, which is recommended length from aes gcm lib:
+        # https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
+        return hmac_value(value).digest()[:12]
+
+    return _generate_nonce
+
+
+def _encrypt_values(
+    values: List[Optional[str]], key: bytes, key_hmac: str, salt_hmac: str
+) -> List[Optional[str]]:
+    """Encrypts each value with AES GCM"""
+    # The nonce is generated deterministically such that the same input val will result in same nonce
+    # and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
+    # implementation loosely based on https://www.vaultproject.io/docs/secrets/transit#convergent-encryption
+    generate_nonce: Callable[[str], bytes] = _build_nonce_function(key_hmac, salt_hmac)
+    return [
+        encrypt(str(value), key, generate_nonce(str(value)))
+        if value is not None
+        else None
+        for value in values
+    ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+import hmac
+from typing import Callable, Dict, List, Optional, Type
 
 from fides.api.schemas.masking.masking_configuration import HmacMaskingConfiguration
 from fides.api.schemas.masking.masking_secrets import (
@@ -14,7 +15,8 @@ from fides.api.schemas.masking.masking_strategy_description import (
 )
 from fides.api.service.masking.strategy.format_preservation import FormatPreservation
 from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
-from fides.api.util.encryption.hmac_encryption_scheme import hmac_encrypt_return_str
+from fides.api.util.encryption.crypto_executor import map_in_chunks
+from fides.api.util.encryption.hmac_encryption_scheme import build_hmac_function
 from fides.api.util.encryption.secrets_util import SecretsUtil
 
 
@@ -53,17 +55,21 @@ class HmacMaskingStrategy(MaskingStrategy):
             request_id, SecretType.salt, masking_meta[SecretType.salt]
         )
 
-        masked_values: List[Optional[str]] = []
-        for value in values:
-            if value is None:
-                masked_values.append(None)
-                continue
-            masked: str = hmac_encrypt_return_str(str(value), key, salt, self.algorithm)  # type: ignore
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked = formatter.format(masked)
-            masked_values.append(masked)
-        return masked_values
+        if all(value is None for value in values):
+            return [None] * len(values)
+
+        # Values are hashed in chunks on the crypto executor
+        hashed_values: List[Optional[str]] = map_in_chunks(
+            _hmac_values, values, key, salt, self.algorithm
+        )
+        if self.format_preservation is None:
+            return hashed_values
+
+        formatter = FormatPreservation(self.format_preservation)
+        return [
+            formatter.format(hashed) if hashed is not None else None
+            for hashed in hashed_values
+        ]
 
     def secrets_required(self) -> bool:
         return True
@@ -113,3 +119,17 @@ class HmacMaskingStrategy(MaskingStrategy):
                 generate_secret_func=SecretsUtil.generate_secret_string,
             ),
         }
+
+
+def _hmac_values(
+    values: List[Optional[str]],
+    key: str,
+    salt: str,
+    algorithm: HmacMaskingConfiguration.Algorithm,
+) -> List[Optional[str]]:
+    """Returns the hmac hexdigest of each value, setting the key up only once"""
+    hmac_value: Callable[[str], hmac.HMAC] = build_hmac_function(key, salt, algorithm)
+    return [
+        hmac_value(str(value)).hexdigest() if value is not None else None
+        for value in values
+    ]
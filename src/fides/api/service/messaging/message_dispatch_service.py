@@ -1,16 +1,18 @@
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-import requests
 import sendgrid
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from loguru import logger
 from sendgrid.helpers.mail import Content, Email, Mail, Personalization, TemplateId, To
 from sqlalchemy.orm import Session
 from twilio.base.exceptions import TwilioRestException
-from twilio.rest import Client
 
 from fides.api.common_exceptions import MessageDispatchException
 from fides.api.email_templates.get_email_template import get_email_template
@@ -44,6 +46,10 @@ from fides.api.schemas.redis_cache import Identity
 from fides.api.service.messaging.messaging_crud_service import (
     get_messaging_template_by_key,
 )
+from fides.api.service.messaging.messaging_service_clients import (
+    MessagingServiceClients,
+    get_messaging_service_clients,
+)
 from fides.api.tasks import MESSAGING_QUEUE_NAME, DatabaseTask, celery_app
 from fides.api.util.logger import Pii
 from fides.config import CONFIG
@@ -51,6 +57,18 @@ from fides.config.config_proxy import ConfigProxy
 
 EMAIL_JOIN_STRING = ", "
 EMAIL_TEMPLATE_NAME = "fides"
+COMPILED_TEMPLATE_CACHE_SIZE = 256
+
+JINJA_ENV = Environment()
+
+MessageBodyParams = Union[
+    AccessRequestCompleteBodyParams,
+    ConsentEmailFulfillmentBodyParams,
+    SubjectIdentityVerificationBodyParams,
+    RequestReceiptBodyParams,
+    RequestReviewDenyBodyParams,
+    ErasureRequestBodyParams,
+]
 
 
 def check_and_dispatch_error_notifications(db: Session) -> None:
@@ -120,16 +138,7 @@ def dispatch_message(
     action_type: MessagingActionType,
     to_identity: Optional[Identity],
     service_type: Optional[str],
-    message_body_params: Optional[
-        Union[
-            AccessRequestCompleteBodyParams,
-            ConsentEmailFulfillmentBodyParams,
-            SubjectIdentityVerificationBodyParams,
-            RequestReceiptBodyParams,
-            RequestReviewDenyBodyParams,
-            ErasureRequestBodyParams,
-        ]
-    ] = None,
+    message_body_params: Optional[MessageBodyParams] = None,
     subject_override: Optional[str] = None,
 ) -> None:
     """
@@ -146,15 +155,172 @@ def dispatch_message(
     messaging_config: MessagingConfig = MessagingConfig.get_configuration(
         db=db, service_type=service_type
     )
+    messaging_method = get_messaging_method(service_type)
+    logger.info("Getting custom messaging template for action type: {}", action_type)
+    messaging_template = get_messaging_template_by_key(db=db, key=action_type.value)
+    message: Union[EmailForActionType, str] = _build_message(
+        action_type,
+        messaging_method,
+        message_body_params,
+        messaging_template,
+        subject_override,
+    )
+    dispatcher: Callable = _get_dispatcher(messaging_config)
     logger.info(
-        "Building appropriate message template for action type: {}", action_type
+        "Starting message dispatch for messaging service with action type: {}",
+        action_type,
     )
-    messaging_method = get_messaging_method(service_type)
-    message: Optional[Union[EmailForActionType, str]] = None
+    dispatcher(messaging_config, message, _get_recipient(to_identity, messaging_method))
 
-    logger.info("Getting custom messaging template for action type: {}", action_type)
+
+def dispatch_messages(
+    db: Session,
+    action_type: MessagingActionType,
+    service_type: Optional[str],
+    recipients: Sequence[Tuple[Identity, Optional[MessageBodyParams]]],
+    subject_override: Optional[str] = None,
+) -> None:
+    """
+    Sends a message to each of the recipients, with content supplied in its body params.
+
+    Emails are sent through the messaging service's batch API where it has one, up
+    to `execution.messaging_batch_size` recipients a request, and other messages one
+    by one. Up to `execution.messaging_send_concurrency` requests are sent at a time.
+    Every message is attempted before an exception is raised for any that failed.
+    """
+    if not service_type:
+        logger.error(
+            "Messages failed to send. No notification service type configured."
+        )
+        raise MessageDispatchException("No notification service type configured.")
+
+    messaging_config: MessagingConfig = MessagingConfig.get_configuration(
+        db=db, service_type=service_type
+    )
+    messaging_method = get_messaging_method(service_type)
     messaging_template = get_messaging_template_by_key(db=db, key=action_type.value)
+    messages: List[Tuple[Union[EmailForActionType, str], Optional[str]]] = [
+        (
+            _build_message(
+                action_type,
+                messaging_method,
+                body_params,
+                messaging_template,
+                subject_override,
+            ),
+            _get_recipient(identity, messaging_method),
+        )
+        for identity, body_params in recipients
+    ]
 
+    sends: List[Callable[[], None]]
+    batch_dispatcher: Optional[Callable] = _get_batch_dispatcher_from_config_type(
+        messaging_config.service_type  # type: ignore[arg-type]
+    )
+    if batch_dispatcher:
+        batch_size: int = CONFIG.execution.messaging_batch_size
+        sends = [
+            partial(batch_dispatcher, messaging_config, messages[i : i + batch_size])
+            for i in range(0, len(messages), batch_size)
+        ]
+    else:
+        dispatcher: Callable = _get_dispatcher(messaging_config)
+        sends = [
+            partial(dispatcher, messaging_config, message, to)
+            for message, to in messages
+        ]
+
+    logger.info(
+        "Sending {} messages with action type {} in {} requests",
+        len(messages),
+        action_type,
+        len(sends),
+    )
+    with ThreadPoolExecutor(
+        max_workers=CONFIG.execution.messaging_send_concurrency
+    ) as executor:
+        futures: List[Future] = [executor.submit(send) for send in sends]
+    errors: List[BaseException] = [
+        error for error in (future.exception() for future in futures) if error
+    ]
+    if errors:
+        logger.error("{} of {} message sends failed", len(errors), len(sends))
+        raise MessageDispatchException(
+            f"{len(errors)} of {len(sends)} message sends failed, the first due to: {errors[0]}"
+        )
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def dispatch_messages_task(
+    self: DatabaseTask,
+    action_type: str,
+    service_type: Optional[str],
+    messages: List[Dict[str, Any]],
+) -> None:
+    """Dispatches a batch of the messages queued by `queue_messages`"""
+    with self.get_new_session() as db:
+        dispatch_messages(
+            db,
+            MessagingActionType(action_type),
+            service_type,
+            [
+                (
+                    Identity.parse_obj(message["to_identity"]),
+                    FidesopsMessage.parse_obj(
+                        {
+                            "action_type": action_type,
+                            "body_params": message["body_params"],
+                        }
+                    ).body_params,
+                )
+                for message in messages
+            ],
+        )
+
+
+def queue_messages(
+    action_type: MessagingActionType,
+    service_type: Optional[str],
+    recipients: Sequence[Tuple[Identity, Optional[MessageBodyParams]]],
+) -> None:
+    """
+    Queues a message to each of the recipients on the messaging queue, in tasks of
+    `execution.messaging_batch_size` messages that are each sent by `dispatch_messages`,
+    so the messaging workers' concurrency limits how many are sent at once.
+    """
+    payloads: List[Dict[str, Any]] = [
+        {
+            "to_identity": identity.dict(),
+            "body_params": FidesopsMessage(
+                action_type=action_type, body_params=body_params
+            ).dict()["body_params"],
+        }
+        for identity, body_params in recipients
+    ]
+    batch_size: int = CONFIG.execution.messaging_batch_size
+    for i in range(0, len(payloads), batch_size):
+        dispatch_messages_task.apply_async(
+            queue=MESSAGING_QUEUE_NAME,
+            kwargs={
+                "action_type": action_type.value,
+                "service_type": service_type,
+                "messages": payloads[i : i + batch_size],
+            },
+        )
+
+
+def _build_message(
+    action_type: MessagingActionType,
+    messaging_method: Optional[MessagingMethod],
+    message_body_params: Any,
+    messaging_template: Optional[MessagingTemplate],
+    subject_override: Optional[str],
+) -> Union[EmailForActionType, str]:
+    """Builds the email or SMS of the action type with the body params"""
+    logger.info(
+        "Building appropriate message template for action type: {}", action_type
+    )
+    message: Union[EmailForActionType, str]
     if messaging_method == MessagingMethod.EMAIL:
         message = _build_email(
             action_type=action_type,
@@ -169,10 +335,28 @@ def dispatch_message(
     else:  # pragma: no cover
         # This is here as a fail safe, but it should be impossible to reach because
         # is controlled by a database enum field.
-        logger.error("Notification service type is not valid: {}", service_type)
+        logger.error("Notification service type is not valid: {}", messaging_method)
         raise MessageDispatchException(
-            f"Notification service type is not valid: {service_type}"
+            f"Notification service type is not valid: {messaging_method}"
         )
+
+    if subject_override and isinstance(message, EmailForActionType):
+        message.subject = subject_override
+    return message
+
+
+def _get_recipient(
+    to_identity: Identity, messaging_method: Optional[MessagingMethod]
+) -> Optional[str]:
+    return (
+        to_identity.email
+        if messaging_method == MessagingMethod.EMAIL
+        else to_identity.phone_number
+    )
+
+
+def _get_dispatcher(messaging_config: MessagingConfig) -> Callable:
+    """The dispatcher of the messaging config's service"""
     messaging_service: MessagingServiceType = messaging_config.service_type  # type: ignore
     logger.info(
         "Retrieving appropriate dispatcher for email service: {}", messaging_service
@@ -188,21 +372,7 @@ def dispatch_message(
         raise MessageDispatchException(
             f"Dispatcher has not been implemented for message service type: {messaging_service}"
         )
-    logger.info(
-        "Starting message dispatch for messaging service with action type: {}",
-        action_type,
-    )
-
-    if subject_override and isinstance(message, EmailForActionType):
-        message.subject = subject_override
-
-    dispatcher(
-        messaging_config,
-        message,
-        to_identity.email
-        if messaging_method == MessagingMethod.EMAIL
-        else to_identity.phone_number,
-    )
+    return dispatcher
 
 
 def _build_sms(  # pylint: disable=too-many-return-statements
@@ -257,13 +427,17 @@ def _build_sms(  # pylint: disable=too-many-return-statements
     )
 
 
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _compile(template_str: str) -> Template:
+    """Compiles a template string, once per distinct template"""
+    return JINJA_ENV.from_string(template_str)
+
+
 def _render(template_str: str, variables: Optional[Dict] = None) -> str:
     """Helper function to render a template string with the provided variables."""
     if variables is None:
         variables = {}
-    jinja_env = Environment()
-    template = jinja_env.from_string(template_str)
-    return template.render(variables)
+    return _compile(template_str).render(variables)
 
 
 def _build_email(  # pylint: disable=too-many-return-statements
@@ -297,6 +471,8 @@ def _build_email(  # pylint: disable=too-many-return-statements
             subject=_render(messaging_template.content["subject"], variables),  # type: ignore
             body=_render(messaging_template.content["body"], variables),  # type: ignore
             template_variables=variables,
+            subject_template=messaging_template.content["subject"],  # type: ignore
+            body_template=messaging_template.content["body"],  # type: ignore
         )
     if action_type == MessagingActionType.MESSAGE_ERASURE_REQUEST_FULFILLMENT:
         base_template = get_email_template(action_type)
@@ -322,6 +498,8 @@ def _build_email(  # pylint: disable=too-many-return-statements
             subject=_render(messaging_template.content["subject"], variables),  # type: ignore
             body=_render(messaging_template.content["body"], variables),  # type: ignore
             template_variables=variables,
+            subject_template=messaging_template.content["subject"],  # type: ignore
+            body_template=messaging_template.content["body"],  # type: ignore
         )
     if action_type == MessagingActionType.PRIVACY_REQUEST_COMPLETE_ACCESS:
         variables = {
@@ -332,6 +510,8 @@ def _build_email(  # pylint: disable=too-many-return-statements
             subject=_render(messaging_template.content["subject"], variables),  # type: ignore
             body=_render(messaging_template.content["body"], variables),  # type: ignore
             template_variables=variables,
+            subject_template=messaging_template.content["subject"],  # type: ignore
+            body_template=messaging_template.content["body"],  # type: ignore
         )
     if action_type == MessagingActionType.PRIVACY_REQUEST_COMPLETE_DELETION:
         return EmailForActionType(
@@ -355,6 +535,8 @@ def _build_email(  # pylint: disable=too-many-return-statements
             subject=_render(messaging_template.content["subject"], variables),  # type: ignore
             body=_render(messaging_template.content["body"], variables),  # type: ignore
             template_variables=variables,
+            subject_template=messaging_template.content["subject"],  # type: ignore
+            body_template=messaging_template.content["body"],  # type: ignore
         )
     if action_type == MessagingActionType.TEST_MESSAGE:
         base_template = get_email_template(action_type)
@@ -380,6 +562,17 @@ def _get_dispatcher_from_config_type(
     return handler.get(message_service_type)  # type: ignore
 
 
+def _get_batch_dispatcher_from_config_type(
+    message_service_type: MessagingServiceType,
+) -> Optional[Callable]:
+    """The dispatcher that sends many messages at once, for the services that can"""
+    handler = {
+        MessagingServiceType.mailgun: _mailgun_batch_dispatcher,
+        MessagingServiceType.twilio_email: _twilio_email_batch_dispatcher,
+    }
+    return handler.get(message_service_type)  # type: ignore
+
+
 def _mailchimp_transactional_dispatcher(
     messaging_config: MessagingConfig,
     message: EmailForActionType,
@@ -415,7 +608,7 @@ def _mailchimp_transactional_dispatcher(
         }
     )
 
-    response = requests.post(
+    response = get_messaging_service_clients(messaging_config).session.post(
         "https://mandrillapp.com/api/1.0/messages/send",
         headers={"Content-Type": "application/json"},
         data=data,
@@ -448,7 +641,20 @@ def _mailgun_dispatcher(
     to: Optional[str],
 ) -> None:
     """Dispatches email using Mailgun"""
-    if not to:
+    _mailgun_batch_dispatcher(messaging_config, [(message, to)])
+
+
+def _mailgun_batch_dispatcher(
+    messaging_config: MessagingConfig,
+    messages: List[Tuple[EmailForActionType, Optional[str]]],
+) -> None:
+    """
+    Dispatches emails using Mailgun, one request for the recipients of each distinct
+    email. Emails rendered from the same messaging template are the same email, whose
+    template variables are filled in from each recipient's recipient variables.
+    Recipient variables also make Mailgun send every recipient their own copy.
+    """
+    if not all(to for _, to in messages):
         logger.error("Message failed to send. No email identity supplied.")
         raise MessageDispatchException("No email identity supplied.")
 
@@ -463,61 +669,81 @@ def _mailgun_dispatcher(
         if messaging_config.details[MessagingServiceDetails.IS_EU_DOMAIN.value] is False
         else "https://api.eu.mailgun.net"
     )
-
     domain = messaging_config.details[MessagingServiceDetails.DOMAIN.value]
+    domain_url = f"{base_url}/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{domain}"
+    auth = (
+        "api",
+        messaging_config.secrets[MessagingServiceSecrets.MAILGUN_API_KEY.value],
+    )
+    clients: MessagingServiceClients = get_messaging_service_clients(messaging_config)
 
-    try:
-        # Check if a fides template exists
-        template_test = requests.get(
-            f"{base_url}/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{domain}/templates/{EMAIL_TEMPLATE_NAME}",
-            auth=(
-                "api",
-                messaging_config.secrets[MessagingServiceSecrets.MAILGUN_API_KEY.value],
-            ),
+    def get_fides_template() -> Optional[str]:
+        template_test = clients.session.get(
+            f"{domain_url}/templates/{EMAIL_TEMPLATE_NAME}", auth=auth
+        )
+        if template_test.status_code == 200:
+            return EMAIL_TEMPLATE_NAME
+        if template_test.status_code == 404:
+            return None
+        raise MessageDispatchException(
+            f"Template lookup failed with status code {template_test.status_code}"
         )
 
-        data = {
-            "from": f"<mailgun@{domain}>",
-            "to": [to.strip()],
-            "subject": message.subject,
-        }
+    # The recipients of each distinct email, with their recipient variables
+    recipients: Dict[Tuple[str, str, str], Dict[str, Dict[str, str]]] = defaultdict(
+        dict
+    )
+    for message, to in messages:
+        to_email: str = to.strip()  # type: ignore[union-attr]
+        candidates: List[Tuple[EmailForActionType, Dict[str, str]]] = [
+            _get_mailgun_templated_email(message) or (message, {}),
+            (message, {}),
+        ]
+        for email, recipient_variables in candidates:
+            key = (
+                email.subject,
+                email.body,
+                json.dumps(email.template_variables or {}, sort_keys=True),
+            )
+            # A recipient only has one set of variables per request
+            if (
+                recipients[key].get(to_email, recipient_variables)
+                == recipient_variables
+            ):
+                recipients[key][to_email] = recipient_variables
+                break
 
-        if template_test.status_code == 200:
-            mailgun_variables = {
-                "fides_email_body": message.body,
-                **(message.template_variables or {}),
-            }
-            data["template"] = EMAIL_TEMPLATE_NAME
-            data["h:X-Mailgun-Variables"] = json.dumps(mailgun_variables)
-            response = requests.post(
-                f"{base_url}/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{domain}/messages",
-                auth=(
-                    "api",
-                    messaging_config.secrets[
-                        MessagingServiceSecrets.MAILGUN_API_KEY.value
-                    ],
-                ),
-                data=data,
+    try:
+        try:
+            # Check if a fides template exists
+            template: Optional[str] = clients.get_template(
+                EMAIL_TEMPLATE_NAME, get_fides_template
             )
+        except MessageDispatchException as exc:
+            logger.warning("Sending email without a Mailgun template: {}", exc)
+            template = None
+
+        for (subject, body, template_variables), to_emails in recipients.items():
+            data: Dict[str, Any] = {
+                "from": f"<mailgun@{domain}>",
+                "to": list(to_emails),
+                "subject": subject,
+            }
+            if len(to_emails) > 1 or any(to_emails.values()):
+                data["recipient-variables"] = json.dumps(to_emails)
 
-            if not response.ok:
-                logger.error(
-                    "Email failed to send with status code: %s", response.status_code
-                )
-                raise MessageDispatchException(
-                    f"Email failed to send with status code {response.status_code}"
-                )
-        else:
-            data["html"] = message.body
-            response = requests.post(
-                f"{base_url}/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{domain}/messages",
-                auth=(
-                    "api",
-                    messaging_config.secrets[
-                        MessagingServiceSecrets.MAILGUN_API_KEY.value
-                    ],
-                ),
-                data=data,
+            if template:
+                mailgun_variables = {
+                    "fides_email_body": body,
+                    **json.loads(template_variables),
+                }
+                data["template"] = template
+                data["h:X-Mailgun-Variables"] = json.dumps(mailgun_variables)
+            else:
+                data["html"] = body
+
+            response = clients.session.post(
+                f"{domain_url}/messages", auth=auth, data=data
             )
             if not response.ok:
                 logger.error(
@@ -531,6 +757,45 @@ def _mailgun_dispatcher(
         raise MessageDispatchException(f"Email failed to send due to: {Pii(e)}")
 
 
+def _get_mailgun_templated_email(
+    message: EmailForActionType,
+) -> Optional[Tuple[EmailForActionType, Dict[str, str]]]:
+    """
+    The email rendered from the message's messaging template with Mailgun recipient
+    variable placeholders for its template variables, and the recipient variables
+    that fill them in. None if the message has no messaging template, or if filling
+    in the placeholders doesn't give back the message, for instance because the
+    template branches on a variable.
+    """
+    variables: Dict[str, Any] = message.template_variables or {}
+    if (
+        message.subject_template is None
+        or message.body_template is None
+        or not variables
+        or not all(isinstance(value, (str, int, float)) for value in variables.values())
+    ):
+        return None
+
+    placeholders: Dict[str, str] = {name: f"%recipient.{name}%" for name in variables}
+    recipient_variables: Dict[str, str] = {
+        name: str(value) for name, value in variables.items()
+    }
+    email = EmailForActionType(
+        subject=_render(message.subject_template, placeholders),
+        body=_render(message.body_template, placeholders),
+        template_variables=placeholders,
+    )
+
+    def fill_in(text: str) -> str:
+        for name, placeholder in placeholders.items():
+            text = text.replace(placeholder, recipient_variables[name])
+        return text
+
+    if fill_in(email.subject) != message.subject or fill_in(email.body) != message.body:
+        return None
+    return email, recipient_variables
+
+
 def _twilio_email_dispatcher(
     messaging_config: MessagingConfig,
     message: EmailForActionType,
@@ -549,21 +814,7 @@ def _twilio_email_dispatcher(
         )
 
     try:
-        sg = sendgrid.SendGridAPIClient(
-            api_key=messaging_config.secrets[
-                MessagingServiceSecrets.TWILIO_API_KEY.value
-            ]
-        )
-
-        # the pagination via the client actually doesn't work
-        # in lieu of over-engineering this we can manually call
-        # the next page if/when we hit the limit here
-        response = sg.client.templates.get(
-            query_params={"generations": "dynamic", "page_size": 200}
-        )
-        template_test = _get_template_id_if_exists(
-            json.loads(response.body), EMAIL_TEMPLATE_NAME
-        )
+        sg, template_test = _get_twilio_email_client(messaging_config)
 
         from_email = Email(
             messaging_config.details[MessagingServiceDetails.TWILIO_EMAIL_FROM.value]
@@ -573,22 +824,103 @@ def _twilio_email_dispatcher(
         mail = _compose_twilio_mail(
             from_email, to_email, subject, message.body, template_test
         )
+        _send_twilio_mail(sg, mail)
+    except Exception as e:
+        logger.error("Email failed to send: {}", Pii(str(e)))
+        raise MessageDispatchException(f"Email failed to send due to: {Pii(e)}")
 
-        response = sg.client.mail.send.post(request_body=mail.get())
-        if response.status_code >= 400:
-            logger.error(
-                "Email failed to send: %s: %s",
-                response.status_code,
-                Pii(str(response.body)),
-            )
-            raise MessageDispatchException(
-                f"Email failed to send: {response.status_code}, {Pii(str(response.body))}"
-            )
+
+def _twilio_email_batch_dispatcher(
+    messaging_config: MessagingConfig,
+    messages: List[Tuple[EmailForActionType, Optional[str]]],
+) -> None:
+    """
+    Dispatches emails using twilio sendgrid, one personalization per recipient. With
+    the Fides template that's a single request, otherwise one for each distinct email.
+    """
+    if not all(to for _, to in messages):
+        logger.error("Message failed to send. No email identity supplied.")
+        raise MessageDispatchException("No email identity supplied.")
+    if not messaging_config.details or not messaging_config.secrets:
+        logger.error(
+            "Message failed to send. No twilio email config details or secrets supplied."
+        )
+        raise MessageDispatchException(
+            "No twilio email config details or secrets supplied."
+        )
+
+    try:
+        sg, template_test = _get_twilio_email_client(messaging_config)
+        from_email = Email(
+            messaging_config.details[MessagingServiceDetails.TWILIO_EMAIL_FROM.value]
+        )
+
+        if template_test:
+            mail = Mail(from_email=from_email)
+            mail.template_id = TemplateId(template_test)
+            for message, to in messages:
+                personalization = Personalization()
+                personalization.subject = message.subject
+                personalization.dynamic_template_data = {
+                    "fides_email_body": message.body
+                }
+                personalization.add_email(To(to.strip()))  # type: ignore[union-attr]
+                mail.add_personalization(personalization)
+            _send_twilio_mail(sg, mail)
+            return
+
+        recipients: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for message, to in messages:
+            recipients[(message.subject, message.body)].append(to.strip())  # type: ignore[union-attr]
+        for (subject, body), to_emails in recipients.items():
+            mail = Mail(from_email=from_email, subject=subject)
+            mail.add_content(Content("text/html", body))
+            for to_email in to_emails:
+                personalization = Personalization()
+                personalization.add_email(To(to_email))
+                mail.add_personalization(personalization)
+            _send_twilio_mail(sg, mail)
     except Exception as e:
         logger.error("Email failed to send: {}", Pii(str(e)))
         raise MessageDispatchException(f"Email failed to send due to: {Pii(e)}")
 
 
+def _get_twilio_email_client(
+    messaging_config: MessagingConfig,
+) -> Tuple[sendgrid.SendGridAPIClient, Optional[str]]:
+    """The config's SendGrid client, and the id of its Fides template if it has one"""
+    clients: MessagingServiceClients = get_messaging_service_clients(messaging_config)
+    sg = clients.sendgrid_client(
+        messaging_config.secrets[MessagingServiceSecrets.TWILIO_API_KEY.value]  # type: ignore[index]
+    )
+
+    def get_fides_template() -> Optional[str]:
+        # the pagination via the client actually doesn't work
+        # in lieu of over-engineering this we can manually call
+        # the next page if/when we hit the limit here
+        response = sg.client.templates.get(
+            query_params={"generations": "dynamic", "page_size": 200}
+        )
+        return _get_template_id_if_exists(
+            json.loads(response.body), EMAIL_TEMPLATE_NAME
+        )
+
+    return sg, clients.get_template(EMAIL_TEMPLATE_NAME, get_fides_template)
+
+
+def _send_twilio_mail(sg: sendgrid.SendGridAPIClient, mail: Mail) -> None:
+    response = sg.client.mail.send.post(request_body=mail.get())
+    if response.status_code >= 400:
+        logger.error(
+            "Email failed to send: %s: %s",
+            response.status_code,
+            Pii(str(response.body)),
+        )
+        raise MessageDispatchException(
+            f"Email failed to send: {response.status_code}, {Pii(str(response.body))}"
+        )
+
+
 def _twilio_sms_dispatcher(
     messaging_config: MessagingConfig,
     message: str,
@@ -614,7 +946,9 @@ def _twilio_sms_dispatcher(
         MessagingServiceSecrets.TWILIO_SENDER_PHONE_NUMBER.value
     )
 
-    client = Client(account_sid, auth_token)
+    client = get_messaging_service_clients(messaging_config).twilio_client(
+        account_sid, auth_token
+    )
     try:
         if messaging_service_id:
             client.messages.create(
@@ -0,0 +1,117 @@
+"""
+Clients for messaging services, reused across sends.
+
+Each messaging config gets a pooled HTTP session, its Twilio and SendGrid clients,
+and a cache of its Fides template lookups, so that a send is a single request over a
+kept-alive connection instead of a template lookup and a new connection. Template
+lookups are reused for `execution.messaging_template_cache_ttl_seconds`. A config's
+clients are replaced as soon as the config is updated, since every send loads the
+config first.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import sendgrid
+from requests import Session
+from twilio.http.http_client import TwilioHttpClient
+from twilio.rest import Client
+
+from fides.api.models.messaging import MessagingConfig
+from fides.config import CONFIG
+
+ConfigVersion = Tuple[str, Optional[datetime]]
+
+
+class MessagingServiceClients:
+    """The clients and template lookups of one version of a messaging config"""
+
+    def __init__(self, version: ConfigVersion):
+        # Avoid circular imports
+        from fides.api.service.connectors.saas.authenticated_client import (  # pylint: disable=import-outside-toplevel
+            create_pooled_session,
+        )
+
+        self.version = version
+        self.session: Session = create_pooled_session(
+            CONFIG.execution.messaging_send_concurrency
+        )
+        self._lock = Lock()
+        self._twilio_clients: Dict[Tuple[str, str], Client] = {}
+        self._sendgrid_clients: Dict[str, sendgrid.SendGridAPIClient] = {}
+        self._templates: Dict[str, Tuple[float, Optional[str]]] = {}
+
+    def twilio_client(self, account_sid: str, auth_token: str) -> Client:
+        """A Twilio client whose connections are kept alive across messages"""
+        with self._lock:
+            client = self._twilio_clients.get((account_sid, auth_token))
+            if client is None:
+                client = Client(
+                    account_sid,
+                    auth_token,
+                    http_client=TwilioHttpClient(pool_connections=True),
+                )
+                self._twilio_clients[(account_sid, auth_token)] = client
+            return client
+
+    def sendgrid_client(self, api_key: str) -> sendgrid.SendGridAPIClient:
+        with self._lock:
+            client = self._sendgrid_clients.get(api_key)
+            if client is None:
+                client = sendgrid.SendGridAPIClient(api_key=api_key)
+                self._sendgrid_clients[api_key] = client
+            return client
+
+    def get_template(
+        self, template_name: str, lookup: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """
+        The id of the service's template with the name, or None if it doesn't have
+        one, as returned by the lookup. The lookup is called at most once every
+        `execution.messaging_template_cache_ttl_seconds`; lookups that raise aren't
+        cached.
+        """
+        looked_up_after: float = (
+            time.monotonic() - CONFIG.execution.messaging_template_cache_ttl_seconds
+        )
+        with self._lock:
+            cached = self._templates.get(template_name)
+        if cached and cached[0] > looked_up_after:
+            return cached[1]
+
+        template_id: Optional[str] = lookup()
+        with self._lock:
+            self._templates[template_name] = (time.monotonic(), template_id)
+        return template_id
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients: Dict[str, MessagingServiceClients] = {}
+_clients_lock = Lock()
+
+
+def get_messaging_service_clients(
+    messaging_config: MessagingConfig,
+) -> MessagingServiceClients:
+    """The clients of the messaging config, which are replaced when it's updated"""
+    version: ConfigVersion = (messaging_config.id, messaging_config.updated_at)
+    with _clients_lock:
+        clients: Optional[MessagingServiceClients] = _clients.get(messaging_config.key)
+        # Replaced clients aren't closed, a send may still be using them
+        if clients is None or clients.version != version:
+            clients = MessagingServiceClients(version)
+            _clients[messaging_config.key] = clients
+        return clients
+
+
+def clear_messaging_service_clients() -> None:
+    """Closes and drops the clients of every messaging config"""
+    with _clients_lock:
+        for clients in _clients.values():
+            clients.close()
+        _clients.clear()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from requests import Response
 
@@ -25,6 +25,22 @@ class PaginationStrategy(Strategy):
     ) -> Optional[SaaSRequestParams]:
         """Build request for next page of data"""
 
+    def get_prefetch_requests(
+        self,
+        request_params: SaaSRequestParams,
+        connector_params: Dict[str, Any],
+        count: int,
+    ) -> List[SaaSRequestParams]:
+        """
+        Build requests for up to `count` pages following the given request, without
+        waiting for its response. Strategies that need each response to build the
+        next request return an empty list.
+
+        Prefetched pages are only used until get_next_request reports there are no
+        more pages, so they may run past the end of the data.
+        """
+        return []
+
     def validate_request(self, request: Dict[str, Any]) -> None:
         """
         Accepts the raw SaaSRequest data and validates that the request
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pydash
 from loguru import logger
@@ -43,19 +43,7 @@ class OffsetPaginationStrategy(PaginationStrategy):
             )
 
         # increment param value and return None if limit has been reached to indicate there are no more pages
-        limit: Optional[Union[int, ConnectorParamRef]] = self.limit
-        if isinstance(self.limit, ConnectorParamRef):
-            limit = connector_params.get(self.limit.connector_param)
-            if limit is None:
-                raise FidesopsException(
-                    f"Unable to find value for 'limit' with the connector_param reference '{self.limit.connector_param}'"
-                )
-            try:
-                limit = int(limit)
-            except ValueError:
-                raise FidesopsException(
-                    f"The value '{limit}' of the '{self.limit.connector_param}' connector_param could not be cast to an int"
-                )
+        limit = self._get_limit(connector_params)
         param_value += self.increment_by
         if limit and param_value > limit:
             logger.info("Pagination limit has been reached")
@@ -71,6 +59,57 @@ class OffsetPaginationStrategy(PaginationStrategy):
             body=request_params.body,
         )
 
+    def get_prefetch_requests(
+        self,
+        request_params: SaaSRequestParams,
+        connector_params: Dict[str, Any],
+        count: int,
+    ) -> List[SaaSRequestParams]:
+        """
+        Build requests for the pages following the given request by incrementing the
+        offset param, stopping at the configured limit.
+        """
+        param_value = request_params.query_params.get(self.incremental_param)
+        if param_value is None:
+            return []
+
+        limit = self._get_limit(connector_params)
+        requests: List[SaaSRequestParams] = []
+        for page in range(1, count + 1):
+            next_value = param_value + page * self.increment_by
+            if limit and next_value > limit:
+                break
+            requests.append(
+                SaaSRequestParams(
+                    method=request_params.method,
+                    headers=request_params.headers,
+                    path=request_params.path,
+                    query_params={
+                        **request_params.query_params,
+                        self.incremental_param: next_value,
+                    },
+                    body=request_params.body,
+                )
+            )
+        return requests
+
+    def _get_limit(self, connector_params: Dict[str, Any]) -> Optional[int]:
+        """Returns the configured limit, resolving it from the connector params if it is a reference"""
+        limit: Optional[Union[int, ConnectorParamRef]] = self.limit
+        if isinstance(self.limit, ConnectorParamRef):
+            limit = connector_params.get(self.limit.connector_param)
+            if limit is None:
+                raise FidesopsException(
+                    f"Unable to find value for 'limit' with the connector_param reference '{self.limit.connector_param}'"
+                )
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise FidesopsException(
+                    f"The value '{limit}' of the '{self.limit.connector_param}' connector_param could not be cast to an int"
+                )
+        return limit  # type: ignore[return-value]
+
     def validate_request(self, request: Dict[str, Any]) -> None:
         """Ensures that the query param specified by 'incremental_param' exists in the request"""
         query_params = (
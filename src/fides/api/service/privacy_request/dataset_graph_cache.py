@@ -0,0 +1,135 @@
+"""
+A process-level cache of the compiled dataset graphs used to run privacy requests.
+
+Datasets rarely change between privacy requests, so instead of rebuilding the
+DatasetGraph for each request, we compile it once and share the frozen graph until
+any DatasetConfig, CTL Dataset or ConnectionConfig row changes.
+"""
+from __future__ import annotations
+
+import hashlib
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from fides.api.common_exceptions import TraversalError
+from fides.api.graph.config import GraphDataset
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.models.sql_models import Dataset as CtlDataset  # type: ignore
+
+
+class CompiledDatasetGraph(NamedTuple):
+    """Frozen graphs built from every configured dataset, and the fingerprint
+    of the rows they were built from"""
+
+    fingerprint: str
+    graph: DatasetGraph
+    consent_graph: DatasetGraph
+
+
+_compiled_graph: Optional[CompiledDatasetGraph] = None
+_compiled_graph_lock = Lock()
+
+
+def build_consent_dataset_graph(datasets: List[DatasetConfig]) -> DatasetGraph:
+    """
+    Build the starting DatasetGraph for consent requests.
+
+    Consent Graph has one node per dataset.  Nodes must be of saas type and have consent requests defined.
+    """
+    consent_datasets: List[GraphDataset] = []
+
+    for dataset_config in datasets:
+        connection_type: ConnectionType = (
+            dataset_config.connection_config.connection_type  # type: ignore
+        )
+        saas_config: Optional[Dict] = dataset_config.connection_config.saas_config
+        if (
+            connection_type == ConnectionType.saas
+            and saas_config
+            and saas_config.get("consent_requests")
+        ):
+            consent_datasets.append(
+                dataset_config.get_dataset_with_stubbed_collection()  # type: ignore[arg-type, assignment]
+            )
+
+    return DatasetGraph(*consent_datasets)
+
+
+def get_dataset_graph_fingerprint(db: Session) -> str:
+    """
+    Fingerprint every row that the dataset graphs are built from.
+
+    Any created, updated or deleted DatasetConfig, CTL Dataset or ConnectionConfig
+    changes the fingerprint.
+    """
+    digest = hashlib.sha256()
+    for model in (DatasetConfig, CtlDataset, ConnectionConfig):
+        digest.update(model.__tablename__.encode())
+        for row_id, updated_at in db.query(model.id, model.updated_at).order_by(
+            model.id
+        ):
+            digest.update(
+                f"{row_id}:{updated_at.isoformat() if updated_at else ''};".encode()
+            )
+    return digest.hexdigest()
+
+
+def compile_dataset_graph(db: Session, fingerprint: str) -> CompiledDatasetGraph:
+    """
+    Build and freeze the dataset graphs, and verify a traversal from each identity
+    so that requests seeded with a single identity can reuse it.
+    """
+    datasets = DatasetConfig.all(db=db)
+    graph = DatasetGraph(*[dataset_config.get_graph() for dataset_config in datasets])
+    graph.freeze()
+    consent_graph = build_consent_dataset_graph(datasets)
+    consent_graph.freeze()
+
+    for seed_key in set(graph.identity_keys.values()):
+        try:
+            Traversal(graph, {seed_key: None})
+        except TraversalError:
+            # Not every identity can reach the whole graph on its own; requests
+            # seeded this way will fail the same way when they build their traversal.
+            logger.debug("No valid traversal from identity '{}'", seed_key)
+
+    return CompiledDatasetGraph(
+        fingerprint=fingerprint, graph=graph, consent_graph=consent_graph
+    )
+
+
+def get_compiled_dataset_graph(db: Session) -> CompiledDatasetGraph:
+    """
+    Return the compiled dataset graphs for the datasets currently configured,
+    recompiling them if any of the rows they are built from have changed.
+
+    The returned graphs are frozen and shared, so they must not be modified.
+    """
+    global _compiled_graph  # pylint: disable=W0603
+    fingerprint = get_dataset_graph_fingerprint(db)
+
+    compiled = _compiled_graph
+    if compiled and compiled.fingerprint == fingerprint:
+        return compiled
+
+    with _compiled_graph_lock:
+        compiled = _compiled_graph
+        if compiled and compiled.fingerprint == fingerprint:
+            return compiled
+        logger.info("Compiling dataset graph")
+        compiled = compile_dataset_graph(db, fingerprint)
+        _compiled_graph = compiled
+        return compiled
+
+
+def clear_compiled_dataset_graph() -> None:
+    """Discard the compiled dataset graphs, so the next request recompiles them"""
+    global _compiled_graph  # pylint: disable=W0603
+    with _compiled_graph_lock:
+        _compiled_graph = None
@@ -1,18 +1,19 @@
 import json
+import math
 import os
 import zipfile
 from collections import defaultdict
-from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Dict, List, Optional
 
-import jinja2
 from jinja2 import Environment, FileSystemLoader
 
 from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.policy import ActionType
 from fides.api.schemas.redis_cache import Identity
 from fides.api.util.storage_util import storage_json_encoder
+from fides.config import CONFIG
 
 DSR_DIRECTORY = Path(__file__).parent.resolve()
 
@@ -21,6 +22,23 @@ HEADER_COLOR = "#F7FAFC"
 BORDER_COLOR = "#E2E8F0"
 
 
+def _pretty_print(value: str, indent: int = 4) -> str:
+    return json.dumps(value, indent=indent, default=storage_json_encoder)
+
+
+# Templates are compiled once per process and reused for every report. They're
+# packaged with Fides, so they aren't checked for changes.
+_template_environment = Environment(
+    loader=FileSystemLoader(DSR_DIRECTORY), auto_reload=False
+)
+_template_environment.filters["pretty_print"] = _pretty_print
+
+
+def collection_page_filename(page: int) -> str:
+    """The filename of a page of a collection's index"""
+    return "index.html" if page == 1 else f"index-{page}.html"
+
+
 # pylint: disable=too-many-instance-attributes
 class DsrReportBuilder:
     def __init__(
@@ -31,21 +49,23 @@ class DsrReportBuilder:
         """
         Manages populating HTML templates from the given data and adding the generated
         pages to a zip file in a way that the pages can be navigated between.
+
+        Pages are rendered and written to the zip file one at a time, collection indexes
+        are split into pages, and the zip file is spooled to disk once it outgrows
+        execution.access_package_spool_size, so the memory used doesn't grow with the
+        size of the report.
         """
 
-        # zip file variables
-        self.baos = BytesIO()
+        # zip file variables, the caller of generate() closes the spooled file
+        # pylint: disable=consider-using-with
+        self.baos: IO[bytes] = SpooledTemporaryFile(
+            max_size=CONFIG.execution.access_package_spool_size
+        )
 
         # we close this in the finally block of generate()
-        # pylint: disable=consider-using-with
         self.out = zipfile.ZipFile(self.baos, "w")
 
-        # Jinja template environment initialization
-        def pretty_print(value: str, indent: int = 4) -> str:
-            return json.dumps(value, indent=indent, default=storage_json_encoder)
-
-        jinja2.filters.FILTERS["pretty_print"] = pretty_print
-        self.template_loader = Environment(loader=FileSystemLoader(DSR_DIRECTORY))
+        self.template_loader = _template_environment
 
         # to pass in custom colors in the future
         self.template_data: Dict[str, Any] = {
@@ -65,6 +85,7 @@ class DsrReportBuilder:
         heading: Optional[str] = None,
         description: Optional[str] = None,
         data: Optional[Dict[str, Any]] = None,
+        **extra: Any,
     ) -> str:
         """Generates a file from the template and data"""
         report_data = {
@@ -74,6 +95,7 @@ class DsrReportBuilder:
             "request": self.request_data,
         }
         report_data.update(self.template_data)
+        report_data.update(extra)
         template = self.template_loader.get_template(template_path)
         return template.render(report_data)
 
@@ -108,36 +130,48 @@ class DsrReportBuilder:
     def _add_collection(
         self, rows: List[Dict[str, Any]], dataset_name: str, collection_name: str
     ) -> None:
-        # track links to detail pages
-        detail_links = {}
-        for index, item in enumerate(rows, 1):
-            detail_url = f"{index}.html"
+        """
+        Generates a page for each item in the collection, and an index of the items split
+        across pages of execution.dsr_report_page_size items.
+        """
+        page_size: int = CONFIG.execution.dsr_report_page_size
+        pages: int = max(1, math.ceil(len(rows) / page_size))
+        for page in range(1, pages + 1):
+            page_filename = collection_page_filename(page)
+            # track links to detail pages
+            detail_links = {}
+            for index in range(
+                (page - 1) * page_size + 1, min(page * page_size, len(rows)) + 1
+            ):
+                detail_url = f"{index}.html"
+                self._add_file(
+                    f"/data/{dataset_name}/{collection_name}/{index}.html",
+                    self._populate_template(
+                        "templates/item.html",
+                        f"{collection_name} (item #{index})",
+                        None,
+                        rows[index - 1],
+                        back_link=page_filename,
+                    ),
+                )
+                detail_links[f"item #{index}"] = detail_url
+
+            # generate detail index page
             self._add_file(
-                f"/data/{dataset_name}/{collection_name}/{index}.html",
+                f"/data/{dataset_name}/{collection_name}/{page_filename}",
                 self._populate_template(
-                    "templates/item.html",
-                    f"{collection_name} (item #{index})",
+                    "templates/collection_index.html",
+                    collection_name,
                     None,
-                    item,
+                    detail_links,
+                    pagination=_pagination(page, pages),
                 ),
             )
-            detail_links[f"item #{index}"] = detail_url
 
-        # generate detail index page
-        self._add_file(
-            f"/data/{dataset_name}/{collection_name}/index.html",
-            self._populate_template(
-                "templates/collection_index.html",
-                collection_name,
-                None,
-                detail_links,
-            ),
-        )
-
-    def generate(self) -> BytesIO:
+    def generate(self) -> IO[bytes]:
         """
         Processes the request and DSR data to build zip file containing the DSR report.
-        Returns the zip file as an in-memory byte array.
+        Returns the zip file as a spooled temporary file, which the caller closes.
         """
         try:
             # all the css for the pages is in main.css
@@ -181,6 +215,18 @@ class DsrReportBuilder:
         return self.baos
 
 
+def _pagination(page: int, pages: int) -> Optional[Dict[str, Any]]:
+    """Links between the pages of a collection's index, if it has more than one page"""
+    if pages == 1:
+        return None
+    return {
+        "page": page,
+        "pages": pages,
+        "previous": collection_page_filename(page - 1) if page > 1 else None,
+        "next": collection_page_filename(page + 1) if page < pages else None,
+    }
+
+
 def _map_privacy_request(privacy_request: PrivacyRequest) -> Dict[str, Any]:
     """Creates a map with a subset of values from the privacy request"""
     request_data = {}
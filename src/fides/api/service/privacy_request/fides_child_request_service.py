@@ -0,0 +1,225 @@
+"""
+The shared poller of the privacy requests Fides connectors create on child Fides
+servers, see `fides.api.service.connectors.fides.child_requests`.
+
+Every `POLL_INTERVAL_SECONDS`, one server checks the statuses of the outstanding child
+requests, in batches, on each child server that hasn't been polled within its
+connector's polling interval. A child server's post-execution webhook can call back
+to have it polled on the next run instead.
+"""
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from httpx import HTTPError
+from loguru import logger
+from redis.exceptions import LockError
+from sqlalchemy.orm import Session
+
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.privacy_request import (
+    CheckpointActionRequired,
+    PrivacyRequest,
+    PrivacyRequestStatus,
+)
+from fides.api.service.connectors.fides.child_requests import (
+    PARENTS_TO_RESUME_KEY,
+    OutstandingChildRequest,
+    finish_child_request,
+    get_outstanding_child_request,
+    get_outstanding_child_requests,
+)
+from fides.api.service.connectors.fides.fides_client import COMPLETION_STATUSES
+from fides.api.service.connectors.fides_connector import FidesConnector
+from fides.api.service.privacy_request.request_runner_service import (
+    queue_privacy_request,
+)
+from fides.api.tasks import DatabaseTask, celery_app
+from fides.api.tasks.scheduled.scheduler import scheduler
+from fides.api.util.cache import FidesopsRedis, get_cache
+from fides.api.util.errors import FidesError
+from fides.config import get_config
+
+CONFIG = get_config()
+CHECK_FIDES_CHILD_REQUESTS = "check_fides_child_requests"
+
+POLL_INTERVAL_SECONDS = 10
+# When each child server was last polled, by the key of its connection
+POLLED_AT_KEY = "fides-child-request-polled-at"
+POLLER_LOCK_KEY = "fides-child-request-poller"
+POLLER_LOCK_TIMEOUT_SECONDS = 600
+
+
+def poll_child_servers(db: Session, cache: FidesopsRedis) -> int:
+    """
+    Checks the statuses of the outstanding child requests on each child server that's
+    due to be polled, one login and a batch of status lookups per server. Returns how
+    many child requests finished or timed out.
+    """
+    by_connection: Dict[str, Dict[str, OutstandingChildRequest]] = defaultdict(dict)
+    for child_id, outstanding in get_outstanding_child_requests(cache).items():
+        by_connection[outstanding.connection_key][child_id] = outstanding
+    polled_at: Dict[str, str] = cache.hgetall(POLLED_AT_KEY)
+
+    finished = 0
+    for connection_key, children in by_connection.items():
+        now: float = time.time()
+        connection_config: Optional[ConnectionConfig] = ConnectionConfig.get_by(
+            db, field="key", value=connection_key
+        )
+        connector: Optional[FidesConnector] = None
+        statuses: Dict[str, PrivacyRequestStatus] = {}
+        if connection_config:
+            connector = FidesConnector(connection_config)
+            if now - float(polled_at.get(connection_key, 0)) < (
+                connector.polling_interval
+            ):
+                continue
+            cache.hset(POLLED_AT_KEY, connection_key, str(now))
+            try:
+                statuses = connector.client().request_statuses(list(children))
+            except (HTTPError, FidesError) as exc:
+                logger.warning(
+                    "Unable to check the status of {} privacy requests on remote Fides {}: {}",
+                    len(children),
+                    connection_key,
+                    exc,
+                )
+        else:
+            # Their parents are resumed to fail on the missing connection
+            logger.warning(
+                "Connection {} of {} outstanding child privacy requests no longer exists",
+                connection_key,
+                len(children),
+            )
+
+        pipe = cache.pipeline()
+        for child_id, outstanding in children.items():
+            status: Optional[PrivacyRequestStatus] = statuses.get(child_id)
+            if status in COMPLETION_STATUSES:
+                finish_child_request(pipe, child_id, outstanding, status.value)  # type: ignore[union-attr]
+            elif not connector or (
+                now - outstanding.created_at > connector.polling_timeout
+            ):
+                finish_child_request(pipe, child_id, outstanding, None)
+            else:
+                continue
+            finished += 1
+        pipe.execute()
+    return finished
+
+
+def resume_parent_requests(db: Session, cache: FidesopsRedis) -> int:
+    """
+    Resumes the paused privacy requests none of whose child requests are outstanding
+    anymore, from the step they paused at. Returns how many were resumed.
+    """
+    waiting: Set[str] = {
+        outstanding.parent_id
+        for outstanding in get_outstanding_child_requests(cache).values()
+    }
+    resumed = 0
+    for parent_id in cache.smembers(PARENTS_TO_RESUME_KEY) - waiting:
+        privacy_request: Optional[PrivacyRequest] = PrivacyRequest.get(
+            db, object_id=parent_id
+        )
+        if (
+            privacy_request
+            and privacy_request.status == PrivacyRequestStatus.in_processing
+        ):
+            # The child requests finished before the privacy request finished pausing
+            continue
+        cache.srem(PARENTS_TO_RESUME_KEY, parent_id)
+        if not privacy_request or privacy_request.status != PrivacyRequestStatus.paused:
+            continue
+
+        paused_details: Optional[
+            CheckpointActionRequired
+        ] = privacy_request.get_paused_collection_details()
+        if not paused_details:
+            logger.warning(
+                "Unable to resume privacy request {}, its paused step is unknown",
+                parent_id,
+            )
+            continue
+
+        logger.info(
+            "Resuming privacy request {} from {} step, its child privacy requests have finished",
+            parent_id,
+            paused_details.step.value,
+        )
+        privacy_request.status = PrivacyRequestStatus.in_processing
+        privacy_request.save(db=db)
+        queue_privacy_request(
+            privacy_request_id=privacy_request.id,
+            from_step=paused_details.step.value,
+        )
+        resumed += 1
+    return resumed
+
+
+def request_child_status_check(cache: FidesopsRedis, child_id: str) -> bool:
+    """
+    Has the child server of an outstanding child request polled on the poller's next
+    run, rather than once its polling interval has passed. Returns whether the child
+    request is outstanding.
+    """
+    outstanding: Optional[OutstandingChildRequest] = get_outstanding_child_request(
+        cache, child_id
+    )
+    if not outstanding:
+        return False
+    cache.hdel(POLLED_AT_KEY, outstanding.connection_key)
+    return True
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def check_fides_child_requests(self: DatabaseTask) -> None:
+    """Polls child servers for the statuses of outstanding child requests, and
+    resumes the privacy requests that were waiting on them"""
+    cache: FidesopsRedis = get_cache()
+    lock = cache.lock(POLLER_LOCK_KEY, timeout=POLLER_LOCK_TIMEOUT_SECONDS)
+    if not lock.acquire(blocking=False):
+        # Another server is polling
+        return
+
+    try:
+        with self.get_new_session() as session:
+            finished: int = poll_child_servers(session, cache)
+            resumed: int = resume_parent_requests(session, cache)
+        if finished or resumed:
+            logger.info(
+                "{} child privacy requests finished, {} privacy requests resumed",
+                finished,
+                resumed,
+            )
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Fides child request poller outlived its lock")
+
+
+def initiate_fides_child_request_polling() -> None:
+    """Schedules the polling of child servers for the statuses of child requests"""
+
+    if CONFIG.test_mode:
+        return
+
+    assert (
+        scheduler.running
+    ), "Scheduler is not running! Cannot add Fides child request polling job."
+
+    logger.info("Initiating scheduler for Fides child request polling")
+    scheduler.add_job(
+        func=check_fides_child_requests,
+        kwargs={},
+        id=CHECK_FIDES_CHILD_REQUESTS,
+        coalesce=True,
+        max_instances=1,
+        replace_existing=True,
+        trigger="interval",
+        seconds=POLL_INTERVAL_SECONDS,
+        next_run_time=datetime.now(),
+    )
@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import List
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.tasks import DatabaseTask, celery_app
+from fides.api.tasks.scheduled.scheduler import scheduler
+from fides.config import get_config
+
+CONFIG = get_config()
+IDENTITY_LOOKUP_HASH_BACKFILL = "identity_lookup_hash_backfill"
+
+# Identities created by servers that haven't been upgraded yet are picked up by the
+# next run; lookups fall back to their legacy hash until then
+BACKFILL_INTERVAL_HOURS = 1
+
+
+def backfill_lookup_hash_batch(db: Session, batch_size: int) -> int:
+    """
+    Gives a batch of identities without a lookup hash one, committing them in one
+    short transaction, and returns how many were backfilled. Rows locked by another
+    server's backfill are skipped, so several servers can backfill at once.
+    """
+    identities: List[ProvidedIdentity] = (
+        db.query(ProvidedIdentity)
+        .filter(ProvidedIdentity.lookup_hash.is_(None))
+        .order_by(ProvidedIdentity.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for identity in identities:
+        value = (identity.encrypted_value or {}).get("value")
+        # Identities without a value can't be searched for, they're marked as
+        # backfilled with an empty hash
+        identity.lookup_hash = (
+            ProvidedIdentity.lookup_hash_value(value) if value else ""
+        )
+    db.commit()
+    return len(identities)
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def backfill_identity_lookup_hashes(self: DatabaseTask) -> int:
+    """Gives every identity created before lookup hashes were added a lookup hash,
+    in batches of security.identity_lookup_hash_backfill_batch_size"""
+    batch_size: int = CONFIG.security.identity_lookup_hash_backfill_batch_size
+    backfilled = 0
+    with self.get_new_session() as session:
+        while batch := backfill_lookup_hash_batch(session, batch_size):
+            backfilled += batch
+            logger.debug("Backfilled {} identity lookup hashes", backfilled)
+    if backfilled:
+        logger.info("Backfilled {} identity lookup hashes", backfilled)
+    return backfilled
+
+
+def initiate_identity_lookup_hash_backfill() -> None:
+    """Schedules the backfill of identity lookup hashes, starting now"""
+
+    if CONFIG.test_mode:
+        return
+
+    assert (
+        scheduler.running
+    ), "Scheduler is not running! Cannot add identity lookup hash backfill job."
+
+    logger.info("Initiating scheduler for identity lookup hash backfill")
+    scheduler.add_job(
+        func=backfill_identity_lookup_hashes,
+        kwargs={},
+        id=IDENTITY_LOOKUP_HASH_BACKFILL,
+        coalesce=True,
+        max_instances=1,
+        replace_existing=True,
+        trigger="interval",
+        hours=BACKFILL_INTERVAL_HOURS,
+        next_run_time=datetime.now(),
+    )
@@ -0,0 +1,299 @@
+"""
+Streaming export of privacy requests, as downloaded from the Admin UI.
+
+Privacy requests are read in chunks with keyset pagination on the requested sort
+column, and the identities, custom fields, denial reasons and policy action types
+for each chunk are loaded with a single query apiece. Each chunk is written out as
+soon as it is read, so neither memory use nor the number of queries per row grows
+with the size of the export.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import and_, or_
+from sqlalchemy.engine.row import Row  # type:ignore[import]
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.expression import nullslast
+
+from fides.api.models.audit_log import AuditLog, AuditLogAction
+from fides.api.models.policy import Policy
+from fides.api.models.privacy_request import (
+    CustomPrivacyRequestField,
+    PrivacyRequest,
+    PrivacyRequestStatus,
+    ProvidedIdentity,
+)
+from fides.api.schemas.privacy_request import PrivacyRequestExportFormat
+from fides.api.schemas.redis_cache import Identity
+from fides.api.util.enums import ColumnSort
+
+EXPORT_CHUNK_SIZE = 1000
+
+# Write a gzip container rather than a raw zlib stream
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+CSV_HEADERS = {
+    "status": "Status",
+    "request_type": "Request Type",
+    "identity": "Subject Identity",
+    "custom_privacy_request_fields": "Custom Privacy Request Fields",
+    "created_at": "Time Received",
+    "reviewed_by": "Reviewed By",
+    "id": "Request ID",
+    "reviewed_at": "Time Approved/Denied",
+    "denial_reason": "Denial Reason",
+}
+
+EXPORT_MEDIA_TYPES = {
+    PrivacyRequestExportFormat.csv: "text/csv",
+    PrivacyRequestExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def _keyset_filter(
+    sort_column: Any, sort_direction: ColumnSort, last_value: Any, last_id: str
+) -> ColumnElement:
+    """
+    Matches the rows that come after (last_value, last_id) when ordering by the
+    sort column with nulls last, and then by id.
+    """
+    if last_value is None:
+        return and_(sort_column.is_(None), PrivacyRequest.id > last_id)
+
+    after_value = (
+        sort_column > last_value
+        if sort_direction == ColumnSort.ASC
+        else sort_column < last_value
+    )
+    return or_(
+        after_value,
+        and_(sort_column == last_value, PrivacyRequest.id > last_id),
+        sort_column.is_(None),
+    )
+
+
+def iter_privacy_request_chunks(
+    privacy_request_query: Query,
+    sort_field: str = "created_at",
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[List[Row]]:
+    """
+    Yields the exported columns of the privacy requests matched by the query, in
+    chunks of up to `chunk_size` rows ordered by the sort field.
+
+    Each chunk is fetched with a keyset filter on the last row of the previous one,
+    so later chunks are as cheap to fetch as the first, unlike OFFSET pagination.
+    """
+    sort_column = getattr(PrivacyRequest, sort_field)
+    query = privacy_request_query.order_by(None).with_entities(
+        PrivacyRequest.id,
+        PrivacyRequest.status,
+        PrivacyRequest.policy_id,
+        PrivacyRequest.created_at,
+        PrivacyRequest.reviewed_by,
+        PrivacyRequest.reviewed_at,
+        sort_column.label("sort_value"),
+    )
+    ordering = (
+        nullslast(getattr(sort_column, sort_direction.value)()),
+        PrivacyRequest.id.asc(),
+    )
+
+    keyset: Optional[ColumnElement] = None
+    while True:
+        chunk_query = query if keyset is None else query.filter(keyset)
+        chunk: List[Row] = chunk_query.order_by(*ordering).limit(chunk_size).all()
+        if chunk:
+            yield chunk
+        if len(chunk) < chunk_size:
+            return
+        keyset = _keyset_filter(
+            sort_column, sort_direction, chunk[-1].sort_value, chunk[-1].id
+        )
+
+
+def _get_persisted_identities(
+    db: Session, privacy_request_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Loads and decrypts the identities of all of the given privacy requests at once"""
+    identities: Dict[str, Identity] = {
+        privacy_request_id: Identity() for privacy_request_id in privacy_request_ids
+    }
+    for privacy_request_id, field_name, encrypted_value in db.query(
+        ProvidedIdentity.privacy_request_id,
+        ProvidedIdentity.field_name,
+        ProvidedIdentity.encrypted_value,
+    ).filter(ProvidedIdentity.privacy_request_id.in_(privacy_request_ids)):
+        if encrypted_value is not None:
+            setattr(
+                identities[privacy_request_id],
+                field_name.value,
+                encrypted_value["value"],
+            )
+    return {
+        privacy_request_id: identity.dict()
+        for privacy_request_id, identity in identities.items()
+    }
+
+
+def _get_persisted_custom_privacy_request_fields(
+    db: Session, privacy_request_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Loads and decrypts the custom fields of all of the given privacy requests at once"""
+    custom_fields: Dict[str, Dict[str, Any]] = {
+        privacy_request_id: {} for privacy_request_id in privacy_request_ids
+    }
+    for privacy_request_id, field_name, field_label, encrypted_value in db.query(
+        CustomPrivacyRequestField.privacy_request_id,
+        CustomPrivacyRequestField.field_name,
+        CustomPrivacyRequestField.field_label,
+        CustomPrivacyRequestField.encrypted_value,
+    ).filter(CustomPrivacyRequestField.privacy_request_id.in_(privacy_request_ids)):
+        if encrypted_value is not None:
+            custom_fields[privacy_request_id][field_name] = {
+                "label": field_label,
+                "value": encrypted_value["value"],
+            }
+    return custom_fields
+
+
+def _get_denial_reasons(db: Session, privacy_request_ids: List[str]) -> Dict[str, str]:
+    return {
+        privacy_request_id: message
+        for privacy_request_id, message in db.query(
+            AuditLog.privacy_request_id, AuditLog.message
+        ).filter(
+            AuditLog.action == AuditLogAction.denied,
+            AuditLog.privacy_request_id.in_(privacy_request_ids),
+        )
+    }
+
+
+def _load_action_types(
+    db: Session, policy_ids: Set[str], action_types: Dict[str, Optional[str]]
+) -> None:
+    """Adds the action types of any policies not yet in `action_types`"""
+    missing = policy_ids - action_types.keys()
+    if not missing:
+        return
+    for policy in (
+        db.query(Policy)
+        .options(selectinload(Policy.rules))  # type: ignore[attr-defined]
+        .filter(Policy.id.in_(missing))
+    ):
+        action_type = policy.get_action_type()
+        action_types[policy.id] = action_type.value if action_type else None
+
+
+def iter_privacy_request_export_rows(
+    db: Session,
+    privacy_request_query: Query,
+    sort_field: str = "created_at",
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yields the privacy requests matched by the query as chunks of export rows"""
+    action_types: Dict[str, Optional[str]] = {}
+
+    for chunk in iter_privacy_request_chunks(
+        privacy_request_query, sort_field, sort_direction, chunk_size
+    ):
+        privacy_request_ids = [row.id for row in chunk]
+        identities = _get_persisted_identities(db, privacy_request_ids)
+        custom_fields = _get_persisted_custom_privacy_request_fields(
+            db, privacy_request_ids
+        )
+        denial_reasons = _get_denial_reasons(
+            db,
+            [row.id for row in chunk if row.status == PrivacyRequestStatus.denied],
+        )
+        _load_action_types(
+            db, {row.policy_id for row in chunk if row.policy_id}, action_types
+        )
+
+        yield [
+            {
+                "status": row.status.value if row.status else None,
+                "request_type": action_types.get(row.policy_id),
+                "identity": identities[row.id],
+                "custom_privacy_request_fields": custom_fields[row.id],
+                "created_at": row.created_at,
+                "reviewed_by": row.reviewed_by,
+                "id": row.id,
+                "reviewed_at": row.reviewed_at,
+                "denial_reason": denial_reasons.get(row.id),
+            }
+            for row in chunk
+        ]
+
+
+def _json_default(o: Any) -> Any:
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    return str(o)
+
+
+def format_export_chunks(
+    chunks: Iterable[List[Dict[str, Any]]],
+    export_format: PrivacyRequestExportFormat = PrivacyRequestExportFormat.csv,
+) -> Iterator[str]:
+    """Formats each chunk of export rows as CSV or newline delimited JSON"""
+    if export_format == PrivacyRequestExportFormat.ndjson:
+        for chunk in chunks:
+            yield "".join(
+                json.dumps(row, default=_json_default) + "\n" for row in chunk
+            )
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADERS.values())
+    for chunk in chunks:
+        writer.writerows([row[key] for key in CSV_HEADERS] for row in chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Nothing was exported, so only the header was written
+        yield buffer.getvalue()
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Compresses the streamed chunks into a single gzip file"""
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode())
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_privacy_request_export(
+    db: Session,
+    privacy_request_query: Query,
+    sort_field: str = "created_at",
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    export_format: PrivacyRequestExportFormat = PrivacyRequestExportFormat.csv,
+    gzip: bool = False,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Streams the privacy requests matched by the query in the given format,
+    optionally gzipped, one chunk at a time.
+    """
+    formatted = format_export_chunks(
+        iter_privacy_request_export_rows(
+            db, privacy_request_query, sort_field, sort_direction, chunk_size
+        ),
+        export_format,
+    )
+    return gzip_stream(formatted) if gzip else formatted
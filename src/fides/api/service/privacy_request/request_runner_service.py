@@ -22,15 +22,10 @@ from fides.api.graph.analytics_events import (
     failed_graph_analytics_event,
     fideslog_graph_failure,
 )
-from fides.api.graph.config import CollectionAddress, GraphDataset
+from fides.api.graph.config import CollectionAddress
 from fides.api.graph.graph import DatasetGraph
 from fides.api.models.audit_log import AuditLog, AuditLogAction
-from fides.api.models.connectionconfig import (
-    AccessLevel,
-    ConnectionConfig,
-    ConnectionType,
-)
-from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.models.connectionconfig import AccessLevel, ConnectionConfig
 from fides.api.models.manual_webhook import AccessManualWebhook
 from fides.api.models.policy import (
     CurrentStep,
@@ -61,6 +56,9 @@ from fides.api.service.connectors.erasure_email_connector import (
 )
 from fides.api.service.connectors.fides_connector import filter_fides_connector_datasets
 from fides.api.service.messaging.message_dispatch_service import dispatch_message
+from fides.api.service.privacy_request.dataset_graph_cache import (
+    get_compiled_dataset_graph,
+)
 from fides.api.service.storage.storage_uploader_service import upload
 from fides.api.task.filter_results import filter_data_categories
 from fides.api.task.graph_task import (
@@ -75,6 +73,7 @@ from fides.api.util.cache import (
     FidesopsRedis,
     get_async_task_tracking_cache_key,
     get_cache,
+    get_privacy_request_cache_index,
 )
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii, _log_exception, _log_warning
@@ -292,6 +291,10 @@ def queue_privacy_request(
             get_async_task_tracking_cache_key(privacy_request_id),
             task.task_id,
         )
+        cache.add_to_index(
+            get_privacy_request_cache_index(privacy_request_id),
+            get_async_task_tracking_cache_key(privacy_request_id),
+        )
     except DataError:
         logger.debug(
             "Error tracking task_id for request with id {}", privacy_request_id
@@ -376,9 +379,8 @@ async def run_privacy_request(
             )
 
         try:
-            datasets = DatasetConfig.all(db=session)
-            dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-            dataset_graph = DatasetGraph(*dataset_graphs)
+            compiled_graph = get_compiled_dataset_graph(session)
+            dataset_graph = compiled_graph.graph
             identity_data = privacy_request.get_cached_identity_data()
             connection_configs = ConnectionConfig.all(db=session)
             fides_connector_datasets: Set[str] = filter_fides_connector_datasets(
@@ -437,7 +439,7 @@ async def run_privacy_request(
                 await run_consent_request(
                     privacy_request=privacy_request,
                     policy=policy,
-                    graph=build_consent_dataset_graph(datasets),
+                    graph=compiled_graph.consent_graph,
                     connection_configs=connection_configs,
                     identity=identity_data,
                     session=session,
@@ -518,31 +520,6 @@ async def run_privacy_request(
         privacy_request.save(db=session)
 
 
-def build_consent_dataset_graph(datasets: List[DatasetConfig]) -> DatasetGraph:
-    """
-    Build the starting DatasetGraph for consent requests.
-
-    Consent Graph has one node per dataset.  Nodes must be of saas type and have consent requests defined.
-    """
-    consent_datasets: List[GraphDataset] = []
-
-    for dataset_config in datasets:
-        connection_type: ConnectionType = (
-            dataset_config.connection_config.connection_type  # type: ignore
-        )
-        saas_config: Optional[Dict] = dataset_config.connection_config.saas_config
-        if (
-            connection_type == ConnectionType.saas
-            and saas_config
-            and saas_config.get("consent_requests")
-        ):
-            consent_datasets.append(
-                dataset_config.get_dataset_with_stubbed_collection()  # type: ignore[arg-type, assignment]
-            )
-
-    return DatasetGraph(*consent_datasets)
-
-
 def initiate_privacy_request_completion_email(
     session: Session,
     policy: Policy,
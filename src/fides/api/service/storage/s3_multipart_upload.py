@@ -0,0 +1,357 @@
+"""
+Multipart, resumable uploads of access packages to S3.
+
+Packages larger than `execution.access_package_upload_part_size` are uploaded in
+parts, several at a time, and each part is retried on its own if it fails. The
+package is kept on disk until the upload completes, and the parts uploaded so far
+are checkpointed in the privacy request's cache, so an upload interrupted by an
+error or a restarted worker picks up where it stopped instead of rebuilding and
+re-sending the package. A rebuilt package wouldn't match the parts already sent,
+since its encryption nonces and zip timestamps differ, so an upload whose package
+is no longer on disk is aborted and started over.
+
+Packages may hold unencrypted personal data, so they're kept in a directory only the
+user Fides runs as can access. An upload that fails in a way resuming won't fix, such
+as S3 denying access, is aborted and its package removed straight away.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+from loguru import logger
+
+from fides.api.util.cache import (
+    FidesopsRedis,
+    get_cache,
+    get_multipart_upload_cache_key,
+    get_privacy_request_cache_index,
+)
+from fides.api.util.storage_util import ensure_private_directory
+from fides.config import CONFIG
+
+# The field of the checkpoint holding the upload's details, the other fields are the
+# ETags of the uploaded parts, by part number
+CHECKPOINT_UPLOAD_FIELD = "upload"
+CHECKPOINT_PART_PREFIX = "part-"
+
+PACKAGE_FILE_SUFFIX = ".upload"
+RETRY_BACKOFF_SECONDS = 1
+# S3 errors an upload can be resumed after, besides server errors
+TRANSIENT_ERROR_CODES = {"RequestTimeout", "SlowDown", "Throttling"}
+
+
+def get_package_directory() -> str:
+    """The directory access packages are kept in while they're uploaded"""
+    return ensure_private_directory(
+        CONFIG.execution.access_package_upload_directory
+        or os.path.join(tempfile.gettempdir(), "fides_access_packages")
+    )
+
+
+def remove_stale_packages() -> None:
+    """Removes packages of uploads that can no longer be resumed, since their
+    checkpoints have expired"""
+    directory = get_package_directory()
+    expired_before = time.time() - CONFIG.redis.default_ttl_seconds
+    for filename in os.listdir(directory):
+        path = os.path.join(directory, filename)
+        if filename.endswith(PACKAGE_FILE_SUFFIX) and (
+            os.path.getmtime(path) < expired_before
+        ):
+            logger.info("Removing stale access package {}", filename)
+            os.remove(path)
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether an upload that failed with the error may succeed if it's resumed"""
+    if isinstance(exc, BotoCoreError):
+        # Connection errors and timeouts
+        return True
+    if isinstance(exc, ClientError):
+        status: int = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return (
+            status >= 500
+            or exc.response.get("Error", {}).get("Code") in TRANSIENT_ERROR_CODES
+        )
+    return False
+
+
+class ResumableS3Upload:
+    """An upload of an access package to S3, which can be resumed if interrupted"""
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket_name: str,
+        file_key: str,
+        privacy_request_id: str,
+    ):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.file_key = file_key
+        self.privacy_request_id = privacy_request_id
+        # Rules may upload packages with the same file key to different buckets
+        self.checkpoint_key = get_multipart_upload_cache_key(
+            privacy_request_id, f"{bucket_name}/{file_key}"
+        )
+        self.package_path = os.path.join(
+            get_package_directory(),
+            f"{privacy_request_id}-{bucket_name}-{file_key}{PACKAGE_FILE_SUFFIX}",
+        )
+
+    def resume(self) -> bool:
+        """
+        Finishes an interrupted upload of the package, if its package is still on disk.
+        Returns whether the package was uploaded, otherwise the package has to be built
+        and uploaded.
+        """
+        remove_stale_packages()
+        checkpoint: Dict[str, str] = get_cache().hgetall(self.checkpoint_key)
+        if CHECKPOINT_UPLOAD_FIELD not in checkpoint:
+            return False
+
+        upload: Dict[str, Any] = json.loads(checkpoint[CHECKPOINT_UPLOAD_FIELD])
+        upload_id: str = upload["upload_id"]
+        if (
+            not os.path.exists(self.package_path)
+            or os.path.getsize(self.package_path) != upload["package_size"]
+        ):
+            logger.info(
+                "Unable to resume upload of {}, the package is no longer available",
+                self.file_key,
+            )
+            self._abort(upload_id)
+            return False
+
+        try:
+            uploaded_parts: Dict[int, str] = self._list_uploaded_parts(upload_id)
+        except ClientError as exc:
+            # The upload was completed, aborted or expired
+            logger.info("Unable to resume upload of {}: {}", self.file_key, exc)
+            self._discard()
+            return False
+
+        # S3 lists the parts it has received, including any whose checkpoint wasn't
+        # saved before the interruption
+        for field, etag in checkpoint.items():
+            if field.startswith(CHECKPOINT_PART_PREFIX):
+                uploaded_parts.setdefault(
+                    int(field[len(CHECKPOINT_PART_PREFIX) :]), etag
+                )
+        logger.info(
+            "Resuming upload of {} with {} part(s) already uploaded",
+            self.file_key,
+            len(uploaded_parts),
+        )
+        self._upload_parts_or_abort(
+            upload_id, upload["package_size"], upload["part_size"], uploaded_parts
+        )
+        return True
+
+    def upload(self, package: IO[bytes]) -> None:
+        """Uploads the package, in parts if it's larger than one part"""
+        part_size: int = CONFIG.execution.access_package_upload_part_size
+        package_size: int = package.seek(0, os.SEEK_END)
+        package.seek(0)
+        if package_size <= part_size:
+            self.s3_client.upload_fileobj(
+                Fileobj=package, Bucket=self.bucket_name, Key=self.file_key
+            )
+            return
+
+        upload_id: str = self._start_upload(package, package_size, part_size)
+        self._upload_parts_or_abort(upload_id, package_size, part_size, {})
+
+    def _start_upload(
+        self, package: IO[bytes], package_size: int, part_size: int
+    ) -> str:
+        """
+        Keeps the package on disk and starts its multipart upload, checkpointing it so
+        the upload can be resumed. Returns the upload's id.
+        """
+        started_upload_id: Optional[str] = None
+        try:
+            # Readable only by the user Fides runs as
+            with os.fdopen(
+                os.open(
+                    self.package_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                ),
+                "wb",
+            ) as package_file:
+                shutil.copyfileobj(package, package_file)
+
+            upload_id: str = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=self.file_key
+            )["UploadId"]
+            started_upload_id = upload_id
+            self._save_checkpoint(
+                CHECKPOINT_UPLOAD_FIELD,
+                json.dumps(
+                    {
+                        "upload_id": upload_id,
+                        "package_size": package_size,
+                        "part_size": part_size,
+                    }
+                ),
+            )
+            return upload_id
+        except BaseException:
+            # The upload can't be resumed without its checkpoint
+            if started_upload_id:
+                self._abort(started_upload_id)
+            else:
+                self._discard()
+            raise
+
+    def _upload_parts_or_abort(
+        self,
+        upload_id: str,
+        package_size: int,
+        part_size: int,
+        uploaded_parts: Dict[int, str],
+    ) -> None:
+        """
+        Uploads the parts that haven't been uploaded yet. If the upload fails in a way
+        resuming it won't fix, it's aborted and its package removed, otherwise the
+        package is kept until the upload is resumed or its checkpoint expires.
+        """
+        try:
+            self._upload_parts(upload_id, package_size, part_size, uploaded_parts)
+        except BaseException as exc:
+            if not is_transient_error(exc):
+                logger.warning(
+                    "Aborting upload of {}, it can't be resumed: {}", self.file_key, exc
+                )
+                self._abort(upload_id)
+            raise
+
+    def _upload_parts(
+        self,
+        upload_id: str,
+        package_size: int,
+        part_size: int,
+        uploaded_parts: Dict[int, str],
+    ) -> None:
+        """Uploads the parts that haven't been uploaded yet, and completes the upload"""
+        part_numbers: List[int] = [
+            part_number
+            for part_number in range(1, math.ceil(package_size / part_size) + 1)
+            if part_number not in uploaded_parts
+        ]
+        with ThreadPoolExecutor(
+            max_workers=CONFIG.execution.access_package_upload_concurrency
+        ) as executor:
+            futures: Dict[int, Future] = {
+                part_number: executor.submit(
+                    self._upload_part, upload_id, part_number, part_size
+                )
+                for part_number in part_numbers
+            }
+        # Raises the first error, once every part has been attempted, leaving the
+        # uploaded parts checkpointed so the upload can be resumed
+        for part_number, future in futures.items():
+            uploaded_parts[part_number] = future.result()
+
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.file_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": uploaded_parts[part_number], "PartNumber": part_number}
+                    for part_number in sorted(uploaded_parts)
+                ]
+            },
+        )
+        self._discard()
+
+    def _upload_part(self, upload_id: str, part_number: int, part_size: int) -> str:
+        """Uploads one part, retrying it if it fails, and returns its ETag"""
+        with open(self.package_path, "rb") as package_file:
+            package_file.seek((part_number - 1) * part_size)
+            body: bytes = package_file.read(part_size)
+
+        retries: int = CONFIG.execution.access_package_upload_part_retries
+        for attempt in range(retries + 1):
+            try:
+                etag: str = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=self.file_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )["ETag"]
+                break
+            except (ClientError, BotoCoreError) as exc:
+                if attempt == retries:
+                    raise
+                logger.warning(
+                    "Retrying upload of part {} of {}: {}",
+                    part_number,
+                    self.file_key,
+                    exc,
+                )
+                time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+
+        self._save_checkpoint(f"{CHECKPOINT_PART_PREFIX}{part_number}", etag)
+        return etag
+
+    def _list_uploaded_parts(self, upload_id: str) -> Dict[int, str]:
+        """The ETags of the parts S3 has received for the upload, by part number"""
+        uploaded_parts: Dict[int, str] = {}
+        part_number_marker: int = 0
+        while True:
+            response: Dict[str, Any] = self.s3_client.list_parts(
+                Bucket=self.bucket_name,
+                Key=self.file_key,
+                UploadId=upload_id,
+                PartNumberMarker=part_number_marker,
+            )
+            for part in response.get("Parts", []):
+                uploaded_parts[part["PartNumber"]] = part["ETag"]
+            if not response.get("IsTruncated"):
+                return uploaded_parts
+            part_number_marker = response["NextPartNumberMarker"]
+
+    def _save_checkpoint(self, field: str, value: str) -> None:
+        cache: FidesopsRedis = get_cache()
+        pipe = cache.pipeline()
+        pipe.hset(self.checkpoint_key, field, value)
+        pipe.expire(self.checkpoint_key, CONFIG.redis.default_ttl_seconds)
+        cache.add_to_index(
+            get_privacy_request_cache_index(self.privacy_request_id),
+            self.checkpoint_key,
+            pipe=pipe,
+        )
+        pipe.execute()
+
+    def _abort(self, upload_id: str) -> None:
+        """Aborts an upload that can't be resumed, so S3 discards its parts"""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=self.file_key, UploadId=upload_id
+            )
+        except ClientError as exc:
+            logger.warning("Unable to abort upload of {}: {}", self.file_key, exc)
+        self._discard()
+
+    def _discard(self) -> None:
+        """Removes the checkpoint and the package kept for resuming the upload"""
+        if os.path.exists(self.package_path):
+            os.remove(self.package_path)
+        cache: FidesopsRedis = get_cache()
+        pipe = cache.pipeline()
+        pipe.delete(self.checkpoint_key)
+        pipe.srem(
+            get_privacy_request_cache_index(self.privacy_request_id),
+            self.checkpoint_key,
+        )
+        pipe.execute()
@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 import copy
 import traceback
 from abc import ABC
@@ -17,6 +18,7 @@ from fides.api.common_exceptions import (
     NotSupportedForCollection,
     PrivacyRequestErasureEmailSendRequired,
     PrivacyRequestPaused,
+    RowLimitExceededException,
     SkippingConsentPropagation,
     TraversalError,
 )
@@ -41,11 +43,12 @@ from fides.api.models.privacy_request import ExecutionLogStatus, PrivacyRequest
 from fides.api.models.sql_models import System  # type: ignore[attr-defined]
 from fides.api.schemas.policy import ActionType
 from fides.api.service.connectors.base_connector import BaseConnector
+from fides.api.service.connectors.limiter.rate_limiter import log_rate_limiter_stats
 from fides.api.task.consolidate_query_matches import consolidate_query_matches
 from fides.api.task.filter_element_match import filter_element_match
 from fides.api.task.refine_target_path import FieldPathNodeInput
 from fides.api.task.task_resources import TaskResources
-from fides.api.util.cache import get_cache
+from fides.api.util.cache import get_cache, get_privacy_request_cache_index
 from fides.api.util.collection_util import (
     NodeInput,
     Row,
@@ -94,8 +97,11 @@ def retry(
                         self.log_retry(action_type)
                     else:
                         self.log_start(action_type)
-                    # Run access or erasure request
-                    return func(*args, **kwargs)
+                    # Run access or erasure request, logging how long it waited on rate limits
+                    with log_rate_limiter_stats(
+                        f"{self.resources.request.id}, {self.traversal_node.address}"
+                    ):
+                        return func(*args, **kwargs)
                 except PrivacyRequestPaused as ex:
                     traceback.print_exc()
                     logger.warning(
@@ -141,6 +147,11 @@ def retry(
                             ExecutionLogStatus.skipped,
                         )
                     return default_return
+                except RowLimitExceededException as exc:
+                    # Retrying would match just as many rows, so fail right away
+                    traceback.print_exc()
+                    raised_ex = exc
+                    break
                 except BaseException as ex:  # pylint: disable=W0703
                     traceback.print_exc()
                     func_delay *= CONFIG.execution.task_retry_backoff
@@ -496,21 +507,18 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
 
         Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
         text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
-        out, both cached versions will be the same.
+        out, both versions are the same, so only the access request format is cached and erasures read it instead.
         """
         post_processed_node_input_data: FieldPathNodeInput = (
             self.post_process_input_data(formatted_input_data)
         )
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
+        # For erasures: results with non-matching array elements *replaced* with placeholder text
         placeholder_output: List[Row] = copy.deepcopy(output)
         for row in placeholder_output:
             filter_element_match(
                 row, query_paths=post_processed_node_input_data, delete_elements=False
             )
-        self.resources.cache_results_with_placeholders(
-            f"access_request__{self.key}", placeholder_output
-        )
 
         # For access request results, cache results with non-matching array elements *removed*
         for row in output:
@@ -521,6 +529,11 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             filter_element_match(row, post_processed_node_input_data)
         self.resources.cache_object(f"access_request__{self.key}", output)
 
+        if placeholder_output != output:
+            self.resources.cache_results_with_placeholders(
+                f"access_request__{self.key}", placeholder_output
+            )
+
         # Return filtered rows with non-matched array data removed.
         return output
 
@@ -771,17 +784,22 @@ def get_cached_data_for_erasures(
     """
     Fetches processed access request results to be used for erasures.
 
-    Processing may have added indicators to not mask certain elements in array data.
+    Processing may have added indicators to not mask certain elements in array data. Collections
+    without placeholder results were unchanged by processing, so their access results are used.
     """
     cache = get_cache()
-    value_dict = cache.get_encoded_objects_by_prefix(
-        f"PLACEHOLDER_RESULTS__{privacy_request_id}"
-    )
-    number_of_leading_strings_to_exclude = 3
-    return {
-        extract_key_for_address(k, number_of_leading_strings_to_exclude): v
-        for k, v in value_dict.items()
+    index = get_privacy_request_cache_index(privacy_request_id)
+    erasure_data = {
+        extract_key_for_address(k, 2): v
+        for k, v in cache.get_encoded_objects_by_prefix(
+            f"{privacy_request_id}__access_request", index=index
+        ).items()
     }
+    for k, v in cache.get_encoded_objects_by_prefix(
+        f"PLACEHOLDER_RESULTS__{privacy_request_id}", index=index
+    ).items():
+        erasure_data[extract_key_for_address(k, 3)] = v
+    return erasure_data
 
 
 def update_erasure_mapping_from_cache(
@@ -32,6 +32,7 @@ from fides.api.service.connectors import (
 )
 from fides.api.service.connectors.base_email_connector import BaseEmailConnector
 from fides.api.util.cache import get_cache
+from fides.api.util.cache_codec import get_result_cache_codec
 from fides.api.util.collection_util import Row, extract_key_for_address
 
 
@@ -114,6 +115,7 @@ class TaskResources:
         self.request = request
         self.policy = policy
         self.cache = get_cache()
+        self.result_cache_codec = get_result_cache_codec()
         # tbd populate connection configurations.
         self.connection_configs: Dict[str, ConnectionConfig] = {
             c.key: c for c in connection_configs
@@ -134,17 +136,25 @@ class TaskResources:
         stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS
         """
         self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}",
+            value,
+            self.result_cache_codec,
+            index=self.request.cache_index,
         )
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}",
+            value,
+            self.result_cache_codec,
+            index=self.request.cache_index,
+        )
 
     def get_all_cached_objects(self) -> Dict[str, Optional[List[Row]]]:
         """Retrieve the access results of all steps (cache_object)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__access_request"
+            f"{self.request.id}__access_request", index=self.request.cache_index
         )
         # extract request id to return a map of address:value
         number_of_leading_strings_to_exclude = 2
@@ -158,13 +168,15 @@ class TaskResources:
         'REQUEST_ID__erasure_request__ADDRESS
         '"""
         self.cache.set_encoded_object(
-            f"{self.request.id}__erasure_request__{key}", value
+            f"{self.request.id}__erasure_request__{key}",
+            value,
+            index=self.request.cache_index,
         )
 
     def get_all_cached_erasures(self) -> Dict[str, int]:
         """Retrieve which collections have been masked and their row counts(cache_erasure)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__erasure_request"
+            f"{self.request.id}__erasure_request", index=self.request.cache_index
         )
         # extract request id to return a map of address:value
         number_of_leading_strings_to_exclude = 2
@@ -2,17 +2,17 @@ from __future__ import annotations
 
 import json
 import os
-import secrets
+import shutil
 import zipfile
 from io import BytesIO
-from typing import Any, Dict, Optional, Set, Union
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 
 import pandas as pd
 from boto3 import Session
 from botocore.exceptions import ClientError, ParamValidationError
 from loguru import logger
 
-from fides.api.cryptography.cryptographic_util import bytes_to_b64_str
 from fides.api.graph.graph import DataCategoryFieldMapping
 from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.storage.storage import (
@@ -23,9 +23,13 @@ from fides.api.schemas.storage.storage import (
 from fides.api.service.privacy_request.dsr_package.dsr_report_builder import (
     DsrReportBuilder,
 )
+from fides.api.service.storage.s3_multipart_upload import ResumableS3Upload
 from fides.api.util.cache import get_cache, get_encryption_cache_key
-from fides.api.util.encryption.aes_gcm_encryption_scheme import (
-    encrypt_to_bytes_verify_secrets_length,
+from fides.api.util.encryption.segmented_encryption_scheme import (
+    SEGMENT_SEPARATOR,
+    encrypt_segments,
+    regroup_segments,
+    split_segments,
 )
 from fides.api.util.storage_authenticator import get_s3_session
 from fides.api.util.storage_util import storage_json_encoder
@@ -33,66 +37,122 @@ from fides.config import CONFIG
 
 LOCAL_FIDES_UPLOAD_DIRECTORY = "fides_uploads"
 
+# The size of the chunks access packages are written in
+WRITE_CHUNK_SIZE = 65536
 
-def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
-    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
-    cache = get_cache()
-    encryption_cache_key = get_encryption_cache_key(
-        privacy_request_id=request_id,
-        encryption_attr="key",
+
+def _get_encryption_key(request_id: str) -> Optional[bytes]:
+    """The encryption key cached for the privacy request, if one was provided"""
+    encryption_key: str | None = get_cache().get(
+        get_encryption_cache_key(
+            privacy_request_id=request_id,
+            encryption_attr="key",
+        )
     )
-    if isinstance(data, bytes):
-        data = data.decode(CONFIG.security.encoding)
+    if not encryption_key:
+        return None
+    return encryption_key.encode(encoding=CONFIG.security.encoding)
 
-    encryption_key: str | None = cache.get(encryption_cache_key)
+
+def write_access_request_results(
+    data: Union[str, bytes, Iterable[bytes]], request_id: str, destination: IO[bytes]
+) -> None:
+    """Write data, or chunks of data as they're produced, to the destination, encrypted
+    in segments with the encryption key if provided, otherwise unencrypted. See
+    segmented_encryption_scheme for the format."""
+    if isinstance(data, str):
+        data = data.encode(CONFIG.security.encoding)
+
+    encryption_key: Optional[bytes] = _get_encryption_key(request_id)
     if not encryption_key:
-        return data
+        for chunk in [data] if isinstance(data, bytes) else data:
+            destination.write(chunk)
+        return
 
-    bytes_encryption_key: bytes = encryption_key.encode(
-        encoding=CONFIG.security.encoding
+    segments: Iterable[bytes] = (
+        split_segments(data) if isinstance(data, bytes) else regroup_segments(data)
     )
-    nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
-    # b64encode the entire nonce and the encrypted message together
-    return bytes_to_b64_str(
-        nonce
-        + encrypt_to_bytes_verify_secrets_length(data, bytes_encryption_key, nonce)
+    for index, encrypted_segment in enumerate(
+        encrypt_segments(segments, encryption_key)
+    ):
+        if index:
+            destination.write(SEGMENT_SEPARATOR)
+        destination.write(encrypted_segment)
+
+
+def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
+    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
+    buffer = BytesIO()
+    write_access_request_results(data, request_id, buffer)
+    return buffer.getvalue().decode(CONFIG.security.encoding)
+
+
+def spooled_file() -> IO[bytes]:
+    """A temporary file that's kept in memory until it outgrows
+    execution.access_package_spool_size, and is then moved to disk"""
+    return SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=CONFIG.execution.access_package_spool_size
     )
 
 
-def write_to_in_memory_buffer(
+def _iter_json_chunks(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Encodes the data as indented JSON, yielding it in chunks as it's encoded"""
+    encoder = json.JSONEncoder(indent=2, default=storage_json_encoder)
+    pending: List[str] = []
+    pending_length = 0
+    for fragment in encoder.iterencode(data):
+        pending.append(fragment)
+        pending_length += len(fragment)
+        if pending_length >= WRITE_CHUNK_SIZE:
+            yield "".join(pending).encode(CONFIG.security.encoding)
+            pending, pending_length = [], 0
+    yield "".join(pending).encode(CONFIG.security.encoding)
+
+
+def _iter_file_chunks(file: IO[bytes]) -> Iterator[bytes]:
+    return iter(lambda: file.read(WRITE_CHUNK_SIZE), b"")
+
+
+def write_access_package(
     resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
-) -> BytesIO:
-    """Write JSON/CSV data to in-memory file-like object to be passed to S3. Encrypt data if encryption key/nonce
-    has been cached for the given privacy request id
+) -> IO[bytes]:
+    """Write JSON/CSV/HTML data to a spooled temporary file to be passed to S3. Encrypt data
+    if encryption key/nonce has been cached for the given privacy request id.
+
+    The package is written as it's produced, and moved from memory to disk once it
+    outgrows execution.access_package_spool_size, so the memory used for writing it
+    doesn't grow with the size of the package. The caller closes the returned file.
 
     :param resp_format: str, should be one of ResponseFormat
     :param data: Dict
-    :param request_id: str, The privacy request id
+    :param privacy_request: PrivacyRequest
     """
-    logger.info("Writing data to in-memory buffer")
+    logger.info("Writing data to spooled file")
 
     if resp_format == ResponseFormat.json.value:
-        json_str = json.dumps(data, indent=2, default=storage_json_encoder)
-        return BytesIO(
-            encrypt_access_request_results(json_str, privacy_request.id).encode(
-                CONFIG.security.encoding
-            )
+        json_file = spooled_file()
+        write_access_request_results(
+            _iter_json_chunks(data), privacy_request.id, json_file
         )
+        json_file.seek(0)
+        return json_file
 
     if resp_format == ResponseFormat.csv.value:
-        zipped_csvs = BytesIO()
+        zipped_csvs = spooled_file()
         with zipfile.ZipFile(zipped_csvs, "w") as f:
             for key in data:
-                df = pd.json_normalize(data[key])
-                buffer = BytesIO()
-                df.to_csv(buffer, index=False, encoding=CONFIG.security.encoding)
-                buffer.seek(0)
-                f.writestr(
-                    f"{key}.csv",
-                    encrypt_access_request_results(
-                        buffer.getvalue(), privacy_request.id
-                    ),
-                )
+                with spooled_file() as csv_buffer:
+                    pd.json_normalize(data[key]).to_csv(
+                        csv_buffer, index=False, encoding=CONFIG.security.encoding
+                    )
+                    # Encryption grows the file by a third, which could take it
+                    # past the size a zip entry without ZIP64 extensions can hold
+                    force_zip64 = csv_buffer.tell() > zipfile.ZIP64_LIMIT // 2
+                    csv_buffer.seek(0)
+                    with f.open(f"{key}.csv", "w", force_zip64=force_zip64) as csv_file:
+                        write_access_request_results(
+                            _iter_file_chunks(csv_buffer), privacy_request.id, csv_file
+                        )
 
         zipped_csvs.seek(0)
         return zipped_csvs
@@ -144,13 +204,17 @@ def upload_to_s3(  # pylint: disable=R0913
         my_session = get_s3_session(auth_method, storage_secrets)
         s3_client = my_session.client("s3")
 
-        # handles file chunking
+        # large packages are uploaded in parts, resuming an interrupted upload
+        # without rebuilding the package if it's still on disk
         try:
-            s3_client.upload_fileobj(
-                Fileobj=write_to_in_memory_buffer(resp_format, data, privacy_request),
-                Bucket=bucket_name,
-                Key=file_key,
+            upload = ResumableS3Upload(
+                s3_client, bucket_name, file_key, privacy_request.id
             )
+            if not upload.resume():
+                with write_access_package(
+                    resp_format, data, privacy_request
+                ) as access_package:
+                    upload.upload(access_package)
         except Exception as e:
             logger.error("Encountered error while uploading s3 object: {}", e)
             raise e
@@ -182,9 +246,8 @@ def upload_to_local(
         os.makedirs(LOCAL_FIDES_UPLOAD_DIRECTORY)
 
     filename = f"{LOCAL_FIDES_UPLOAD_DIRECTORY}/{file_key}"
-    in_memory_file = write_to_in_memory_buffer(resp_format, data, privacy_request)
-
-    with open(filename, "wb") as file:
-        file.write(in_memory_file.getvalue())
+    with write_access_package(resp_format, data, privacy_request) as access_package:
+        with open(filename, "wb") as file:
+            shutil.copyfileobj(access_package, file)
 
     return "your local fides_uploads folder"
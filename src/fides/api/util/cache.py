@@ -7,11 +7,18 @@ from urllib.parse import quote, unquote_to_bytes
 from bson.objectid import ObjectId
 from loguru import logger
 from redis import Redis
-from redis.client import Script  # type: ignore
+from redis.client import Pipeline  # type: ignore
 from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 
 from fides.api import common_exceptions
 from fides.api.schemas.masking.masking_secrets import SecretType
+from fides.api.util.cache_codec import (
+    CODEC_PREFIX,
+    CacheCodec,
+    decode_with_codec,
+    encode_with_codec,
+    is_codec_encoded,
+)
 from fides.config import CONFIG
 
 # This constant represents every type a redis key may contain, and can be
@@ -20,6 +27,9 @@ RedisValue = Union[bytes, float, int, str]
 
 _connection = None
 
+# Member of an index which has tracked every key stored for it
+COMPLETE_INDEX_MARKER = "__complete__"
+
 ENCODED_BYTES_PREFIX = "quote_encoded_"
 ENCODED_DATE_PREFIX = "date_encoded_"
 ENCODED_MONGO_OBJECT_ID_PREFIX = "encoded_object_id_"
@@ -74,16 +84,63 @@ class FidesopsRedis(Redis):
         key: str,
         value: RedisValue,
         expire_time: int = CONFIG.redis.default_ttl_seconds,
+        index: Optional[str] = None,
     ) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
+        """Call the connection class' default set method with ex= our default TTL
+
+        If an index is given, the key is also added to that index."""
         if not expire_time:
             # We have to check this condition for the edge case where `None` is explicitly
             # passed to this method.
             expire_time = CONFIG.redis.default_ttl_seconds
-        return self.set(key, value, ex=expire_time)
+        if not index:
+            return self.set(key, value, ex=expire_time)
+
+        pipe = self.pipeline()
+        pipe.set(key, value, ex=expire_time)
+        self.add_to_index(index, key, expire_time=expire_time, pipe=pipe)
+        return pipe.execute()[0]
+
+    def create_index(self, index: str) -> None:
+        """
+        Mark the index as complete. Only indexes created before any of their keys were
+        stored are complete; keys stored before an index existed aren't in it, so
+        lookups of incomplete indexes still scan the keyspace.
+        """
+        self.add_to_index(index, COMPLETE_INDEX_MARKER)
+
+    def is_complete_index(self, index: str) -> bool:
+        """Whether the index has tracked its keys since they were first stored"""
+        return bool(self.sismember(index, COMPLETE_INDEX_MARKER))
+
+    def add_to_index(
+        self,
+        index: str,
+        *keys: str,
+        expire_time: Optional[int] = None,
+        pipe: Optional[Pipeline] = None,
+    ) -> None:
+        """
+        Add keys to an index, a set of the keys stored for one privacy request, so they
+        can be found without scanning the keyspace. Each addition resets the index's
+        TTL to at least the default TTL, so it outlives the keys added to it.
+        """
+        client = pipe if pipe is not None else self.pipeline()
+        client.sadd(index, *keys)
+        client.expire(index, max(expire_time or 0, CONFIG.redis.default_ttl_seconds))
+        if pipe is None:
+            client.execute()
+
+    def get_keys_by_prefix(
+        self, prefix: str, chunk_size: int = 1000, index: Optional[str] = None
+    ) -> List[str]:
+        """Retrieve all keys that match a given prefix.
+
+        If an index is given and is complete, the keys are read from the index instead
+        of scanning the keyspace."""
+        if index and self.is_complete_index(index):
+            return [key for key in self.smembers(index) if key.startswith(prefix)]
 
-    def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
-        """Retrieve all keys that match a given prefix."""
         cursor: Any = "0"
         out = []
         while cursor != 0:
@@ -93,43 +150,83 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
-        )
-        s()
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix.
+
+        Keys are found with SCAN rather than KEYS, and unlinked in chunks, so Redis
+        isn't blocked while the keyspace is searched."""
+        keys = self.get_keys_by_prefix(prefix, chunk_size)
+        for start in range(0, len(keys), chunk_size):
+            self.unlink(*keys[start : start + chunk_size])
+
+    def delete_index(self, index: str, chunk_size: int = 1000) -> None:
+        """Delete every key in the index, in chunks, and the index itself"""
+        keys = list(self.smembers(index) - {COMPLETE_INDEX_MARKER})
+        for start in range(0, len(keys), chunk_size):
+            self.unlink(*keys[start : start + chunk_size])
+        self.unlink(index)
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
         dictionary. Note that if a key does not exist in redis it will be returned as None
         """
+        if not keys:
+            return {}
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
+    def set_encoded_object(
+        self,
+        key: str,
+        obj: Any,
+        codec: Optional[CacheCodec] = None,
+        index: Optional[str] = None,
+    ) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
-        get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        get_objects_by_prefix or processed with decode_obj.
+
+        The object is stored as JSON unless a codec is given, and added to the index if
+        one is given."""
+        return self.set_with_autoexpire(
+            f"EN_{key}", FidesopsRedis.encode_obj(obj, codec), index=index
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
         val = super().get(key)
         return self.decode_obj(val) if val else None
 
-    def get_encoded_objects_by_prefix(self, prefix: str) -> Dict[str, Optional[Any]]:
+    def get_encoded_objects_by_prefix(
+        self, prefix: str, index: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
         """Return all objects stored under a given prefix. This method
-        assumes these objects have been stored encoded using set_object"""
-        keys = self.get_keys_by_prefix(f"EN_{prefix}")
+        assumes these objects have been stored encoded using set_object
+
+        If an index is given, the objects are looked up in the index instead of
+        scanning the keyspace."""
+        keys = self.get_keys_by_prefix(f"EN_{prefix}", index=index)
         encoded_object_dict = self.get_values(keys)
         return {
             key: FidesopsRedis.decode_obj(value)
             for key, value in encoded_object_dict.items()
+            # an index may still list keys that have since expired or been deleted
+            if value is not None
         }
 
     @staticmethod
-    def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a JSON string that can be stored in Redis"""
+    def encode_obj(obj: Any, codec: Optional[CacheCodec] = None) -> bytes:
+        """Encode an object to a JSON string that can be stored in Redis, or with the
+        given codec if there is one"""
+        if codec:
+            try:
+                return encode_with_codec(obj, codec)  # type: ignore
+            except (OverflowError, TypeError, ValueError) as exc:
+                # e.g. integers too large for msgpack, which JSON can still store
+                logger.debug(
+                    "Unable to encode object with cache codec '{}', storing it as JSON. {}",
+                    codec.name,
+                    exc,
+                )
         return json.dumps(obj, cls=CustomJSONEncoder)  # type: ignore
 
     @staticmethod
@@ -137,7 +234,13 @@ class FidesopsRedis(Redis):
         """Decode an object from its JSON.
 
         Since Redis may not contain a value
-        for a given key it's possible we may try to decode an empty object."""
+        for a given key it's possible we may try to decode an empty object.
+
+        Values encoded with a cache codec are decoded with that codec."""
+        if isinstance(bs, bytes) and bs.startswith(CODEC_PREFIX.encode()):
+            bs = bs.decode()
+        if is_codec_encoded(bs):
+            return decode_with_codec(bs)  # type: ignore
         if bs:
             try:
                 result = json.loads(bs, object_hook=_custom_decoder)
@@ -230,12 +333,35 @@ def get_masking_secret_cache_key(
     )
 
 
+def get_multipart_upload_cache_key(privacy_request_id: str, file_key: str) -> str:
+    """Return the key of the checkpoint of this PrivacyRequest's upload of a file"""
+    return f"id-{privacy_request_id}-multipart-upload-{file_key}"
+
+
+def get_fides_child_request_cache_key(
+    privacy_request_id: str, connection_key: str, step: str
+) -> str:
+    """Return the key of the checkpoint of the requests this PrivacyRequest created
+    on a child Fides server"""
+    return f"id-{privacy_request_id}-fides-child-request-{connection_key}-{step}"
+
+
+def get_privacy_request_cache_index(privacy_request_id: str) -> str:
+    """Return the key of the index of the keys cached for this privacy request"""
+    return f"id-{privacy_request_id}-cache-index"
+
+
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
-    """Returns all cache keys related to this privacy request's cached identities"""
+    """Returns all cache keys related to this privacy request's cached identities
+    and results, including the index of them"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    index = get_privacy_request_cache_index(privacy_request_id)
+    if cache.is_complete_index(index):
+        return [index, *cache.smembers(index) - {COMPLETE_INDEX_MARKER}]
+    # requests cached before the index existed
+    return cache.get_keys_by_prefix(
+        f"{privacy_request_id}-"
+    ) + cache.get_keys_by_prefix(f"id-{privacy_request_id}-")
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
@@ -0,0 +1,128 @@
+"""
+Codecs for values stored in the Redis cache.
+
+Values encoded with a codec are stored as `fides-codec:<codec name>:<base64 payload>`,
+so they can be stored alongside, and told apart from, values stored as plain JSON.
+"""
+import zlib
+from abc import ABC, abstractmethod
+from base64 import b64decode, b64encode
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+import msgpack
+from bson.objectid import ObjectId
+
+from fides.config import CONFIG
+
+CODEC_PREFIX = "fides-codec:"
+
+# msgpack extension type codes
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_OBJECT_ID = 3
+
+
+class CacheCodec(ABC):
+    """Encodes cached values to bytes and back"""
+
+    name: str
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Encode the object to bytes"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode the bytes produced by `encode` back to the object"""
+
+
+def _msgpack_default(o: Any) -> Any:  # pylint: disable=too-many-return-statements
+    """Converts the types msgpack can't serialize, mirroring CustomJSONEncoder"""
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, datetime):
+        return msgpack.ExtType(EXT_DATETIME, o.isoformat().encode())
+    if isinstance(o, date):
+        return msgpack.ExtType(EXT_DATE, o.isoformat().encode())
+    if isinstance(o, ObjectId):
+        return msgpack.ExtType(EXT_OBJECT_ID, o.binary)
+    if isinstance(o, int):
+        raise OverflowError(f"Integer {o} is too large for msgpack")
+    if hasattr(o, "__dict__"):
+        return o.__dict__
+    return str(o)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == EXT_OBJECT_ID:
+        return ObjectId(data)
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackZlibCodec(CacheCodec):
+    """
+    msgpack, with extension types for datetimes, dates and Mongo ObjectIds, compressed
+    with zlib. Bytes are stored natively, so no values need to be prefixed and scanned.
+    """
+
+    name = "msgpack+zlib"
+
+    # Favor speed, most of the size reduction comes from the first levels
+    compression_level = 1
+
+    def encode(self, obj: Any) -> bytes:
+        packed = msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+        return zlib.compress(packed, self.compression_level)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(
+            zlib.decompress(data),
+            ext_hook=_msgpack_ext_hook,
+            raw=False,
+            strict_map_key=False,
+        )
+
+
+CACHE_CODECS: Dict[str, CacheCodec] = {
+    codec.name: codec for codec in [MsgpackZlibCodec()]
+}
+
+
+def get_cache_codec(name: str) -> CacheCodec:
+    """Returns the registered codec with the given name"""
+    try:
+        return CACHE_CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache codec '{name}'. Valid codecs are: {', '.join(CACHE_CODECS)}"
+        )
+
+
+def get_result_cache_codec() -> Optional[CacheCodec]:
+    """The codec privacy request results are cached with, or None to cache them as JSON"""
+    name = CONFIG.redis.result_cache_codec
+    if name == "json":
+        return None
+    return get_cache_codec(name)
+
+
+def is_codec_encoded(value: Any) -> bool:
+    """Whether the cached value was encoded with a codec rather than stored as JSON"""
+    return isinstance(value, str) and value.startswith(CODEC_PREFIX)
+
+
+def encode_with_codec(obj: Any, codec: CacheCodec) -> str:
+    """Encodes the object as a string that can be stored in Redis"""
+    return f"{CODEC_PREFIX}{codec.name}:{b64encode(codec.encode(obj)).decode()}"
+
+
+def decode_with_codec(value: str) -> Any:
+    """Decodes a value encoded with `encode_with_codec`, using the codec it names"""
+    name, _, payload = value[len(CODEC_PREFIX) :].partition(":")
+    return get_cache_codec(name).decode(b64decode(payload))
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Set
 
-import yaml
-
 from fides.api.common_exceptions import NoSuchConnectionTypeSecretSchemaError
 from fides.api.models.connectionconfig import ConnectionType
 from fides.api.schemas.connection_configuration import (
@@ -90,43 +88,11 @@ def get_connection_types(
             # if none of our filters are enabled, pass quickly to avoid unnecessary overhead
             return True
 
-        template = ConnectorRegistry.get_connector_template(connection_type)
-        if template is None:  # shouldn't happen, but we can be safe
+        summary = ConnectorRegistry.get_connector_template_summary(connection_type)
+        if summary is None:  # shouldn't happen, but we can be safe
             return False
 
-        saas_config = SaaSConfig(**yaml.safe_load(template.config).get("saas_config"))
-        has_access = bool(
-            next(
-                (
-                    request.read
-                    for request in [
-                        endpoint.requests for endpoint in saas_config.endpoints
-                    ]
-                ),
-                None,
-            )
-        )
-        has_erasure = (
-            bool(
-                next(
-                    (
-                        request.update or request.delete
-                        for request in [
-                            endpoint.requests for endpoint in saas_config.endpoints
-                        ]
-                    ),
-                    None,
-                )
-            )
-            or saas_config.data_protection_request
-        )
-        has_consent = saas_config.consent_requests
-
-        return bool(
-            (ActionType.consent in action_types and has_consent)
-            or (ActionType.access in action_types and has_access)
-            or (ActionType.erasure in action_types and has_erasure)
-        )
+        return any(action in action_types for action in summary.supported_actions)
 
     connection_system_types: list[ConnectionSystemTypeMap] = []
     if (system_type == SystemType.database or system_type is None) and (
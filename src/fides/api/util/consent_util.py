@@ -234,10 +234,7 @@ def get_fides_user_device_id_provided_identity(
         db=db,
         conditions=(
             (ProvidedIdentity.field_name == ProvidedIdentityType.fides_user_device_id)
-            & (
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value(fides_user_device_id)
-            )
+            & ProvidedIdentity.lookup_condition(db, fides_user_device_id)
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -266,9 +263,6 @@ def get_or_create_fides_user_device_id_provided_identity(
             data={
                 "privacy_request_id": None,
                 "field_name": ProvidedIdentityType.fides_user_device_id.value,
-                "hashed_value": ProvidedIdentity.hash_value(
-                    identity_data.fides_user_device_id
-                ),
                 "encrypted_value": {"value": identity_data.fides_user_device_id},
             },
         )
@@ -0,0 +1,98 @@
+"""
+An executor shared by masking strategies and access package encryption, so that
+encrypting and hashing many values or a large package isn't bound to one core.
+
+The executor is a thread pool or a process pool, as configured by
+`execution.crypto_executor`. The cryptography library releases the GIL while it
+encrypts, so threads suit large inputs like access package segments; a process pool
+also parallelizes the Python work done for each of many small values. Functions run
+on the executor must be picklable, that is, defined at module level, and are passed
+their secrets as arguments.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+from fides.config import CONFIG
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_executor: Optional[Executor] = None
+_executor_lock = Lock()
+
+
+def get_crypto_executor() -> Optional[Executor]:
+    """Returns the configured executor, creating it on first use, or None if crypto
+    work should run in the calling thread"""
+    global _executor  # pylint: disable=W0603
+    if CONFIG.execution.crypto_executor == "none":
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                executor_class = (
+                    ProcessPoolExecutor
+                    if CONFIG.execution.crypto_executor == "process"
+                    else ThreadPoolExecutor
+                )
+                _executor = executor_class(
+                    max_workers=CONFIG.execution.crypto_max_workers
+                )
+    return _executor
+
+
+def shutdown_crypto_executor() -> None:
+    """Shuts down the executor, so the next use creates one from the current config"""
+    global _executor  # pylint: disable=W0603
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def map_in_chunks(func: Callable[..., List[R]], values: List[T], *args: Any) -> List[R]:
+    """
+    Calls func(chunk, *args) for chunks of `execution.crypto_chunk_size` values on the
+    crypto executor, and returns the results of every chunk, in order. Values that fit
+    in a single chunk are processed in the calling thread, since handing them to the
+    executor would only add overhead.
+    """
+    chunk_size: int = CONFIG.execution.crypto_chunk_size
+    executor: Optional[Executor] = get_crypto_executor()
+    if executor is None or len(values) <= chunk_size:
+        return func(values, *args)
+
+    futures: List[Future] = [
+        executor.submit(func, values[start : start + chunk_size], *args)
+        for start in range(0, len(values), chunk_size)
+    ]
+    results: List[R] = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+def imap_ordered(func: Callable[..., R], items: Iterable[T], *args: Any) -> Iterator[R]:
+    """
+    Yields func(item, *args) for each item, in order, computing them on the crypto
+    executor. Only a few more items than there are workers are in flight at once, so
+    a large input can be streamed through without being held in memory.
+    """
+    executor: Optional[Executor] = get_crypto_executor()
+    if executor is None:
+        for item in items:
+            yield func(item, *args)
+        return
+
+    max_in_flight: int = CONFIG.execution.crypto_max_workers * 2
+    in_flight: Deque[Future] = deque()
+    for item in items:
+        in_flight.append(executor.submit(func, item, *args))
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().result()
+    while in_flight:
+        yield in_flight.popleft().result()
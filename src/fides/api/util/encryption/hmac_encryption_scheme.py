@@ -24,6 +24,34 @@ def hmac_encrypt_return_str(
     return _hmac_encrypt(value, hmac_key, salt, hashing_algorithm).hexdigest()
 
 
+def build_hmac_function(
+    hmac_key: str,
+    salt: str,
+    hashing_algorithm: HmacMaskingConfiguration.Algorithm,
+) -> Callable[[str], hmac.HMAC]:
+    """Returns a function that creates the hmac of a value, for hashing many values with
+    the same key and salt. The key is only set up once, and copied for each value."""
+    digestmod_mapping = {
+        HmacMaskingConfiguration.Algorithm.sha_256: hashlib.sha256,
+        HmacMaskingConfiguration.Algorithm.sha_512: hashlib.sha512,
+    }
+    if hashing_algorithm not in digestmod_mapping:
+        raise ValueError(f"{hashing_algorithm} is an unsupported hashing_algorithm")
+
+    keyed_hmac = hmac.new(
+        key=hmac_key.encode(CONFIG.security.encoding),
+        digestmod=digestmod_mapping[hashing_algorithm],
+    )
+    encoding: str = CONFIG.security.encoding
+
+    def _hmac_value(value: str) -> hmac.HMAC:
+        value_hmac = keyed_hmac.copy()
+        value_hmac.update((value + salt).encode(encoding))
+        return value_hmac
+
+    return _hmac_value
+
+
 def _hmac_encrypt(
     value: str,
     hmac_key: str,
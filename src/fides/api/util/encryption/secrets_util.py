@@ -1,5 +1,7 @@
 import secrets
-from typing import Dict, List, Optional, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, TypeVar
 
 from loguru import logger
 
@@ -12,8 +14,32 @@ from fides.api.util.cache import get_cache, get_masking_secret_cache_key
 
 T = TypeVar("T")
 
+# Secrets already read from the cache, while inside SecretsUtil.cached_secrets()
+_cached_secrets: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "cached_masking_secrets", default=None
+)
+
 
 class SecretsUtil:
+    @staticmethod
+    @contextmanager
+    def cached_secrets() -> Iterator[None]:
+        """
+        Keeps the masking secrets read from the cache in memory until the context exits,
+        so masking many values for a privacy request reads each secret only once.
+        Secrets aren't kept any longer than that, since they expire with the request.
+        """
+        if _cached_secrets.get() is not None:
+            # Already inside an outer context, which owns the cached secrets
+            yield
+            return
+
+        token = _cached_secrets.set({})
+        try:
+            yield
+        finally:
+            _cached_secrets.reset(token)
+
     @staticmethod
     def get_or_generate_secret(
         privacy_request_id: Optional[str],
@@ -43,13 +69,19 @@ class SecretsUtil:
         secret_type: SecretType,
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> Optional[T]:
-        cache = get_cache()
         masking_secret_cache_key: str = get_masking_secret_cache_key(
             privacy_request_id=privacy_request_id,
             masking_strategy=masking_secret_meta.masking_strategy,
             secret_type=secret_type,
         )
-        return cache.get_encoded_by_key(masking_secret_cache_key)
+        cached_secrets: Optional[Dict[str, Any]] = _cached_secrets.get()
+        if cached_secrets is not None and masking_secret_cache_key in cached_secrets:
+            return cached_secrets[masking_secret_cache_key]
+
+        secret: Optional[T] = get_cache().get_encoded_by_key(masking_secret_cache_key)
+        if cached_secrets is not None and secret:
+            cached_secrets[masking_secret_cache_key] = secret
+        return secret
 
     @staticmethod
     def generate_secret_string(length: int) -> str:
@@ -0,0 +1,160 @@
+"""
+Segmented AES GCM encryption, for access packages too large to encrypt as one value.
+
+The plaintext is split into segments of `execution.access_package_segment_size`
+bytes, and each segment is encrypted separately, so segments can be encrypted in
+parallel and a package can be decrypted as a stream, one segment at a time.
+
+Format
+------
+An encrypted package is one or more encrypted segments separated by a newline
+(``\\n``), with no trailing newline. Each encrypted segment is the standard base64
+encoding of::
+
+    nonce (12 bytes) || AES GCM ciphertext and 16 byte tag
+
+The segment is encrypted with the request's encryption key, and its nonce is also
+its associated data. The nonce is made up of::
+
+    package prefix (7 random bytes) || final flag (1 byte) || segment index (4 bytes)
+
+The prefix is shared by every segment of a package. The final flag is 1 for the last
+segment and 0 for every other, and the index is the segment's position in the
+package, starting at 0, as a big-endian unsigned integer. An empty plaintext is a
+single, empty, final segment.
+
+To decrypt a package, read it line by line, base64 decode each line, split off the
+first 12 bytes as the nonce and decrypt the rest with AES GCM, using the nonce as
+associated data, then concatenate the plaintext segments. Checking that every nonce
+has the first segment's prefix, the expected index and a final flag only on the last
+segment detects segments that were reordered, dropped or taken from another
+package; `decrypt_segments` does so.
+
+A package that fits in one segment is the base64 encoding of its nonce and
+ciphertext, as access packages were before they were segmented, so it can still be
+decrypted with `decrypt_combined_nonce_and_message`.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import secrets
+from typing import Iterable, Iterator, Optional, Tuple
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from fides.api.util.encryption.aes_gcm_encryption_scheme import verify_encryption_key
+from fides.api.util.encryption.crypto_executor import imap_ordered
+from fides.config import CONFIG
+
+SEGMENT_SEPARATOR = b"\n"
+
+NONCE_PREFIX_LENGTH = 7
+NONCE_LENGTH = 12
+FINAL_SEGMENT = b"\x01"
+NON_FINAL_SEGMENT = b"\x00"
+
+
+def split_segments(data: bytes, segment_size: Optional[int] = None) -> Iterator[bytes]:
+    """Splits the data into plaintext segments. Empty data is a single empty segment."""
+    segment_size = segment_size or CONFIG.execution.access_package_segment_size
+    view = memoryview(data)
+    yield bytes(view[:segment_size])
+    for start in range(segment_size, len(data), segment_size):
+        yield bytes(view[start : start + segment_size])
+
+
+def regroup_segments(
+    chunks: Iterable[bytes], segment_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """Regroups chunks of any size, as they're produced, into plaintext segments.
+    No chunks is a single empty segment."""
+    segment_size = segment_size or CONFIG.execution.access_package_segment_size
+    buffer = bytearray()
+    produced = False
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= segment_size:
+            produced = True
+            yield bytes(buffer[:segment_size])
+            del buffer[:segment_size]
+    if buffer or not produced:
+        yield bytes(buffer)
+
+
+def _build_nonce(prefix: bytes, index: int, final: bool) -> bytes:
+    return (
+        prefix
+        + (FINAL_SEGMENT if final else NON_FINAL_SEGMENT)
+        + index.to_bytes(4, "big")
+    )
+
+
+def _encrypt_segment(segment: bytes, key: bytes, nonce: bytes) -> bytes:
+    """Encrypts one segment, returning the base64 encoded nonce and ciphertext"""
+    return base64.b64encode(nonce + AESGCM(key).encrypt(nonce, segment, nonce))
+
+
+def _encrypt_indexed_segment(
+    indexed_segment: Tuple[int, bytes, bool], key: bytes, prefix: bytes
+) -> bytes:
+    index, segment, final = indexed_segment
+    return _encrypt_segment(segment, key, _build_nonce(prefix, index, final))
+
+
+def _mark_final(segments: Iterable[bytes]) -> Iterator[Tuple[int, bytes, bool]]:
+    """Pairs each segment with its index and whether it's the last segment"""
+    previous: Optional[bytes] = None
+    index = 0
+    for segment in segments:
+        if previous is not None:
+            yield index, previous, False
+            index += 1
+        previous = segment
+    yield index, previous if previous is not None else b"", True
+
+
+def encrypt_segments(segments: Iterable[bytes], key: bytes) -> Iterator[bytes]:
+    """
+    Encrypts the plaintext segments in the segmented format, yielding each encrypted
+    segment, without separators, in order. Segments are encrypted on the crypto
+    executor, and only a few are held in memory at once.
+    """
+    verify_encryption_key(key)
+    prefix: bytes = secrets.token_bytes(NONCE_PREFIX_LENGTH)
+    yield from imap_ordered(
+        _encrypt_indexed_segment, _mark_final(segments), key, prefix
+    )
+
+
+def decrypt_segments(
+    encrypted_segments: Iterable[bytes], key: bytes
+) -> Iterator[bytes]:
+    """
+    Decrypts the encrypted segments of a package, yielding each plaintext segment in
+    order. Raises a ValueError if the segments aren't a complete package, in order.
+    """
+    verify_encryption_key(key)
+    gcm = AESGCM(key)
+    prefix: Optional[bytes] = None
+    final_seen = False
+    for index, encrypted_segment in enumerate(encrypted_segments):
+        if final_seen:
+            raise ValueError("Encrypted package has segments after its final segment")
+        try:
+            combined: bytes = base64.b64decode(encrypted_segment.strip(), validate=True)
+        except binascii.Error as exc:
+            raise ValueError(f"Segment {index} is not valid base64") from exc
+
+        nonce, encrypted = combined[:NONCE_LENGTH], combined[NONCE_LENGTH:]
+        if prefix is None:
+            prefix = nonce[:NONCE_PREFIX_LENGTH]
+        final_seen = (
+            nonce[NONCE_PREFIX_LENGTH : NONCE_PREFIX_LENGTH + 1] == FINAL_SEGMENT
+        )
+        if nonce != _build_nonce(prefix, index, final_seen):
+            raise ValueError(f"Segment {index} is out of order or from another package")
+        yield gcm.decrypt(nonce, encrypted, nonce)
+
+    if not final_seen:
+        raise ValueError("Encrypted package is missing its final segment")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Callable, Generic, Optional, TypeVar
+from collections import Counter
+from typing import Callable, Generic, Hashable, Optional, TypeVar
 
-T = TypeVar("T")
+T = TypeVar("T", bound=Hashable)
 
 
 class MatchingQueue(Generic[T]):
@@ -10,21 +11,31 @@ class MatchingQueue(Generic[T]):
 
     def __init__(self, *values: T):
         self.data = list(values)
+        # membership counts, so that push_if_new doesn't need to scan the queue
+        self._members: Counter[T] = Counter(self.data)
 
     def push(self, t: T) -> None:
         """insert into the queue"""
         self.data.append(t)
+        self._members[t] += 1
 
     def push_if_new(self, t: T) -> None:
         """insert into the queue only if this value is not already in the queue."""
-        if t not in self.data:
+        if not self._members[t]:
             self.push(t)
 
+    def _discard(self, t: T) -> None:
+        """Update membership counts for a value removed from the queue"""
+        self._members[t] -= 1
+        if not self._members[t]:
+            del self._members[t]
+
     def pop(self) -> Optional[T]:
         """safely return the next value in the queue, or None if the queue is empty."""
         if self.data:
             v = self.data[0]
             del self.data[0]
+            self._discard(v)
             return v
         return None
 
@@ -33,6 +44,7 @@ class MatchingQueue(Generic[T]):
         for idx, val in enumerate(self.data):
             if fn(val):
                 del self.data[idx]
+                self._discard(val)
                 return val
         # if no matching value exists, return None
         return None
@@ -0,0 +1,173 @@
+"""
+Snapshots of the privacy experience responses served to anonymous users.
+
+Responses that aren't supplemented with a user's saved preferences only depend on
+the query params and the experience, notice and system data, so they're rendered
+once and stored in this process and in Redis under a TableCacheVersion of those
+tables. Snapshots are served with a strong ETag, so browsers and CDNs can revalidate
+them with If-None-Match and get a 304 without the response being rebuilt.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+from loguru import logger
+from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.models.privacy_experience import (
+    PrivacyExperience,
+    PrivacyExperienceConfig,
+)
+from fides.api.models.privacy_notice import PrivacyNotice
+from fides.api.models.sql_models import (  # type:ignore[attr-defined]
+    PrivacyDeclaration,
+    System,
+)
+from fides.api.schemas.base_class import FidesSchema
+from fides.api.util.cache import FidesopsRedis, get_cache
+from fides.api.util.consent_util import UNESCAPE_SAFESTR_HEADER
+from fides.api.util.table_cache_version import TableCacheVersion
+from fides.api.util.tcf.tcf_experience_contents_cache import get_gvl_hash
+from fides.config import CONFIG
+
+PRIVACY_EXPERIENCE_SNAPSHOT_VERSION = TableCacheVersion(
+    "privacy-experience-snapshot-version",
+    [
+        PrivacyExperience.__tablename__,
+        PrivacyExperienceConfig.__tablename__,
+        PrivacyNotice.__tablename__,
+        System.__tablename__,
+        PrivacyDeclaration.__tablename__,
+    ],
+)
+PRIVACY_EXPERIENCE_SNAPSHOT_PREFIX = "privacy-experience-snapshot"
+
+# The number of snapshots kept in each process, one per distinct set of query params
+PROCESS_SNAPSHOT_LIMIT = 256
+
+_process_snapshots: "OrderedDict[str, ExperienceSnapshot]" = OrderedDict()
+_process_snapshots_lock = Lock()
+
+
+class ExperienceSnapshot(FidesSchema):
+    """A rendered privacy experience response body and its ETag"""
+
+    etag: str
+    body: str
+
+
+def get_experience_snapshot_key(params: Dict[str, Any]) -> Optional[str]:
+    """
+    The key the snapshot for these query params is stored under, for the current
+    experience, notice, system and GVL data. Returns None if Redis is unavailable,
+    since there's then no telling whether a snapshot is current.
+    """
+    try:
+        cache: FidesopsRedis = get_cache()
+        version = PRIVACY_EXPERIENCE_SNAPSHOT_VERSION.get(cache)
+    except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+        logger.warning("Unable to read privacy experience snapshots: {}", exc)
+        return None
+
+    params_hash = hashlib.sha256(
+        json.dumps(
+            {**params, "tcf_enabled": CONFIG.consent.tcf_enabled},
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+    return (
+        f"{PRIVACY_EXPERIENCE_SNAPSHOT_PREFIX}-{version}-{get_gvl_hash()}-{params_hash}"
+    )
+
+
+def _store_in_process(cache_key: str, snapshot: ExperienceSnapshot) -> None:
+    with _process_snapshots_lock:
+        _process_snapshots[cache_key] = snapshot
+        _process_snapshots.move_to_end(cache_key)
+        while len(_process_snapshots) > PROCESS_SNAPSHOT_LIMIT:
+            _process_snapshots.popitem(last=False)
+
+
+def get_experience_snapshot(cache_key: str) -> Optional[ExperienceSnapshot]:
+    """Returns the snapshot stored under the key, from this process or Redis"""
+    snapshot = _process_snapshots.get(cache_key)
+    if snapshot:
+        return snapshot
+
+    try:
+        cached_value: Optional[str] = get_cache().get(cache_key)
+    except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+        logger.warning("Unable to read privacy experience snapshot: {}", exc)
+        return None
+    if not cached_value:
+        return None
+
+    snapshot = ExperienceSnapshot.parse_raw(cached_value)
+    _store_in_process(cache_key, snapshot)
+    return snapshot
+
+
+def save_experience_snapshot(cache_key: str, body: bytes) -> ExperienceSnapshot:
+    """Stores the rendered response body under the key, and returns its snapshot"""
+    snapshot = ExperienceSnapshot(
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', body=body.decode()
+    )
+    _store_in_process(cache_key, snapshot)
+    try:
+        get_cache().set_with_autoexpire(cache_key, snapshot.json())
+    except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+        logger.warning("Unable to store privacy experience snapshot: {}", exc)
+    return snapshot
+
+
+def clear_process_experience_snapshots() -> None:
+    """Discard the snapshots stored in this process"""
+    with _process_snapshots_lock:
+        _process_snapshots.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag, so a 304 can be returned"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    # Weak comparison, as If-None-Match requires
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def experience_snapshot_response(
+    request: Request, snapshot: ExperienceSnapshot, response: Optional[Response] = None
+) -> Response:
+    """
+    The snapshot as a response, or a 304 with no body if the client already has it.
+
+    FastAPI only adds the headers set on an endpoint's response parameter, such as
+    the X-RateLimit-* headers, to responses it renders itself, so they're copied
+    onto the snapshot response.
+    """
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": f"public, max-age={CONFIG.consent.privacy_experience_max_age_seconds}, must-revalidate",
+        "Vary": UNESCAPE_SAFESTR_HEADER,
+    }
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        snapshot_response = Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        snapshot_response = Response(
+            content=snapshot.body, media_type="application/json", headers=headers
+        )
+    if response:
+        snapshot_response.raw_headers.extend(
+            (name, value)
+            for name, value in response.raw_headers
+            if name not in {b"content-length", b"content-type"}
+        )
+    return snapshot_response
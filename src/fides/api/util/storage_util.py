@@ -1,3 +1,5 @@
+import os
+import stat
 from datetime import datetime
 from typing import Any, Dict, Union
 
@@ -53,3 +55,22 @@ def storage_json_encoder(field: Any) -> Union[str, Dict[str, str]]:
     if isinstance(field, ObjectId):
         return {"$oid": str(field)}
     return field
+
+
+def ensure_private_directory(directory: str) -> str:
+    """
+    Creates the directory, if it doesn't exist, so that only the user Fides runs as
+    can access it. Raises a PermissionError if the directory is a symlink or belongs
+    to another user, since another user could then read or replace its files.
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    directory_stat = os.lstat(directory)
+    if not stat.S_ISDIR(directory_stat.st_mode) or (
+        directory_stat.st_uid != os.getuid()
+    ):
+        raise PermissionError(
+            f"{directory} must be a directory owned by the user Fides runs as"
+        )
+    if stat.S_IMODE(directory_stat.st_mode) & 0o077:
+        os.chmod(directory, 0o700)
+    return directory
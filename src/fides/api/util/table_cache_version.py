@@ -0,0 +1,111 @@
+"""
+Versions for values cached from database tables.
+
+A TableCacheVersion is kept in Redis and replaced with a new random value whenever a
+session commits changes to any of its tables, so values cached under a version are
+never served after the rows they were built from have changed. Changes are tracked
+through session flush and execute events, so bulk statements are covered too.
+"""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Iterable, List, Optional, Set
+from uuid import uuid4
+
+from loguru import logger
+from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.session import ORMExecuteState  # type:ignore[attr-defined]
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.util.cache import FidesopsRedis, get_cache
+
+# The tracked tables a session has uncommitted changes to, stored in Session.info
+SESSION_CHANGED_TABLES = "changed_cache_version_tables"
+
+_table_cache_versions: List[TableCacheVersion] = []
+_tracked_tables: Set[str] = set()
+
+
+class TableCacheVersion:
+    """A version, kept in Redis, that changes whenever any of the given tables do"""
+
+    def __init__(self, key: str, tables: Iterable[str]) -> None:
+        self.key = key
+        self.tables = frozenset(tables)
+        _table_cache_versions.append(self)
+        _tracked_tables.update(self.tables)
+
+    def get(self, cache: FidesopsRedis) -> str:
+        """Returns the current version, creating one if it doesn't exist yet"""
+        version: Optional[str] = cache.get(self.key)
+        if version is None:
+            # Versions are random rather than a counter, so that values cached before
+            # the version was lost can never be mistaken for current ones
+            cache.setnx(self.key, uuid4().hex)
+            version = cache.get(self.key)
+        return version  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        """Replaces the version, so values cached under the old one are no longer used"""
+        try:
+            get_cache().set(self.key, uuid4().hex)
+        except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+            logger.error("Unable to invalidate cache version '{}': {}", self.key, exc)
+
+
+def invalidate_table_cache_versions() -> None:
+    """
+    Invalidates every version. Run on startup, since migrations and data loaded
+    outside of a session aren't tracked.
+    """
+    for version in _table_cache_versions:
+        version.invalidate()
+
+
+def _mark_changed_tables(session: Session, tables: Iterable[str]) -> None:
+    changed = _tracked_tables.intersection(tables)
+    if changed:
+        session.info.setdefault(SESSION_CHANGED_TABLES, set()).update(changed)
+
+
+@event.listens_for(Session, "after_flush")
+def track_table_changes_on_flush(session: Session, _: Any) -> None:
+    """Records the tracked tables that a flush inserted, updated or deleted rows in"""
+    _mark_changed_tables(
+        session,
+        {
+            instance.__table__.name
+            for instance in chain(session.new, session.dirty, session.deleted)
+            if hasattr(instance, "__table__")
+        },
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_table_changes_on_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Records the tracked tables targeted by insert, update or delete statements"""
+    if orm_execute_state.is_select:
+        return
+    table_name: Optional[str] = getattr(
+        getattr(orm_execute_state.statement, "table", None), "name", None
+    )
+    if table_name:
+        _mark_changed_tables(orm_execute_state.session, [table_name])
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_versions_on_commit(session: Session) -> None:
+    """Invalidates the versions of the tables whose changes were just committed"""
+    changed: Set[str] = session.info.pop(SESSION_CHANGED_TABLES, set())
+    if not changed:
+        return
+    for version in _table_cache_versions:
+        if version.tables & changed:
+            version.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_table_changes_on_rollback(session: Session) -> None:
+    session.info.pop(SESSION_CHANGED_TABLES, None)
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic import Extra, root_validator
 
@@ -65,8 +65,13 @@ def build_tcf_version_hash(tcf_contents: TCFExperienceContents) -> str:
     return hashed_val[:12]  # Shortening string for usability, collision risk is low
 
 
-def build_experience_tcf_meta(tcf_contents: TCFExperienceContents) -> Dict:
-    """Build TCF Meta information to supplement a TCF Privacy Experience at runtime"""
+def build_experience_tcf_meta(
+    tcf_contents: TCFExperienceContents, version_hash: Optional[str] = None
+) -> Dict:
+    """Build TCF Meta information to supplement a TCF Privacy Experience at runtime
+
+    Pass the `version_hash` if it's already been built for these contents.
+    """
     accept_all_tc_model: TCModel = convert_tcf_contents_to_tc_model(
         tcf_contents, UserConsentPreference.opt_in
     )
@@ -78,7 +83,7 @@ def build_experience_tcf_meta(tcf_contents: TCFExperienceContents) -> Dict:
     reject_all_mobile_data: TCMobileData = build_tc_data_for_mobile(reject_all_tc_model)
 
     return ExperienceMeta(
-        version_hash=build_tcf_version_hash(tcf_contents),
+        version_hash=version_hash or build_tcf_version_hash(tcf_contents),
         accept_all_fides_string=accept_all_mobile_data.IABTCF_TCString,
         reject_all_fides_string=reject_all_mobile_data.IABTCF_TCString,
         accept_all_fides_mobile_data=accept_all_mobile_data,
@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import Field, NonNegativeInt, PositiveInt, root_validator, validator
 
@@ -253,14 +253,14 @@ def _validate_vendor_legal_basis_fields(
 ) -> List[int]:
     """Helper for looping through legal basis vendor lists and removing vendors where the legal basis
     is not permitted"""
-    to_remove: List[int] = []
+    to_remove: Set[int] = set()
     for vendor_id in vendor_list:
         vendor_record: Optional[Dict] = gvl.get("vendors", {}).get(str(vendor_id))
 
         if not vendor_record:
             # This vendor isn't in the GVLvalues.get("is_service_specific")
             # , we've got to remove it!
-            to_remove.append(vendor_id)
+            to_remove.add(vendor_id)
             continue
 
         if vendor_record.get(corresponding_gvl_key):
@@ -279,13 +279,13 @@ def _validate_vendor_legal_basis_fields(
         if not is_service_specific or not vendor_record.get("flexiblePurposes"):
             # Either this is a globally scoped string, in which cases flexible purposes don't have an effect,
             # or there are no flexible purposes at all.  We have to remove the vendor from the legal bases list.
-            to_remove.append(vendor_id)
+            to_remove.add(vendor_id)
             continue
 
         # TODO once adding publisher_restrictions to the TCModel are supported, check if there is a publisher
         # restriction value that would enable this vendor to have the override preferred basis.
         # For now, assume there are no restrictions defined:
-        to_remove.append(vendor_id)
+        to_remove.add(vendor_id)
 
     return [v_id for v_id in vendor_list if v_id not in to_remove]
 
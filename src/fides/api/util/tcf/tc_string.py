@@ -1,13 +1,10 @@
 import base64
 import binascii
-from typing import Any, Dict, List, Optional, Type, Union
-
-from iab_tcf import ConsentV2, decode_v2  # type: ignore[import]
-from pydantic import Field
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple, Type, Union
 
 from fides.api.common_exceptions import DecodeTCStringError
 from fides.api.models.privacy_notice import UserConsentPreference
-from fides.api.schemas.base_class import FidesSchema
 from fides.api.schemas.privacy_preference import TCStringFidesPreferences
 from fides.api.schemas.tcf import TCFPurposeSave, TCFSpecialFeatureSave, TCFVendorSave
 from fides.api.util.tcf.tc_model import TCModel, convert_tcf_contents_to_tc_model
@@ -20,85 +17,140 @@ SPECIAL_FEATURE_BITS = 12
 PURPOSE_CONSENTS_BITS = 24
 PURPOSE_LEGITIMATE_INTERESTS_BITS = 24
 
+_all_options_tc_model: Optional[Tuple[TCFExperienceContents, TCModel]] = None
+
 
 def add_gvl_prefix(vendor_id: str) -> str:
     """Add gvl prefix to create a universal gvl identifier for the given vendor id"""
     return GVL_PREFIX + vendor_id
 
 
-class TCField(FidesSchema):
-    """Schema to represent a field within a TC string segment"""
+class TCBitWriter:
+    """Builds a TC string segment as an integer bitset, most significant bit first"""
 
-    name: str = Field(description="Field name")
-    bits: int = Field(
-        description="The number of bits that should be used to represent this value"
-    )
-    value_override: Optional[Any] = Field(
-        description="The value that should be used instead of the field on the TC model"
-    )
+    def __init__(self) -> None:
+        self.value: int = 0
+        self.length: int = 0
 
+    def write_int(self, value: int, num_bits: int) -> None:
+        """Append an unsigned integer, padded to use the specified number of bits"""
+        if value < 0 or value >> num_bits:
+            raise ValueError(f"{value} cannot be represented in {num_bits} bits")
+        self.value = (self.value << num_bits) | value
+        self.length += num_bits
 
-def get_bits_for_section(fields: List[TCField], tc_model: TCModel) -> str:
-    """Construct a representation of the fields supplied in bits for a given section."""
-
-    def _convert_val_to_bitstring(val: Union[str, list, int], num_bits: int) -> str:
-        """Internal helper to take a string, list of integers, or integer, and convert it to a bitstring"""
-        bit_components: str = ""
-
-        if isinstance(val, str):
-            # Used for things like publisher country code and consent_language.
-            # There are two letters, represented by 12 bits total, so we convert
-            # the letters to numbers, and they are represented by 6 bits apiece
-            bit_allocation = int(num_bits / len(val))
-            for char in val:
-                converted_num: int = _convert_letter_to_number(char)
-                bit_components += format(converted_num, f"0{bit_allocation}b")
-            return bit_components
-
-        if isinstance(val, list):
-            # List of integers expected.  Bitstring should be the length of the
-            # maximum integer in the list
-            for i in range(1, num_bits + 1):
-                bit_components += "1" if i in val else "0"
-            return bit_components
-
-        # Converts an integer to bits, padding to use the specified number of bits
-        return format(val, f"0{num_bits}b")
-
-    total_bits: str = ""
-    for field in fields:
-        # Either fetch the field of the same name off of the TCModel for encoding,
-        # or use the value override, if supplied.
-        field_value: Any = (
-            field.value_override
-            if field.value_override is not None
-            else getattr(tc_model, field.name)
-        )
+    def write_bool(self, value: bool) -> None:
+        self.write_int(int(value), 1)
+
+    def write_letters(self, letters: str, num_bits: int) -> None:
+        """Used for things like publisher country code and consent_language.
+        There are two letters, represented by 12 bits total, so we convert
+        the letters to numbers, and they are represented by 6 bits apiece"""
+        bits_per_letter = num_bits // len(letters)
+        for letter in letters:
+            self.write_int(ord(letter) - ord("A"), bits_per_letter)
 
-        # Cleanup before building bit strings by converting bools to ints
-        if isinstance(field_value, bool):
-            field_value = int(field_value)
+    def write_bitfield(self, ids: Iterable[int], num_bits: int) -> None:
+        """Append a bitfield where the bit at position i (starting at 1) is set if i is in ids"""
+        self.write_int(build_bitfield(ids, num_bits), num_bits)
 
-        # Converting field value to bitstring of specified length and add that onto the string we're building
-        total_bits += _convert_val_to_bitstring(field_value, field.bits)
-    return total_bits
+    def write_section(self, section: "TCSection") -> None:
+        """Append the bits of a previously built section"""
+        self.write_int(section.value, section.length)
 
+    def to_section(self) -> "TCSection":
+        return TCSection(self.value, self.length)
 
-def _convert_letter_to_number(letter: str) -> int:
-    """A->0, Z->25"""
-    return ord(letter) - ord("A")
+    def to_base64(self) -> str:
+        """Pad the bits to work with both base64 and bit->byte conversion, and encode them"""
+        least_common_multiple = 24  # 6 bits (basis for base 64) and 8 bits (one byte)
+        padding: int = least_common_multiple - (self.length % least_common_multiple)
+        padded_length: int = self.length + padding
+        return base64.urlsafe_b64encode(
+            (self.value << padding).to_bytes(padded_length // 8, byteorder="big")
+        ).decode()
 
 
-def _convert_bitstring_to_bytes(bitstr: str) -> bytes:
-    """Convert a string of 0's and 1's to bytes, padded to both work with base64
-    and bit->byte conversion"""
-    least_common_multiple = 24  # 6 bits (basis for base 64) and 8 bits (one byte)
-    padding: int = len(bitstr) % least_common_multiple
-    new_bits: str = "0" * (least_common_multiple - padding)
-    bitstr += new_bits
+class TCSection(NamedTuple):
+    """The bits of an encoded section, reusable across TC strings"""
 
-    integer_val: int = int(bitstr, 2)
-    return integer_val.to_bytes((len(bitstr)) // 8, byteorder="big")
+    value: int
+    length: int
+
+
+class TCBitReader:
+    """Reads fields from a base64-encoded TC string segment, most significant bit first"""
+
+    def __init__(self, segment: str) -> None:
+        try:
+            decoded: bytes = base64.urlsafe_b64decode(
+                segment + "=" * (-len(segment) % 4)
+            )
+        except (binascii.Error, ValueError):
+            raise DecodeTCStringError("Invalid base64-encoded string")
+        self.value: int = int.from_bytes(decoded, byteorder="big")
+        self.length: int = len(decoded) * 8
+        self.position: int = 0
+
+    def read_int(self, num_bits: int) -> int:
+        if self.position + num_bits > self.length:
+            raise DecodeTCStringError("Missing expected section(s) in TC String")
+        self.position += num_bits
+        return (self.value >> (self.length - self.position)) & ((1 << num_bits) - 1)
+
+    def read_bool(self) -> bool:
+        return bool(self.read_int(1))
+
+    def read_letters(self, num_letters: int, bits_per_letter: int = 6) -> str:
+        return "".join(
+            chr(ord("A") + self.read_int(bits_per_letter)) for _ in range(num_letters)
+        )
+
+    def read_bitfield(self, num_bits: int) -> List[int]:
+        """Returns the positions (starting at 1) of the bits that are set"""
+        bitfield: int = self.read_int(num_bits)
+        if not bitfield:
+            return []
+        bits: str = format(bitfield, f"0{num_bits}b")
+        positions: List[int] = []
+        index: int = bits.find("1")
+        while index != -1:
+            positions.append(index + 1)
+            index = bits.find("1", index + 1)
+        return positions
+
+    def read_vendors(self) -> List[int]:
+        """Read a vendor section, which may be bitfield or range encoded"""
+        max_vendor_id: int = self.read_int(16)
+        if not self.read_bool():
+            return self.read_bitfield(max_vendor_id)
+
+        vendor_ids: List[int] = []
+        for _ in range(self.read_int(12)):
+            is_a_range: bool = self.read_bool()
+            start: int = self.read_int(16)
+            end: int = self.read_int(16) if is_a_range else start
+            vendor_ids.extend(range(start, end + 1))
+        return vendor_ids
+
+
+def build_bitfield(ids: Iterable[int], num_bits: int) -> int:
+    """Build an integer bitset of num_bits, where the bit at position i (starting at 1,
+    from the most significant bit) is set if i is in ids. Ids out of range are ignored.
+    """
+    bitfield: int = 0
+    for i in ids:
+        if 1 <= i <= num_bits:
+            bitfield |= 1 << (num_bits - i)
+    return bitfield
+
+
+def bitfield_to_bitstring(ids: Iterable[int], num_bits: int) -> str:
+    """Construct a string of 0's and 1's, num_bits long, where the character at position i
+    (starting at 1) is 1 if i is in ids"""
+    if not num_bits:
+        return ""
+    return format(build_bitfield(ids, num_bits), f"0{num_bits}b")
 
 
 def _get_max_vendor_id(vendor_list: List[int]) -> int:
@@ -109,6 +161,76 @@ def _get_max_vendor_id(vendor_list: List[int]) -> int:
     return max(int(vendor_id) for vendor_id in vendor_list)
 
 
+def _get_vendor_ranges(vendor_ids: Tuple[int, ...]) -> List[Tuple[int, int]]:
+    """Group sorted vendor ids into (start, end) runs of consecutive ids"""
+    ranges: List[Tuple[int, int]] = []
+    for vendor_id in vendor_ids:
+        if ranges and ranges[-1][1] == vendor_id - 1:
+            ranges[-1] = (ranges[-1][0], vendor_id)
+        else:
+            ranges.append((vendor_id, vendor_id))
+    return ranges
+
+
+@lru_cache(maxsize=256)
+def _build_vendor_section(vendor_ids: Tuple[int, ...]) -> TCSection:
+    """Build a vendor section for the given sorted vendor ids.
+
+    Vendor sections can be bitfield encoded, using one bit per vendor id up to the max
+    vendor id, or range encoded, using 17 bits per vendor id or 33 bits per run of
+    consecutive vendor ids. Whichever encoding is shorter is used.
+    """
+    max_vendor_id: int = vendor_ids[-1] if vendor_ids else 0
+    ranges: List[Tuple[int, int]] = _get_vendor_ranges(vendor_ids)
+    range_encoding_bits: int = 12 + sum(
+        17 if start == end else 33 for start, end in ranges
+    )
+
+    writer = TCBitWriter()
+    writer.write_int(max_vendor_id, 16)
+    if range_encoding_bits < max_vendor_id:
+        writer.write_bool(True)
+        writer.write_int(len(ranges), 12)
+        for start, end in ranges:
+            writer.write_bool(start != end)
+            writer.write_int(start, 16)
+            if start != end:
+                writer.write_int(end, 16)
+    else:
+        writer.write_bool(False)
+        writer.write_bitfield(vendor_ids, max_vendor_id)
+    return writer.to_section()
+
+
+def _vendor_key(vendor_ids: Iterable[int]) -> Tuple[int, ...]:
+    return tuple(sorted({int(vendor_id) for vendor_id in vendor_ids}))
+
+
+@lru_cache(maxsize=64)
+def _build_core_metadata_section(  # pylint: disable=too-many-arguments
+    cmp_id: int,
+    cmp_version: int,
+    consent_screen: int,
+    consent_language: str,
+    vendor_list_version: int,
+    policy_version: int,
+    is_service_specific: bool,
+    use_non_standard_texts: bool,
+) -> TCSection:
+    """Build the core fields between the timestamps and the user's choices, which are
+    the same for every TC string built for a given CMP and GVL version"""
+    writer = TCBitWriter()
+    writer.write_int(cmp_id, 12)
+    writer.write_int(cmp_version, 12)
+    writer.write_int(consent_screen, 6)
+    writer.write_letters(consent_language, 12)
+    writer.write_int(vendor_list_version, 12)
+    writer.write_int(policy_version, 6)
+    writer.write_bool(is_service_specific)
+    writer.write_bool(use_non_standard_texts)
+    return writer.to_section()
+
+
 def build_tc_string(model: TCModel) -> str:
     """Construct a TC String from the given TCModel
 
@@ -126,73 +248,120 @@ def build_core_string(model: TCModel) -> str:
 
     https://github.com/InteractiveAdvertisingBureau/GDPR-Transparency-and-Consent-Framework/blob/master/TCFv2/IAB%20Tech%20Lab%20-%20Consent%20string%20and%20vendor%20list%20formats%20v2.md#the-core-string
     """
-    max_vendor_consents: int = _get_max_vendor_id(model.vendor_consents)
-    max_vendor_li: int = _get_max_vendor_id(model.vendor_legitimate_interests)
-
-    # List of core fields.  Order is intentional!
-    core_fields: list = [
-        TCField(name="version", bits=6),
-        TCField(name="created", bits=36),
-        TCField(name="last_updated", bits=36),
-        TCField(name="cmp_id", bits=12),
-        TCField(name="cmp_version", bits=12),
-        TCField(name="consent_screen", bits=6),
-        TCField(name="consent_language", bits=12),
-        TCField(name="vendor_list_version", bits=12),
-        TCField(name="policy_version", bits=6),
-        TCField(name="is_service_specific", bits=1),
-        TCField(name="use_non_standard_texts", bits=USE_NON_STANDARD_TEXT_BITS),
-        TCField(name="special_feature_optins", bits=SPECIAL_FEATURE_BITS),
-        TCField(name="purpose_consents", bits=PURPOSE_CONSENTS_BITS),
-        TCField(
-            name="purpose_legitimate_interests", bits=PURPOSE_LEGITIMATE_INTERESTS_BITS
-        ),
-        TCField(name="purpose_one_treatment", bits=1),
-        TCField(name="publisher_country_code", bits=12),
-        TCField(name="max_vendor_consent", bits=16, value_override=max_vendor_consents),
-        TCField(
-            name="is_vendor_consent_range_encoding", bits=1, value_override=0
-        ),  # Using bitfield
-        TCField(name="vendor_consents", bits=max_vendor_consents),
-        TCField(name="max_vendor_li", bits=16, value_override=max_vendor_li),
-        TCField(
-            name="is_vendor_li_range_encoding", bits=1, value_override=0
-        ),  # Using bitfield
-        TCField(name="vendor_legitimate_interests", bits=max_vendor_li),
-        TCField(name="num_pub_restrictions", bits=12),
-    ]
-
-    core_bits: str = get_bits_for_section(core_fields, model)
-    return base64.urlsafe_b64encode(_convert_bitstring_to_bytes(core_bits)).decode()
+    # Order of fields is intentional!
+    writer = TCBitWriter()
+    writer.write_int(model.version, 6)
+    writer.write_int(model.created or 0, 36)
+    writer.write_int(model.last_updated or 0, 36)
+    writer.write_section(
+        _build_core_metadata_section(
+            model.cmp_id,
+            model.cmp_version,
+            model.consent_screen,
+            model.consent_language,
+            model.vendor_list_version,
+            model.policy_version,
+            model.is_service_specific,
+            model.use_non_standard_texts,
+        )
+    )
+    writer.write_bitfield(model.special_feature_optins, SPECIAL_FEATURE_BITS)
+    writer.write_bitfield(model.purpose_consents, PURPOSE_CONSENTS_BITS)
+    writer.write_bitfield(
+        model.purpose_legitimate_interests, PURPOSE_LEGITIMATE_INTERESTS_BITS
+    )
+    writer.write_bool(model.purpose_one_treatment)
+    writer.write_letters(model.publisher_country_code, 12)
+    writer.write_section(_build_vendor_section(_vendor_key(model.vendor_consents)))
+    writer.write_section(
+        _build_vendor_section(_vendor_key(model.vendor_legitimate_interests))
+    )
+    writer.write_int(model.num_pub_restrictions, 12)
+    return writer.to_base64()
+
+
+@lru_cache(maxsize=64)
+def _build_disclosed_vendors_string(vendors_disclosed: Tuple[int, ...]) -> str:
+    writer = TCBitWriter()
+    writer.write_int(1, 3)  # 1 for Disclosed Vendors section
+    writer.write_section(_build_vendor_section(vendors_disclosed))
+    return writer.to_base64()
 
 
 def build_disclosed_vendors_string(model: TCModel) -> str:
     """Build the Optional Disclosed Vendors" section of the TC String
 
+    This only depends on the vendors in the datamap, so it is cached.
+
     https://github.com/InteractiveAdvertisingBureau/GDPR-Transparency-and-Consent-Framework/blob/master/TCFv2/IAB%20Tech%20Lab%20-%20Consent%20string%20and%20vendor%20list%20formats%20v2.md#disclosed-vendors
     """
-    max_vendor_id: int = _get_max_vendor_id(model.vendors_disclosed)
-
-    # List of disclosed vendor fields.  Order is intentional!
-    disclosed_vendor_fields: list = [
-        TCField(
-            name="segment_type", bits=3, value_override=1
-        ),  # 1 for Disclosed Vendors section
-        TCField(name="max_vendor_id", bits=16, value_override=max_vendor_id),
-        TCField(
-            name="is_range_encoding", bits=1, value_override=0
-        ),  # Using Bitfield encoding
-        TCField(
-            name="vendors_disclosed",
-            bits=max_vendor_id,
-            value_override=model.vendors_disclosed,
+    return _build_disclosed_vendors_string(_vendor_key(model.vendors_disclosed))
+
+
+class DecodedTCString(NamedTuple):
+    """The fields decoded from the core and disclosed vendors sections of a TC string"""
+
+    version: int
+    created: int
+    last_updated: int
+    cmp_id: int
+    cmp_version: int
+    consent_screen: int
+    consent_language: str
+    vendor_list_version: int
+    policy_version: int
+    is_service_specific: bool
+    use_non_standard_texts: bool
+    special_feature_optins: List[int]
+    purpose_consents: List[int]
+    purpose_legitimate_interests: List[int]
+    purpose_one_treatment: bool
+    publisher_country_code: str
+    vendor_consents: List[int]
+    vendor_legitimate_interests: List[int]
+    vendors_disclosed: List[int] = []
+
+
+def decode_tc_string(tc_string: str) -> DecodedTCString:
+    """Decode the core section of a TC String, and its disclosed vendors section if present.
+    Bitfield and range encoded vendor sections are both supported.
+
+    Raises a DecodeTCStringError if the string isn't base64-encoded or the core section
+    is missing fields.
+    """
+    segments: List[str] = tc_string.split(".")
+    reader = TCBitReader(segments[0])
+
+    # Order of fields is intentional!
+    decoded = DecodedTCString(
+        version=reader.read_int(6),
+        created=reader.read_int(36),
+        last_updated=reader.read_int(36),
+        cmp_id=reader.read_int(12),
+        cmp_version=reader.read_int(12),
+        consent_screen=reader.read_int(6),
+        consent_language=reader.read_letters(2),
+        vendor_list_version=reader.read_int(12),
+        policy_version=reader.read_int(6),
+        is_service_specific=reader.read_bool(),
+        use_non_standard_texts=reader.read_bool(),
+        special_feature_optins=reader.read_bitfield(SPECIAL_FEATURE_BITS),
+        purpose_consents=reader.read_bitfield(PURPOSE_CONSENTS_BITS),
+        purpose_legitimate_interests=reader.read_bitfield(
+            PURPOSE_LEGITIMATE_INTERESTS_BITS
         ),
-    ]
+        purpose_one_treatment=reader.read_bool(),
+        publisher_country_code=reader.read_letters(2),
+        vendor_consents=reader.read_vendors(),
+        vendor_legitimate_interests=reader.read_vendors(),
+    )
+
+    for segment in segments[1:]:
+        segment_reader = TCBitReader(segment)
+        if segment_reader.read_int(3) == 1:  # Disclosed Vendors section
+            decoded = decoded._replace(vendors_disclosed=segment_reader.read_vendors())
 
-    disclosed_vendor_bits: str = get_bits_for_section(disclosed_vendor_fields, model)
-    return base64.urlsafe_b64encode(
-        _convert_bitstring_to_bytes(disclosed_vendor_bits)
-    ).decode()
+    return decoded
 
 
 def boolean_to_user_consent_preference(preference: bool) -> UserConsentPreference:
@@ -204,7 +373,7 @@ FidesPreferenceType = Union[TCFPurposeSave, TCFVendorSave, TCFSpecialFeatureSave
 
 def convert_to_fides_preference(
     datamap_options: List[int],
-    tc_string_preferences: Dict[int, bool],
+    tc_string_opt_ins: Set[int],
     preference_class: Union[
         Type[TCFPurposeSave], Type[TCFVendorSave], Type[TCFSpecialFeatureSave]
     ],
@@ -217,7 +386,7 @@ def convert_to_fides_preference(
 
     for identifier in datamap_options:
         # Check if there's an opt_in encoded in the string.  Otherwise, we assume the user is opting out.
-        preference: bool = tc_string_preferences.get(identifier, False)
+        preference: bool = identifier in tc_string_opt_ins
 
         if preference_class == TCFVendorSave:
             # Vendors are currently saved as strings in our db.
@@ -236,6 +405,25 @@ def convert_to_fides_preference(
     return preferences_array
 
 
+def _get_all_options_tc_model(tcf_contents: TCFExperienceContents) -> TCModel:
+    """From our datamap, build all the possible options for the TC string, if the user
+    opted into everything.
+
+    The model for the most recent contents is kept, since the TCF contents are cached
+    and shared between requests until the datamap changes.
+    """
+    global _all_options_tc_model  # pylint: disable=W0603
+    cached = _all_options_tc_model
+    if cached and cached[0] is tcf_contents:
+        return cached[1]
+
+    all_options_tc_model: TCModel = convert_tcf_contents_to_tc_model(
+        tcf_contents, UserConsentPreference.opt_in
+    )
+    _all_options_tc_model = (tcf_contents, all_options_tc_model)
+    return all_options_tc_model
+
+
 def decode_tc_string_to_preferences(
     tc_string: str, tcf_contents: TCFExperienceContents
 ) -> TCStringFidesPreferences:
@@ -243,43 +431,39 @@ def decode_tc_string_to_preferences(
     preferences can be saved into the Fides database"""
     try:
         # Decode the string and pull the user opt-ins off of the string
-        decoded: ConsentV2 = decode_v2(tc_string)
-        tc_str_p_c: Dict[int, bool] = decoded.purposes_consent
-        tc_str_p_li: Dict[int, bool] = decoded.purposes_legitimate_interests
-        tc_str_v_c: Dict[int, bool] = decoded.consented_vendors
-        tc_str_v_li: Dict[int, bool] = decoded.interests_vendors
-        tc_str_sf: Dict[int, bool] = decoded.special_features_optin
-    except (binascii.Error, AttributeError):
+        decoded: DecodedTCString = decode_tc_string(tc_string)
+    except DecodeTCStringError:
         raise DecodeTCStringError("Invalid base64-encoded TC string")
 
-    # From our datamap, build all the possible options for the TC string, if the user
-    # opted into everything
-    all_options_tc_model: TCModel = convert_tcf_contents_to_tc_model(
-        tcf_contents, UserConsentPreference.opt_in
-    )
-    datamap_p_c: List[int] = all_options_tc_model.purpose_consents
-    datamap_p_li: List[int] = all_options_tc_model.purpose_legitimate_interests
-    datamap_v_c: List[int] = all_options_tc_model.vendor_consents
-    datamap_v_li: List[int] = all_options_tc_model.vendor_legitimate_interests
-    datamap_sf: List[int] = all_options_tc_model.special_feature_optins
+    all_options_tc_model: TCModel = _get_all_options_tc_model(tcf_contents)
 
     # Return TCString Preferences that are driven by the datamap.  For every element in the datamap,
     # consider it an opt-in preference if it's included in the TC string, otherwise, consider
     # it an opt-out preference.
     return TCStringFidesPreferences(
         purpose_consent_preferences=convert_to_fides_preference(
-            datamap_p_c, tc_str_p_c, TCFPurposeSave
+            all_options_tc_model.purpose_consents,
+            set(decoded.purpose_consents),
+            TCFPurposeSave,
         ),
         purpose_legitimate_interests_preferences=convert_to_fides_preference(
-            datamap_p_li, tc_str_p_li, TCFPurposeSave
+            all_options_tc_model.purpose_legitimate_interests,
+            set(decoded.purpose_legitimate_interests),
+            TCFPurposeSave,
         ),
         vendor_consent_preferences=convert_to_fides_preference(
-            datamap_v_c, tc_str_v_c, TCFVendorSave
+            all_options_tc_model.vendor_consents,
+            set(decoded.vendor_consents),
+            TCFVendorSave,
         ),
         vendor_legitimate_interests_preferences=convert_to_fides_preference(
-            datamap_v_li, tc_str_v_li, TCFVendorSave
+            all_options_tc_model.vendor_legitimate_interests,
+            set(decoded.vendor_legitimate_interests),
+            TCFVendorSave,
         ),
         special_feature_preferences=convert_to_fides_preference(
-            datamap_sf, tc_str_sf, TCFSpecialFeatureSave
+            all_options_tc_model.special_feature_optins,
+            set(decoded.special_feature_optins),
+            TCFSpecialFeatureSave,
         ),
     )
@@ -0,0 +1,129 @@
+"""
+A process- and Redis-level cache of the TCF experience contents.
+
+Building the TCF contents runs several privacy declaration queries, but the contents
+only change when a System, a PrivacyDeclaration or the GVL does. The built contents
+and their version hash are cached under a TableCacheVersion of the System and
+PrivacyDeclaration tables, so serving a TCF experience costs one lookup of that
+version.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from loguru import logger
+from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
+from sqlalchemy.orm import Session
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.models.sql_models import (  # type:ignore[attr-defined]
+    PrivacyDeclaration,
+    System,
+)
+from fides.api.schemas.base_class import FidesSchema
+from fides.api.util.cache import FidesopsRedis, get_cache
+from fides.api.util.table_cache_version import TableCacheVersion
+from fides.api.util.tcf.experience_meta import build_tcf_version_hash
+from fides.api.util.tcf.tcf_experience_contents import (
+    TCFExperienceContents,
+    get_tcf_contents,
+    load_gvl,
+)
+
+TCF_CONTENTS_VERSION_KEY = "tcf-experience-contents-version"
+TCF_CONTENTS_KEY_PREFIX = "tcf-experience-contents"
+
+TCF_CONTENTS_VERSION = TableCacheVersion(
+    TCF_CONTENTS_VERSION_KEY,
+    [System.__tablename__, PrivacyDeclaration.__tablename__],
+)
+
+
+class CachedTCFContents(FidesSchema):
+    """The TCF experience contents and their version hash, as cached in Redis"""
+
+    contents: TCFExperienceContents
+    version_hash: str
+
+
+class _ProcessCachedTCFContents(NamedTuple):
+    cache_key: str
+    cached: CachedTCFContents
+
+
+_process_cached_contents: Optional[_ProcessCachedTCFContents] = None
+_process_cached_contents_lock = Lock()
+_gvl_hash: Optional[str] = None
+
+
+def get_gvl_hash() -> str:
+    """A hash of the loaded GVL, so that contents built from a different GVL aren't reused"""
+    global _gvl_hash  # pylint: disable=W0603
+    if _gvl_hash is None:
+        _gvl_hash = hashlib.sha256(
+            json.dumps(load_gvl(), sort_keys=True).encode()
+        ).hexdigest()[:12]
+    return _gvl_hash
+
+
+def get_tcf_contents_cache_key(cache: FidesopsRedis) -> str:
+    """The key the TCF contents for the current System and GVL data are cached under"""
+    version = TCF_CONTENTS_VERSION.get(cache)
+    return f"{TCF_CONTENTS_KEY_PREFIX}-{version}-{get_gvl_hash()}"
+
+
+def build_cached_tcf_contents(db: Session) -> CachedTCFContents:
+    contents = get_tcf_contents(db)
+    return CachedTCFContents(
+        contents=contents, version_hash=build_tcf_version_hash(contents)
+    )
+
+
+def get_cached_tcf_contents(db: Session) -> CachedTCFContents:
+    """
+    Returns the TCF experience contents and their version hash, from this process's
+    cache if they're still current, otherwise from Redis, and otherwise built from
+    the database and cached in both.
+
+    The returned contents are shared, so they must not be modified.
+    """
+    global _process_cached_contents  # pylint: disable=W0603
+    try:
+        cache: FidesopsRedis = get_cache()
+        cache_key = get_tcf_contents_cache_key(cache)
+    except (RedisConnectionError, ConnectionErrorFromRedis) as exc:
+        # Without the version there's no telling whether cached contents are
+        # current, so build them instead
+        logger.warning("Unable to read cached TCF contents: {}", exc)
+        return build_cached_tcf_contents(db)
+
+    process_cached = _process_cached_contents
+    if process_cached and process_cached.cache_key == cache_key:
+        return process_cached.cached
+
+    with _process_cached_contents_lock:
+        process_cached = _process_cached_contents
+        if process_cached and process_cached.cache_key == cache_key:
+            return process_cached.cached
+
+        cached_value: Optional[str] = cache.get(cache_key)
+        if cached_value:
+            cached = CachedTCFContents.parse_raw(cached_value)
+        else:
+            logger.info("Building TCF experience contents")
+            cached = build_cached_tcf_contents(db)
+            cache.set_with_autoexpire(cache_key, cached.json())
+
+        _process_cached_contents = _ProcessCachedTCFContents(cache_key, cached)
+        return cached
+
+
+def invalidate_tcf_contents_cache() -> None:
+    """Discard the cached TCF contents in every process, so they're rebuilt on next use"""
+    global _process_cached_contents  # pylint: disable=W0603
+    with _process_cached_contents_lock:
+        _process_cached_contents = None
+    TCF_CONTENTS_VERSION.invalidate()
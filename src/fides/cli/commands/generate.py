@@ -1,4 +1,6 @@
 """Contains the generate group of CLI commands for fides."""
+from typing import Tuple
+
 import rich_click as click
 
 from fides.cli.options import (
@@ -8,9 +10,13 @@ from fides.cli.options import (
     connection_string_option,
     credentials_id_option,
     include_null_flag,
+    incremental_flag,
+    introspection_workers_option,
     okta_org_url_option,
     okta_token_option,
     organization_fides_key_option,
+    schema_filter_option,
+    table_filter_option,
 )
 from fides.cli.utils import (
     handle_aws_credentials_options,
@@ -45,6 +51,10 @@ def generate_dataset(ctx: click.Context) -> None:
 @credentials_id_option
 @connection_string_option
 @include_null_flag
+@schema_filter_option
+@table_filter_option
+@introspection_workers_option
+@incremental_flag
 @with_analytics
 def generate_dataset_db(
     ctx: click.Context,
@@ -52,6 +62,10 @@ def generate_dataset_db(
     connection_string: str,
     credentials_id: str,
     include_null: bool,
+    schema_patterns: Tuple[str, ...],
+    table_patterns: Tuple[str, ...],
+    workers: int,
+    incremental: bool,
 ) -> None:
     """
     Generate a Fides dataset by walking a database and recording every schema/table/field.
@@ -66,6 +80,10 @@ def generate_dataset_db(
         connection_string=actual_connection_string,
         file_name=output_filename,
         include_null=include_null,
+        schema_patterns=list(schema_patterns),
+        table_patterns=list(table_patterns),
+        workers=workers,
+        incremental=incremental,
     )
 
 
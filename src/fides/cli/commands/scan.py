@@ -1,4 +1,5 @@
 """Contains the scan group of the commands for fides."""
+from typing import Tuple
 
 import rich_click as click
 
@@ -9,10 +10,13 @@ from fides.cli.options import (
     connection_string_option,
     coverage_threshold_option,
     credentials_id_option,
+    introspection_workers_option,
     manifests_dir_argument,
     okta_org_url_option,
     okta_token_option,
     organization_fides_key_option,
+    schema_filter_option,
+    table_filter_option,
 )
 from fides.cli.utils import (
     handle_aws_credentials_options,
@@ -46,6 +50,9 @@ def scan_dataset(ctx: click.Context) -> None:
 @credentials_id_option
 @connection_string_option
 @coverage_threshold_option
+@schema_filter_option
+@table_filter_option
+@introspection_workers_option
 @with_analytics
 def scan_dataset_db(
     ctx: click.Context,
@@ -53,6 +60,9 @@ def scan_dataset_db(
     connection_string: str,
     credentials_id: str,
     coverage_threshold: int,
+    schema_patterns: Tuple[str, ...],
+    table_patterns: Tuple[str, ...],
+    workers: int,
 ) -> None:
     """
     Scan a database directly using a SQLAlchemy-style connection string.
@@ -74,6 +84,9 @@ def scan_dataset_db(
         url=config.cli.server_url,
         headers=config.user.auth_header,
         local=config.cli.local_mode,
+        schema_patterns=list(schema_patterns),
+        table_patterns=list(table_patterns),
+        workers=workers,
     )
 
 
@@ -171,6 +171,58 @@ def connection_string_option(command: Callable) -> Callable:
     return command
 
 
+def schema_filter_option(command: Callable) -> Callable:
+    "Only include the database schemas matching a glob pattern"
+    command = click.option(
+        "--schema",
+        "schema_patterns",
+        multiple=True,
+        help="Only include schemas matching this glob pattern. Can be repeated.",
+    )(
+        command
+    )  # type: ignore
+    return command
+
+
+def table_filter_option(command: Callable) -> Callable:
+    "Only include the database tables matching a glob pattern"
+    command = click.option(
+        "--table",
+        "table_patterns",
+        multiple=True,
+        help="Only include tables matching this glob pattern. Can be repeated.",
+    )(
+        command
+    )  # type: ignore
+    return command
+
+
+def introspection_workers_option(command: Callable) -> Callable:
+    "Introspect database schemas in parallel"
+    command = click.option(
+        "--workers",
+        type=click.IntRange(1, 15),
+        default=1,
+        show_default=True,
+        help="The number of database schemas to introspect at once.",
+    )(
+        command
+    )  # type: ignore
+    return command
+
+
+def incremental_flag(command: Callable) -> Callable:
+    "Only introspect the database schemas that changed since the last manifest"
+    command = click.option(
+        "--incremental",
+        is_flag=True,
+        help="Keep the datasets of schemas that haven't changed since the output file was generated.",
+    )(
+        command
+    )  # type: ignore
+    return command
+
+
 def okta_org_url_option(command: Callable) -> Callable:
     "Use org url option to connect to okta. Requires options --org-url and --token"
     command = click.option(
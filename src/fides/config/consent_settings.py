@@ -6,6 +6,11 @@ from .fides_settings import FidesSettings
 class ConsentSettings(FidesSettings):
     """Configuration settings for Consent."""
 
+    privacy_experience_max_age_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="The max-age, in the Cache-Control header, of privacy experiences served to users without saved preferences. Caches must revalidate them with their ETag once this has passed.",
+    )
     tcf_enabled: bool = Field(
         default=False, description="Toggle whether TCF is enabled."
     )
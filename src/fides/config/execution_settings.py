@@ -1,4 +1,6 @@
-from pydantic import Field
+from typing import Optional
+
+from pydantic import Field, validator
 
 from .fides_settings import FidesSettings
 
@@ -8,10 +10,85 @@ ENV_PREFIX = "FIDES__EXECUTION__"
 class ExecutionSettings(FidesSettings):
     """Configuration settings for DSR execution."""
 
+    access_package_segment_size: int = Field(
+        default=1048576,
+        gt=0,
+        description="The number of bytes of an access package encrypted as one segment. Each segment is encrypted separately with its own nonce, so packages can be encrypted in parallel and decrypted as a stream.",
+    )
+    access_package_spool_size: int = Field(
+        default=10485760,
+        gt=0,
+        description="The number of bytes of an access package kept in memory while it's written. Larger packages are moved to a temporary file on disk.",
+    )
+    access_package_upload_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="The number of parts of an access package uploaded to S3 at the same time.",
+    )
+    access_package_upload_directory: str = Field(
+        default="",
+        description="The directory access packages are kept in while they're uploaded to S3 in parts, so an interrupted upload can be resumed without rebuilding the package. The directory must belong to the user Fides runs as, and is made accessible to that user only. If left unset, a directory in the system's temporary directory is used. Packages are removed once uploaded, once their upload fails in a way resuming won't fix, or once they're older than the Redis TTL. Incomplete uploads are aborted when they can't be resumed; an S3 lifecycle rule to abort incomplete multipart uploads is still recommended.",
+    )
+    access_package_upload_part_retries: int = Field(
+        default=3,
+        ge=0,
+        description="The number of times the upload of a part of an access package to S3 is retried before the upload fails.",
+    )
+    access_package_upload_part_size: int = Field(
+        default=8388608,
+        ge=5242880,
+        description="The number of bytes of an access package uploaded to S3 as one part. Packages larger than one part are uploaded to S3 in parts, which can be resumed if the upload is interrupted. S3 requires parts of at least 5 MiB.",
+    )
+    crypto_chunk_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of values masked by a single task on the crypto executor. Batches of values no larger than this are masked without the executor.",
+    )
+    crypto_executor: str = Field(
+        default="thread",
+        description="Where values are encrypted and hashed for masking and access packages: 'thread' for a thread pool, 'process' for a process pool, or 'none' to run in the calling thread. A process pool can't be used from daemonic processes, such as the workers of Celery's default prefork pool.",
+    )
+    crypto_max_workers: int = Field(
+        default=4,
+        gt=0,
+        description="The number of threads or processes in the crypto executor.",
+    )
+
+    dsr_report_page_size: int = Field(
+        default=500,
+        gt=0,
+        description="The number of items listed on each page of a collection in HTML access packages. Collections with more items are split across several pages.",
+    )
     masking_strict: bool = Field(
         default=True,
         description="If set to True, only use UPDATE requests to mask data. If False, Fides will use any defined DELETE or GDPR DELETE endpoints to remove PII, which may extend beyond the specific data categories that configured in your execution policy.",
     )
+    masking_batch_size: int = Field(
+        default=500,
+        gt=0,
+        description="The maximum number of rows masked by a single batched UPDATE statement when running erasures against SQL databases.",
+    )
+    max_rows_per_collection: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of rows retrieved from a single SQL collection during a privacy request. A privacy request that matches more rows in a collection fails, rather than leave the additional rows out of access packages and erasures. If not set, all matching rows are retrieved.",
+    )
+    messaging_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        le=1000,
+        description="The maximum number of recipients of a single Mailgun batch send or SendGrid request when messages are sent in bulk.",
+    )
+    messaging_send_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="The number of messages or batches of messages a bulk send sends at the same time, and the number of HTTP connections kept alive for each messaging config.",
+    )
+    messaging_template_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long the result of looking up a messaging service's Fides template is reused before the service is asked again.",
+    )
     privacy_request_delay_timeout: int = Field(
         default=3600,
         description="The amount of time to wait for actions which delay privacy requests (e.g., pre- and post-processing webhooks).",
@@ -20,6 +97,35 @@ class ExecutionSettings(FidesSettings):
         default=False,
         description="Whether privacy requests require explicit approval to execute.",
     )
+    saas_http_pool_size: int = Field(
+        default=10,
+        gt=0,
+        description="The number of HTTP connections kept alive per host for each SaaS connection during a privacy request.",
+    )
+    saas_prefetch_pages: int = Field(
+        default=0,
+        ge=0,
+        description="The number of pages requested ahead of the current page for SaaS endpoints whose pagination strategy allows it, such as offset pagination. Pages requested past the last page are discarded.",
+    )
+    saas_request_concurrency: int = Field(
+        default=1,
+        gt=0,
+        description="The number of independent read requests for a single SaaS collection that may run at the same time. Requests still respect the collection's rate limits, and don't prefetch pages while they run concurrently. Each collection read by a privacy request can use this many threads, so raise it with the number of collections read at once in mind.",
+    )
+    saas_template_cache_directory: str = Field(
+        default="",
+        description="The directory the compiled SaaS connector templates are cached in, so templates that haven't changed aren't parsed and validated again at startup. The directory must belong to the user Fides runs as, and is made accessible to that user only; otherwise templates aren't cached. If left unset, a directory in the system's temporary directory is used.",
+    )
+    sql_in_clause_chunk_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The maximum number of input values bound into a single query against a SQL database. Larger inputs are split across several queries.",
+    )
+    sql_fetch_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of rows fetched at a time when streaming results from SQL databases. This bounds the rows buffered by the database driver, but a collection's rows are still all held in memory once fetched; use max_rows_per_collection to bound them.",
+    )
     subject_identity_verification_required: bool = Field(
         default=False,
         description="Whether privacy requests require user identity verification.",
@@ -43,5 +149,18 @@ class ExecutionSettings(FidesSettings):
         description="Allows custom privacy request fields to be used in request execution.",
     )
 
+    @validator("crypto_executor", pre=True)
+    @classmethod
+    def validate_crypto_executor(cls, value: str) -> str:
+        """Ensure the provided executor type is a valid value."""
+        valid_values = ["thread", "process", "none"]
+        value = value.lower()  # force lowercase for safety
+
+        if value not in valid_values:
+            raise ValueError(
+                f"Invalid CRYPTO_EXECUTOR provided '{value}', must be one of: {', '.join(valid_values)}"
+            )
+        return value
+
     class Config:
         env_prefix = ENV_PREFIX
@@ -47,6 +47,10 @@ class RedisSettings(FidesSettings):
         default=6379,
         description="The port at which the application cache will be accessible.",
     )
+    result_cache_codec: str = Field(
+        default="msgpack+zlib",
+        description="The codec used to cache privacy request results in Redis. Set to 'json' to cache them as plain JSON, which can be read by releases that predate cache codecs.",
+    )
     ssl: bool = Field(
         default=False,
         description="Whether the application's connections to the cache should be encrypted using TLS.",
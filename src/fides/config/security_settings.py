@@ -49,6 +49,19 @@ class SecuritySettings(FidesSettings):
         default="dev",
         description="The default, `dev`, does not apply authentication to endpoints typically used by the CLI. The other option, `prod`, requires authentication for _all_ endpoints that may contain sensitive information.",
     )
+    identity_legacy_hash_writes: bool = Field(
+        default=True,
+        description="Whether provided identities and privacy preference records are still written with the legacy bcrypt hash of their value, which servers that predate identity lookup hashes search by. Leave enabled during a rolling upgrade; it can be disabled once every server has been upgraded and the lookup hash backfill has finished, after which new identities are searchable by their lookup hash only.",
+    )
+    identity_lookup_hash_backfill_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of provided identities given a lookup hash per transaction by the background backfill of identities created before lookup hashes were added.",
+    )
+    identity_lookup_pepper: Optional[str] = Field(
+        default=None,
+        description="The secret key provided identities' lookup hashes (HMAC-SHA256 blind indexes, used to search for identities) are keyed with. If left unset, a key derived from the app_encryption_key is used. Changing it makes existing identities unsearchable until their lookup hashes are cleared and backfilled again.",
+    )
     identity_verification_attempt_limit: int = Field(
         default=3,
         description="The number of times identity verification will be attempted before raising an error.",
@@ -77,6 +90,16 @@ class SecuritySettings(FidesSettings):
         default=16,
         description="Sets desired length in bytes of generated client secret used for oauth.",
     )
+    oauth_token_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="The number of verified API tokens each server process keeps, so requests made with the same token don't decrypt it and load its client again. Set to 0 to verify every request's token from scratch.",
+    )
+    oauth_token_cache_ttl_seconds: int = Field(
+        default=60,
+        gt=0,
+        description="The number of seconds a verified API token is kept before it's verified again. Cached tokens are also dropped as soon as any client or user's roles change, or a client is deleted.",
+    )
     parent_server_password: Optional[str] = Field(
         default=None,
         description="When using a parent/child Fides deployment, this password will be used by the child server to access the parent server.",
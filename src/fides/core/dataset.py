@@ -1,5 +1,10 @@
 """Module that adds functionality for generating or scanning datasets."""
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import sqlalchemy
 from fideslang import manifests
@@ -30,6 +35,61 @@ SCHEMA_EXCLUSION = {
     "redshift": ["information_schema"],
 }
 
+# Dialects whose tables and columns are read from information_schema, in one query
+# per schema, instead of one round trip per table
+BULK_INTROSPECTION_DIALECTS = {"mssql", "mysql", "postgresql", "redshift", "snowflake"}
+
+# Names are kept as they're defined in the database, which matters for Snowflake,
+# where sqlalchemy's inspector lower-cases them, and the DSR implementation
+# double-quotes them
+BULK_INTROSPECTION_QUERY = text(
+    """
+    SELECT T.TABLE_NAME, C.COLUMN_NAME
+    FROM INFORMATION_SCHEMA.TABLES T
+    LEFT JOIN INFORMATION_SCHEMA.COLUMNS C
+        ON C.TABLE_SCHEMA = T.TABLE_SCHEMA AND C.TABLE_NAME = T.TABLE_NAME
+    WHERE T.TABLE_SCHEMA = :schema AND T.TABLE_TYPE = 'BASE TABLE'
+    ORDER BY T.TABLE_NAME, C.ORDINAL_POSITION
+    """
+)
+
+# Queries returning a fingerprint of each schema's columns, which changes when the
+# schema's DDL does, so incremental generation can skip unchanged schemas
+SCHEMA_FINGERPRINT_QUERIES = {
+    "mssql": """
+        SELECT TABLE_SCHEMA, CONCAT(COUNT(*), '-', CHECKSUM_AGG(
+            CHECKSUM(TABLE_NAME, COLUMN_NAME, DATA_TYPE, ORDINAL_POSITION)))
+        FROM INFORMATION_SCHEMA.COLUMNS GROUP BY TABLE_SCHEMA
+    """,
+    "mysql": """
+        SELECT TABLE_SCHEMA, CONCAT(COUNT(*), '-', SUM(CRC32(CONCAT_WS(':',
+            TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, ORDINAL_POSITION))))
+        FROM INFORMATION_SCHEMA.COLUMNS GROUP BY TABLE_SCHEMA
+    """,
+    "postgresql": """
+        SELECT TABLE_SCHEMA, MD5(STRING_AGG(
+            TABLE_NAME || '.' || COLUMN_NAME || ':' || DATA_TYPE, ','
+            ORDER BY TABLE_NAME, ORDINAL_POSITION))
+        FROM INFORMATION_SCHEMA.COLUMNS GROUP BY TABLE_SCHEMA
+    """,
+    "redshift": """
+        SELECT TABLE_SCHEMA, COUNT(*) || '-' || SUM(STRTOL(LEFT(MD5(
+            TABLE_NAME || '.' || COLUMN_NAME || ':' || DATA_TYPE || ':'
+            || CAST(ORDINAL_POSITION AS VARCHAR)), 8), 16))
+        FROM INFORMATION_SCHEMA.COLUMNS GROUP BY TABLE_SCHEMA
+    """,
+    "snowflake": """
+        SELECT TABLE_SCHEMA,
+            HASH_AGG(TABLE_NAME, COLUMN_NAME, DATA_TYPE, ORDINAL_POSITION)
+        FROM INFORMATION_SCHEMA.COLUMNS GROUP BY TABLE_SCHEMA
+    """,
+}
+SCHEMA_FINGERPRINT_META_KEY = "schema_fingerprint"
+
+# Introspection workers each hold a connection, and an engine's default pool has
+# up to 15
+MAX_INTROSPECTION_WORKERS = 15
+
 
 def get_all_server_datasets(
     url: AnyHttpUrl, headers: Dict[str, str], exclude_datasets: List[Dataset]
@@ -63,26 +123,112 @@ def include_dataset_schema(schema: str, database_type: str) -> bool:
     return schema not in schema_exclusion_list
 
 
+def matches_any_pattern(name: str, patterns: Optional[List[str]]) -> bool:
+    """
+    Returns whether the name matches any of the glob patterns, or True if no
+    patterns are given
+    """
+    return not patterns or any(fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def get_db_schema_names(
+    engine: Engine, schema_patterns: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Returns the names of the database's schemas that should be included, and match
+    any of the schema glob patterns
+    """
+    if engine.dialect.name == "snowflake":
+        # The inspector lower-cases Snowflake's names, see BULK_INTROSPECTION_QUERY
+        schema_names = [row[1] for row in engine.execute(text("SHOW SCHEMAS"))]
+    else:
+        schema_names = sqlalchemy.inspect(engine).get_schema_names()
+    return [
+        schema
+        for schema in schema_names
+        if include_dataset_schema(schema=schema, database_type=engine.dialect.name)
+        and matches_any_pattern(schema, schema_patterns)
+    ]
+
+
+def get_db_schema_tables(
+    engine: Engine, schema: str, table_patterns: Optional[List[str]] = None
+) -> Dict[str, List[str]]:
+    """
+    Returns the column names of each of the schema's tables that match any of the
+    table glob patterns
+    """
+    if engine.dialect.name in BULK_INTROSPECTION_DIALECTS:
+        db_tables: Dict[str, List[str]] = {}
+        with engine.connect() as connection:
+            for table, column in connection.execute(
+                BULK_INTROSPECTION_QUERY, {"schema": schema}
+            ):
+                if matches_any_pattern(table, table_patterns):
+                    columns = db_tables.setdefault(table, [])
+                    if column is not None:
+                        columns.append(column)
+        return db_tables
+
+    inspector = sqlalchemy.inspect(engine)
+    return {
+        table: [
+            column["name"] for column in inspector.get_columns(table, schema=schema)
+        ]
+        for table in inspector.get_table_names(schema=schema)
+        if matches_any_pattern(table, table_patterns)
+    }
+
+
 def get_db_schemas(
     engine: Engine,
+    schema_patterns: Optional[List[str]] = None,
+    table_patterns: Optional[List[str]] = None,
+    workers: int = 1,
+    schemas: Optional[Iterable[str]] = None,
 ) -> Dict[str, Dict[str, List[str]]]:
     """
     Extract the schema, table and column names from a database given a sqlalchemy engine
+
+    Schemas are introspected by up to `workers` threads at once. Only the given
+    schemas are introspected, if any, otherwise every included schema matching any
+    of the schema glob patterns. Only tables matching any of the table glob patterns
+    are included.
     """
-    if engine.dialect.name != "snowflake":
-        inspector = sqlalchemy.inspect(engine)
-        db_schemas: Dict[str, Dict[str, List]] = {}
-        for schema in inspector.get_schema_names():
-            if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-                db_schemas[schema] = {}
-                for table in inspector.get_table_names(schema=schema):
-                    db_schemas[schema][table] = [
-                        column["name"]
-                        for column in inspector.get_columns(table, schema=schema)
-                    ]
-    else:
-        db_schemas = get_snowflake_schemas(engine=engine)
-    return db_schemas
+    schema_names = (
+        list(schemas)
+        if schemas is not None
+        else get_db_schema_names(engine=engine, schema_patterns=schema_patterns)
+    )
+    with ThreadPoolExecutor(
+        max_workers=min(workers, MAX_INTROSPECTION_WORKERS)
+    ) as executor:
+        schema_tables = list(
+            executor.map(
+                partial(get_db_schema_tables, engine, table_patterns=table_patterns),
+                schema_names,
+            )
+        )
+    return dict(zip(schema_names, schema_tables))
+
+
+def get_schema_fingerprints(
+    engine: Engine, table_patterns: Optional[List[str]] = None
+) -> Dict[str, str]:
+    """
+    Returns a fingerprint of each schema's DDL, including the table glob patterns
+    it's introspected with, or nothing if the dialect doesn't support fingerprints
+    """
+    query = SCHEMA_FINGERPRINT_QUERIES.get(engine.dialect.name)
+    if not query:
+        return {}
+
+    patterns = ",".join(sorted(table_patterns or []))
+    with engine.connect() as connection:
+        return {
+            schema: hashlib.sha256(f"{fingerprint}|{patterns}".encode()).hexdigest()
+            for schema, fingerprint in connection.execute(text(query))
+        }
 
 
 def create_db_datasets(db_schemas: Dict[str, Dict[str, List[str]]]) -> List[Dataset]:
@@ -255,6 +401,9 @@ def scan_dataset_db(
     url: AnyHttpUrl,
     headers: Dict[str, str],
     local: bool = False,
+    schema_patterns: Optional[List[str]] = None,
+    table_patterns: Optional[List[str]] = None,
+    workers: int = 1,
 ) -> None:
     """
     Given a database connection string, fetches collections
@@ -287,7 +436,12 @@ def scan_dataset_db(
     )
 
     # Generate the collections and fields for the target database
-    db_datasets = generate_db_datasets(connection_string=connection_string)
+    db_datasets = generate_db_datasets(
+        connection_string=connection_string,
+        schema_patterns=schema_patterns,
+        table_patterns=table_patterns,
+        workers=workers,
+    )
     uncategorized_fields, db_field_count = find_all_uncategorized_dataset_fields(
         existing_datasets=all_datasets,
         source_datasets=db_datasets,
@@ -307,19 +461,64 @@ def scan_dataset_db(
     )
 
 
-def generate_db_datasets(connection_string: str) -> List[Dataset]:
+def generate_db_datasets(
+    connection_string: str,
+    schema_patterns: Optional[List[str]] = None,
+    table_patterns: Optional[List[str]] = None,
+    workers: int = 1,
+    previous_datasets: Optional[List[Dataset]] = None,
+) -> List[Dataset]:
     """
     Given a database connection string, extract all tables/fields from it
     and generate corresponding datasets.
+
+    If previous datasets are given, the previous dataset of each schema whose
+    fingerprint hasn't changed since it was generated is returned instead of
+    introspecting the schema again, and the generated datasets are fingerprinted.
     """
     db_engine = get_db_engine(connection_string)
-    db_schemas = get_db_schemas(engine=db_engine)
+    database_host, database_name = db_engine.url.host, db_engine.url.database
+    schema_names = get_db_schema_names(
+        engine=db_engine, schema_patterns=schema_patterns
+    )
+
+    fingerprints: Dict[str, str] = {}
+    unchanged_datasets: Dict[str, Dataset] = {}
+    if previous_datasets is not None:
+        fingerprints = get_schema_fingerprints(
+            engine=db_engine, table_patterns=table_patterns
+        )
+        for dataset in previous_datasets:
+            meta = dataset.meta or {}
+            if (
+                dataset.name in fingerprints
+                and meta.get(SCHEMA_FINGERPRINT_META_KEY) == fingerprints[dataset.name]
+                and meta.get("database_host") == database_host
+                and meta.get("database_name") == database_name
+            ):
+                unchanged_datasets[dataset.name] = dataset
+
+    db_schemas = get_db_schemas(
+        engine=db_engine,
+        table_patterns=table_patterns,
+        workers=workers,
+        schemas=[schema for schema in schema_names if schema not in unchanged_datasets],
+    )
     db_datasets = create_db_datasets(db_schemas=db_schemas)
-    unique_db_datasets = [
-        make_dataset_key_unique(dataset, db_engine.url.host, db_engine.url.database)
+    unique_db_datasets = {
+        dataset.name: make_dataset_key_unique(dataset, database_host, database_name)
         for dataset in db_datasets
+    }
+    for schema_name, dataset in unique_db_datasets.items():
+        if schema_name in fingerprints:
+            dataset.meta = {
+                **(dataset.meta or {}),
+                SCHEMA_FINGERPRINT_META_KEY: fingerprints[schema_name],
+            }
+    return [
+        unchanged_datasets.get(schema_name) or unique_db_datasets[schema_name]
+        for schema_name in schema_names
     ]
-    return unique_db_datasets
 
 
 def write_dataset_manifest(
@@ -339,13 +538,33 @@ def write_dataset_manifest(
 
 
 def generate_dataset_db(
-    connection_string: str, file_name: str, include_null: bool
+    connection_string: str,
+    file_name: str,
+    include_null: bool,
+    schema_patterns: Optional[List[str]] = None,
+    table_patterns: Optional[List[str]] = None,
+    workers: int = 1,
+    incremental: bool = False,
 ) -> str:
     """
     Given a database connection string, extract all tables/fields from it
     and write out a boilerplate dataset manifest, excluding optional null attributes.
+
+    If incremental, the datasets of schemas that haven't changed since the manifest
+    was last generated are kept from the manifest instead of being introspected again.
     """
-    db_datasets = generate_db_datasets(connection_string=connection_string)
+    previous_datasets: Optional[List[Dataset]] = None
+    if incremental:
+        previous_datasets = (
+            parse(file_name).dataset or [] if os.path.exists(file_name) else []
+        )
+    db_datasets = generate_db_datasets(
+        connection_string=connection_string,
+        schema_patterns=schema_patterns,
+        table_patterns=table_patterns,
+        workers=workers,
+        previous_datasets=previous_datasets,
+    )
     write_dataset_manifest(
         file_name=file_name, include_null=include_null, datasets=db_datasets
     )
@@ -377,42 +596,3 @@ def generate_dynamo_db_datasets(aws_config: Optional[AWSConfig]) -> Dataset:
     described_dynamo_tables = describe_dynamo_tables(client, dynamo_tables)
     dynamo_dataset = create_dynamodb_dataset(described_dynamo_tables)
     return dynamo_dataset
-
-
-def get_snowflake_schemas(
-    engine: Engine,
-) -> Dict[str, Dict[str, List[str]]]:
-    """
-    Returns Datasets that match the case-sensitivity that may be
-    required by Snowflake. Iterates through each schema.table.column
-    the logged in user has access to.
-
-    This is currently required because of the inferred casing of Snowflake,
-    which defaults to upper-case. Anything else must be double-quoted, however
-    `snowflake-sqlalchemy` does not account for this in a flexible manner in
-    it's implementation of the `inspect()` method, forcing everything to what
-    is deemed to be normalized (i.e. lower-case).
-
-    The following code maintains casing as defined in Snowflake which combines
-    well with our DSR implementation in always using double-quoted query syntax.
-
-    It may be worthwhile for us to invest some time in resolving the core issue
-    and being able to fall back to using the connector.
-
-    Reference: https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157
-    """
-    schema_cursor = engine.execute(text("SHOW SCHEMAS"))
-    db_schemas = [row[1] for row in schema_cursor]
-    metadata: Dict[str, Dict[str, List]] = {}
-    for schema in db_schemas:
-        if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-            metadata[schema] = {}
-            table_cursor = engine.execute(text(f'SHOW TABLES IN "{schema}"'))
-            db_tables = [row[1] for row in table_cursor]
-            for table in db_tables:
-                column_cursor = engine.execute(
-                    text(f'SHOW COLUMNS IN "{schema}"."{table}"')
-                )
-                columns = [row[2] for row in column_cursor]
-                metadata[schema][table] = columns
-    return metadata
@@ -1,11 +1,12 @@
 """Module for evaluating policies."""
 import uuid
-from typing import Callable, Dict, List, Optional, Set, cast
+from typing import Dict, List, Optional, Sequence, Set, Tuple, cast
 
 from fideslang.default_taxonomy import DEFAULT_TAXONOMY
 from fideslang.models import (
     Dataset,
     Evaluation,
+    FidesModel,
     MatchesEnum,
     Policy,
     PolicyRule,
@@ -17,7 +18,6 @@ from fideslang.models import (
     ViolationAttributes,
 )
 from fideslang.relationships import get_referenced_missing_keys
-from fideslang.utils import get_resource_by_fides_key
 from fideslang.validation import FidesKey
 from pydantic import AnyHttpUrl
 
@@ -105,6 +105,59 @@ def validate_policies_exist(policies: List[Policy], evaluate_fides_key: str) ->
         raise SystemExit(1)
 
 
+# The violating data categories, data uses and data subjects of a policy rule
+RuleMatch = Tuple[Set[str], Set[str], Set[str]]
+
+
+class TaxonomyIndex:
+    """
+    The resources of a taxonomy by fides key, with the parent hierarchy of each key
+    memoised as it's first needed.
+
+    Evaluating a taxonomy looks up the hierarchies of the same few keys for every
+    policy rule, system, declaration and dataset field, so the index is built once
+    per evaluation instead of scanning the taxonomy for every step of every
+    hierarchy.
+    """
+
+    def __init__(self, taxonomy: Taxonomy) -> None:
+        # A later resource with the same key replaces an earlier one, as it does
+        # for fideslang's get_resource_by_fides_key
+        self.resources: Dict[str, FidesModel] = {
+            resource.fides_key: resource
+            for resource_type in taxonomy.__fields_set__
+            for resource in getattr(taxonomy, resource_type) or []
+        }
+        self.datasets: Dict[str, Dataset] = {}
+        for dataset in taxonomy.dataset or []:
+            self.datasets.setdefault(dataset.fides_key, dataset)
+        self._hierarchies: Dict[str, Tuple[FidesKey, ...]] = {}
+
+    def get_parent_hierarchy(self, fides_key: str) -> Tuple[FidesKey, ...]:
+        """
+        Returns the hierarchy of parents of the fides key, starting with the key.
+        Exits if the key, or one of its parents, isn't in the taxonomy.
+        """
+        hierarchy = self._hierarchies.get(fides_key)
+        if hierarchy is not None:
+            return hierarchy
+
+        resource = self.resources.get(fides_key)
+        if resource is None:
+            echo_red("Found missing key ({}) referenced in taxonomy".format(fides_key))
+            raise SystemExit(1)
+        parent_key: Optional[str] = (
+            getattr(resource, "parent_key")
+            if "parent_key" in resource.__fields_set__
+            else None
+        )
+        hierarchy = (FidesKey(fides_key),) + (
+            self.get_parent_hierarchy(parent_key) if parent_key else ()
+        )
+        self._hierarchies[fides_key] = hierarchy
+        return hierarchy
+
+
 def get_fides_key_parent_hierarchy(
     taxonomy: Taxonomy, fides_key: str
 ) -> List[FidesKey]:
@@ -112,32 +165,12 @@ def get_fides_key_parent_hierarchy(
     Traverses a hierarchy of parents for a given fides key and returns
     the hierarchy starting with the given fides key.
     """
-    current_key = fides_key
-    fides_key_parent_hierarchy = []
-    while True:
-        fides_key_parent_hierarchy.append(FidesKey(current_key))
-        found_resource_map = get_resource_by_fides_key(
-            taxonomy=taxonomy, fides_key=current_key
-        )
-        if found_resource_map:
-            found_resource = list(found_resource_map.values())[-1]
-            if found_resource and "parent_key" in found_resource.__fields_set__:
-                current_key = getattr(found_resource, "parent_key")
-                if not current_key:
-                    break
-            else:
-                break
-        else:
-            echo_red(
-                "Found missing key ({}) referenced in taxonomy".format(current_key)
-            )
-            raise SystemExit(1)
-    return fides_key_parent_hierarchy
+    return list(TaxonomyIndex(taxonomy).get_parent_hierarchy(fides_key))
 
 
 def compare_rule_to_declaration(
     rule_types: List[FidesKey],
-    declaration_type_hierarchies: List[List[FidesKey]],
+    declaration_type_hierarchies: Sequence[Sequence[FidesKey]],
     rule_match: MatchesEnum,
 ) -> Set[str]:
     """
@@ -146,68 +179,65 @@ def compare_rule_to_declaration(
     field to determine whether the rule is triggered or not. Returns the offending
     keys, prioritizing the first descendant in the hierarchy.
     """
-    matched_declaration_types = set()
-    mismatched_declaration_types = set()
+    matched_declaration_types: Set[str] = set()
+    mismatched_declaration_types: Set[str] = set()
+    rule_type_set = set(rule_types)
     for declaration_type_hierarchy in declaration_type_hierarchies:
         declared_declaration_type = declaration_type_hierarchy[0]
-        if len(set(declaration_type_hierarchy).intersection(set(rule_types))) > 0:
+        if not rule_type_set.isdisjoint(declaration_type_hierarchy):
             matched_declaration_types.add(declared_declaration_type)
         else:
             mismatched_declaration_types.add(declared_declaration_type)
 
-    matches_map: Dict[MatchesEnum, Callable] = {
-        # any matches return matching declared values as violations
-        MatchesEnum.ANY: lambda: matched_declaration_types,
-        # all matches return matching declared values as violations if all values match rule values
-        MatchesEnum.ALL: lambda: matched_declaration_types
-        if len(matched_declaration_types) == len(declaration_type_hierarchies)
-        else set(),
-        # none matches return mismatched declared values as violations if none of the values matched rule values
-        MatchesEnum.NONE: lambda: mismatched_declaration_types
-        if not any(matched_declaration_types)
-        else set(),
-        # other matches return mismatched declared values as violations
-        MatchesEnum.OTHER: lambda: mismatched_declaration_types,
-    }
-
-    return matches_map[rule_match]()
+    # any matches return matching declared values as violations
+    if rule_match == MatchesEnum.ANY:
+        return matched_declaration_types
+    # all matches return matching declared values as violations if all values match rule values
+    if rule_match == MatchesEnum.ALL:
+        return (
+            matched_declaration_types
+            if len(matched_declaration_types) == len(declaration_type_hierarchies)
+            else set()
+        )
+    # none matches return mismatched declared values as violations if none of the values matched rule values
+    if rule_match == MatchesEnum.NONE:
+        return mismatched_declaration_types if not matched_declaration_types else set()
+    # other matches return mismatched declared values as violations
+    return mismatched_declaration_types
 
 
-def evaluate_policy_rule(
-    taxonomy: Taxonomy,
+def match_policy_rule(
     policy_rule: PolicyRule,
     data_subjects: List[str],
     data_categories: List[str],
     data_qualifier: str,
     data_use: str,
-    declaration_violation_message: str,
-) -> List[Violation]:
+    taxonomy_index: TaxonomyIndex,
+) -> Optional[RuleMatch]:
     """
     Given data subjects, data categories, data qualifier and data use,
-    builds hierarchies of applicable types and evaluates the result of a
-    policy rule
+    builds hierarchies of applicable types and matches them against a
+    policy rule. Returns the violating data categories, data uses and data
+    subjects if the rule is violated.
     """
     category_hierarchies = [
-        get_fides_key_parent_hierarchy(
-            taxonomy=taxonomy, fides_key=declaration_category
-        )
+        taxonomy_index.get_parent_hierarchy(declaration_category)
         for declaration_category in data_categories
     ]
-    data_category_violations = compare_rule_to_declaration(
-        rule_types=policy_rule.data_categories.values,
-        declaration_type_hierarchies=category_hierarchies,
-        rule_match=policy_rule.data_categories.matches,
-    )
-
     # A declaration only has one data use, so its hierarchy gets put in a list
-    data_use_hierarchies = [
-        get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_use)
-    ]
+    data_use_hierarchies = [taxonomy_index.get_parent_hierarchy(data_use)]
+    data_qualifier_hierarchy = taxonomy_index.get_parent_hierarchy(data_qualifier)
+
+    # The rule is only violated if every kind of type violates it, so the
+    # declaration's data use, subjects and qualifier, which are the same for
+    # each of its dataset's fields, are compared before its data categories
     data_use_violations = compare_rule_to_declaration(
         rule_types=policy_rule.data_uses.values,
         declaration_type_hierarchies=data_use_hierarchies,
         rule_match=policy_rule.data_uses.matches,
     )
+    if not data_use_violations:
+        return None
 
     # A data subject does not have a hierarchical structure
     data_subject_violations = compare_rule_to_declaration(
@@ -217,22 +247,52 @@ def evaluate_policy_rule(
         ],
         rule_match=policy_rule.data_subjects.matches,
     )
+    if not data_subject_violations:
+        return None
+
+    if policy_rule.data_qualifier not in data_qualifier_hierarchy:
+        return None
 
-    data_qualifier_violation = (
-        policy_rule.data_qualifier
-        in get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_qualifier)
+    data_category_violations = compare_rule_to_declaration(
+        rule_types=policy_rule.data_categories.values,
+        declaration_type_hierarchies=category_hierarchies,
+        rule_match=policy_rule.data_categories.matches,
     )
+    if not data_category_violations:
+        return None
+    return data_category_violations, data_use_violations, data_subject_violations
 
-    evaluation_result = all(
-        [
+
+def evaluate_policy_rule(
+    taxonomy: Taxonomy,
+    policy_rule: PolicyRule,
+    data_subjects: List[str],
+    data_categories: List[str],
+    data_qualifier: str,
+    data_use: str,
+    declaration_violation_message: str,
+    taxonomy_index: Optional[TaxonomyIndex] = None,
+) -> List[Violation]:
+    """
+    Given data subjects, data categories, data qualifier and data use,
+    builds hierarchies of applicable types and evaluates the result of a
+    policy rule
+    """
+    taxonomy_index = taxonomy_index or TaxonomyIndex(taxonomy)
+    rule_match = match_policy_rule(
+        policy_rule=policy_rule,
+        data_subjects=data_subjects,
+        data_categories=data_categories,
+        data_qualifier=data_qualifier,
+        data_use=data_use,
+        taxonomy_index=taxonomy_index,
+    )
+    if rule_match:
+        (
             data_category_violations,
             data_use_violations,
             data_subject_violations,
-            data_qualifier_violation,
-        ]
-    )
-
-    if evaluation_result:
+        ) = rule_match
         violations = [
             Violation(
                 detail="{}. Violated usage of data categories ({}) with qualifier ({}) for data uses ({}) and subjects ({})".format(
@@ -275,11 +335,13 @@ def evaluate_dataset_reference(
     policy_rule: PolicyRule,
     privacy_declaration: PrivacyDeclaration,
     dataset: Dataset,
+    taxonomy_index: Optional[TaxonomyIndex] = None,
 ) -> List[Violation]:
     """
     Evaluates the constraints of a given rule and dataset that was referenced
     from a given privacy declaration
     """
+    taxonomy_index = taxonomy_index or TaxonomyIndex(taxonomy)
     evaluation_violation_list = []
     if dataset.data_categories:
         dataset_violation_message = "Declaration ({}) of system ({}) failed rule ({}) from policy ({}) for dataset ({})".format(
@@ -299,6 +361,7 @@ def evaluate_dataset_reference(
             data_qualifier=data_qualifier,
             data_use=privacy_declaration.data_use,
             declaration_violation_message=dataset_violation_message,
+            taxonomy_index=taxonomy_index,
         )
 
         evaluation_violation_list += dataset_result_violations
@@ -321,6 +384,7 @@ def evaluate_dataset_reference(
                 data_qualifier=collection.data_qualifier,
                 data_use=privacy_declaration.data_use,
                 declaration_violation_message=collection_violation_message,
+                taxonomy_index=taxonomy_index,
             )
 
             evaluation_violation_list += dataset_collection_result_violations
@@ -343,6 +407,7 @@ def evaluate_dataset_reference(
                     data_qualifier=field.data_qualifier,
                     data_use=privacy_declaration.data_use,
                     declaration_violation_message=field_violation_message,
+                    taxonomy_index=taxonomy_index,
                 )
 
                 evaluation_violation_list += field_result_violations
@@ -356,11 +421,13 @@ def evaluate_privacy_declaration(
     system: System,
     policy_rule: PolicyRule,
     privacy_declaration: PrivacyDeclaration,
+    taxonomy_index: Optional[TaxonomyIndex] = None,
 ) -> List[Violation]:
     """
     Evaluates the contraints of a given rule and privacy declaration. This
     includes additional data set references
     """
+    taxonomy_index = taxonomy_index or TaxonomyIndex(taxonomy)
     evaluation_violation_list = []
 
     declaration_violation_message = (
@@ -385,14 +452,13 @@ def evaluate_privacy_declaration(
         data_qualifier=data_qualifier,
         data_use=privacy_declaration.data_use,
         declaration_violation_message=declaration_violation_message,
+        taxonomy_index=taxonomy_index,
     )
 
     evaluation_violation_list += declaration_result_violations
 
     for dataset_reference in privacy_declaration.dataset_references or []:
-        dataset = get_dataset_by_fides_key(
-            taxonomy=taxonomy, fides_key=dataset_reference
-        )
+        dataset = taxonomy_index.datasets.get(dataset_reference)
         if dataset:
             evaluation_violation_list += evaluate_dataset_reference(
                 taxonomy=taxonomy,
@@ -401,6 +467,7 @@ def evaluate_privacy_declaration(
                 policy_rule=policy_rule,
                 privacy_declaration=privacy_declaration,
                 dataset=dataset,
+                taxonomy_index=taxonomy_index,
             )
         else:
             echo_red(
@@ -420,6 +487,7 @@ def execute_evaluation(taxonomy: Taxonomy) -> Evaluation:
     evaluation_violation_list = []
     taxonomy.policy = getattr(taxonomy, "policy") or []
     taxonomy.system = getattr(taxonomy, "system") or []
+    taxonomy_index = TaxonomyIndex(taxonomy)
     for policy in taxonomy.policy:
         for rule in policy.rules:
             for system in taxonomy.system:
@@ -430,6 +498,7 @@ def execute_evaluation(taxonomy: Taxonomy) -> Evaluation:
                         system=system,
                         policy_rule=rule,
                         privacy_declaration=declaration,
+                        taxonomy_index=taxonomy_index,
                     )
     status_enum = (
         StatusEnum.FAIL if len(evaluation_violation_list) > 0 else StatusEnum.PASS
@@ -1,6 +1,7 @@
 # pylint: disable=missing-docstring, redefined-outer-name
 import os
 from typing import Dict, Generator, List
+from unittest import mock
 from urllib.parse import quote_plus
 from uuid import uuid4
 
@@ -357,6 +358,71 @@ def test_unsupported_dialect_error() -> None:
         _dataset.generate_dataset_db(test_url, "test_file.yml", False)
 
 
+@pytest.mark.unit
+class TestGenerateDbDatasets:
+    @pytest.fixture
+    def sqlite_url(self, tmpdir: LocalPath) -> Generator:
+        url = f"sqlite:///{tmpdir}/introspection.db"
+        engine = sqlalchemy.create_engine(url)
+        engine.execute("CREATE TABLE users (id INTEGER, email TEXT)")
+        engine.execute("CREATE TABLE user_logins (id INTEGER, user_id INTEGER)")
+        engine.execute("CREATE TABLE orders (id INTEGER, user_id INTEGER)")
+        # get_db_engine sets a connect timeout, which SQLite doesn't support, and
+        # SQLite URLs have no host to make keys unique with
+        with mock.patch.object(
+            _dataset, "get_db_engine", sqlalchemy.create_engine
+        ), mock.patch.object(
+            _dataset, "generate_unique_fides_key", lambda key, host, name: key
+        ):
+            yield url
+
+    @pytest.fixture
+    def fingerprint_query(self) -> Generator:
+        """A stand-in for the fingerprint queries of the databases that support them"""
+        with mock.patch.dict(
+            _dataset.SCHEMA_FINGERPRINT_QUERIES,
+            {"sqlite": "SELECT 'main', group_concat(sql) FROM sqlite_master"},
+        ):
+            yield
+
+    def test_get_db_schemas_filtered(self, sqlite_url: str) -> None:
+        engine = sqlalchemy.create_engine(sqlite_url)
+        assert _dataset.get_db_schemas(
+            engine=engine, table_patterns=["user*"], workers=2
+        ) == {"main": {"users": ["id", "email"], "user_logins": ["id", "user_id"]}}
+        assert _dataset.get_db_schemas(engine=engine, schema_patterns=["other"]) == {}
+
+    def test_incremental(self, sqlite_url: str, fingerprint_query: None) -> None:
+        datasets = _dataset.generate_db_datasets(sqlite_url, previous_datasets=[])
+        fingerprint = datasets[0].meta[_dataset.SCHEMA_FINGERPRINT_META_KEY]
+        datasets[0].collections[0].fields[0].data_categories = ["user.contact.email"]
+
+        with mock.patch.object(
+            _dataset, "get_db_schemas", wraps=_dataset.get_db_schemas
+        ) as get_db_schemas:
+            unchanged_datasets = _dataset.generate_db_datasets(
+                sqlite_url, previous_datasets=datasets
+            )
+        assert unchanged_datasets == datasets
+        assert get_db_schemas.call_args.kwargs["schemas"] == []
+
+        sqlalchemy.create_engine(sqlite_url).execute(
+            "ALTER TABLE orders ADD COLUMN total INTEGER"
+        )
+        changed_datasets = _dataset.generate_db_datasets(
+            sqlite_url, previous_datasets=datasets
+        )
+        assert changed_datasets != datasets
+        assert (
+            changed_datasets[0].meta[_dataset.SCHEMA_FINGERPRINT_META_KEY]
+            != fingerprint
+        )
+
+    def test_not_incremental(self, sqlite_url: str, fingerprint_query: None) -> None:
+        datasets = _dataset.generate_db_datasets(sqlite_url)
+        assert _dataset.SCHEMA_FINGERPRINT_META_KEY not in datasets[0].meta
+
+
 # Generate Dataset Database Integration Tests
 
 # These URLs are for the databases in the docker-compose.integration-tests.yml file
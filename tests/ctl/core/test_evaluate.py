@@ -637,3 +637,66 @@ class TestMergeTaxonomies:
             ],
         )
         assert evaluate.merge_taxonomies(taxonomy_1, taxonomy_2) == taxonomy_3
+
+
+@pytest.mark.unit
+class TestTaxonomyIndex:
+    def test_parent_hierarchy_memoised(
+        self, evaluation_hierarchical_key_basic_taxonomy: Taxonomy
+    ) -> None:
+        taxonomy_index = evaluate.TaxonomyIndex(
+            evaluation_hierarchical_key_basic_taxonomy
+        )
+        hierarchy = taxonomy_index.get_parent_hierarchy("data_category.parent.child")
+        assert hierarchy == (
+            "data_category.parent.child",
+            "data_category.parent",
+            "data_category",
+        )
+        assert (
+            taxonomy_index.get_parent_hierarchy("data_category.parent.child")
+            is hierarchy
+        )
+
+    def test_missing_key(
+        self, evaluation_hierarchical_key_basic_taxonomy: Taxonomy
+    ) -> None:
+        taxonomy_index = evaluate.TaxonomyIndex(
+            evaluation_hierarchical_key_basic_taxonomy
+        )
+        with pytest.raises(SystemExit):
+            taxonomy_index.get_parent_hierarchy("data_category.invalid")
+
+    def test_datasets(self) -> None:
+        dataset_1 = Dataset(fides_key="dataset_1", collections=[])
+        dataset_2 = Dataset(fides_key="dataset_2", collections=[])
+        taxonomy_index = evaluate.TaxonomyIndex(
+            Taxonomy(dataset=[dataset_1, dataset_2])
+        )
+        assert taxonomy_index.datasets == {
+            "dataset_1": dataset_1,
+            "dataset_2": dataset_2,
+        }
+
+
+@pytest.mark.unit
+def test_evaluate_policy_rule_checks_every_key(
+    evaluation_hierarchical_key_basic_taxonomy: Taxonomy,
+) -> None:
+    """Keys are looked up even when the rule isn't violated by the data use"""
+    policy_rule = create_policy_rule_with_keys(
+        data_categories=["data_category"],
+        data_uses=["data_use_1"],
+        data_subjects=["data_subject_1"],
+        data_qualifier="data_qualifier_1",
+    )
+    with pytest.raises(SystemExit):
+        evaluate.evaluate_policy_rule(
+            taxonomy=evaluation_hierarchical_key_basic_taxonomy,
+            policy_rule=policy_rule,
+            data_subjects=["data_subject_1"],
+            data_categories=["data_category.invalid"],
+            data_qualifier="data_category",
+            data_use="data_category",
+            declaration_violation_message="",
+        )
@@ -10,6 +10,7 @@ from fides.api.cryptography.cryptographic_util import (
     generate_salt,
     generate_secure_random_string,
     hash_with_salt,
+    hmac_sha256,
     str_to_b64_str,
 )
 
@@ -79,6 +80,19 @@ def test_hash_with_salt(encoding: str = "UTF-8") -> None:
     assert hashed == expected_hash
 
 
+def test_hmac_sha256(encoding: str = "UTF-8") -> None:
+    plain_text = "This is Plaintext. Not hashed. or salted. or chopped. or grilled."
+    key = "a-pepper"
+
+    expected_hash = "a66d9949b28941ca4e6780667944634e41ff77d2348d39670ba7dd4743557d23"
+    hashed = hmac_sha256(
+        plain_text.encode(encoding),
+        key.encode(encoding),
+    )
+
+    assert hashed == expected_hash
+
+
 def test_str_to_b64_str() -> None:
     orig_string = "https://www.google.com"
     b64_string = "aHR0cHM6Ly93d3cuZ29vZ2xlLmNvbQ=="
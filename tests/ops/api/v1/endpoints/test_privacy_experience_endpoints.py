@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 from starlette.status import HTTP_200_OK
 from starlette.testclient import TestClient
@@ -9,6 +11,10 @@ from fides.api.api.v1.endpoints.privacy_experience_endpoints import (
 )
 from fides.api.models.privacy_experience import ComponentType, PrivacyExperience
 from fides.api.models.privacy_notice import ConsentMechanism
+from fides.api.util.privacy_experience_snapshot import (
+    PRIVACY_EXPERIENCE_SNAPSHOT_VERSION,
+    clear_process_experience_snapshots,
+)
 from fides.common.api.v1.urn_registry import PRIVACY_EXPERIENCE, V1_URL_PREFIX
 
 
@@ -652,6 +658,97 @@ class TestGetPrivacyExperiences:
         assert data["privacy_notices"][0]["outdated_served"] is True
 
 
+class TestPrivacyExperienceSnapshots:
+    @pytest.fixture(scope="function")
+    def url(self) -> str:
+        return V1_URL_PREFIX + PRIVACY_EXPERIENCE
+
+    @pytest.fixture(autouse=True)
+    def clear_experience_snapshots(self):
+        clear_process_experience_snapshots()
+        PRIVACY_EXPERIENCE_SNAPSHOT_VERSION.invalidate()
+        yield
+        clear_process_experience_snapshots()
+
+    def test_snapshot_served_with_etag(
+        self, api_client: TestClient, url, privacy_experience_overlay
+    ):
+        resp = api_client.get(url + "?region=us_ca")
+        assert resp.status_code == 200
+        assert resp.headers["etag"]
+        assert "must-revalidate" in resp.headers["cache-control"]
+        assert resp.json()["items"][0]["id"] == privacy_experience_overlay.id
+
+        with mock.patch(
+            "fides.api.api.v1.endpoints.privacy_experience_endpoints._build_privacy_experience_page"
+        ) as mock_build_page:
+            cached_resp = api_client.get(url + "?region=us_ca")
+        assert not mock_build_page.called
+        assert cached_resp.json() == resp.json()
+        assert cached_resp.headers["etag"] == resp.headers["etag"]
+
+    def test_not_modified_when_etag_matches(
+        self, api_client: TestClient, url, privacy_experience_overlay
+    ):
+        etag = api_client.get(url + "?region=us_ca").headers["etag"]
+
+        resp = api_client.get(url + "?region=us_ca", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+        resp = api_client.get(url + "?region=us_co", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+    def test_rate_limit_headers_on_snapshots(
+        self, api_client: TestClient, url, privacy_experience_overlay
+    ):
+        resp = api_client.get(url + "?region=us_ca")
+        cached_resp = api_client.get(url + "?region=us_ca")
+        not_modified_resp = api_client.get(
+            url + "?region=us_ca", headers={"If-None-Match": resp.headers["etag"]}
+        )
+        assert not_modified_resp.status_code == 304
+
+        for response in [resp, cached_resp, not_modified_resp]:
+            assert response.headers["x-ratelimit-limit"]
+            assert response.headers["x-ratelimit-remaining"]
+            assert response.headers["x-ratelimit-reset"]
+
+    def test_snapshot_rebuilt_after_notice_change(
+        self,
+        db,
+        api_client: TestClient,
+        url,
+        privacy_experience_overlay,
+        privacy_notice,
+    ):
+        resp = api_client.get(url + "?region=us_ca")
+        assert resp.json()["items"][0]["privacy_notices"][0]["id"] == privacy_notice.id
+
+        privacy_notice.update(db, data={"name": "Updated notice name"})
+
+        updated_resp = api_client.get(
+            url + "?region=us_ca", headers={"If-None-Match": resp.headers["etag"]}
+        )
+        assert updated_resp.status_code == 200
+        assert updated_resp.headers["etag"] != resp.headers["etag"]
+        assert (
+            updated_resp.json()["items"][0]["privacy_notices"][0]["name"]
+            == "Updated notice name"
+        )
+
+    def test_device_specific_experiences_not_snapshotted(
+        self, api_client: TestClient, url, privacy_experience_overlay
+    ):
+        resp = api_client.get(
+            url
+            + "?region=us_ca&fides_user_device_id=051b219f-20e4-45df-82f7-5eb68a00889f"
+        )
+        assert resp.status_code == 200
+        assert "etag" not in resp.headers
+
+
 class TestGetTCFPrivacyExperiences:
     @pytest.fixture(scope="function")
     def url(self) -> str:
@@ -1,7 +1,9 @@
 import ast
 import csv
+import gzip
 import io
 import json
+import time
 from datetime import datetime, timedelta
 from random import randint
 from typing import List
@@ -54,9 +56,12 @@ from fides.api.schemas.messaging.messaging import (
 )
 from fides.api.schemas.policy import ActionType, PolicyResponse
 from fides.api.schemas.redis_cache import Identity
+from fides.api.service.connectors.fides.child_requests import ChildRequestCheckpoint
+from fides.api.service.privacy_request.fides_child_request_service import POLLED_AT_KEY
 from fides.api.task import graph_task
 from fides.api.tasks import MESSAGING_QUEUE_NAME
 from fides.api.util.cache import (
+    get_cache,
     get_encryption_cache_key,
     get_identity_cache_key,
     get_masking_secret_cache_key,
@@ -80,6 +85,7 @@ from fides.common.api.v1.urn_registry import (
     PRIVACY_REQUEST_AUTHENTICATED,
     PRIVACY_REQUEST_BULK_RETRY,
     PRIVACY_REQUEST_DENY,
+    PRIVACY_REQUEST_FIDES_CHILD_CALLBACK,
     PRIVACY_REQUEST_MANUAL_ERASURE,
     PRIVACY_REQUEST_MANUAL_INPUT,
     PRIVACY_REQUEST_MANUAL_WEBHOOK_ACCESS_INPUT,
@@ -111,12 +117,10 @@ class TestCreatePrivacyRequest:
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_create_privacy_request(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         run_access_request_mock,
         url,
         db,
@@ -138,7 +142,7 @@ class TestCreatePrivacyRequest:
         pr = PrivacyRequest.get(db=db, object_id=response_data[0]["id"])
         pr.delete(db=db)
         assert run_access_request_mock.called
-        assert not mock_dispatch_message.called
+        assert not mock_queue_messages.called
 
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
@@ -765,6 +769,24 @@ class TestGetPrivacyRequests:
         resp = response.json()
         assert resp == expected_resp
 
+    def test_get_privacy_requests_by_ids(
+        self,
+        api_client: TestClient,
+        url,
+        generate_auth_header,
+        privacy_requests,
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        requested = [privacy_requests[0].id, privacy_requests[2].id, "pri_nonexistent"]
+        response = api_client.get(
+            url, headers=auth_header, params={"request_ids": requested}
+        )
+        assert 200 == response.status_code
+        assert {item["id"] for item in response.json()["items"]} == {
+            privacy_requests[0].id,
+            privacy_requests[2].id,
+        }
+
     def test_get_privacy_requests_by_partial_id(
         self,
         api_client: TestClient,
@@ -1423,6 +1445,27 @@ class TestGetPrivacyRequests:
 
         privacy_request.delete(db)
 
+    def test_get_privacy_requests_gzipped_ndjson_format(
+        self, db, generate_auth_header, api_client, url, privacy_request
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(
+            url + f"?download_format=ndjson&download_gzip=True", headers=auth_header
+        )
+        assert 200 == response.status_code
+
+        assert response.headers["content-type"] == "application/gzip"
+        assert (
+            response.headers["content-disposition"]
+            == f"attachment; filename=privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.ndjson.gz"
+        )
+
+        lines = gzip.decompress(response.content).decode().splitlines()
+        first_row = json.loads(lines[0])
+        assert first_row["id"] == privacy_request.id
+        assert first_row["status"] == privacy_request.status.value
+        assert first_row["request_type"] == "access"
+
     def test_get_paused_access_privacy_request_resume_info(
         self, db, privacy_request, generate_auth_header, api_client, url
     ):
@@ -2051,12 +2094,10 @@ class TestApprovePrivacyRequest:
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_approve_privacy_request(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         submit_mock,
         db,
         url,
@@ -2100,19 +2141,17 @@ class TestApprovePrivacyRequest:
         )
 
         assert submit_mock.called
-        assert not mock_dispatch_message.called
+        assert not mock_queue_messages.called
 
         privacy_request.delete(db)
 
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_approve_privacy_request_with_custom_fields(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         submit_mock,
         db,
         url,
@@ -2158,19 +2197,17 @@ class TestApprovePrivacyRequest:
         )
 
         assert submit_mock.called
-        assert not mock_dispatch_message.called
+        assert not mock_queue_messages.called
 
         privacy_request.delete(db)
 
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_approve_privacy_request_creates_audit_log_and_sends_email(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         submit_mock,
         db,
         url,
@@ -2206,19 +2243,11 @@ class TestApprovePrivacyRequest:
 
         approval_audit_log.delete(db)
 
-        call_args = mock_dispatch_message.call_args[1]
-        task_kwargs = call_args["kwargs"]
-        assert task_kwargs["to_identity"] == Identity(email="test@example.com")
-        assert task_kwargs["service_type"] == MessagingServiceType.mailgun.value
-
-        message_meta = task_kwargs["message_meta"]
-        assert (
-            message_meta["action_type"]
-            == MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE
+        mock_queue_messages.assert_called_once_with(
+            MessagingActionType.PRIVACY_REQUEST_REVIEW_APPROVE,
+            MessagingServiceType.mailgun.value,
+            [(Identity(email="test@example.com"), None)],
         )
-        assert message_meta["body_params"] is None
-        queue = call_args["queue"]
-        assert queue == MESSAGING_QUEUE_NAME
 
 
 class TestDenyPrivacyRequest:
@@ -2292,12 +2321,10 @@ class TestDenyPrivacyRequest:
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_deny_privacy_request_without_denial_reason(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         submit_mock,
         db,
         url,
@@ -2338,21 +2365,16 @@ class TestDenyPrivacyRequest:
             ),
         ).first()
 
-        call_args = mock_dispatch_message.call_args[1]
-        task_kwargs = call_args["kwargs"]
-        assert task_kwargs["to_identity"] == Identity(email="test@example.com")
-        assert task_kwargs["service_type"] == MessagingServiceType.mailgun.value
-
-        message_meta = task_kwargs["message_meta"]
-        assert (
-            message_meta["action_type"]
-            == MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY
-        )
-        assert message_meta["body_params"] == RequestReviewDenyBodyParams(
-            rejection_reason=None
+        mock_queue_messages.assert_called_once_with(
+            MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+            MessagingServiceType.mailgun.value,
+            [
+                (
+                    Identity(email="test@example.com"),
+                    RequestReviewDenyBodyParams(rejection_reason=None),
+                )
+            ],
         )
-        queue = call_args["queue"]
-        assert queue == MESSAGING_QUEUE_NAME
 
         assert denial_audit_log.message is None
 
@@ -2363,12 +2385,10 @@ class TestDenyPrivacyRequest:
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_deny_privacy_request_with_denial_reason(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         submit_mock,
         db,
         url,
@@ -2409,21 +2429,16 @@ class TestDenyPrivacyRequest:
             ),
         ).first()
 
-        call_args = mock_dispatch_message.call_args[1]
-        task_kwargs = call_args["kwargs"]
-        assert task_kwargs["to_identity"] == Identity(email="test@example.com")
-        assert task_kwargs["service_type"] == MessagingServiceType.mailgun.value
-
-        message_meta = task_kwargs["message_meta"]
-        assert (
-            message_meta["action_type"]
-            == MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY
-        )
-        assert message_meta["body_params"] == RequestReviewDenyBodyParams(
-            rejection_reason=denial_reason
+        mock_queue_messages.assert_called_once_with(
+            MessagingActionType.PRIVACY_REQUEST_REVIEW_DENY,
+            MessagingServiceType.mailgun.value,
+            [
+                (
+                    Identity(email="test@example.com"),
+                    RequestReviewDenyBodyParams(rejection_reason=denial_reason),
+                )
+            ],
         )
-        queue = call_args["queue"]
-        assert queue == MESSAGING_QUEUE_NAME
 
         assert denial_audit_log.message == denial_reason
 
@@ -2597,6 +2612,60 @@ class TestResumePrivacyRequest:
         privacy_request.delete(db)
 
 
+class TestFidesChildRequestCallback:
+    @pytest.fixture(scope="function")
+    def url(self):
+        return V1_URL_PREFIX + PRIVACY_REQUEST_FIDES_CHILD_CALLBACK
+
+    @pytest.fixture(scope="function")
+    def outstanding_child_request(self, privacy_request):
+        checkpoint = ChildRequestCheckpoint(
+            privacy_request.id, "fides_connector_connection_1", CurrentStep.access
+        )
+        checkpoint.save(["pri_child"])
+        get_cache().hset(
+            POLLED_AT_KEY, "fides_connector_connection_1", str(time.time())
+        )
+        yield checkpoint
+        checkpoint.discard()
+
+    def test_callback_not_authenticated(self, url, api_client):
+        response = api_client.post(url, json={"privacy_request_id": "pri_child"})
+        assert response.status_code == 401
+
+    def test_callback_wrong_scope(self, url, api_client, generate_auth_header):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.post(
+            url, headers=auth_header, json={"privacy_request_id": "pri_child"}
+        )
+        assert response.status_code == 403
+
+    def test_callback_polls_child_server_on_next_run(
+        self, url, api_client, generate_auth_header, outstanding_child_request
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_CALLBACK_RESUME])
+        response = api_client.post(
+            url,
+            headers=auth_header,
+            json={
+                "privacy_request_id": "pri_child",
+                "privacy_request_status": "in_processing",
+            },
+        )
+        assert response.status_code == 200
+        assert not get_cache().hexists(POLLED_AT_KEY, "fides_connector_connection_1")
+
+    def test_callback_unknown_request_ignored(
+        self, url, api_client, generate_auth_header, outstanding_child_request
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_CALLBACK_RESUME])
+        response = api_client.post(
+            url, headers=auth_header, json={"privacy_request_id": "pri_unknown"}
+        )
+        assert response.status_code == 200
+        assert get_cache().hexists(POLLED_AT_KEY, "fides_connector_connection_1")
+
+
 class TestResumeAccessRequestWithManualInput:
     @pytest.fixture(scope="function")
     def url(self, privacy_request):
@@ -4396,12 +4465,10 @@ class TestCreatePrivacyRequestEmailReceiptNotification:
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_create_privacy_request_no_email_config(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         mock_execute_request,
         url,
         db,
@@ -4425,34 +4492,28 @@ class TestCreatePrivacyRequestEmailReceiptNotification:
         assert mock_execute_request.called
         assert response_data[0]["status"] == PrivacyRequestStatus.pending
 
-        assert mock_dispatch_message.called
-
-        call_args = mock_dispatch_message.call_args[1]
-        task_kwargs = call_args["kwargs"]
-        assert task_kwargs["to_identity"] == Identity(email="test@example.com")
-        assert task_kwargs["service_type"] == MessagingServiceType.mailgun.value
+        assert mock_queue_messages.called
 
-        message_meta = task_kwargs["message_meta"]
-        assert (
-            message_meta["action_type"] == MessagingActionType.PRIVACY_REQUEST_RECEIPT
-        )
-        assert message_meta["body_params"] == RequestReceiptBodyParams(
-            request_types={ActionType.access.value}
+        mock_queue_messages.assert_called_once_with(
+            MessagingActionType.PRIVACY_REQUEST_RECEIPT,
+            MessagingServiceType.mailgun.value,
+            [
+                (
+                    Identity(email="test@example.com"),
+                    RequestReceiptBodyParams(request_types={ActionType.access.value}),
+                )
+            ],
         )
-        queue = call_args["queue"]
-        assert queue == MESSAGING_QUEUE_NAME
 
         pr.delete(db=db)
 
     @mock.patch(
         "fides.api.service.privacy_request.request_runner_service.run_privacy_request.delay"
     )
-    @mock.patch(
-        "fides.api.api.v1.endpoints.privacy_request_endpoints.dispatch_message_task.apply_async"
-    )
+    @mock.patch("fides.api.api.v1.endpoints.privacy_request_endpoints.queue_messages")
     def test_create_privacy_request_with_email_config(
         self,
-        mock_dispatch_message,
+        mock_queue_messages,
         mock_execute_request,
         url,
         db,
@@ -4476,22 +4537,18 @@ class TestCreatePrivacyRequestEmailReceiptNotification:
         assert mock_execute_request.called
 
         assert response_data[0]["status"] == PrivacyRequestStatus.pending
-        assert mock_dispatch_message.called
-
-        call_args = mock_dispatch_message.call_args[1]
-        task_kwargs = call_args["kwargs"]
-        assert task_kwargs["to_identity"] == Identity(email="test@example.com")
-        assert task_kwargs["service_type"] == MessagingServiceType.mailgun.value
-
-        message_meta = task_kwargs["message_meta"]
-        assert (
-            message_meta["action_type"] == MessagingActionType.PRIVACY_REQUEST_RECEIPT
-        )
-        assert message_meta["body_params"] == RequestReceiptBodyParams(
-            request_types={ActionType.access.value}
+        assert mock_queue_messages.called
+
+        mock_queue_messages.assert_called_once_with(
+            MessagingActionType.PRIVACY_REQUEST_RECEIPT,
+            MessagingServiceType.mailgun.value,
+            [
+                (
+                    Identity(email="test@example.com"),
+                    RequestReceiptBodyParams(request_types={ActionType.access.value}),
+                )
+            ],
         )
-        queue = call_args["queue"]
-        assert queue == MESSAGING_QUEUE_NAME
 
         pr.delete(db=db)
 
@@ -1,5 +1,8 @@
+from unittest import mock
+
 import pytest
 
+from fides.api.common_exceptions import RowLimitExceededException
 from fides.api.graph.config import *
 from fides.api.graph.traversal import *
 from fides.api.models.policy import ActionType
@@ -108,3 +111,49 @@ def test_retry_decorator(privacy_request, policy, db):
     assert isinstance(test_obj.end_called_with[1], KeyError)
     assert test_obj.start_logged == 1
     assert test_obj.retry_logged == 5
+
+
+def test_retry_decorator_fails_on_row_limit(privacy_request, policy, db):
+    graph: DatasetGraph = integration_db_graph("postgres_example")
+    traversal = Traversal(graph, {"email": "X"})
+    customer_node = traversal.traversal_node_dict[
+        CollectionAddress("postgres_example", "customer")
+    ]
+
+    CONFIG.execution.task_retry_count = 5
+    CONFIG.execution.task_retry_delay = 0.1
+    CONFIG.execution.task_retry_backoff = 0.01
+
+    class TestRetryDecorator:
+        def __init__(self):
+            self.traversal_node = customer_node
+            self.call_count = 0
+            self.retry_logged = 0
+            self.end_called_with = ()
+            self.resources = TaskResources(privacy_request, policy, [], db)
+            self.connector = mock.Mock()
+
+        def log_end(self, action_type: ActionType, exc: Optional[str] = None):
+            self.end_called_with = (action_type, exc)
+
+        def log_start(self, _: ActionType):
+            pass
+
+        def log_retry(self, _: ActionType):
+            self.retry_logged += 1
+
+        def skip_if_disabled(self) -> bool:
+            return False
+
+        @retry(action_type=ActionType.access, default_return=[])
+        def test_function(self):
+            self.call_count += 1
+            raise RowLimitExceededException("Too many rows")
+
+    test_obj = TestRetryDecorator()
+    with pytest.raises(RowLimitExceededException):
+        test_obj.test_function()
+    # retrying would match just as many rows
+    assert test_obj.call_count == 1
+    assert test_obj.retry_logged == 0
+    assert isinstance(test_obj.end_called_with[1], RowLimitExceededException)
@@ -692,3 +692,63 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def test_wide_tree_traversal() -> None:
+    """A wide tree is fully traversed and every leaf is a terminal node"""
+    t = generate_binary_tree_resources(200, 3)
+    graph = DatasetGraph(*t)
+    traversal = Traversal(graph, {"email": "X"})
+    traversal_map, terminators = traversal.traversal_map()
+
+    assert len(traversal_map) == len(graph.nodes) + 1
+    assert set(terminators) == {
+        address
+        for address, node in traversal.traversal_node_dict.items()
+        if not node.children
+    }
+    assert all(
+        len(node.parents) == 1 for node in traversal.traversal_node_dict.values()
+    )
+
+
+def test_frozen_graph_reuses_verified_traversal() -> None:
+    """Traversals of a frozen graph from the same seed keys share the first verified traversal"""
+    t = generate_fully_connected_resources(5)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_2", "ds_2", "f1").identity = "user_id"
+    graph = DatasetGraph(*t)
+    expected = Traversal(graph, {"email": "1"}).traversal_map()
+
+    graph.freeze()
+    assert graph.frozen
+    first = Traversal(graph, {"email": "1"})
+    assert set(graph.traversal_skeletons) == {frozenset({"email"})}
+
+    second = Traversal(graph, {"email": "2"})
+    assert first.traversal_map() == second.traversal_map() == expected
+    assert second.edges == first.edges
+    assert second.edges is not graph.traversal_skeletons[frozenset({"email"})].edges
+
+    Traversal(graph, {"email": "1", "user_id": "1"})
+    assert set(graph.traversal_skeletons) == {
+        frozenset({"email"}),
+        frozenset({"email", "user_id"}),
+    }
+
+
+def test_frozen_graph_is_read_only() -> None:
+    t = generate_graph_resources(2)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    graph = DatasetGraph(*t)
+    assert not graph.frozen
+
+    graph.freeze()
+    with pytest.raises(TypeError):
+        graph.nodes[CollectionAddress("dr_3", "ds_3")] = graph.nodes[  # type: ignore
+            CollectionAddress("dr_1", "ds_1")
+        ]
+    with pytest.raises(AttributeError):
+        graph.edges.add(  # type: ignore
+            Edge(FieldAddress("dr_1", "ds_1", "f1"), FieldAddress("dr_2", "ds_2", "f1"))
+        )
@@ -105,6 +105,23 @@ class TestTraversalNode:
             is True
         )
 
+    def test_can_run_given_remaining_dataset_keys(self) -> None:
+        tn = TraversalNode(generate_node("a", "b", "c"))
+        tn.node.dataset.after.update(["f1"])
+
+        assert (
+            tn.can_run_given(
+                {CollectionAddress("_", "_")}, remaining_dataset_keys={"f1"}
+            )
+            is False
+        )
+        assert (
+            tn.can_run_given(
+                {CollectionAddress("f1", "_")}, remaining_dataset_keys={"_"}
+            )
+            is True
+        )
+
     def test_is_root_node(self):
         tn = TraversalNode(generate_node("__ROOT__", "__ROOT__"))
         assert tn.is_root_node()
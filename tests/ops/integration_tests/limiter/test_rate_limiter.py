@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, Generator, List
 import pytest
 from requests import Session
 
+from fides.api.common_exceptions import RedisConnectionError
 from fides.api.db import session
 from fides.api.graph.graph import DatasetGraph
 from fides.api.models.connectionconfig import (
@@ -20,11 +21,14 @@ from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.models.sql_models import Dataset as CtlDataset
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.connectors.limiter.rate_limiter import (
+    MAX_LOCAL_KEYS,
     RateLimiter,
     RateLimiterPeriod,
     RateLimiterRequest,
     RateLimiterTimeoutException,
+    log_rate_limiter_stats,
 )
+from fides.api.service.connectors.saas_connector import in_current_context
 from fides.api.task import graph_task
 from fides.api.util.saas_util import (
     load_config_with_replacement,
@@ -116,6 +120,18 @@ def simulate_calls_with_limiter(
     return call_log
 
 
+def assert_within_rate_limit(call_log: Dict, rate_limit: int) -> None:
+    """
+    Verifies the calls of each second stayed within the limit. The first second can
+    also use the burst, which defaults to the rate limit.
+    """
+    for second, value in sorted(call_log.items())[1:]:
+        # even though we set the rate limit there is a small chance our
+        # seconds dont line up with the second used by the rate limiter
+        assert value < rate_limit + 3, second
+    assert sorted(call_log.items())[0][1] < 2 * rate_limit + 3
+
+
 @pytest.mark.integration
 def test_limiter_respects_rate_limit() -> None:
     """Make a number of calls which requires limiter slow down and verify limit is not breached"""
@@ -133,10 +149,7 @@ def test_limiter_respects_rate_limit() -> None:
     )
 
     assert sum(call_log.values()) == num_calls
-    for value in call_log.values():
-        # even though we set the rate limit at 100 there is a small chance our
-        # seconds dont line up with the second used by the rate limiter
-        assert value < rate_limit + 3
+    assert_within_rate_limit(call_log, rate_limit)
 
 
 @pytest.mark.integration
@@ -167,8 +180,7 @@ def test_limiter_respects_rate_limit_multiple_threads() -> None:
         total_counts += Counter(call_future.result())
 
     assert sum(total_counts.values()) == num_calls_per_thread * concurrent_executions
-    for value in total_counts.values():
-        assert value < rate_limit + 3
+    assert_within_rate_limit(total_counts, rate_limit)
 
 
 @pytest.mark.integration
@@ -195,8 +207,7 @@ def test_limiter_with_multiple_limits() -> None:
     )
 
     assert sum(call_log.values()) == num_calls
-    for value in call_log.values():
-        assert value < rate_limit_2 + 3
+    assert_within_rate_limit(call_log, rate_limit_2)
 
 
 @pytest.mark.integration
@@ -218,6 +229,194 @@ def test_limiter_times_out_when_bucket_full() -> None:
             time.sleep(0.002)
 
 
+@pytest.mark.integration
+def test_limiter_times_out_without_waiting() -> None:
+    """A wait longer than the timeout raises immediately instead of sleeping until the timeout"""
+    limiter: RateLimiter = RateLimiter()
+    requests = [
+        RateLimiterRequest(
+            key="my_test_key_3",
+            rate_limit=1,
+            period=RateLimiterPeriod.DAY,
+        ),
+    ]
+    limiter.limit(requests=requests, timeout_seconds=10)
+    start = time.time()
+    with pytest.raises(RateLimiterTimeoutException):
+        limiter.limit(requests=requests, timeout_seconds=10)
+    assert time.time() - start < 1
+
+
+@pytest.mark.integration
+def test_limiter_reservation_cost() -> None:
+    """A reservation of several calls waits for each of them"""
+    limiter: RateLimiter = RateLimiter()
+    requests = [
+        RateLimiterRequest(
+            key="my_test_key_4",
+            rate_limit=10,
+            period=RateLimiterPeriod.SECOND,
+        ),
+    ]
+    assert limiter.reserve(requests, cost=10) == 0
+    assert limiter.reserve(requests, cost=5) == pytest.approx(0.5, abs=0.05)
+
+
+@pytest.mark.integration
+def test_limiter_allows_rate_limit_of_long_period() -> None:
+    """The calls of a limit longer than the timeout aren't spaced across the period"""
+    limiter: RateLimiter = RateLimiter()
+    requests = [
+        RateLimiterRequest(
+            key="my_test_key_5",
+            rate_limit=500,
+            period=RateLimiterPeriod.DAY,
+        ),
+    ]
+    for _ in range(5):
+        limiter.limit(requests=requests, timeout_seconds=1)
+
+
+class TestLocalRateLimiter:
+    """Limiting within the process when redis can't be reached"""
+
+    @pytest.fixture(autouse=True)
+    def redis_unavailable(self):
+        with mock.patch(
+            "fides.api.service.connectors.limiter.rate_limiter.get_cache",
+            side_effect=RedisConnectionError("unavailable"),
+        ):
+            yield
+        RateLimiter._local_tats.clear()
+
+    def test_reserve_local_waits_for_next_call(self) -> None:
+        limiter: RateLimiter = RateLimiter()
+        requests = [
+            RateLimiterRequest(
+                key="local_key", rate_limit=10, period=RateLimiterPeriod.SECOND
+            )
+        ]
+        for _ in range(10):
+            assert limiter.reserve(requests) == 0
+        assert limiter.reserve(requests) == pytest.approx(0.1, abs=0.01)
+
+    def test_limit_local_allows_rate_limit_of_long_period(self) -> None:
+        """500 calls a day aren't spaced 172.8 seconds apart"""
+        limiter: RateLimiter = RateLimiter()
+        requests = [
+            RateLimiterRequest(
+                key="local_key", rate_limit=500, period=RateLimiterPeriod.DAY
+            )
+        ]
+        for _ in range(500):
+            limiter.limit(requests=requests, timeout_seconds=1)
+        with pytest.raises(RateLimiterTimeoutException):
+            limiter.limit(requests=requests, timeout_seconds=1)
+
+    def test_reserve_local_drops_available_keys(self) -> None:
+        limiter: RateLimiter = RateLimiter()
+        limiter.reserve(
+            [
+                RateLimiterRequest(
+                    key="local_key", rate_limit=1, period=RateLimiterPeriod.DAY
+                )
+            ]
+        )
+        for index in range(MAX_LOCAL_KEYS + 1):
+            limiter.reserve(
+                [
+                    RateLimiterRequest(
+                        key=f"local_key_{index}",
+                        rate_limit=1000,
+                        period=RateLimiterPeriod.SECOND,
+                        burst=1,
+                    )
+                ]
+            )
+        assert len(RateLimiter._local_tats) <= MAX_LOCAL_KEYS
+        # the limit that isn't available yet is kept
+        assert (
+            limiter.reserve(
+                [
+                    RateLimiterRequest(
+                        key="local_key", rate_limit=1, period=RateLimiterPeriod.DAY
+                    )
+                ]
+            )
+            > 0
+        )
+
+    def test_reserve_local_burst(self) -> None:
+        limiter: RateLimiter = RateLimiter()
+        requests = [
+            RateLimiterRequest(
+                key="local_key",
+                rate_limit=10,
+                period=RateLimiterPeriod.SECOND,
+                burst=3,
+            )
+        ]
+        for _ in range(3):
+            assert limiter.reserve(requests) == 0
+        assert limiter.reserve(requests) == pytest.approx(0.1, abs=0.01)
+
+    def test_reserve_local_waits_for_every_limit(self) -> None:
+        limiter: RateLimiter = RateLimiter()
+        fast = RateLimiterRequest(
+            key="local_key_1", rate_limit=100, period=RateLimiterPeriod.SECOND, burst=1
+        )
+        slow = RateLimiterRequest(
+            key="local_key_2", rate_limit=2, period=RateLimiterPeriod.SECOND, burst=1
+        )
+        assert limiter.reserve([fast, slow]) == 0
+        assert limiter.reserve([fast, slow]) == pytest.approx(0.5, abs=0.01)
+        # nothing was reserved against the fast limit while the slow one was breached
+        assert limiter.reserve([fast]) == pytest.approx(0.01, abs=0.01)
+
+    def test_limit_respects_rate_limit(self) -> None:
+        rate_limit = 50
+        with mock.patch(
+            "fides.api.service.connectors.limiter.rate_limiter.logger"
+        ) as mock_logger:
+            with log_rate_limiter_stats("local_node") as rate_limiter_stats:
+                call_log = simulate_calls_with_limiter(
+                    num_calls=150,
+                    rate_limit_requests=[
+                        RateLimiterRequest(
+                            key="local_key",
+                            rate_limit=rate_limit,
+                            period=RateLimiterPeriod.SECOND,
+                        )
+                    ],
+                )
+        assert sum(call_log.values()) == 150
+        assert_within_rate_limit(call_log, rate_limit)
+
+        stats = rate_limiter_stats.get()["local_key"]
+        assert stats["calls"] == 150
+        assert stats["delayed_calls"] > 0
+        assert stats["wait_seconds"] > 1
+        mock_logger.info.assert_called_once()
+        assert mock_logger.info.call_args.args[1:4] == ("local_node", "local_key", 150)
+
+    def test_stats_recorded_from_threads_in_current_context(self) -> None:
+        requests = [
+            RateLimiterRequest(
+                key="local_key", rate_limit=100, period=RateLimiterPeriod.SECOND
+            )
+        ]
+        with log_rate_limiter_stats("local_node") as rate_limiter_stats:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for _ in range(8):
+                    executor.submit(
+                        in_current_context(RateLimiter().limit), requests
+                    ).result()
+                # threads not running in the node's context aren't counted
+                executor.submit(RateLimiter().limit, requests).result()
+
+        assert rate_limiter_stats.get()["local_key"]["calls"] == 8
+
+
 @pytest.mark.integration_saas
 @pytest.mark.integration_zendesk
 @pytest.mark.asyncio
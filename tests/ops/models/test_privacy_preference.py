@@ -30,6 +30,7 @@ from fides.api.models.privacy_request import (
     ProvidedIdentityType,
 )
 from fides.api.models.sql_models import PrivacyDeclaration
+from fides.config import CONFIG
 
 
 class TestPrivacyPreferenceHistory:
@@ -1788,6 +1789,32 @@ class TestAnonymizeIpAddress:
         )
 
 
+class TestExtractIdentityFromProvidedIdentity:
+    @pytest.fixture
+    def email_identity(self):
+        return ProvidedIdentity(
+            field_name=ProvidedIdentityType.email,
+            encrypted_value={"value": "customer@example.com"},
+            hashed_value="legacy-hash",
+        )
+
+    def test_extract_identity(self, email_identity):
+        assert extract_identity_from_provided_identity(
+            email_identity, ProvidedIdentityType.email
+        ) == ("customer@example.com", "legacy-hash")
+        assert extract_identity_from_provided_identity(
+            email_identity, ProvidedIdentityType.phone_number
+        ) == (None, None)
+
+    def test_extract_identity_without_legacy_hash_writes(
+        self, email_identity, monkeypatch
+    ):
+        monkeypatch.setattr(CONFIG.security, "identity_legacy_hash_writes", False)
+        assert extract_identity_from_provided_identity(
+            email_identity, ProvidedIdentityType.email
+        ) == ("customer@example.com", None)
+
+
 class TestServedNoticeHistory:
     def test_create_served_notice_history_for_multiple_consent_attributes(
         self, db, fides_user_provided_identity, privacy_experience_france_tcf_overlay
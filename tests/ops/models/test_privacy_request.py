@@ -246,10 +246,12 @@ def test_delete_privacy_request_removes_cached_data(
         identity_attribute=identity_attribute,
     )
     assert cache.get(key) == identity_value
+    assert cache.is_complete_index(privacy_request.cache_index)
     privacy_request.delete(db)
     from_db = PrivacyRequest.get(db=db, object_id=privacy_request.id)
     assert from_db is None
     assert cache.get(key) is None
+    assert not cache.exists(privacy_request.cache_index)
 
 
 class TestPrivacyRequestTriggerWebhooks:
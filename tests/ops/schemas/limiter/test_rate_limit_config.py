@@ -13,6 +13,10 @@ class TestRateLimitCongi:
         with pytest.raises(ValidationError):
             RateLimit(rate=0, period=RateLimitPeriod.second)
 
+    def test_burst_less_than_zero_validation(self):
+        with pytest.raises(ValidationError):
+            RateLimit(rate=10, period=RateLimitPeriod.second, burst=0)
+
     def test_limits_set_if_disabled_validation(self):
         with pytest.raises(ValidationError):
             RateLimitConfig(
@@ -179,6 +179,41 @@ class TestFidesClientUnit:
         request.read()
         assert request.content == b'[{"field1": "value1"}]'
 
+    def test_request_statuses(self, test_fides_client: FidesClient):
+        """
+        Statuses are fetched in batches, ignoring requests that weren't asked for,
+        and requests a remote Fides doesn't filter by id are looked up one at a time
+        """
+        test_fides_client.token = SAMPLE_TOKEN
+        batch_response = MockResponse(
+            True,
+            {
+                "items": [
+                    {"id": "pri_1", "status": "complete"},
+                    {"id": "pri_other", "status": "error"},
+                ]
+            },
+        )
+        with mock.patch.object(
+            test_fides_client.session, "send", return_value=batch_response
+        ) as mock_send, mock.patch.object(
+            test_fides_client,
+            "request_status",
+            return_value=[{"id": "pri_2", "status": "in_processing"}],
+        ) as mock_request_status:
+            statuses = test_fides_client.request_statuses(["pri_1", "pri_2"])
+
+        assert statuses == {
+            "pri_1": PrivacyRequestStatus.complete,
+            "pri_2": PrivacyRequestStatus.in_processing,
+        }
+        mock_send.assert_called_once()
+        assert mock_send.call_args.args[0].url.params.get_list("request_ids") == [
+            "pri_1",
+            "pri_2",
+        ]
+        mock_request_status.assert_called_once_with("pri_2")
+
     @pytest.mark.asyncio
     def test_poll_for_completion(
         self,
@@ -347,6 +382,22 @@ class TestFidesClientIntegration:
         # let's not assume anything about the status here.
         assert statuses[0]["status"] is not None
 
+    def test_request_statuses(
+        self, authenticated_fides_client: FidesClient, policy, monkeypatch, api_client
+    ):
+        monkeypatch.setattr(Client, "send", api_client.send)
+
+        pr_ids = [
+            authenticated_fides_client.create_privacy_request(
+                external_id=f"test_external_id_{i}",
+                identity={"email": "test@example.com"},
+                policy_key=policy.key,
+            )
+            for i in range(2)
+        ]
+        statuses = authenticated_fides_client.request_statuses(pr_ids)
+        assert set(statuses) == set(pr_ids)
+
     def test_retrieve_request_results_nonexistent_request(
         self, authenticated_fides_client: FidesClient, policy
     ):
@@ -1,10 +1,12 @@
 import time
 import unittest.mock as mock
 from email.utils import formatdate
+from http.client import HTTPMessage
 from typing import Any, Dict
 
 import pytest
-from requests import ConnectionError, Response, Session
+from requests import ConnectionError, Request, Response, Session
+from requests.cookies import extract_cookies_to_jar
 
 from fides.api.common_exceptions import ClientUnsuccessfulException, ConnectionException
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
@@ -12,6 +14,7 @@ from fides.api.schemas.saas.saas_config import ClientConfig
 from fides.api.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
 from fides.api.service.connectors.saas.authenticated_client import (
     AuthenticatedClient,
+    create_pooled_session,
     get_retry_after,
 )
 from fides.api.util.saas_util import load_config_with_replacement
@@ -170,3 +173,60 @@ class TestRetryAfterHeaderParsing:
         test_response.headers = {"Retry-After": formatdate(timeval=time_in_past)}
         retry_after_sleep = get_retry_after(test_response)
         assert retry_after_sleep == 0
+
+
+@pytest.mark.unit_saas
+class TestPooledSession:
+    def test_create_pooled_session(self):
+        session = create_pooled_session(pool_size=4)
+        for prefix in ["https://", "http://"]:
+            adapter = session.get_adapter(f"{prefix}ethyca.com")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 4
+
+    def test_pooled_session_keeps_no_cookies(self):
+        session = create_pooled_session(pool_size=4)
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "session_id=abc; Path=/"
+        # how Session.send stores the cookies of a response
+        extract_cookies_to_jar(
+            session.cookies,
+            Request("GET", "https://ethyca.com/login").prepare(),
+            mock.Mock(_original_response=mock.Mock(msg=headers)),
+        )
+        assert len(session.cookies) == 0
+
+    def test_client_uses_provided_session(
+        self, test_connection_config, test_client_config
+    ):
+        session = create_pooled_session(pool_size=4)
+        client = AuthenticatedClient(
+            "https://ethyca.com",
+            test_connection_config,
+            test_client_config,
+            session=session,
+        )
+        assert client.session is session
+
+    def test_authentication_strategy_reused(
+        self, test_connection_config, test_saas_request
+    ):
+        client = AuthenticatedClient(
+            "https://ethyca.com",
+            test_connection_config,
+            ClientConfig(
+                protocol="https",
+                host="test_host",
+                authentication={
+                    "strategy": "bearer",
+                    "configuration": {"token": "<access_token>"},
+                },
+            ),
+        )
+        first = client.get_authenticated_request(test_saas_request)
+        strategy = client.auth_strategy
+        second = client.get_authenticated_request(test_saas_request)
+
+        assert strategy is not None
+        assert client.auth_strategy is strategy
+        assert first.headers["Authorization"] == second.headers["Authorization"]
@@ -1,14 +1,21 @@
+import json
 import os
+import stat
 from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock
 from zipfile import ZipFile
 
 import pytest
+from pydantic import ValidationError
 
 from fides.api.common_exceptions import NoSuchSaaSRequestOverrideException
 from fides.api.models.custom_connector_template import CustomConnectorTemplate
-from fides.api.schemas.saas.connector_template import ConnectorTemplate
+from fides.api.schemas.policy import ActionType
+from fides.api.schemas.saas.connector_template import (
+    ConnectorTemplate,
+    ConnectorTemplateSummary,
+)
 from fides.api.service.authentication.authentication_strategy import (
     AuthenticationStrategy,
 )
@@ -17,6 +24,9 @@ from fides.api.service.connectors.saas.connector_registry_service import (
     CustomConnectorTemplateLoader,
     FileConnectorTemplateLoader,
 )
+from fides.api.service.connectors.saas.connector_template_cache import (
+    TEMPLATE_CACHE_FILE_NAME,
+)
 from fides.api.service.saas_request.saas_request_override_factory import (
     SaaSRequestOverrideFactory,
     SaaSRequestType,
@@ -57,6 +67,118 @@ class TestFileConnectorTemplateLoader:
 
         assert connector_templates.get("not_found") is None
 
+    def test_file_connector_template_summaries(self):
+        summaries = FileConnectorTemplateLoader.get_connector_template_summaries()
+
+        assert summaries["mailchimp"] == ConnectorTemplateSummary(
+            type="mailchimp",
+            human_readable="Mailchimp",
+            version=load_config_from_string(
+                load_yaml_as_string("data/saas/config/mailchimp_config.yml")
+            )["version"],
+            authorization_required=False,
+            user_guide="https://docs.ethyca.com/user-guides/integrations/saas-integrations/mailchimp",
+            supported_actions=[ActionType.access, ActionType.erasure],
+            identities=["email"],
+            connector_params=["domain", "username", "api_key"],
+        )
+        assert (
+            ActionType.consent in summaries["mailchimp_transactional"].supported_actions
+        )
+        assert set(summaries) == set(
+            FileConnectorTemplateLoader.get_connector_templates()
+        )
+
+
+class TestFileConnectorTemplateCache:
+    @pytest.fixture(autouse=True)
+    def cache_directory(self, tmp_path):
+        """
+        Caches the compiled templates in a temporary directory, and resets the loader
+        singleton instances before and after each test
+        """
+        FileConnectorTemplateLoader._instance = None
+        with mock.patch.object(
+            CONFIG.execution, "saas_template_cache_directory", str(tmp_path)
+        ):
+            yield tmp_path
+        FileConnectorTemplateLoader._instance = None
+
+    def test_unchanged_templates_not_validated_again(self, cache_directory):
+        FileConnectorTemplateLoader()
+        assert (cache_directory / TEMPLATE_CACHE_FILE_NAME).exists()
+        summaries = FileConnectorTemplateLoader.get_connector_template_summaries()
+
+        FileConnectorTemplateLoader._instance = None
+        with mock.patch(
+            "fides.api.service.connectors.saas.connector_registry_service.SaaSConfig",
+            side_effect=AssertionError,
+        ), mock.patch(
+            "fides.api.schemas.saas.connector_template.SaaSConfig",
+            side_effect=AssertionError,
+        ):
+            assert FileConnectorTemplateLoader.get_connector_template_summaries() == (
+                summaries
+            )
+            # the template that's served is validated even though its summary was cached
+            with pytest.raises(ValidationError):
+                FileConnectorTemplateLoader.get_connector_templates()["mailchimp"]
+
+        # templates are loaded once they're used
+        mailchimp_connector = FileConnectorTemplateLoader.get_connector_templates()[
+            "mailchimp"
+        ]
+        assert mailchimp_connector.config == load_yaml_as_string(
+            "data/saas/config/mailchimp_config.yml"
+        )
+        assert mailchimp_connector.icon == encode_file_contents(
+            "data/saas/icon/mailchimp.svg"
+        )
+
+    def test_changed_templates_compiled_again(self, cache_directory):
+        FileConnectorTemplateLoader()
+        cache_file = cache_directory / TEMPLATE_CACHE_FILE_NAME
+        cache = json.loads(cache_file.read_text())
+        cache["templates"]["mailchimp_config.yml"]["digest"] = "changed"
+        cache["templates"]["mailchimp_config.yml"]["summary"]["version"] = "0.0.0"
+        cache_file.write_text(json.dumps(cache))
+
+        FileConnectorTemplateLoader._instance = None
+        summary = FileConnectorTemplateLoader.get_connector_template_summaries()[
+            "mailchimp"
+        ]
+
+        assert summary.version != "0.0.0"
+        assert (
+            json.loads(cache_file.read_text())["templates"]["mailchimp_config.yml"][
+                "digest"
+            ]
+            != "changed"
+        )
+
+    def test_cache_of_other_version_ignored(self, cache_directory):
+        cache_file = cache_directory / TEMPLATE_CACHE_FILE_NAME
+        cache_file.write_text(
+            json.dumps({"fides_version": "0.0.0", "templates": {"unknown": {}}})
+        )
+
+        assert FileConnectorTemplateLoader.get_connector_templates().get("mailchimp")
+        assert json.loads(cache_file.read_text())["fides_version"] != "0.0.0"
+
+    def test_cache_directory_is_private(self, cache_directory):
+        cache_directory.chmod(0o777)
+        FileConnectorTemplateLoader()
+        assert stat.S_IMODE(cache_directory.stat().st_mode) == 0o700
+
+    def test_cache_directory_of_another_user_not_used(self, cache_directory):
+        with mock.patch.object(
+            os, "getuid", return_value=cache_directory.stat().st_uid + 1
+        ):
+            assert FileConnectorTemplateLoader.get_connector_templates().get(
+                "mailchimp"
+            )
+        assert not (cache_directory / TEMPLATE_CACHE_FILE_NAME).exists()
+
 
 class TestCustomConnectorTemplateLoader:
     @pytest.fixture(autouse=True)
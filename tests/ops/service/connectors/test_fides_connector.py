@@ -1,15 +1,26 @@
 import uuid
 from typing import Tuple
+from unittest import mock
 
 import pytest
 from httpx import Client
 
+from fides.api.common_exceptions import PrivacyRequestPaused
 from fides.api.graph.traversal import TraversalNode
-from fides.api.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
+from fides.api.models.connectionconfig import (
+    ConnectionConfig,
+    ConnectionTestStatus,
+    ConnectionType,
+)
 from fides.api.models.datasetconfig import DatasetConfig
-from fides.api.models.policy import Policy
+from fides.api.models.policy import CurrentStep, Policy
 from fides.api.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
 from fides.api.schemas.policy import ActionType
+from fides.api.service.connectors.fides.child_requests import (
+    ChildRequestCheckpoint,
+    finish_child_request,
+    get_outstanding_child_requests,
+)
 from fides.api.service.connectors.fides.fides_client import FidesClient
 from fides.api.service.connectors.fides_connector import (
     DEFAULT_POLLING_INTERVAL,
@@ -18,6 +29,11 @@ from fides.api.service.connectors.fides_connector import (
     filter_fides_connector_datasets,
 )
 from fides.api.service.privacy_request import request_service
+from fides.api.service.privacy_request.fides_child_request_service import (
+    poll_child_servers,
+)
+from fides.api.util.cache import get_cache
+from fides.api.util.errors import FidesError
 from tests.ops.graph.graph_test_util import assert_rows_match, generate_node
 
 
@@ -76,6 +92,168 @@ class TestFidesConnectorUnit:
         assert not datasets
 
 
+@pytest.fixture(scope="function")
+def child_request_connector(fides_connector_example_secrets) -> FidesConnector:
+    """A Fides connector whose client is mocked, creating child request pri_child"""
+    connector = FidesConnector(
+        ConnectionConfig(
+            key=f"fides_child_connection_{uuid.uuid4()}",
+            connection_type=ConnectionType.fides,
+            secrets=fides_connector_example_secrets,
+        )
+    )
+    client = mock.Mock(spec=FidesClient)
+    client.create_privacy_request.return_value = "pri_child"
+    client.retrieve_request_results.return_value = {
+        "dataset:collection": [{"email": "customer-1@example.com"}]
+    }
+    connector.db_client = client
+    return connector
+
+
+@pytest.fixture(scope="function")
+def child_request_parent() -> PrivacyRequest:
+    privacy_request = PrivacyRequest(id=f"test_fides_child_request_{uuid.uuid4()}")
+    privacy_request.cache_identity(identity={"email": "customer-1@example.com"})
+    return privacy_request
+
+
+@pytest.fixture(scope="function")
+def access_policy() -> mock.Mock:
+    policy = mock.Mock(key="access_policy")
+    policy.get_rules_for_action.return_value = [mock.Mock(key="access_rule")]
+    return policy
+
+
+def finish_child_requests(connector: FidesConnector, status: PrivacyRequestStatus):
+    """Finishes the connector's child requests as the poller would"""
+    cache = get_cache()
+    pipe = cache.pipeline()
+    for child_id, outstanding in get_outstanding_child_requests(cache).items():
+        if outstanding.connection_key == connector.configuration.key:
+            finish_child_request(pipe, child_id, outstanding, status.value)
+    pipe.execute()
+
+
+@pytest.mark.unit
+class TestFidesConnectorChildRequests:
+    """
+    Tests of the FidesConnector pausing privacy requests until their child
+    requests finish, rather than blocking until they do
+    """
+
+    @pytest.fixture(scope="function")
+    def node(self) -> TraversalNode:
+        return TraversalNode(
+            generate_node("fides_dataset", "fides_collection", "test_field")
+        )
+
+    def test_retrieve_data_pauses_until_child_request_completes(
+        self, child_request_connector, child_request_parent, access_policy, node
+    ):
+        client = child_request_connector.db_client
+        for _ in range(2):
+            with pytest.raises(PrivacyRequestPaused):
+                child_request_connector.retrieve_data(
+                    node, access_policy, child_request_parent, {}
+                )
+        # the child request is only created once
+        client.create_privacy_request.assert_called_once_with(
+            external_id=child_request_parent.id,
+            identity=mock.ANY,
+            policy_key="access_policy",
+        )
+        assert get_outstanding_child_requests(get_cache())["pri_child"].parent_id == (
+            child_request_parent.id
+        )
+        assert (
+            child_request_parent.get_paused_collection_details().step
+            == CurrentStep.access
+        )
+
+        finish_child_requests(child_request_connector, PrivacyRequestStatus.complete)
+        result = child_request_connector.retrieve_data(
+            node, access_policy, child_request_parent, {}
+        )
+        assert result == [
+            {
+                "access_rule": {
+                    "dataset:collection": [{"email": "customer-1@example.com"}]
+                }
+            }
+        ]
+        client.retrieve_request_results.assert_called_once_with(
+            privacy_request_id="pri_child", rule_key="access_rule"
+        )
+        assert not ChildRequestCheckpoint(
+            child_request_parent.id,
+            child_request_connector.configuration.key,
+            CurrentStep.access,
+        ).load()
+
+    def test_retrieve_data_child_request_errored(
+        self, child_request_connector, child_request_parent, access_policy, node
+    ):
+        with pytest.raises(PrivacyRequestPaused):
+            child_request_connector.retrieve_data(
+                node, access_policy, child_request_parent, {}
+            )
+        finish_child_requests(child_request_connector, PrivacyRequestStatus.error)
+        with pytest.raises(FidesError) as exc:
+            child_request_connector.retrieve_data(
+                node, access_policy, child_request_parent, {}
+            )
+        assert "finished with status error" in str(exc.value)
+
+    def test_retrieve_data_child_request_timed_out(
+        self, child_request_connector, child_request_parent, access_policy, node
+    ):
+        with pytest.raises(PrivacyRequestPaused):
+            child_request_connector.retrieve_data(
+                node, access_policy, child_request_parent, {}
+            )
+        child_request_connector.polling_timeout = -1
+        with pytest.raises(FidesError) as exc:
+            child_request_connector.retrieve_data(
+                node, access_policy, child_request_parent, {}
+            )
+        assert "did not complete" in str(exc.value)
+        assert "pri_child" not in get_outstanding_child_requests(get_cache())
+
+    def test_mask_data_one_child_request_per_identity(
+        self, child_request_connector, child_request_parent, access_policy, node
+    ):
+        rows = [{"row": i} for i in range(3)]
+        with pytest.raises(PrivacyRequestPaused):
+            child_request_connector.mask_data(
+                node, access_policy, child_request_parent, rows, {}
+            )
+        assert (
+            child_request_parent.get_paused_collection_details().step
+            == CurrentStep.erasure
+        )
+
+        finish_child_requests(child_request_connector, PrivacyRequestStatus.complete)
+        assert (
+            child_request_connector.mask_data(
+                node, access_policy, child_request_parent, rows, {}
+            )
+            == 3
+        )
+        child_request_connector.db_client.create_privacy_request.assert_called_once()
+
+    def test_mask_data_no_rows(
+        self, child_request_connector, child_request_parent, access_policy, node
+    ):
+        assert (
+            child_request_connector.mask_data(
+                node, access_policy, child_request_parent, [], {}
+            )
+            == 0
+        )
+        child_request_connector.db_client.create_privacy_request.assert_not_called()
+
+
 @pytest.mark.integration
 class TestFidesConnectorIntegration:
     """
@@ -99,6 +277,7 @@ class TestFidesConnectorIntegration:
     )
     def test_retrieve_data(
         self,
+        db,
         test_fides_connector: FidesConnector,
         policy_local_storage: Policy,
         monkeypatch,
@@ -133,6 +312,16 @@ class TestFidesConnectorIntegration:
             request_service, "get_async_client", lambda: async_api_client
         )
 
+        # the privacy request is paused until the child request completes
+        with pytest.raises(PrivacyRequestPaused):
+            test_fides_connector.retrieve_data(
+                node=node,
+                policy=policy_local_storage,
+                privacy_request=privacy_request,
+                input_data=[],
+            )
+        poll_child_servers(db, get_cache())
+
         result = test_fides_connector.retrieve_data(
             node=node,
             policy=policy_local_storage,
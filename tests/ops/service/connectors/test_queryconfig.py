@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Set
+from unittest import mock
 
 import pytest
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -20,10 +21,14 @@ from fides.api.schemas.masking.masking_configuration import HashMaskingConfigura
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
 from fides.api.service.connectors.query_config import (
     DynamoDBQueryConfig,
+    MicrosoftSQLServerQueryConfig,
     MongoQueryConfig,
     SQLQueryConfig,
 )
 from fides.api.service.masking.strategy.masking_strategy_hash import HashMaskingStrategy
+from fides.api.service.masking.strategy.masking_strategy_string_rewrite import (
+    StringRewriteMaskingStrategy,
+)
 from fides.api.util.data_category import DataCategory
 
 from ...task.traversal_data import combined_mongo_postgresql_graph, integration_db_graph
@@ -167,6 +172,36 @@ class TestSQLQueryConfig:
             == "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE customer_id = :customer_id"
         )
 
+    def test_generate_query_chunks(self):
+        config = SQLQueryConfig(payment_card_node)
+        input_data = {
+            "id": ["A", "B", "B", "C"],
+            "customer_id": ["V"],
+            "ignore_me": ["X"],
+        }
+
+        # Small inputs produce the same single query as generate_query
+        queries = config.generate_query_chunks(input_data, chunk_size=4)
+        assert len(queries) == 1
+        assert str(queries[0]) == str(config.generate_query(input_data))
+
+        queries = config.generate_query_chunks(input_data, chunk_size=2)
+        assert [str(query) for query in queries] == [
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN :id",
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id = :id OR customer_id = :customer_id",
+        ]
+        assert set(queries[0].compile().params["id"]) == {"A", "B"}
+        assert queries[1].compile().params == {"id": ("C",), "customer_id": ("V",)}
+
+        assert config.generate_query_chunks({"ignore_me": ["X"]}, chunk_size=2) == []
+
+    def test_generate_query_chunks_max_query_parameters(self):
+        config = MicrosoftSQLServerQueryConfig(payment_card_node)
+        input_data = {"id": [str(i) for i in range(2500)]}
+
+        queries = config.generate_query_chunks(input_data, chunk_size=5000)
+        assert [len(query.compile().params) for query in queries] == [2000, 500]
+
     def test_update_rule_target_fields(
         self, erasure_policy, example_datasets, connection_config
     ):
@@ -352,6 +387,88 @@ class TestSQLQueryConfig:
             text_clause._bindparams["email"].value == "*****"
         )  # String rewrite masking strategy
 
+    def test_generate_update_batches(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 6)
+        ]
+        # Not enough data to update this row
+        rows.append({"email": "customer-6@example.com", "name": "Customer 6"})
+
+        batches = config.generate_update_batches(
+            rows, erasure_policy, privacy_request, batch_size=2
+        )
+        assert [len(params) for _, params in batches] == [2, 2, 1]
+        for update_stmt, _ in batches:
+            assert update_stmt.text == "UPDATE customer SET name = :name WHERE id = :id"
+        assert [params for _, batch in batches for params in batch] == [
+            {"name": None, "id": i} for i in range(1, 6)
+        ]
+
+    def test_update_value_maps_masks_values_in_bulk(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 4)
+        ]
+        erasure_policy.rules[0].masking_strategy = {
+            "strategy": "string_rewrite",
+            "configuration": {"rewrite_value": "MASKED"},
+        }
+
+        with mock.patch.object(
+            StringRewriteMaskingStrategy,
+            "mask",
+            side_effect=lambda _, values, request_id: [f"masked {v}" for v in values],
+            autospec=True,
+        ) as mock_mask:
+            value_maps = config.update_value_maps(rows, erasure_policy, privacy_request)
+
+        # The values of every row were masked with one call to the strategy
+        assert mock_mask.call_count == 1
+        assert mock_mask.call_args.args[1] == [
+            "Customer 1",
+            "Customer 2",
+            "Customer 3",
+        ]
+        assert value_maps == [{"name": f"masked Customer {i}"} for i in range(1, 4)]
+        assert config.update_value_map(rows[0], erasure_policy, privacy_request) == {
+            "name": "MASKED"
+        }
+
 
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
@@ -1,5 +1,6 @@
 import json
 import random
+import time
 from typing import List
 from unittest import mock
 from unittest.mock import Mock
@@ -16,9 +17,10 @@ from fides.api.models.policy import Policy
 from fides.api.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
 from fides.api.schemas.redis_cache import Identity
 from fides.api.schemas.saas.saas_config import ParamValue, SaaSConfig, SaaSRequest
-from fides.api.schemas.saas.shared_schemas import HTTPMethod
+from fides.api.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
 from fides.api.service.connectors import get_connector
 from fides.api.service.connectors.saas_connector import SaaSConnector
+from fides.config import CONFIG
 from tests.ops.graph.graph_test_util import generate_node
 
 
@@ -398,6 +400,115 @@ class TestSaaSConnectorMethods:
         assert client.rate_limit_config.enabled is False
         assert connector.get_rate_limit_config().enabled is False
 
+    def test_clients_reused_across_requests(
+        self, db: Session, segment_connection_config, segment_dataset_config
+    ):
+        connector: SaaSConnector = get_connector(segment_connection_config)
+        connector.set_saas_request_state(
+            SaaSRequest(path="test_path", method=HTTPMethod.GET)
+        )
+        client = connector.create_client()
+        assert connector.create_client() is client
+
+        segment_user_endpoint = next(
+            end for end in connector.saas_config.endpoints if end.name == "segment_user"
+        )
+        connector.set_saas_request_state(segment_user_endpoint.requests.read)
+        user_client = connector.create_client()
+
+        # A different client config gets its own client, sharing the pooled session
+        assert user_client is not client
+        assert user_client.session is client.session is connector.http_session
+
+        connector.close()
+        assert connector.http_session is None
+        assert connector.create_client() is not user_client
+
+    def test_execute_prepared_requests_preserves_order(
+        self, db: Session, segment_connection_config, segment_dataset_config
+    ):
+        connector: SaaSConnector = get_connector(segment_connection_config)
+        saas_request = SaaSRequest(path="test_path", method=HTTPMethod.GET)
+        prepared_requests = [
+            SaaSRequestParams(method=HTTPMethod.GET, path=f"/users/{i}")
+            for i in range(10)
+        ]
+
+        def execute_paginated_request(
+            prepared_request, identity_data, request, prefetch
+        ):
+            # pages aren't prefetched by requests running concurrently
+            assert not prefetch
+            # finish the earlier requests last
+            time.sleep(0.001 * (10 - int(prepared_request.path.split("/")[-1])))
+            return [{"path": prepared_request.path}]
+
+        original_request_concurrency = CONFIG.execution.saas_request_concurrency
+        CONFIG.execution.saas_request_concurrency = 4
+        try:
+            with mock.patch.object(
+                connector,
+                "execute_paginated_request",
+                side_effect=execute_paginated_request,
+            ):
+                rows = connector.execute_prepared_requests(
+                    prepared_requests, {}, saas_request
+                )
+        finally:
+            CONFIG.execution.saas_request_concurrency = original_request_concurrency
+        assert rows == [{"path": f"/users/{i}"} for i in range(10)]
+
+    def test_execute_paginated_request_prefetches_offset_pages(
+        self, db: Session, segment_connection_config, segment_dataset_config
+    ):
+        connector: SaaSConnector = get_connector(segment_connection_config)
+        saas_request = SaaSRequest(
+            path="/users",
+            method=HTTPMethod.GET,
+            data_path="users",
+            query_params=[{"name": "page", "value": 1}],
+            pagination={
+                "strategy": "offset",
+                "configuration": {
+                    "incremental_param": "page",
+                    "increment_by": 1,
+                    "limit": 10,
+                },
+            },
+        )
+        connector.set_saas_request_state(saas_request)
+
+        sent_pages = []
+
+        def send_prepared_request(prepared_request, request):
+            page = prepared_request.query_params["page"]
+            sent_pages.append(page)
+            response = Response()
+            response.status_code = HTTP_200_OK
+            users = [{"page": page}] if page <= 3 else []
+            response._content = json.dumps({"users": users}).encode()
+            return response
+
+        original_prefetch_pages = CONFIG.execution.saas_prefetch_pages
+        CONFIG.execution.saas_prefetch_pages = 2
+        try:
+            with mock.patch.object(
+                connector, "send_prepared_request", side_effect=send_prepared_request
+            ):
+                rows = connector.execute_paginated_request(
+                    SaaSRequestParams(
+                        method=HTTPMethod.GET, path="/users", query_params={"page": 1}
+                    ),
+                    {},
+                    saas_request,
+                )
+        finally:
+            CONFIG.execution.saas_prefetch_pages = original_prefetch_pages
+
+        assert rows == [{"page": 1}, {"page": 2}, {"page": 3}]
+        # pages are requested three at a time until the empty page is found
+        assert sorted(sent_pages) == [1, 2, 3, 4, 5, 6]
+
 
 @pytest.mark.integration_saas
 @pytest.mark.integration_mailchimp_transactional
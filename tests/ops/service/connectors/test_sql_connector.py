@@ -0,0 +1,150 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from fides.api.common_exceptions import RowLimitExceededException
+from fides.api.graph.config import CollectionAddress, FieldPath
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.service.connectors.sql_connector import MySQLConnector, SQLConnector
+from fides.config import CONFIG
+
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE customer (id INTEGER, name TEXT)"))
+        for i in range(1, 6):
+            connection.execute(
+                text("INSERT INTO customer VALUES (:id, :name)"),
+                {"id": i, "name": f"Customer {i}"},
+            )
+    yield engine
+    engine.dispose()
+
+
+class TestExecuteUpdateBatch:
+    update_stmt = text("UPDATE customer SET name = :name WHERE id = :id")
+    # The last row does not exist, so it is not counted as updated
+    params = [{"name": None, "id": i} for i in [1, 2, 3, 10]]
+
+    def test_execute_update_batch(self, sqlite_engine):
+        with sqlite_engine.begin() as connection:
+            assert (
+                SQLConnector.execute_update_batch(
+                    connection, self.update_stmt, self.params
+                )
+                == 3
+            )
+        with sqlite_engine.connect() as connection:
+            assert connection.execute(
+                text("SELECT id FROM customer WHERE name IS NULL ORDER BY id")
+            ).fetchall() == [(1,), (2,), (3,)]
+
+    def test_execute_update_batch_without_multi_rowcount(self, sqlite_engine):
+        with sqlite_engine.begin() as connection:
+            with mock.patch.object(
+                connection.dialect, "supports_sane_multi_rowcount", False
+            ), mock.patch.object(
+                connection, "execute", wraps=connection.execute
+            ) as execute:
+                assert (
+                    SQLConnector.execute_update_batch(
+                        connection, self.update_stmt, self.params
+                    )
+                    == 3
+                )
+            assert execute.call_count == len(self.params)
+
+
+class TestRetrieveData:
+    @pytest.fixture
+    def connector(self, sqlite_engine):
+        connector = MySQLConnector(
+            ConnectionConfig(key="test_sql", connection_type=ConnectionType.mysql)
+        )
+        query_config = mock.Mock()
+        query_config.generate_query_chunks.return_value = [
+            text("SELECT id, name FROM customer ORDER BY id")
+        ]
+        query_config.primary_key_field_paths = {}
+        with mock.patch.object(
+            connector, "client", return_value=sqlite_engine
+        ), mock.patch.object(
+            connector, "query_config", return_value=query_config
+        ), mock.patch.object(
+            connector, "set_schema"
+        ):
+            yield connector
+
+    @pytest.fixture
+    def node(self):
+        node = mock.Mock()
+        node.address = CollectionAddress("test_dataset", "customer")
+        return node
+
+    def test_retrieve_data_streams_rows(self, connector, node):
+        original_batch_size = CONFIG.execution.sql_fetch_batch_size
+        CONFIG.execution.sql_fetch_batch_size = 2
+        try:
+            rows = connector.retrieve_data(node, None, None, {"email": ["a"]})
+        finally:
+            CONFIG.execution.sql_fetch_batch_size = original_batch_size
+
+        assert rows == [{"id": i, "name": f"Customer {i}"} for i in range(1, 6)]
+
+    @pytest.mark.parametrize("max_rows", [5, 6])
+    def test_retrieve_data_max_rows_per_collection(self, connector, node, max_rows):
+        original_max_rows = CONFIG.execution.max_rows_per_collection
+        CONFIG.execution.max_rows_per_collection = max_rows
+        try:
+            rows = connector.retrieve_data(node, None, None, {"email": ["a"]})
+        finally:
+            CONFIG.execution.max_rows_per_collection = original_max_rows
+
+        assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+
+    def test_retrieve_data_max_rows_per_collection_exceeded(self, connector, node):
+        """Rows past the limit aren't dropped, they would go unmasked by erasures"""
+        original_max_rows = CONFIG.execution.max_rows_per_collection
+        CONFIG.execution.max_rows_per_collection = 3
+        try:
+            with pytest.raises(RowLimitExceededException):
+                connector.retrieve_data(node, None, None, {"email": ["a"]})
+        finally:
+            CONFIG.execution.max_rows_per_collection = original_max_rows
+
+    @pytest.mark.parametrize("primary_key_field_paths", [{FieldPath("id"): None}, {}])
+    def test_retrieve_data_deduplicates_chunks(
+        self, connector, node, primary_key_field_paths
+    ):
+        query_config = connector.query_config(node)
+        query_config.generate_query_chunks.return_value = [
+            text("SELECT id, name FROM customer WHERE id IN (1, 2, 3) ORDER BY id"),
+            text("SELECT id, name FROM customer WHERE id IN (2, 3, 4) ORDER BY id"),
+        ]
+        query_config.primary_key_field_paths = primary_key_field_paths
+
+        rows = connector.retrieve_data(node, None, None, {"email": ["a"]})
+
+        assert rows == [{"id": i, "name": f"Customer {i}"} for i in range(1, 5)]
+
+    @pytest.mark.parametrize("primary_key_field_paths", [{FieldPath("id"): None}, {}])
+    def test_retrieve_data_deduplicates_single_chunk(
+        self, connector, node, primary_key_field_paths
+    ):
+        """Rows are deduplicated the same way whether or not the query was chunked"""
+        query_config = connector.query_config(node)
+        query_config.generate_query_chunks.return_value = [
+            text(
+                "SELECT id, name FROM customer WHERE id IN (1, 2, 3) "
+                "UNION ALL SELECT id, name FROM customer WHERE id IN (2, 3, 4) "
+                "ORDER BY id"
+            ),
+        ]
+        query_config.primary_key_field_paths = primary_key_field_paths
+
+        rows = connector.retrieve_data(node, None, None, {"email": ["a"]})
+
+        assert rows == [{"id": i, "name": f"Customer {i}"} for i in range(1, 5)]
@@ -2,6 +2,8 @@ from datetime import datetime
 from unittest import mock
 from unittest.mock import Mock
 
+import pytest
+
 from fides.api.schemas.masking.masking_configuration import (
     AesEncryptionMaskingConfiguration,
 )
@@ -9,6 +11,8 @@ from fides.api.schemas.masking.masking_secrets import MaskingSecretCache, Secret
 from fides.api.service.masking.strategy.masking_strategy_aes_encrypt import (
     AesEncryptionMaskingStrategy,
 )
+from fides.api.util.encryption.crypto_executor import shutdown_crypto_executor
+from fides.config import CONFIG
 
 from ....test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -88,3 +92,24 @@ def test_mask_arguments_date():
     masked = masker.mask([datetime(2000, 1, 1)], request_id)
     assert expected == masked
     clear_cache_secrets(request_id)
+
+
+@pytest.mark.parametrize("executor_type", ["none", "thread", "process"])
+def test_mask_in_chunks(executor_type):
+    """Values masked in chunks on the crypto executor match values masked one by one"""
+    original_executor = CONFIG.execution.crypto_executor
+    original_chunk_size = CONFIG.execution.crypto_chunk_size
+    CONFIG.execution.crypto_executor = executor_type
+    CONFIG.execution.crypto_chunk_size = 3
+    shutdown_crypto_executor()
+    cache_secrets()
+
+    values = [f"value {i}" if i % 4 else None for i in range(10)]
+    masked = AES_STRATEGY.mask(values, request_id)
+    assert masked == [AES_STRATEGY.mask([value], request_id)[0] for value in values]
+    assert masked[0] is None
+
+    clear_cache_secrets(request_id)
+    CONFIG.execution.crypto_executor = original_executor
+    CONFIG.execution.crypto_chunk_size = original_chunk_size
+    shutdown_crypto_executor()
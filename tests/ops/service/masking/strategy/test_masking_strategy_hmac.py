@@ -1,8 +1,12 @@
 from datetime import datetime
 
+import pytest
+
 from fides.api.schemas.masking.masking_configuration import HmacMaskingConfiguration
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
+from fides.api.util.encryption.crypto_executor import shutdown_crypto_executor
+from fides.config import CONFIG
 
 from ....test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -170,3 +174,40 @@ def test_mask_arguments_date():
     masked = masker.mask([datetime(2000, 1, 1)], request_id)
     assert expected == masked
     clear_cache_secrets(request_id)
+
+
+@pytest.mark.parametrize("executor_type", ["none", "thread", "process"])
+def test_mask_in_chunks(executor_type):
+    """Values masked in chunks on the crypto executor match values masked one by one"""
+    original_executor = CONFIG.execution.crypto_executor
+    original_chunk_size = CONFIG.execution.crypto_chunk_size
+    CONFIG.execution.crypto_executor = executor_type
+    CONFIG.execution.crypto_chunk_size = 3
+    shutdown_crypto_executor()
+    configuration = HmacMaskingConfiguration(
+        format_preservation={"suffix": "@masked.com"}
+    )
+    masker = HmacMaskingStrategy(configuration)
+    secret_key = MaskingSecretCache[str](
+        secret="test_key",
+        masking_strategy=HmacMaskingStrategy.name,
+        secret_type=SecretType.key,
+    )
+    cache_secret(secret_key, request_id)
+    secret_salt = MaskingSecretCache[str](
+        secret="test_salt",
+        masking_strategy=HmacMaskingStrategy.name,
+        secret_type=SecretType.salt,
+    )
+    cache_secret(secret_salt, request_id)
+
+    values = [f"value {i}" if i % 4 else None for i in range(10)]
+    masked = masker.mask(values, request_id)
+    assert masked == [masker.mask([value], request_id)[0] for value in values]
+    assert masked[0] is None
+    assert masked[1].endswith("@masked.com")
+
+    clear_cache_secrets(request_id)
+    CONFIG.execution.crypto_executor = original_executor
+    CONFIG.execution.crypto_chunk_size = original_chunk_size
+    shutdown_crypto_executor()
@@ -1,5 +1,7 @@
+import json
 from unittest import mock
 from unittest.mock import Mock
+from urllib.parse import parse_qs
 
 import pytest
 import requests_mock
@@ -32,13 +34,28 @@ from fides.api.schemas.privacy_request import Consent
 from fides.api.schemas.redis_cache import Identity
 from fides.api.service.messaging.message_dispatch_service import (
     EMAIL_TEMPLATE_NAME,
+    _build_email,
+    _compile,
     _compose_twilio_mail,
     _get_dispatcher_from_config_type,
     _get_template_id_if_exists,
+    _mailgun_batch_dispatcher,
+    _mailgun_dispatcher,
+    _render,
+    _twilio_email_batch_dispatcher,
     _twilio_email_dispatcher,
     _twilio_sms_dispatcher,
     dispatch_message,
+    dispatch_messages,
+    dispatch_messages_task,
+    queue_messages,
 )
+from fides.api.service.messaging.messaging_service_clients import (
+    clear_messaging_service_clients,
+    get_messaging_service_clients,
+)
+from fides.api.tasks import MESSAGING_QUEUE_NAME
+from fides.config import CONFIG
 
 
 @pytest.fixture
@@ -95,6 +112,8 @@ class TestMessageDispatchService:
                 subject="Your one-time code is 2348",
                 body="Your privacy request verification code is 2348. Please return to the Privacy Center and enter the code to continue. This code will expire in 10 minutes.",
                 template_variables={"code": "2348", "minutes": 10},
+                subject_template="Your one-time code is {{code}}",
+                body_template="Your privacy request verification code is {{code}}. Please return to the Privacy Center and enter the code to continue. This code will expire in {{minutes}} minutes.",
             ),
             "test@email.com",
         )
@@ -123,6 +142,8 @@ class TestMessageDispatchService:
                 subject="Your data is ready to be downloaded",
                 body=f"Your access request has been completed and can be downloaded at {download_link}. For security purposes, this secret link will expire in {days} days.",
                 template_variables={"download_link": download_link, "days": days},
+                subject_template="Your data is ready to be downloaded",
+                body_template="Your access request has been completed and can be downloaded at {{download_link}}. For security purposes, this secret link will expire in {{days}} days.",
             ),
             "test@email.com",
         )
@@ -150,6 +171,8 @@ class TestMessageDispatchService:
                 subject="Your privacy request has been denied",
                 body=f"Your privacy request has been denied. {denial_reason}.",
                 template_variables={"denial_reason": denial_reason},
+                subject_template="Your privacy request has been denied",
+                body_template="Your privacy request has been denied. {{denial_reason}}.",
             ),
             "test@email.com",
         )
@@ -684,6 +707,8 @@ class TestTwilioSmsDispatcher:
                 subject="Testing subject override",
                 body="Your privacy request verification code is 2348. Please return to the Privacy Center and enter the code to continue. This code will expire in 10 minutes.",
                 template_variables={"code": "2348", "minutes": 10},
+                subject_template="Your one-time code is {{code}}",
+                body_template="Your privacy request verification code is {{code}}. Please return to the Privacy Center and enter the code to continue. This code will expire in {{minutes}} minutes.",
             ),
             "test@email.com",
         )
@@ -711,3 +736,367 @@ class TestTwilioSmsDispatcher:
             + f"This code will expire in 10 minutes",
             "+12312341231",
         )
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    clear_messaging_service_clients()
+    yield
+    clear_messaging_service_clients()
+
+
+@pytest.fixture
+def mailgun_url(messaging_config) -> str:
+    return f"https://api.mailgun.net/{messaging_config.details[MessagingServiceDetails.API_VERSION.value]}/{messaging_config.details[MessagingServiceDetails.DOMAIN.value]}"
+
+
+@pytest.fixture
+def twilio_email_config(messaging_config_twilio_email):
+    messaging_config_twilio_email.details = {
+        MessagingServiceDetails.TWILIO_EMAIL_FROM.value: "from@email.com"
+    }
+    return messaging_config_twilio_email
+
+
+@pytest.fixture
+def mock_sendgrid_client(test_template_response_body):
+    with mock.patch("sendgrid.SendGridAPIClient") as mock_client:
+        client = mock_client.return_value.client
+        client.templates.get.return_value.body = json.dumps(test_template_response_body)
+        client.mail.send.post.return_value.status_code = 202
+        yield client
+
+
+class TestMessagingServiceClients:
+    def test_clients_reused_until_config_updated(self, db, messaging_config):
+        clients = get_messaging_service_clients(messaging_config)
+        assert get_messaging_service_clients(messaging_config) is clients
+
+        messaging_config.set_secrets(
+            db=db,
+            messaging_secrets={
+                MessagingServiceSecrets.MAILGUN_API_KEY.value: "new_api_key"
+            },
+        )
+        assert get_messaging_service_clients(messaging_config) is not clients
+
+    def test_template_lookup_cached(self, messaging_config):
+        clients = get_messaging_service_clients(messaging_config)
+        lookup = Mock(return_value=None)
+        assert clients.get_template("template", lookup) is None
+        assert clients.get_template("template", lookup) is None
+        assert lookup.call_count == 1
+
+    def test_template_lookup_expires(self, messaging_config):
+        clients = get_messaging_service_clients(messaging_config)
+        lookup = Mock(return_value="template_id")
+        with mock.patch.object(
+            CONFIG.execution, "messaging_template_cache_ttl_seconds", 0
+        ):
+            clients.get_template("template", lookup)
+            clients.get_template("template", lookup)
+        assert lookup.call_count == 2
+
+    def test_failed_template_lookup_not_cached(self, messaging_config):
+        clients = get_messaging_service_clients(messaging_config)
+        lookup = Mock(side_effect=[MessageDispatchException("failed"), "template_id"])
+        with pytest.raises(MessageDispatchException):
+            clients.get_template("template", lookup)
+        assert clients.get_template("template", lookup) == "template_id"
+
+
+class TestRenderTemplate:
+    def test_template_compiled_once(self):
+        _compile.cache_clear()
+        assert _render("Hello {{name}}", {"name": "one"}) == "Hello one"
+        assert _render("Hello {{name}}", {"name": "two"}) == "Hello two"
+        assert _compile.cache_info().hits == 1
+
+
+class TestMailgunDispatcher:
+    def test_template_looked_up_once(self, messaging_config, mailgun_url):
+        with requests_mock.Mocker() as mock_response:
+            template_lookup = mock_response.get(
+                f"{mailgun_url}/templates/{EMAIL_TEMPLATE_NAME}", status_code=200
+            )
+            send = mock_response.post(f"{mailgun_url}/messages", status_code=200)
+            for to in ["one@email.com", "two@email.com"]:
+                _mailgun_dispatcher(
+                    messaging_config,
+                    EmailForActionType(subject="test", body="test body"),
+                    to,
+                )
+
+        assert template_lookup.call_count == 1
+        assert send.call_count == 2
+        assert "template=fides" in send.last_request.text
+
+    def test_failed_template_lookup_sends_without_template(
+        self, messaging_config, mailgun_url
+    ):
+        with requests_mock.Mocker() as mock_response:
+            template_lookup = mock_response.get(
+                f"{mailgun_url}/templates/{EMAIL_TEMPLATE_NAME}", status_code=500
+            )
+            send = mock_response.post(f"{mailgun_url}/messages", status_code=200)
+            for to in ["one@email.com", "two@email.com"]:
+                _mailgun_dispatcher(
+                    messaging_config,
+                    EmailForActionType(subject="test", body="test body"),
+                    to,
+                )
+
+        assert template_lookup.call_count == 2
+        assert "html=test+body" in send.last_request.text
+
+    def test_batch_one_request_per_distinct_email(self, messaging_config, mailgun_url):
+        email = EmailForActionType(subject="test", body="test body")
+        with requests_mock.Mocker() as mock_response:
+            mock_response.get(
+                f"{mailgun_url}/templates/{EMAIL_TEMPLATE_NAME}", status_code=404
+            )
+            send = mock_response.post(f"{mailgun_url}/messages", status_code=200)
+            _mailgun_batch_dispatcher(
+                messaging_config,
+                [
+                    (email, "one@email.com"),
+                    (email, "two@email.com"),
+                    (
+                        EmailForActionType(subject="other", body="other body"),
+                        "three@email.com",
+                    ),
+                ],
+            )
+
+        assert send.call_count == 2
+        batch = send.request_history[0].text
+        assert "to=one%40email.com&to=two%40email.com" in batch
+        assert "recipient-variables" in batch
+        assert "recipient-variables" not in send.request_history[1].text
+
+    def test_batch_one_request_per_messaging_template(
+        self, messaging_config, mailgun_url
+    ):
+        messaging_template = Mock(
+            content={
+                "subject": "Your one-time code is {{code}}",
+                "body": "Your code is {{code}}, it expires in {{minutes}} minutes.",
+            }
+        )
+        emails = [
+            _build_email(
+                MessagingActionType.SUBJECT_IDENTITY_VERIFICATION,
+                SubjectIdentityVerificationBodyParams(
+                    verification_code=code, verification_code_ttl_seconds=600
+                ),
+                messaging_template,
+            )
+            for code in ["123456", "654321"]
+        ]
+        with requests_mock.Mocker() as mock_response:
+            mock_response.get(
+                f"{mailgun_url}/templates/{EMAIL_TEMPLATE_NAME}", status_code=404
+            )
+            send = mock_response.post(f"{mailgun_url}/messages", status_code=200)
+            _mailgun_batch_dispatcher(
+                messaging_config,
+                [(emails[0], "one@email.com"), (emails[1], "two@email.com")],
+            )
+
+        assert send.call_count == 1
+        batch = parse_qs(send.last_request.text)
+        assert batch["to"] == ["one@email.com", "two@email.com"]
+        assert batch["subject"] == ["Your one-time code is %recipient.code%"]
+        assert json.loads(batch["recipient-variables"][0]) == {
+            "one@email.com": {"code": "123456", "minutes": "10"},
+            "two@email.com": {"code": "654321", "minutes": "10"},
+        }
+
+    def test_batch_same_recipient_twice_not_merged(self, messaging_config, mailgun_url):
+        messaging_template = Mock(
+            content={"subject": "Your code", "body": "Your code is {{code}}"}
+        )
+        emails = [
+            _build_email(
+                MessagingActionType.SUBJECT_IDENTITY_VERIFICATION,
+                SubjectIdentityVerificationBodyParams(
+                    verification_code=code, verification_code_ttl_seconds=600
+                ),
+                messaging_template,
+            )
+            for code in ["123456", "654321"]
+        ]
+        with requests_mock.Mocker() as mock_response:
+            mock_response.get(
+                f"{mailgun_url}/templates/{EMAIL_TEMPLATE_NAME}", status_code=404
+            )
+            send = mock_response.post(f"{mailgun_url}/messages", status_code=200)
+            _mailgun_batch_dispatcher(
+                messaging_config,
+                [(emails[0], "one@email.com"), (emails[1], "one@email.com")],
+            )
+
+        assert send.call_count == 2
+        assert {
+            parse_qs(request.text)["html"][0] for request in send.request_history
+        } == {"Your code is %recipient.code%", "Your code is 654321"}
+
+    def test_batch_no_to(self, messaging_config):
+        with pytest.raises(MessageDispatchException) as exc:
+            _mailgun_batch_dispatcher(
+                messaging_config,
+                [(EmailForActionType(subject="test", body="test body"), None)],
+            )
+
+        assert "No email identity" in str(exc.value)
+
+
+class TestTwilioEmailBatchDispatcher:
+    def test_template_looked_up_once(self, twilio_email_config, mock_sendgrid_client):
+        email = EmailForActionType(subject="test", body="test body")
+        _twilio_email_dispatcher(twilio_email_config, email, "one@email.com")
+        _twilio_email_dispatcher(twilio_email_config, email, "two@email.com")
+
+        assert mock_sendgrid_client.templates.get.call_count == 1
+        assert mock_sendgrid_client.mail.send.post.call_count == 2
+
+    def test_templated_batch_one_request(
+        self, twilio_email_config, mock_sendgrid_client
+    ):
+        _twilio_email_batch_dispatcher(
+            twilio_email_config,
+            [
+                (EmailForActionType(subject="test", body="test body"), "one@email.com"),
+                (
+                    EmailForActionType(subject="other", body="other body"),
+                    "two@email.com",
+                ),
+            ],
+        )
+
+        mock_sendgrid_client.mail.send.post.assert_called_once()
+        mail = mock_sendgrid_client.mail.send.post.call_args.kwargs["request_body"]
+        assert "template_id" in mail
+        assert {
+            personalization["subject"]: personalization["dynamic_template_data"]
+            for personalization in mail["personalizations"]
+        } == {
+            "test": {"fides_email_body": "test body"},
+            "other": {"fides_email_body": "other body"},
+        }
+
+    def test_non_templated_batch_one_request_per_distinct_email(
+        self, twilio_email_config, mock_sendgrid_client
+    ):
+        mock_sendgrid_client.templates.get.return_value.body = json.dumps(
+            {"result": []}
+        )
+        email = EmailForActionType(subject="test", body="test body")
+        _twilio_email_batch_dispatcher(
+            twilio_email_config,
+            [
+                (email, "one@email.com"),
+                (email, "two@email.com"),
+                (
+                    EmailForActionType(subject="other", body="other body"),
+                    "three@email.com",
+                ),
+            ],
+        )
+
+        assert mock_sendgrid_client.mail.send.post.call_count == 2
+        mail = mock_sendgrid_client.mail.send.post.call_args_list[0].kwargs[
+            "request_body"
+        ]
+        assert len(mail["personalizations"]) == 2
+
+
+class TestDispatchMessages:
+    @mock.patch(
+        "fides.api.service.messaging.message_dispatch_service._mailgun_batch_dispatcher"
+    )
+    def test_dispatch_messages_in_batches(
+        self, mock_batch_dispatcher: Mock, db: Session, messaging_config
+    ) -> None:
+        with mock.patch.object(CONFIG.execution, "messaging_batch_size", 2):
+            dispatch_messages(
+                db=db,
+                action_type=MessagingActionType.SUBJECT_IDENTITY_VERIFICATION,
+                service_type=MessagingServiceType.mailgun.value,
+                recipients=[
+                    (
+                        Identity(email=f"test{i}@email.com"),
+                        SubjectIdentityVerificationBodyParams(
+                            verification_code=str(i), verification_code_ttl_seconds=600
+                        ),
+                    )
+                    for i in range(3)
+                ],
+            )
+
+        assert [
+            [to for _, to in call.args[1]]
+            for call in mock_batch_dispatcher.call_args_list
+        ] == [["test0@email.com", "test1@email.com"], ["test2@email.com"]]
+
+    @mock.patch(
+        "fides.api.service.messaging.message_dispatch_service._twilio_sms_dispatcher"
+    )
+    def test_dispatch_messages_without_batch_api(
+        self, mock_sms_dispatcher: Mock, db: Session, messaging_config_twilio_sms
+    ) -> None:
+        mock_sms_dispatcher.side_effect = [
+            MessageDispatchException("failed"),
+            None,
+        ]
+        with pytest.raises(MessageDispatchException) as exc:
+            dispatch_messages(
+                db=db,
+                action_type=MessagingActionType.TEST_MESSAGE,
+                service_type=MessagingServiceType.twilio_text.value,
+                recipients=[
+                    (Identity(phone_number="+12312341231"), None),
+                    (Identity(phone_number="+12312341232"), None),
+                ],
+            )
+
+        # every message is attempted before the failures are raised
+        assert mock_sms_dispatcher.call_count == 2
+        assert "1 of 2 message sends failed" in str(exc.value)
+
+    @mock.patch(
+        "fides.api.service.messaging.message_dispatch_service.dispatch_messages_task.apply_async"
+    )
+    def test_queue_messages(self, mock_apply_async: Mock) -> None:
+        with mock.patch.object(CONFIG.execution, "messaging_batch_size", 2):
+            queue_messages(
+                MessagingActionType.SUBJECT_IDENTITY_VERIFICATION,
+                MessagingServiceType.mailgun.value,
+                [
+                    (
+                        Identity(email=f"test{i}@email.com"),
+                        SubjectIdentityVerificationBodyParams(
+                            verification_code=str(i), verification_code_ttl_seconds=600
+                        ),
+                    )
+                    for i in range(3)
+                ],
+            )
+
+        assert mock_apply_async.call_count == 2
+        first_batch = mock_apply_async.call_args_list[0].kwargs
+        assert first_batch["queue"] == MESSAGING_QUEUE_NAME
+        assert len(first_batch["kwargs"]["messages"]) == 2
+
+        with mock.patch(
+            "fides.api.service.messaging.message_dispatch_service.dispatch_messages"
+        ) as mock_dispatch_messages:
+            dispatch_messages_task.apply(kwargs=first_batch["kwargs"]).get()
+
+        recipients = mock_dispatch_messages.call_args.args[3]
+        assert recipients[1] == (
+            Identity(email="test1@email.com"),
+            SubjectIdentityVerificationBodyParams(
+                verification_code="1", verification_code_ttl_seconds=600
+            ),
+        )
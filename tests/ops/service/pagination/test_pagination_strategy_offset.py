@@ -258,3 +258,45 @@ def test_headers_present_in_paginated_request(response_with_body):
         request_params, {}, response_with_body, "conversations"
     )
     assert next_request.headers == request_params.headers
+
+
+def test_offset_prefetch_requests():
+    config = OffsetPaginationConfiguration(
+        incremental_param="page", increment_by=1, limit=4
+    )
+    request_params: SaaSRequestParams = SaaSRequestParams(
+        method=HTTPMethod.GET,
+        path="/conversations",
+        query_params={"page": 1, "per_page": 3},
+    )
+    paginator = OffsetPaginationStrategy(config)
+    assert paginator.get_prefetch_requests(request_params, {}, 5) == [
+        SaaSRequestParams(
+            method=HTTPMethod.GET,
+            path="/conversations",
+            query_params={"page": page, "per_page": 3},
+        )
+        for page in (2, 3, 4)
+    ]
+    assert paginator.get_prefetch_requests(request_params, {}, 1) == [
+        SaaSRequestParams(
+            method=HTTPMethod.GET,
+            path="/conversations",
+            query_params={"page": 2, "per_page": 3},
+        )
+    ]
+    # the original request is left untouched
+    assert request_params.query_params == {"page": 1, "per_page": 3}
+
+
+def test_offset_prefetch_requests_missing_param():
+    config = OffsetPaginationConfiguration(
+        incremental_param="page", increment_by=1, limit=4
+    )
+    request_params: SaaSRequestParams = SaaSRequestParams(
+        method=HTTPMethod.GET,
+        path="/conversations",
+        query_params={},
+    )
+    paginator = OffsetPaginationStrategy(config)
+    assert paginator.get_prefetch_requests(request_params, {}, 5) == []
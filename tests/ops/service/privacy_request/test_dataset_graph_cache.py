@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.common_exceptions import TraversalError
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.service.privacy_request.dataset_graph_cache import (
+    clear_compiled_dataset_graph,
+    get_compiled_dataset_graph,
+    get_dataset_graph_fingerprint,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_graph_cache():
+    clear_compiled_dataset_graph()
+    yield
+    clear_compiled_dataset_graph()
+
+
+class TestCompiledDatasetGraph:
+    def test_compiled_graph_is_reused(
+        self, db: Session, dataset_config: DatasetConfig
+    ) -> None:
+        compiled = get_compiled_dataset_graph(db)
+
+        assert compiled.graph.frozen
+        assert compiled.consent_graph.frozen
+        assert {
+            CollectionAddress(dataset_config.fides_key, collection.name)
+            for collection in dataset_config.get_graph().collections
+        } <= set(compiled.graph.nodes)
+        assert get_compiled_dataset_graph(db) is compiled
+
+    def test_identity_traversals_precompiled(
+        self, db: Session, dataset_config: DatasetConfig
+    ) -> None:
+        compiled = get_compiled_dataset_graph(db)
+
+        # Verified on an unfrozen copy of the graph, which doesn't keep skeletons
+        graph = DatasetGraph(
+            *[dataset_config.get_graph() for dataset_config in DatasetConfig.all(db=db)]
+        )
+        traversable_seed_keys = set()
+        for seed_key in set(graph.identity_keys.values()):
+            try:
+                Traversal(graph, {seed_key: None})
+                traversable_seed_keys.add(seed_key)
+            except TraversalError:
+                pass
+
+        assert traversable_seed_keys
+        assert set(compiled.graph.traversal_skeletons) == {
+            frozenset({seed_key}) for seed_key in traversable_seed_keys
+        }
+
+    def test_dataset_update_recompiles(
+        self, db: Session, dataset_config: DatasetConfig
+    ) -> None:
+        compiled = get_compiled_dataset_graph(db)
+        fingerprint = get_dataset_graph_fingerprint(db)
+
+        dataset_config.ctl_dataset.description = "Updated description"
+        dataset_config.ctl_dataset.save(db)
+
+        assert get_dataset_graph_fingerprint(db) != fingerprint
+        recompiled = get_compiled_dataset_graph(db)
+        assert recompiled is not compiled
+        assert recompiled.fingerprint == get_dataset_graph_fingerprint(db)
@@ -0,0 +1,170 @@
+import time
+from unittest import mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.models.policy import CurrentStep
+from fides.api.models.privacy_request import PrivacyRequestStatus
+from fides.api.service.connectors.fides.child_requests import (
+    PARENTS_TO_RESUME_KEY,
+    ChildRequestCheckpoint,
+    get_outstanding_child_requests,
+)
+from fides.api.service.connectors.fides_connector import FidesConnector
+from fides.api.service.privacy_request.fides_child_request_service import (
+    POLLED_AT_KEY,
+    check_fides_child_requests,
+    poll_child_servers,
+    request_child_status_check,
+    resume_parent_requests,
+)
+from fides.api.util.cache import get_cache
+
+
+@pytest.fixture
+def child_requests(privacy_request, fides_connector_connection_config):
+    """Two outstanding child requests the privacy request paused for"""
+    cache = get_cache()
+    cache.delete(POLLED_AT_KEY, PARENTS_TO_RESUME_KEY)
+    checkpoint = ChildRequestCheckpoint(
+        privacy_request.id, fides_connector_connection_config.key, CurrentStep.access
+    )
+    checkpoint.save(["pri_child_1", "pri_child_2"])
+    privacy_request.cache_paused_collection_details(step=CurrentStep.access)
+    yield checkpoint
+    checkpoint.load()
+    checkpoint.discard()
+
+
+@pytest.fixture
+def mock_request_statuses():
+    with mock.patch.object(FidesConnector, "client") as mock_client:
+        yield mock_client.return_value.request_statuses
+
+
+class TestFidesChildRequestPolling:
+    def test_poll_records_finished_child_requests(
+        self, db: Session, child_requests, mock_request_statuses
+    ):
+        mock_request_statuses.return_value = {
+            "pri_child_1": PrivacyRequestStatus.complete,
+            "pri_child_2": PrivacyRequestStatus.in_processing,
+        }
+        cache = get_cache()
+        assert poll_child_servers(db, cache) == 1
+        mock_request_statuses.assert_called_once_with(["pri_child_1", "pri_child_2"])
+
+        assert child_requests.load()
+        assert child_requests.statuses == {
+            "pri_child_1": PrivacyRequestStatus.complete.value,
+            "pri_child_2": None,
+        }
+        assert set(get_outstanding_child_requests(cache)) == {"pri_child_2"}
+
+    def test_poll_honors_polling_interval(
+        self, db: Session, child_requests, mock_request_statuses
+    ):
+        mock_request_statuses.return_value = {}
+        cache = get_cache()
+        poll_child_servers(db, cache)
+        poll_child_servers(db, cache)
+        assert mock_request_statuses.call_count == 1
+
+        # a child server's callback has it polled on the next run
+        assert request_child_status_check(cache, "pri_child_1")
+        poll_child_servers(db, cache)
+        assert mock_request_statuses.call_count == 2
+
+        assert not request_child_status_check(cache, "pri_unknown")
+
+    def test_poll_times_out_child_requests(
+        self, db: Session, child_requests, mock_request_statuses, monkeypatch
+    ):
+        mock_request_statuses.return_value = {}
+        monkeypatch.setattr(time, "time", lambda: child_requests.created_at + 3600)
+        assert poll_child_servers(db, get_cache()) == 2
+        assert not get_outstanding_child_requests(get_cache())
+
+    @mock.patch(
+        "fides.api.service.privacy_request.fides_child_request_service.queue_privacy_request"
+    )
+    def test_resume_once_all_child_requests_finish(
+        self,
+        mock_queue,
+        db: Session,
+        privacy_request,
+        child_requests,
+        mock_request_statuses,
+    ):
+        privacy_request.status = PrivacyRequestStatus.paused
+        privacy_request.save(db)
+        cache = get_cache()
+
+        mock_request_statuses.return_value = {
+            "pri_child_1": PrivacyRequestStatus.complete
+        }
+        poll_child_servers(db, cache)
+        assert resume_parent_requests(db, cache) == 0
+
+        cache.delete(POLLED_AT_KEY)
+        mock_request_statuses.return_value = {
+            "pri_child_2": PrivacyRequestStatus.complete
+        }
+        poll_child_servers(db, cache)
+        assert resume_parent_requests(db, cache) == 1
+
+        db.refresh(privacy_request)
+        assert privacy_request.status == PrivacyRequestStatus.in_processing
+        mock_queue.assert_called_once_with(
+            privacy_request_id=privacy_request.id,
+            from_step=CurrentStep.access.value,
+        )
+        assert not cache.smembers(PARENTS_TO_RESUME_KEY)
+
+    @mock.patch(
+        "fides.api.service.privacy_request.fides_child_request_service.queue_privacy_request"
+    )
+    def test_resume_waits_for_parent_to_pause(
+        self,
+        mock_queue,
+        db: Session,
+        privacy_request,
+        child_requests,
+        mock_request_statuses,
+    ):
+        privacy_request.status = PrivacyRequestStatus.in_processing
+        privacy_request.save(db)
+        mock_request_statuses.return_value = {
+            "pri_child_1": PrivacyRequestStatus.complete,
+            "pri_child_2": PrivacyRequestStatus.error,
+        }
+        cache = get_cache()
+        poll_child_servers(db, cache)
+        assert resume_parent_requests(db, cache) == 0
+        assert cache.smembers(PARENTS_TO_RESUME_KEY) == {privacy_request.id}
+
+        privacy_request.status = PrivacyRequestStatus.paused
+        privacy_request.save(db)
+        assert resume_parent_requests(db, cache) == 1
+        mock_queue.assert_called_once()
+
+    @mock.patch(
+        "fides.api.service.privacy_request.fides_child_request_service.queue_privacy_request"
+    )
+    def test_check_fides_child_requests_task(
+        self,
+        mock_queue,
+        db: Session,
+        privacy_request,
+        child_requests,
+        mock_request_statuses,
+    ):
+        privacy_request.status = PrivacyRequestStatus.paused
+        privacy_request.save(db)
+        mock_request_statuses.return_value = {
+            "pri_child_1": PrivacyRequestStatus.complete,
+            "pri_child_2": PrivacyRequestStatus.complete,
+        }
+        check_fides_child_requests.delay().get()
+        mock_queue.assert_called_once()
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_request import ProvidedIdentity, ProvidedIdentityType
+from fides.api.service.privacy_request.identity_lookup_hash_service import (
+    backfill_identity_lookup_hashes,
+    backfill_lookup_hash_batch,
+)
+from fides.config import CONFIG
+
+
+@pytest.fixture
+def recheck_backfill(monkeypatch):
+    """Checks whether identities are backfilled on every lookup"""
+    monkeypatch.setattr(ProvidedIdentity, "_lookup_hashes_checked_at", 0.0)
+    monkeypatch.setattr(
+        "fides.api.models.privacy_request.LOOKUP_HASH_BACKFILL_CHECK_SECONDS", 0
+    )
+
+
+@pytest.fixture
+def legacy_identities(db: Session):
+    """Identities as they were created before lookup hashes were added"""
+    identities = []
+    for value in ["legacy_1@example.com", "legacy_2@example.com", None]:
+        identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": ProvidedIdentityType.email.value,
+                "hashed_value": ProvidedIdentity.hash_value(value) if value else None,
+                "encrypted_value": {"value": value} if value else None,
+            },
+        )
+        identity.lookup_hash = None
+        identity.save(db)
+        identities.append(identity)
+    yield identities
+    for identity in identities:
+        identity.delete(db)
+
+
+def find_identity(db: Session, value: str):
+    return ProvidedIdentity.filter(
+        db=db,
+        conditions=(
+            ProvidedIdentity.lookup_condition(db, value)
+            & (ProvidedIdentity.field_name == ProvidedIdentityType.email)
+        ),
+    ).first()
+
+
+class TestIdentityLookupHash:
+    def test_lookup_hash_value_keyed_with_pepper(self, monkeypatch):
+        unpeppered = ProvidedIdentity.lookup_hash_value("customer@example.com")
+        assert unpeppered == ProvidedIdentity.lookup_hash_value("customer@example.com")
+        assert unpeppered != ProvidedIdentity.lookup_hash_value("other@example.com")
+
+        monkeypatch.setattr(CONFIG.security, "identity_lookup_pepper", "a-pepper")
+        assert ProvidedIdentity.lookup_hash_value("customer@example.com") != unpeppered
+
+    def test_create_sets_lookup_hash(self, db):
+        identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": ProvidedIdentityType.email.value,
+                "encrypted_value": {"value": "customer@example.com"},
+            },
+        )
+        assert identity.lookup_hash == ProvidedIdentity.lookup_hash_value(
+            "customer@example.com"
+        )
+        assert identity.hashed_value == ProvidedIdentity.hash_value(
+            "customer@example.com"
+        )
+        identity.delete(db)
+
+    def test_create_without_legacy_hash_writes(self, db, monkeypatch):
+        monkeypatch.setattr(CONFIG.security, "identity_legacy_hash_writes", False)
+        identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": ProvidedIdentityType.email.value,
+                "encrypted_value": {"value": "customer@example.com"},
+            },
+        )
+        assert identity.hashed_value is None
+        assert identity.has_hash
+        identity.delete(db)
+
+    def test_legacy_identities_found_before_backfill(
+        self, db, recheck_backfill, legacy_identities
+    ):
+        assert not ProvidedIdentity.lookup_hashes_backfilled(db)
+        assert find_identity(db, "legacy_1@example.com") == legacy_identities[0]
+        assert find_identity(db, "missing@example.com") is None
+
+    def test_backfill_in_batches(self, db, recheck_backfill, legacy_identities):
+        assert backfill_lookup_hash_batch(db, 2) == 2
+        assert backfill_lookup_hash_batch(db, 2) == 1
+        assert backfill_lookup_hash_batch(db, 2) == 0
+
+        for identity in legacy_identities:
+            db.refresh(identity)
+        assert legacy_identities[0].lookup_hash == ProvidedIdentity.lookup_hash_value(
+            "legacy_1@example.com"
+        )
+        assert legacy_identities[2].lookup_hash == ""
+
+        assert ProvidedIdentity.lookup_hashes_backfilled(db)
+        assert find_identity(db, "legacy_2@example.com") == legacy_identities[1]
+
+    def test_backfill_task(self, db, recheck_backfill, legacy_identities):
+        assert backfill_identity_lookup_hashes.delay().get() == 3
+        assert ProvidedIdentity.lookup_hashes_backfilled(db)
+        assert backfill_identity_lookup_hashes.delay().get() == 0
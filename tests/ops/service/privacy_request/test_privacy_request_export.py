@@ -0,0 +1,174 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.schemas.privacy_request import PrivacyRequestExportFormat
+from fides.api.schemas.redis_cache import Identity
+from fides.api.service.privacy_request.privacy_request_export import (
+    CSV_HEADERS,
+    format_export_chunks,
+    gzip_stream,
+    iter_privacy_request_chunks,
+    iter_privacy_request_export_rows,
+    stream_privacy_request_export,
+)
+from fides.api.util.enums import ColumnSort
+
+ROWS = [
+    {
+        "status": "approved",
+        "request_type": "access",
+        "identity": {"email": "customer-1@example.com"},
+        "custom_privacy_request_fields": {},
+        "created_at": datetime(2023, 5, 1, 12, 30),
+        "reviewed_by": "user-1",
+        "id": "pri_1",
+        "reviewed_at": datetime(2023, 5, 2, 9, 0),
+        "denial_reason": None,
+    },
+    {
+        "status": "denied",
+        "request_type": "erasure",
+        "identity": {"email": "customer-2@example.com"},
+        "custom_privacy_request_fields": {"dept": {"label": "Dept", "value": "IT"}},
+        "created_at": datetime(2023, 5, 3, 8, 15),
+        "reviewed_by": "user-2",
+        "id": "pri_2",
+        "reviewed_at": datetime(2023, 5, 4, 10, 0),
+        "denial_reason": "Duplicate request",
+    },
+]
+
+
+class TestFormatExportChunks:
+    def test_csv(self):
+        chunks = list(format_export_chunks([ROWS[:1], ROWS[1:]]))
+
+        # One string per chunk of rows, with the header in the first
+        assert len(chunks) == 2
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert list(rows[0].keys()) == list(CSV_HEADERS.values())
+        assert [row["Request ID"] for row in rows] == ["pri_1", "pri_2"]
+        assert rows[0]["Time Received"] == "2023-05-01 12:30:00"
+        assert rows[0]["Denial Reason"] == ""
+        assert rows[1]["Denial Reason"] == "Duplicate request"
+
+    def test_csv_without_rows(self):
+        rows = list(csv.reader(io.StringIO("".join(format_export_chunks([])))))
+        assert rows == [list(CSV_HEADERS.values())]
+
+    def test_ndjson(self):
+        content = "".join(
+            format_export_chunks([ROWS], PrivacyRequestExportFormat.ndjson)
+        )
+
+        lines = [json.loads(line) for line in content.splitlines()]
+        assert [line["id"] for line in lines] == ["pri_1", "pri_2"]
+        assert lines[0]["created_at"] == "2023-05-01T12:30:00"
+        assert lines[1]["custom_privacy_request_fields"] == {
+            "dept": {"label": "Dept", "value": "IT"}
+        }
+
+    def test_gzip_stream(self):
+        chunks = list(format_export_chunks([ROWS[:1], ROWS[1:]]))
+        compressed = b"".join(gzip_stream(chunks))
+        assert gzip.decompress(compressed).decode() == "".join(chunks)
+
+
+class TestIterPrivacyRequestChunks:
+    @pytest.mark.parametrize("sort_direction", [ColumnSort.ASC, ColumnSort.DESC])
+    def test_keyset_chunks(
+        self, db: Session, privacy_requests, sort_direction: ColumnSort
+    ) -> None:
+        query = db.query(PrivacyRequest).filter(
+            PrivacyRequest.id.in_([pr.id for pr in privacy_requests])
+        )
+
+        chunks = list(
+            iter_privacy_request_chunks(
+                query, "created_at", sort_direction, chunk_size=2
+            )
+        )
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        expected = sorted(
+            privacy_requests,
+            key=lambda pr: (pr.created_at, pr.id),
+            reverse=sort_direction == ColumnSort.DESC,
+        )
+        assert [row.id for chunk in chunks for row in chunk] == [
+            pr.id for pr in expected
+        ]
+
+    def test_keyset_chunks_with_null_sort_values(
+        self, db: Session, privacy_requests
+    ) -> None:
+        """Requests without a value for the sort field are still exported, last"""
+        privacy_requests[0].reviewed_at = datetime.utcnow()
+        privacy_requests[0].save(db)
+        query = db.query(PrivacyRequest).filter(
+            PrivacyRequest.id.in_([pr.id for pr in privacy_requests])
+        )
+
+        ids = [
+            row.id
+            for chunk in iter_privacy_request_chunks(
+                query, "reviewed_at", ColumnSort.DESC, chunk_size=1
+            )
+            for row in chunk
+        ]
+
+        assert ids[0] == privacy_requests[0].id
+        assert ids[1:] == sorted(pr.id for pr in privacy_requests[1:])
+
+
+class TestPrivacyRequestExportRows:
+    def test_export_rows(self, db: Session, privacy_request, policy) -> None:
+        privacy_request.persist_identity(
+            db=db, identity=Identity(email="customer-1@example.com")
+        )
+        query = db.query(PrivacyRequest).filter(PrivacyRequest.id == privacy_request.id)
+
+        (chunk,) = list(iter_privacy_request_export_rows(db, query))
+
+        assert chunk == [
+            {
+                "status": privacy_request.status.value,
+                "request_type": policy.get_action_type().value,
+                "identity": privacy_request.get_persisted_identity().dict(),
+                "custom_privacy_request_fields": privacy_request.get_persisted_custom_privacy_request_fields(),
+                "created_at": privacy_request.created_at,
+                "reviewed_by": privacy_request.reviewed_by,
+                "id": privacy_request.id,
+                "reviewed_at": privacy_request.reviewed_at,
+                "denial_reason": None,
+            }
+        ]
+        assert chunk[0]["identity"]["email"] == "customer-1@example.com"
+
+    def test_stream_gzipped_ndjson(self, db: Session, privacy_requests) -> None:
+        query = db.query(PrivacyRequest).filter(
+            PrivacyRequest.id.in_([pr.id for pr in privacy_requests])
+        )
+
+        content = gzip.decompress(
+            b"".join(
+                stream_privacy_request_export(
+                    db,
+                    query,
+                    export_format=PrivacyRequestExportFormat.ndjson,
+                    gzip=True,
+                    chunk_size=2,
+                )
+            )
+        ).decode()
+
+        assert {json.loads(line)["id"] for line in content.splitlines()} == {
+            pr.id for pr in privacy_requests
+        }
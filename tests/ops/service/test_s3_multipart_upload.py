@@ -0,0 +1,230 @@
+import os
+import stat
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from botocore.exceptions import ClientError
+
+from fides.api.service.storage import s3_multipart_upload
+from fides.api.service.storage.s3_multipart_upload import ResumableS3Upload
+from fides.api.util.cache import get_privacy_request_cache_index
+from fides.config import CONFIG
+
+PART_SIZE = 10
+
+
+class FakeS3Client:
+    """An in-memory stand in for the multipart upload API of a boto3 S3 client"""
+
+    def __init__(
+        self,
+        failures: Optional[Dict[int, int]] = None,
+        parts_per_listing: int = 2,
+        failure_code: str = "SlowDown",
+    ):
+        # The number of times each part number fails before it's uploaded
+        self.failures: Dict[int, int] = failures or {}
+        self.failure_code = failure_code
+        self.parts_per_listing = parts_per_listing
+        self.objects: Dict[str, bytes] = {}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.part_calls: List[int] = []
+
+    def upload_fileobj(self, Fileobj, Bucket, Key) -> None:
+        self.objects[Key] = Fileobj.read()
+
+    def create_multipart_upload(self, Bucket, Key) -> Dict[str, Any]:
+        upload_id = str(uuid4())
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body) -> Dict[str, Any]:
+        self.part_calls.append(PartNumber)
+        if self.failures.get(PartNumber):
+            self.failures[PartNumber] -= 1
+            raise ClientError({"Error": {"Code": self.failure_code}}, "UploadPart")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def list_parts(self, Bucket, Key, UploadId, PartNumberMarker) -> Dict[str, Any]:
+        if UploadId not in self.uploads:
+            raise ClientError({"Error": {"Code": "NoSuchUpload"}}, "ListParts")
+        part_numbers = [
+            part_number
+            for part_number in sorted(self.uploads[UploadId])
+            if part_number > PartNumberMarker
+        ]
+        listed = part_numbers[: self.parts_per_listing]
+        return {
+            "Parts": [
+                {"PartNumber": part_number, "ETag": f"etag-{part_number}"}
+                for part_number in listed
+            ],
+            "IsTruncated": len(part_numbers) > len(listed),
+            "NextPartNumberMarker": listed[-1] if listed else PartNumberMarker,
+        }
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload) -> None:
+        parts = self.uploads.pop(UploadId)
+        assert [part["PartNumber"] for part in MultipartUpload["Parts"]] == sorted(
+            parts
+        )
+        self.objects[Key] = b"".join(
+            parts[part_number] for part_number in sorted(parts)
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId) -> None:
+        self.uploads.pop(UploadId, None)
+
+
+class TestResumableS3Upload:
+    @pytest.fixture(autouse=True)
+    def upload_config(self, tmp_path):
+        original_part_size = CONFIG.execution.access_package_upload_part_size
+        original_directory = CONFIG.execution.access_package_upload_directory
+        original_retries = CONFIG.execution.access_package_upload_part_retries
+        CONFIG.execution.access_package_upload_part_size = PART_SIZE
+        CONFIG.execution.access_package_upload_directory = str(tmp_path)
+        CONFIG.execution.access_package_upload_part_retries = 1
+        with mock.patch.object(s3_multipart_upload, "RETRY_BACKOFF_SECONDS", 0):
+            yield
+        CONFIG.execution.access_package_upload_part_size = original_part_size
+        CONFIG.execution.access_package_upload_directory = original_directory
+        CONFIG.execution.access_package_upload_part_retries = original_retries
+
+    @pytest.fixture
+    def package(self) -> bytes:
+        return bytes(range(95))
+
+    @pytest.fixture
+    def privacy_request_id(self) -> str:
+        return f"pri_{uuid4()}"
+
+    def test_small_package_uploaded_at_once(self, cache, privacy_request_id):
+        s3_client = FakeS3Client()
+        upload = ResumableS3Upload(
+            s3_client, "bucket", "small.json", privacy_request_id
+        )
+        upload.upload(BytesIO(b"0123456789"))
+
+        assert s3_client.objects["small.json"] == b"0123456789"
+        assert not s3_client.part_calls
+        assert not os.path.exists(upload.package_path)
+
+    def test_package_uploaded_in_parts(self, cache, package, privacy_request_id):
+        s3_client = FakeS3Client()
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        upload.upload(BytesIO(package))
+
+        assert s3_client.objects["large.zip"] == package
+        assert sorted(s3_client.part_calls) == list(range(1, 11))
+        assert not s3_client.uploads
+        assert not os.path.exists(upload.package_path)
+        assert not cache.exists(upload.checkpoint_key)
+        assert not cache.sismember(
+            get_privacy_request_cache_index(privacy_request_id), upload.checkpoint_key
+        )
+        assert not upload.resume()
+
+    def test_failed_part_retried(self, cache, package, privacy_request_id):
+        s3_client = FakeS3Client(failures={3: 1})
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        upload.upload(BytesIO(package))
+
+        assert s3_client.objects["large.zip"] == package
+        assert len(s3_client.part_calls) == 11
+
+    def test_interrupted_upload_resumed(self, cache, package, privacy_request_id):
+        s3_client = FakeS3Client(failures={3: 2, 7: 2})
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        with pytest.raises(ClientError):
+            upload.upload(BytesIO(package))
+
+        assert "large.zip" not in s3_client.objects
+        assert os.path.exists(upload.package_path)
+        # the package may hold unencrypted personal data
+        assert stat.S_IMODE(os.stat(upload.package_path).st_mode) == 0o600
+        assert (
+            stat.S_IMODE(os.stat(os.path.dirname(upload.package_path)).st_mode) == 0o700
+        )
+        assert cache.sismember(
+            get_privacy_request_cache_index(privacy_request_id), upload.checkpoint_key
+        )
+        (uploaded_parts,) = s3_client.uploads.values()
+        assert sorted(uploaded_parts) == [1, 2, 4, 5, 6, 8, 9, 10]
+
+        # A later attempt only uploads the parts that are missing
+        s3_client.part_calls = []
+        resumed = ResumableS3Upload(
+            s3_client, "bucket", "large.zip", privacy_request_id
+        )
+        assert resumed.resume()
+
+        assert s3_client.objects["large.zip"] == package
+        assert sorted(s3_client.part_calls) == [3, 7]
+        assert not os.path.exists(resumed.package_path)
+        assert not cache.exists(resumed.checkpoint_key)
+
+    def test_resume_without_package_aborts(self, cache, package, privacy_request_id):
+        s3_client = FakeS3Client(failures={3: 2, 7: 2})
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        with pytest.raises(ClientError):
+            upload.upload(BytesIO(package))
+        os.remove(upload.package_path)
+
+        assert not upload.resume()
+        assert not s3_client.uploads
+        assert not cache.exists(upload.checkpoint_key)
+
+    def test_resume_expired_upload(self, cache, package, privacy_request_id):
+        s3_client = FakeS3Client(failures={3: 2, 7: 2})
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        with pytest.raises(ClientError):
+            upload.upload(BytesIO(package))
+        s3_client.uploads.clear()
+
+        assert not upload.resume()
+        assert not os.path.exists(upload.package_path)
+        assert not cache.exists(upload.checkpoint_key)
+
+    def test_failed_upload_not_resumable_aborted(
+        self, cache, package, privacy_request_id
+    ):
+        s3_client = FakeS3Client(failures={3: 2}, failure_code="AccessDenied")
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        with pytest.raises(ClientError):
+            upload.upload(BytesIO(package))
+
+        assert not s3_client.uploads
+        assert not os.path.exists(upload.package_path)
+        assert not cache.exists(upload.checkpoint_key)
+        assert not upload.resume()
+
+    def test_failed_start_of_upload_removes_package(
+        self, cache, package, privacy_request_id
+    ):
+        s3_client = FakeS3Client()
+        upload = ResumableS3Upload(s3_client, "bucket", "large.zip", privacy_request_id)
+        with mock.patch.object(
+            s3_client,
+            "create_multipart_upload",
+            side_effect=ClientError({"Error": {"Code": "NoSuchBucket"}}, "Create"),
+        ), pytest.raises(ClientError):
+            upload.upload(BytesIO(package))
+
+        assert not os.path.exists(upload.package_path)
+
+    def test_package_directory_of_another_user_rejected(self, tmp_path):
+        directory = tmp_path / "packages"
+        directory.mkdir(mode=0o755)
+        CONFIG.execution.access_package_upload_directory = str(directory)
+        assert s3_multipart_upload.get_package_directory() == str(directory)
+        assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+        with mock.patch.object(
+            os, "getuid", return_value=directory.stat().st_uid + 1
+        ), pytest.raises(PermissionError):
+            s3_multipart_upload.get_package_directory()
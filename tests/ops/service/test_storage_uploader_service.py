@@ -2,6 +2,7 @@ import json
 import os
 from datetime import datetime
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from typing import Any, Dict, Generator
 from unittest import mock
 from unittest.mock import Mock
@@ -27,11 +28,12 @@ from fides.api.service.storage.storage_uploader_service import get_extension, up
 from fides.api.tasks.storage import (
     LOCAL_FIDES_UPLOAD_DIRECTORY,
     encrypt_access_request_results,
-    write_to_in_memory_buffer,
+    write_access_package,
 )
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     decrypt_combined_nonce_and_message,
 )
+from fides.api.util.encryption.segmented_encryption_scheme import decrypt_segments
 from fides.config import CONFIG
 
 
@@ -85,7 +87,7 @@ def test_uploader_s3_success_secrets_auth(
     storage_config.delete(db)
 
 
-def test_write_to_in_memory_buffer_handles_bson(privacy_request: PrivacyRequest):
+def test_write_access_package_handles_bson(privacy_request: PrivacyRequest):
     OBJECT_ID_STR = "5b4a61b1326bd9777aa61c19"
     data = {
         "collection:users": [
@@ -133,7 +135,7 @@ def test_write_to_in_memory_buffer_handles_bson(privacy_request: PrivacyRequest)
     }
     # This will throw a `ValueError: Circular reference detected` if no ObjectId
     # handler is available to the JSON encoder.
-    bytesio = write_to_in_memory_buffer(
+    bytesio = write_access_package(
         resp_format="json",
         data=data,
         privacy_request=privacy_request,
@@ -338,7 +340,7 @@ def test_uploader_local_dsr_package(
     config.delete(db)
 
 
-class TestWriteToInMemoryBuffer:
+class TestWriteAccessPackage:
     key = "test--encryption"
 
     @pytest.fixture(scope="function")
@@ -362,13 +364,13 @@ class TestWriteToInMemoryBuffer:
         }
 
     def test_json_data(self, data, privacy_request):
-        buff = write_to_in_memory_buffer("json", data, privacy_request)
-        assert isinstance(buff, BytesIO)
+        buff = write_access_package("json", data, privacy_request)
+        assert isinstance(buff, SpooledTemporaryFile)
         assert json.load(buff) == data
 
     def test_csv_format(self, data, privacy_request):
-        buff = write_to_in_memory_buffer("csv", data, privacy_request)
-        assert isinstance(buff, BytesIO)
+        buff = write_access_package("csv", data, privacy_request)
+        assert isinstance(buff, SpooledTemporaryFile)
 
         zipfile = ZipFile(buff)
         assert zipfile.namelist() == [
@@ -434,8 +436,8 @@ class TestWriteToInMemoryBuffer:
             ]
 
     def test_html_format(self, data, privacy_request):
-        buff = write_to_in_memory_buffer("html", data, privacy_request)
-        assert isinstance(buff, BytesIO)
+        buff = write_access_package("html", data, privacy_request)
+        assert isinstance(buff, SpooledTemporaryFile)
 
         zipfile = ZipFile(buff)
         assert zipfile.namelist() == [
@@ -457,16 +459,55 @@ class TestWriteToInMemoryBuffer:
             "/welcome.html",
         ]
 
+    def test_html_format_paginated(self, data, privacy_request):
+        original_page_size = CONFIG.execution.dsr_report_page_size
+        CONFIG.execution.dsr_report_page_size = 1
+        buff = write_access_package("html", data, privacy_request)
+        CONFIG.execution.dsr_report_page_size = original_page_size
+
+        zipfile = ZipFile(buff)
+        assert [
+            name
+            for name in zipfile.namelist()
+            if name.startswith("/data/mongo/address")
+        ] == [
+            "/data/mongo/address/1.html",
+            "/data/mongo/address/index.html",
+            "/data/mongo/address/2.html",
+            "/data/mongo/address/index-2.html",
+        ]
+        first_page = zipfile.read("/data/mongo/address/index.html").decode()
+        assert 'href="1.html"' in first_page
+        assert 'href="2.html"' not in first_page
+        assert 'href="index-2.html">Next' in first_page
+        assert "Page 1 of 2" in first_page
+        second_page = zipfile.read("/data/mongo/address/index-2.html").decode()
+        assert 'href="index.html">Previous' in second_page
+        assert (
+            'href="index-2.html"' in zipfile.read("/data/mongo/address/2.html").decode()
+        )
+        # a collection that fits on one page isn't paginated
+        assert (
+            "pagination" not in zipfile.read("/data/mongo/foobar/index.html").decode()
+        )
+
+    def test_spooled_to_disk(self, data, privacy_request):
+        original_spool_size = CONFIG.execution.access_package_spool_size
+        CONFIG.execution.access_package_spool_size = 10
+        buff = write_access_package("json", data, privacy_request)
+        CONFIG.execution.access_package_spool_size = original_spool_size
+
+        assert buff._rolled
+        assert json.load(buff) == data
+
     def test_not_implemented(self, data, privacy_request):
         with pytest.raises(NotImplementedError):
-            write_to_in_memory_buffer("not-a-valid-format", data, privacy_request)
+            write_access_package("not-a-valid-format", data, privacy_request)
 
     def test_encrypted_json(self, data, privacy_request_with_encryption_keys):
         original_data = data
-        buff = write_to_in_memory_buffer(
-            "json", data, privacy_request_with_encryption_keys
-        )
-        assert isinstance(buff, BytesIO)
+        buff = write_access_package("json", data, privacy_request_with_encryption_keys)
+        assert isinstance(buff, SpooledTemporaryFile)
         encrypted = buff.read()
         data = encrypted.decode(CONFIG.security.encoding)
         decrypted = decrypt_combined_nonce_and_message(
@@ -475,10 +516,8 @@ class TestWriteToInMemoryBuffer:
         assert json.loads(decrypted) == original_data
 
     def test_encrypted_csv(self, data, privacy_request_with_encryption_keys):
-        buff = write_to_in_memory_buffer(
-            "csv", data, privacy_request_with_encryption_keys
-        )
-        assert isinstance(buff, BytesIO)
+        buff = write_access_package("csv", data, privacy_request_with_encryption_keys)
+        assert isinstance(buff, SpooledTemporaryFile)
 
         zipfile = ZipFile(buff)
 
@@ -526,6 +565,23 @@ class TestEncryptResultsPackage:
         )
         assert data == decrypted
 
+    def test_encrypted_in_segments(self, privacy_request):
+        key = "abvnfhrke8398398"
+        privacy_request.cache_encryption(key)
+        original_segment_size = CONFIG.execution.access_package_segment_size
+        CONFIG.execution.access_package_segment_size = 4
+        data = "test data in several segments"
+
+        ret = encrypt_access_request_results(data, request_id=privacy_request.id)
+
+        segments = ret.encode(CONFIG.security.encoding).split(b"\n")
+        assert len(segments) == 8
+        decrypted = b"".join(
+            decrypt_segments(segments, key.encode(CONFIG.security.encoding))
+        )
+        assert decrypted.decode(CONFIG.security.encoding) == data
+        CONFIG.execution.access_package_segment_size = original_segment_size
+
 
 def test_get_extension():
     assert get_extension(ResponseFormat.json) == "json"
@@ -0,0 +1,49 @@
+from typing import List
+
+import pytest
+
+from fides.api.util.encryption import crypto_executor
+from fides.api.util.encryption.crypto_executor import imap_ordered, map_in_chunks
+from fides.config import CONFIG
+
+
+def _add_to_chunk(values: List[int], amount: int) -> List[int]:
+    return [value + amount for value in values]
+
+
+def _double(value: int) -> int:
+    return value * 2
+
+
+@pytest.fixture(params=["none", "thread", "process"])
+def executor_type(request):
+    original = CONFIG.execution.crypto_executor
+    original_chunk_size = CONFIG.execution.crypto_chunk_size
+    CONFIG.execution.crypto_executor = request.param
+    CONFIG.execution.crypto_chunk_size = 3
+    crypto_executor.shutdown_crypto_executor()
+    yield request.param
+    CONFIG.execution.crypto_executor = original
+    CONFIG.execution.crypto_chunk_size = original_chunk_size
+    crypto_executor.shutdown_crypto_executor()
+
+
+class TestCryptoExecutor:
+    def test_get_crypto_executor(self, executor_type):
+        executor = crypto_executor.get_crypto_executor()
+        if executor_type == "none":
+            assert executor is None
+        else:
+            assert crypto_executor.get_crypto_executor() is executor
+
+    def test_map_in_chunks(self, executor_type):
+        assert map_in_chunks(_add_to_chunk, list(range(10)), 1) == list(range(1, 11))
+
+    def test_map_in_chunks_single_chunk(self, executor_type):
+        assert map_in_chunks(_add_to_chunk, [1, 2], 1) == [2, 3]
+        assert map_in_chunks(_add_to_chunk, [], 1) == []
+
+    def test_imap_ordered(self, executor_type):
+        assert list(imap_ordered(_double, iter(range(20)))) == [
+            value * 2 for value in range(20)
+        ]
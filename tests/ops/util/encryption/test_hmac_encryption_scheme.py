@@ -1,5 +1,6 @@
 from fides.api.schemas.masking.masking_configuration import HmacMaskingConfiguration
 from fides.api.util.encryption.hmac_encryption_scheme import (
+    build_hmac_function,
     hmac_encrypt_return_bytes,
     hmac_encrypt_return_str,
 )
@@ -27,3 +28,13 @@ def test_encrypt_return_string():
     assert (
         encrypted == "360a7d27a927d1fb3436e7edabe86cba5f96f671874975e628fb80245cc229ab"
     )
+
+
+def test_build_hmac_function():
+    hmac_function = build_hmac_function(
+        KEY, SALT, HmacMaskingConfiguration.Algorithm.sha_512
+    )
+    for plaintext in ["I am a cat meow", "I am a dog woof", ""]:
+        assert hmac_function(plaintext).hexdigest() == hmac_encrypt_return_str(
+            plaintext, KEY, SALT, HmacMaskingConfiguration.Algorithm.sha_512
+        )
@@ -1,4 +1,5 @@
 from typing import Dict, List
+from unittest import mock
 
 from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretCache,
@@ -88,3 +89,44 @@ def test_build_masking_secrets_for_cache() -> None:
         masking_meta
     )
     assert len(result) == 2
+
+
+def test_get_secret_within_cached_secrets() -> None:
+    masking_meta_key = MaskingSecretMeta[str](
+        masking_strategy=HmacMaskingStrategy.name,
+        generate_secret_func=SecretsUtil.generate_secret_string,
+    )
+    secret_key = MaskingSecretCache[str](
+        secret="test_key",
+        masking_strategy=HmacMaskingStrategy.name,
+        secret_type=SecretType.key,
+    )
+    cache_secret(secret_key, request_id)
+
+    with SecretsUtil.cached_secrets():
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                request_id, SecretType.key, masking_meta_key
+            )
+            == "test_key"
+        )
+        with mock.patch(
+            "fides.api.util.encryption.secrets_util.get_cache"
+        ) as mock_get_cache:
+            with SecretsUtil.cached_secrets():
+                # Nested contexts share the outer context's secrets
+                assert (
+                    SecretsUtil.get_or_generate_secret(
+                        request_id, SecretType.key, masking_meta_key
+                    )
+                    == "test_key"
+                )
+        assert not mock_get_cache.called
+
+    # Secrets aren't kept once the context exits
+    with mock.patch(
+        "fides.api.util.encryption.secrets_util.get_cache"
+    ) as mock_get_cache:
+        SecretsUtil.get_or_generate_secret(request_id, SecretType.key, masking_meta_key)
+    assert mock_get_cache.called
+    clear_cache_secrets(request_id)
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from fides.api.util.encryption import crypto_executor
+from fides.api.util.encryption.aes_gcm_encryption_scheme import (
+    decrypt_combined_nonce_and_message,
+)
+from fides.api.util.encryption.segmented_encryption_scheme import (
+    decrypt_segments,
+    encrypt_segments,
+    regroup_segments,
+    split_segments,
+)
+from fides.config import CONFIG
+
+KEY = b"y\xc5I\xd4\x92\xf6G\t\x80\xb1$\x06\x19t/\xc4"
+
+
+@pytest.fixture(params=["none", "thread", "process"])
+def executor_type(request):
+    original = CONFIG.execution.crypto_executor
+    CONFIG.execution.crypto_executor = request.param
+    crypto_executor.shutdown_crypto_executor()
+    yield request.param
+    CONFIG.execution.crypto_executor = original
+    crypto_executor.shutdown_crypto_executor()
+
+
+class TestSegmentedEncryption:
+    def test_split_segments(self):
+        assert list(split_segments(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+        assert list(split_segments(b"abcdef", 3)) == [b"abc", b"def"]
+        assert list(split_segments(b"", 3)) == [b""]
+
+    def test_regroup_segments(self):
+        assert list(regroup_segments([b"ab", b"cdefg", b"", b"h"], 3)) == [
+            b"abc",
+            b"def",
+            b"gh",
+        ]
+        assert list(regroup_segments([b"abc", b"def"], 3)) == [b"abc", b"def"]
+        assert list(regroup_segments([], 3)) == [b""]
+
+    def test_round_trip(self, executor_type):
+        data = os.urandom(10000)
+        encrypted = list(encrypt_segments(split_segments(data, 1000), KEY))
+
+        assert len(encrypted) == 10
+        assert b"".join(decrypt_segments(encrypted, KEY)) == data
+
+    def test_empty(self):
+        encrypted = list(encrypt_segments(split_segments(b""), KEY))
+
+        assert len(encrypted) == 1
+        assert b"".join(decrypt_segments(encrypted, KEY)) == b""
+
+    def test_single_segment_matches_unsegmented_format(self):
+        encrypted = b"".join(encrypt_segments(split_segments(b"test data"), KEY))
+
+        assert (
+            decrypt_combined_nonce_and_message(
+                encrypted.decode(CONFIG.security.encoding), KEY
+            )
+            == "test data"
+        )
+
+    @pytest.mark.parametrize(
+        "tamper,message",
+        [
+            (lambda segments: segments[:-1], "missing its final segment"),
+            (lambda segments: segments[1:], "out of order"),
+            (
+                lambda segments: [segments[1], segments[0]] + segments[2:],
+                "out of order",
+            ),
+            (lambda segments: segments + segments[:1], "after its final segment"),
+            (lambda segments: [b"not base64!"] + segments[1:], "not valid base64"),
+        ],
+    )
+    def test_tampered_segments(self, tamper, message):
+        encrypted = list(encrypt_segments(split_segments(os.urandom(100), 10), KEY))
+
+        with pytest.raises(ValueError) as exc:
+            list(decrypt_segments(tamper(encrypted), KEY))
+        assert message in str(exc.value)
+
+    def test_segments_from_another_package(self):
+        data = os.urandom(100)
+        encrypted = list(encrypt_segments(split_segments(data, 10), KEY))
+        other = list(encrypt_segments(split_segments(data, 10), KEY))
+
+        with pytest.raises(ValueError) as exc:
+            list(decrypt_segments(encrypted[:5] + other[5:], KEY))
+        assert "Segment 5 is out of order or from another package" in str(exc.value)
@@ -13,6 +13,9 @@ from fides.api.util.cache import (
     ENCODED_DATE_PREFIX,
     ENCODED_MONGO_OBJECT_ID_PREFIX,
     FidesopsRedis,
+    get_all_cache_keys_for_privacy_request,
+    get_identity_cache_key,
+    get_privacy_request_cache_index,
 )
 from fides.config import CONFIG
 from tests.fixtures.application_fixtures import faker
@@ -88,6 +91,82 @@ def test_scan(cache: FidesopsRedis) -> List:
     assert len(keys) == 0
 
 
+class TestCacheIndex:
+    @pytest.fixture
+    def index(self, cache: FidesopsRedis):
+        index = f"id-{random.random()}-cache-index"
+        yield index
+        cache.delete_index(index)
+
+    def test_complete_index(self, cache: FidesopsRedis, index: str) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.create_index(index)
+        assert cache.is_complete_index(index)
+
+        for i in range(10):
+            cache.set_encoded_object(f"{prefix}{i}", i, index=index)
+        cache.set_with_autoexpire(f"{prefix}plain", "value", index=index)
+        # not in the index, so not found
+        cache.set_encoded_object(f"{prefix}unindexed", -1)
+
+        assert cache.get_encoded_objects_by_prefix(prefix, index=index) == {
+            f"EN_{prefix}{i}": i for i in range(10)
+        }
+        assert cache.get_keys_by_prefix(prefix, index=index) == [f"{prefix}plain"]
+        assert cache.ttl(index) > 0
+
+        # expired or deleted keys still listed in the index are skipped
+        cache.delete(f"EN_{prefix}0")
+        assert f"EN_{prefix}0" not in cache.get_encoded_objects_by_prefix(
+            prefix, index=index
+        )
+        cache.delete(f"EN_{prefix}unindexed")
+
+    def test_incomplete_index_scans(self, cache: FidesopsRedis, index: str) -> None:
+        """Keys stored before an index was created aren't in it, so the keyspace is scanned"""
+        prefix = f"redis_key_{random.random()}_"
+        cache.set_encoded_object(f"{prefix}before", 1)
+        cache.set_encoded_object(f"{prefix}after", 2, index=index)
+        assert not cache.is_complete_index(index)
+
+        assert cache.get_encoded_objects_by_prefix(prefix, index=index) == {
+            f"EN_{prefix}before": 1,
+            f"EN_{prefix}after": 2,
+        }
+        cache.delete(f"EN_{prefix}before")
+
+    def test_delete_index(self, cache: FidesopsRedis, index: str) -> None:
+        prefix = f"redis_key_{random.random()}_"
+        cache.create_index(index)
+        for i in range(10):
+            cache.set_encoded_object(f"{prefix}{i}", i, index=index)
+
+        cache.delete_index(index)
+        assert not cache.exists(index)
+        assert cache.get_keys_by_prefix(f"EN_{prefix}") == []
+
+
+def test_get_all_cache_keys_for_privacy_request(cache: FidesopsRedis) -> None:
+    privacy_request_id = f"pri_{random.random()}"
+    index = get_privacy_request_cache_index(privacy_request_id)
+    identity_key = get_identity_cache_key(privacy_request_id, "email")
+
+    # requests cached without an index are found by scanning
+    cache.set_with_autoexpire(identity_key, "customer-1@example.com")
+    assert get_all_cache_keys_for_privacy_request(privacy_request_id) == [identity_key]
+
+    cache.delete(identity_key)
+    cache.create_index(index)
+    cache.set_with_autoexpire(identity_key, "customer-1@example.com", index=index)
+    cache.set_encoded_object(
+        f"{privacy_request_id}__access_request__a:b", [], index=index
+    )
+    assert sorted(get_all_cache_keys_for_privacy_request(privacy_request_id)) == sorted(
+        [index, identity_key, f"EN_{privacy_request_id}__access_request__a:b"]
+    )
+    cache.delete_index(index)
+
+
 class TestCustomJSONEncoder:
     def test_encode_enum_string(self):
         class TestEnum(Enum):
@@ -0,0 +1,91 @@
+from datetime import date, datetime, timezone
+from enum import Enum
+
+import pytest
+from bson.objectid import ObjectId
+
+from fides.api.util.cache import FidesopsRedis
+from fides.api.util.cache_codec import (
+    CODEC_PREFIX,
+    MsgpackZlibCodec,
+    decode_with_codec,
+    encode_with_codec,
+    get_cache_codec,
+    is_codec_encoded,
+)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+ROWS = [
+    {
+        "id": 1,
+        "email": "customer-1@example.com",
+        "created": datetime(2023, 5, 1, 12, 30, tzinfo=timezone.utc),
+        "birthday": date(1990, 1, 2),
+        "_id": ObjectId("507f1f77bcf86cd799439011"),
+        "secret": b"\x00\x01binary",
+        "score": 1.5,
+        "deleted": None,
+        "tags": ["a", "FIDESOPS_DO_NOT_MASK", {"nested": [1, 2, 3]}],
+    },
+    {"id": 2, "email": "customer-2@example.com", "tags": []},
+]
+
+
+class TestMsgpackZlibCodec:
+    def test_round_trip(self):
+        codec = MsgpackZlibCodec()
+        assert codec.decode(codec.encode(ROWS)) == ROWS
+
+    def test_types_preserved(self):
+        codec = MsgpackZlibCodec()
+        row = codec.decode(codec.encode(ROWS))[0]
+        assert type(row["created"]) is datetime
+        assert type(row["birthday"]) is date
+        assert isinstance(row["_id"], ObjectId)
+        assert isinstance(row["secret"], bytes)
+
+    def test_enum_encoded_as_value(self):
+        codec = MsgpackZlibCodec()
+        assert codec.decode(codec.encode({"color": Color.RED})) == {"color": "red"}
+
+    def test_smaller_than_json(self):
+        rows = [dict(ROWS[1], id=i) for i in range(1000)]
+        assert len(encode_with_codec(rows, MsgpackZlibCodec())) < len(
+            FidesopsRedis.encode_obj(rows)
+        )
+
+
+class TestCodecEncoding:
+    def test_encode_with_codec(self):
+        encoded = encode_with_codec(ROWS, MsgpackZlibCodec())
+        assert encoded.startswith(f"{CODEC_PREFIX}msgpack+zlib:")
+        assert is_codec_encoded(encoded)
+        assert decode_with_codec(encoded) == ROWS
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            get_cache_codec("pickle")
+
+    def test_decode_obj_with_codec(self):
+        encoded = FidesopsRedis.encode_obj(ROWS, MsgpackZlibCodec())
+        assert FidesopsRedis.decode_obj(encoded) == ROWS
+        assert FidesopsRedis.decode_obj(encoded.encode()) == ROWS
+
+    def test_decode_obj_reads_json(self):
+        """Values cached as JSON are still decoded as before"""
+        encoded = FidesopsRedis.encode_obj(ROWS)
+        assert not is_codec_encoded(encoded)
+        decoded = FidesopsRedis.decode_obj(encoded)
+        assert decoded[0]["_id"] == ROWS[0]["_id"]
+        assert decoded[0]["created"] == ROWS[0]["created"]
+
+    def test_encode_obj_falls_back_to_json(self):
+        """Values the codec can't encode are cached as JSON instead"""
+        value = {"big": 2**70}
+        encoded = FidesopsRedis.encode_obj(value, MsgpackZlibCodec())
+        assert not is_codec_encoded(encoded)
+        assert FidesopsRedis.decode_obj(encoded) == value
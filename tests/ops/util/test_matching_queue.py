@@ -14,3 +14,15 @@ def test_queue() -> None:
     queue.pop()
     queue.push_if_new("C")
     assert queue.data == ["C"]
+
+
+def test_push_if_new_after_pop_first_match() -> None:
+    queue = MatchingQueue("A", "B")
+    queue.push("B")
+    assert queue.pop_first_match(lambda x: x == "B") == "B"
+    # one "B" is still queued
+    queue.push_if_new("B")
+    assert queue.data == ["A", "B"]
+    assert queue.pop_first_match(lambda x: x == "B") == "B"
+    queue.push_if_new("B")
+    assert queue.data == ["A", "B"]
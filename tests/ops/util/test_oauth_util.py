@@ -1,7 +1,12 @@
+from unittest import mock
+
 import pytest
 
 from fides.api.common_exceptions import AuthorizationError
-from fides.api.oauth.utils import get_root_client
+from fides.api.oauth.token_cache import VerifiedTokenCache, verified_token_cache
+from fides.api.oauth.utils import extract_token_and_load_client, get_root_client
+from fides.common.api.scope_registry import CLIENT_READ
+from fides.config import CONFIG
 
 
 class TestGetRootClient:
@@ -16,3 +21,103 @@ class TestGetRootClient:
         """Feed a bad client_id in and expect an AuthorizationError."""
         with pytest.raises(AuthorizationError):
             await get_root_client(db=db, client_id="badclientid")
+
+
+class TestVerifiedTokenCache:
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        verified_token_cache.clear()
+        yield
+        verified_token_cache.clear()
+
+    @pytest.fixture
+    def token(self, oauth_client) -> str:
+        return oauth_client.create_access_code_jwe(CONFIG.security.app_encryption_key)
+
+    def test_verified_token_cached(self, db, oauth_client, token) -> None:
+        token_data, client = extract_token_and_load_client(token, db)
+
+        with mock.patch("fides.api.oauth.utils.extract_payload") as mock_extract:
+            cached_token_data, cached_client = extract_token_and_load_client(token, db)
+
+        assert not mock_extract.called
+        assert cached_token_data == token_data
+        assert cached_client.id == client.id
+        assert cached_client.scopes == oauth_client.scopes
+        assert verified_token_cache.stats()["hits"] == 1
+        assert verified_token_cache.stats()["hit_rate"] == 0.5
+
+    def test_cached_client_can_be_updated(self, db, oauth_client, token) -> None:
+        extract_token_and_load_client(token, db)
+        _, client = extract_token_and_load_client(token, db)
+
+        client.scopes = [CLIENT_READ]
+        client.save(db)
+        db.refresh(oauth_client)
+
+        assert oauth_client.scopes == [CLIENT_READ]
+
+    def test_invalidated_on_client_change(self, db, oauth_client, token) -> None:
+        extract_token_and_load_client(token, db)
+        oauth_client.scopes = [CLIENT_READ]
+        oauth_client.save(db)
+
+        _, client = extract_token_and_load_client(token, db)
+
+        assert client.scopes == [CLIENT_READ]
+        assert verified_token_cache.stats()["hits"] == 0
+
+    def test_revoked_token_rejected(self, db, oauth_client, token) -> None:
+        extract_token_and_load_client(token, db)
+        oauth_client.delete(db)
+
+        with pytest.raises(AuthorizationError):
+            extract_token_and_load_client(token, db)
+
+    def test_expired_token_rejected(self, db, token) -> None:
+        extract_token_and_load_client(token, db)
+
+        with mock.patch.object(
+            CONFIG.security, "oauth_access_token_expire_minutes", -1
+        ):
+            with pytest.raises(AuthorizationError):
+                extract_token_and_load_client(token, db)
+
+    def test_least_recently_used_token_evicted(self, db, oauth_client) -> None:
+        tokens = [
+            oauth_client.create_access_code_jwe(CONFIG.security.app_encryption_key)
+            for _ in range(3)
+        ]
+        with mock.patch.object(CONFIG.security, "oauth_token_cache_size", 2):
+            for token in tokens:
+                extract_token_and_load_client(token, db)
+            extract_token_and_load_client(tokens[2], db)
+            extract_token_and_load_client(tokens[0], db)
+
+        assert verified_token_cache.stats() == {
+            "size": 2,
+            "hits": 1,
+            "misses": 4,
+            "hit_rate": 0.2,
+        }
+
+    def test_cache_disabled(self, db, token) -> None:
+        with mock.patch.object(CONFIG.security, "oauth_token_cache_size", 0):
+            extract_token_and_load_client(token, db)
+            extract_token_and_load_client(token, db)
+
+        assert verified_token_cache.stats()["size"] == 0
+
+    def test_stats_logged_periodically(self) -> None:
+        token_cache = VerifiedTokenCache()
+        with mock.patch("fides.api.oauth.token_cache.logger") as mock_logger:
+            token_cache.get("Bearer token", "version")
+            assert not mock_logger.info.called
+
+            with mock.patch(
+                "fides.api.oauth.token_cache.TOKEN_CACHE_STATS_LOG_SECONDS", 0
+            ):
+                token_cache.get("Bearer token", "version")
+
+        mock_logger.info.assert_called_once()
+        assert mock_logger.info.call_args.args[1:] == (0, 0, 2, 0.0)
@@ -0,0 +1,128 @@
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fides.api.util import privacy_experience_snapshot
+from fides.api.util.privacy_experience_snapshot import (
+    PRIVACY_EXPERIENCE_SNAPSHOT_VERSION,
+    clear_process_experience_snapshots,
+    etag_matches,
+    experience_snapshot_response,
+    get_experience_snapshot,
+    get_experience_snapshot_key,
+    save_experience_snapshot,
+)
+
+
+def build_request(headers=None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (key.lower().encode(), value.encode())
+                for key, value in (headers or {}).items()
+            ],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_experience_snapshots():
+    clear_process_experience_snapshots()
+    yield
+    clear_process_experience_snapshots()
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        "if_none_match,expected",
+        [
+            (None, False),
+            ("", False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"def", "abc"', True),
+            ("*", True),
+            ('"def"', False),
+            ("abc", False),
+        ],
+    )
+    def test_etag_matches(self, if_none_match, expected) -> None:
+        assert etag_matches(if_none_match, '"abc"') is expected
+
+
+class TestExperienceSnapshots:
+    def test_snapshot_key_depends_on_params_and_version(self, cache) -> None:
+        key = get_experience_snapshot_key({"region": "us_ca"})
+
+        assert get_experience_snapshot_key({"region": "us_ca"}) == key
+        assert get_experience_snapshot_key({"region": "us_co"}) != key
+
+        PRIVACY_EXPERIENCE_SNAPSHOT_VERSION.invalidate()
+        assert get_experience_snapshot_key({"region": "us_ca"}) != key
+
+    def test_save_and_get_snapshot(self, cache) -> None:
+        key = get_experience_snapshot_key({"region": "us_ca"})
+        assert get_experience_snapshot(key) is None
+
+        snapshot = save_experience_snapshot(key, b'{"items": []}')
+
+        assert get_experience_snapshot(key) is snapshot
+        assert snapshot.etag.startswith('"') and snapshot.etag.endswith('"')
+
+        clear_process_experience_snapshots()
+        from_redis = get_experience_snapshot(key)
+        assert from_redis is not snapshot
+        assert from_redis == snapshot
+
+    def test_process_snapshots_limited(self, cache, monkeypatch) -> None:
+        monkeypatch.setattr(privacy_experience_snapshot, "PROCESS_SNAPSHOT_LIMIT", 2)
+
+        for region in ["us_ca", "us_co", "us_va"]:
+            save_experience_snapshot(region, b"{}")
+
+        assert list(privacy_experience_snapshot._process_snapshots) == [
+            "us_co",
+            "us_va",
+        ]
+
+    def test_snapshot_response(self) -> None:
+        snapshot = save_experience_snapshot("snapshot-response-test", b'{"total": 0}')
+
+        response = experience_snapshot_response(build_request(), snapshot)
+        assert response.status_code == 200
+        assert response.body == b'{"total": 0}'
+        assert response.headers["etag"] == snapshot.etag
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+        response = experience_snapshot_response(
+            build_request({"If-None-Match": snapshot.etag}), snapshot
+        )
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == snapshot.etag
+
+    def test_snapshot_response_keeps_endpoint_headers(self) -> None:
+        """Headers set on the endpoint's response, like X-RateLimit-*, are kept"""
+        snapshot = save_experience_snapshot("snapshot-headers-test", b'{"total": 0}')
+        endpoint_response = Response()
+        endpoint_response.headers["X-RateLimit-Limit"] = "1000"
+
+        for request in [
+            build_request(),
+            build_request({"If-None-Match": snapshot.etag}),
+        ]:
+            response = experience_snapshot_response(
+                request, snapshot, endpoint_response
+            )
+            assert response.headers["x-ratelimit-limit"] == "1000"
+            assert response.headers["etag"] == snapshot.etag
+
+        # The endpoint response's own content-length isn't copied
+        assert response.status_code == 304
+        response = experience_snapshot_response(
+            build_request(), snapshot, endpoint_response
+        )
+        assert response.headers.getlist("content-length") == ["12"]
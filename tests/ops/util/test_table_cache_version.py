@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, delete, update
+from sqlalchemy.orm import Session, declarative_base
+
+from fides.api.util.table_cache_version import SESSION_CHANGED_TABLES, TableCacheVersion
+
+CacheVersionTestBase = declarative_base()
+
+
+class TrackedRow(CacheVersionTestBase):
+    __tablename__ = "table_cache_version_tracked"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class UntrackedRow(CacheVersionTestBase):
+    __tablename__ = "table_cache_version_untracked"
+    id = Column(Integer, primary_key=True)
+
+
+TRACKED_VERSION = TableCacheVersion(
+    "table-cache-version-test", [TrackedRow.__tablename__]
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    CacheVersionTestBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestTableCacheVersion:
+    def test_version_created_once(self, cache) -> None:
+        cache.delete(TRACKED_VERSION.key)
+
+        version = TRACKED_VERSION.get(cache)
+        assert version
+        assert TRACKED_VERSION.get(cache) == version
+
+    def test_invalidated_on_commit(self, cache, session) -> None:
+        version = TRACKED_VERSION.get(cache)
+
+        session.add(TrackedRow(name="added"))
+        session.flush()
+        assert TRACKED_VERSION.get(cache) == version
+
+        session.commit()
+        assert TRACKED_VERSION.get(cache) != version
+        assert SESSION_CHANGED_TABLES not in session.info
+
+    def test_invalidated_on_bulk_statements(self, cache, session) -> None:
+        session.add(TrackedRow(name="added"))
+        session.commit()
+
+        for statement in [
+            update(TrackedRow).values(name="updated"),
+            delete(TrackedRow),
+        ]:
+            version = TRACKED_VERSION.get(cache)
+            session.execute(statement)
+            session.commit()
+            assert TRACKED_VERSION.get(cache) != version
+
+    def test_not_invalidated_by_untracked_tables(self, cache, session) -> None:
+        version = TRACKED_VERSION.get(cache)
+
+        session.add(UntrackedRow())
+        session.commit()
+
+        assert TRACKED_VERSION.get(cache) == version
+
+    def test_not_invalidated_on_rollback(self, cache, session) -> None:
+        version = TRACKED_VERSION.get(cache)
+
+        session.add(TrackedRow(name="rolled back"))
+        session.flush()
+        session.rollback()
+        session.commit()
+
+        assert TRACKED_VERSION.get(cache) == version
+        assert SESSION_CHANGED_TABLES not in session.info
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from unittest import mock
 
 import pytest
 from iab_tcf import decode_v2
@@ -26,9 +27,13 @@ from fides.api.util.tcf.tc_model import (
 from fides.api.util.tcf.tc_string import (
     TCModel,
     build_tc_string,
+    decode_tc_string,
     decode_tc_string_to_preferences,
 )
-from fides.api.util.tcf.tcf_experience_contents import get_tcf_contents
+from fides.api.util.tcf.tcf_experience_contents import (
+    TCFExperienceContents,
+    get_tcf_contents,
+)
 
 
 class TestHashTCFExperience:
@@ -577,105 +582,13 @@ class TestBuildTCModel:
         assert decoded.purpose_one_treatment is False
         assert decoded.publisher_cc == b"AA"
         assert decoded.consented_vendors == {}
-        assert decoded.interests_vendors == {
-            1: False,
-            2: False,
-            3: False,
-            4: False,
-            5: False,
-            6: False,
-            7: False,
-            8: False,
-            9: False,
-            10: False,
-            11: False,
-            12: False,
-            13: False,
-            14: False,
-            15: False,
-            16: False,
-            17: False,
-            18: False,
-            19: False,
-            20: False,
-            21: False,
-            22: False,
-            23: False,
-            24: False,
-            25: False,
-            26: False,
-            27: False,
-            28: False,
-            29: False,
-            30: False,
-            31: False,
-            32: False,
-            33: False,
-            34: False,
-            35: False,
-            36: False,
-            37: False,
-            38: False,
-            39: False,
-            40: False,
-            41: False,
-            42: False,
-            43: False,
-            44: False,
-            45: False,
-            46: True,
-        }
+        # A single vendor is shorter to range encode than to bitfield encode
+        assert decoded.is_interests_range_encoding is True
+        assert decoded.interests_vendors_range == [(46, 46)]
 
         assert decoded.pub_restriction_entries == []
 
-        assert decoded.oob_disclosed_vendors == {
-            1: False,
-            2: False,
-            3: False,
-            4: False,
-            5: False,
-            6: False,
-            7: False,
-            8: False,
-            9: False,
-            10: False,
-            11: False,
-            12: False,
-            13: False,
-            14: False,
-            15: False,
-            16: False,
-            17: False,
-            18: False,
-            19: False,
-            20: False,
-            21: False,
-            22: False,
-            23: False,
-            24: False,
-            25: False,
-            26: False,
-            27: False,
-            28: False,
-            29: False,
-            30: False,
-            31: False,
-            32: False,
-            33: False,
-            34: False,
-            35: False,
-            36: False,
-            37: False,
-            38: False,
-            39: False,
-            40: False,
-            41: False,
-            42: False,
-            43: False,
-            44: False,
-            45: False,
-            46: True,
-        }
+        assert decoded.oob_disclosed_vendors == {46: True}
 
     @pytest.mark.usefixtures(
         "skimbit_system", "emerse_system", "captify_technologies_system"
@@ -1698,3 +1611,91 @@ class TestConvertTCStringtoMobile:
         assert tc_mobile_data["IABTCF_VendorConsents"] == ""
         assert tc_mobile_data["IABTCF_VendorLegitimateInterests"] == ""
         assert tc_mobile_data["IABTCF_SpecialFeaturesOptIns"] == "000000000000"
+
+
+class TestTCStringEncoding:
+    def test_vendors_bitfield_encoded_when_shorter(self):
+        model = TCModel(vendor_consents=[2, 8], vendors_disclosed=[2, 8])
+
+        decoded = decode_v2(build_tc_string(model))
+
+        assert decoded.is_consent_range_encoding is False
+        assert decoded.consented_vendors == {
+            1: False,
+            2: True,
+            3: False,
+            4: False,
+            5: False,
+            6: False,
+            7: False,
+            8: True,
+        }
+
+    def test_vendors_range_encoded_when_shorter(self):
+        vendor_ids = [20, 21, 22, 23, 24, 25, 1231, 1232, 1233]
+        model = TCModel(
+            vendor_consents=vendor_ids,
+            vendor_legitimate_interests=[],
+            vendors_disclosed=vendor_ids,
+        )
+
+        tc_str = build_tc_string(model)
+        decoded = decode_v2(tc_str)
+
+        assert decoded.is_consent_range_encoding is True
+        assert decoded.max_consent_vendor_id == 1233
+        assert decoded.consented_vendors_range == [(20, 25), (1231, 1233)]
+        assert decoded.is_interests_range_encoding is False
+        assert decoded.interests_vendors == {}
+        assert sorted(decoded.oob_disclosed_vendors) == vendor_ids
+
+        assert decode_tc_string(tc_str).vendor_consents == vendor_ids
+
+    def test_decode_tc_string_round_trip(self):
+        model = TCModel(
+            created=16987392000,
+            last_updated=16987392000,
+            cmp_id=CMP_ID,
+            vendor_list_version=22,
+            publisher_country_code="DE",
+            special_feature_optins=[2],
+            purpose_consents=[1, 2, 3, 4, 7, 9, 10],
+            purpose_legitimate_interests=[2, 7, 8, 9, 10],
+            vendor_consents=[2, 8],
+            vendor_legitimate_interests=[8, 46],
+            vendors_disclosed=[2, 8, 46],
+        )
+
+        decoded = decode_tc_string(build_tc_string(model))
+
+        assert decoded.version == 2
+        assert decoded.created == decoded.last_updated == 16987392000
+        assert decoded.cmp_id == CMP_ID
+        assert decoded.consent_language == "EN"
+        assert decoded.vendor_list_version == 22
+        assert decoded.publisher_country_code == "DE"
+        assert decoded.special_feature_optins == [2]
+        assert decoded.purpose_consents == [1, 2, 3, 4, 7, 9, 10]
+        assert decoded.purpose_legitimate_interests == [2, 7, 8, 9, 10]
+        assert decoded.vendor_consents == [2, 8]
+        assert decoded.vendor_legitimate_interests == [8, 46]
+        assert decoded.vendors_disclosed == [2, 8, 46]
+
+    def test_decode_tc_string_missing_sections(self):
+        with pytest.raises(DecodeTCStringError):
+            decode_tc_string("bad_string")
+
+    def test_all_options_tc_model_reused_for_same_contents(self):
+        tc_str = "CPzEX8APzEX8AAMABBENAUEEAPLAAAAAAAAAABEAAAAA.IABE"
+        tcf_contents = TCFExperienceContents()
+
+        with mock.patch(
+            "fides.api.util.tcf.tc_string.convert_tcf_contents_to_tc_model",
+            wraps=convert_tcf_contents_to_tc_model,
+        ) as mock_convert:
+            decode_tc_string_to_preferences(tc_str, tcf_contents)
+            decode_tc_string_to_preferences(tc_str, tcf_contents)
+            assert mock_convert.call_count == 1
+
+            decode_tc_string_to_preferences(tc_str, TCFExperienceContents())
+            assert mock_convert.call_count == 2
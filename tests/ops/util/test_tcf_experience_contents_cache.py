@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+from fideslang.models import LegalBasisForProcessingEnum
+
+from fides.api.util.tcf import tcf_experience_contents_cache
+from fides.api.util.tcf.experience_meta import build_tcf_version_hash
+from fides.api.util.tcf.tcf_experience_contents import get_tcf_contents
+from fides.api.util.tcf.tcf_experience_contents_cache import (
+    TCF_CONTENTS_VERSION_KEY,
+    get_cached_tcf_contents,
+    get_tcf_contents_cache_key,
+    invalidate_tcf_contents_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tcf_contents_cache():
+    invalidate_tcf_contents_cache()
+    yield
+    invalidate_tcf_contents_cache()
+
+
+class TestCachedTCFContents:
+    def test_contents_cached_in_process(self, db, emerse_system) -> None:
+        cached = get_cached_tcf_contents(db)
+
+        assert cached.contents == get_tcf_contents(db)
+        assert cached.version_hash == build_tcf_version_hash(cached.contents)
+        assert len(cached.contents.tcf_vendor_consents) == 1
+
+        with mock.patch(
+            "fides.api.util.tcf.tcf_experience_contents_cache.get_tcf_contents"
+        ) as mock_get_tcf_contents:
+            assert get_cached_tcf_contents(db) is cached
+        assert not mock_get_tcf_contents.called
+
+    def test_contents_cached_in_redis(self, db, emerse_system) -> None:
+        """Other processes read the contents from Redis instead of rebuilding them"""
+        cached = get_cached_tcf_contents(db)
+        tcf_experience_contents_cache._process_cached_contents = None
+
+        with mock.patch(
+            "fides.api.util.tcf.tcf_experience_contents_cache.get_tcf_contents"
+        ) as mock_get_tcf_contents:
+            from_redis = get_cached_tcf_contents(db)
+
+        assert not mock_get_tcf_contents.called
+        assert from_redis is not cached
+        assert from_redis == cached
+
+    def test_version_restored_when_missing(self, cache) -> None:
+        cache.delete(TCF_CONTENTS_VERSION_KEY)
+
+        cache_key = get_tcf_contents_cache_key(cache)
+
+        assert cache.get(TCF_CONTENTS_VERSION_KEY) in cache_key
+        assert get_tcf_contents_cache_key(cache) == cache_key
+
+    def test_invalidated_on_privacy_declaration_change(self, db, emerse_system) -> None:
+        cached = get_cached_tcf_contents(db)
+        assert cached.contents.tcf_vendor_legitimate_interests
+
+        for privacy_declaration in emerse_system.privacy_declarations:
+            if (
+                privacy_declaration.legal_basis_for_processing
+                == LegalBasisForProcessingEnum.LEGITIMATE_INTEREST
+            ):
+                privacy_declaration.update(
+                    db, data={"legal_basis_for_processing": "Consent"}
+                )
+
+        updated = get_cached_tcf_contents(db)
+        assert updated is not cached
+        assert not updated.contents.tcf_vendor_legitimate_interests
+        assert updated.version_hash != cached.version_hash
+
+    def test_invalidated_on_system_delete(self, db, emerse_system) -> None:
+        assert get_cached_tcf_contents(db).contents.tcf_vendor_consents
+
+        emerse_system.delete(db)
+
+        assert not get_cached_tcf_contents(db).contents.tcf_vendor_consents
+
+    def test_not_invalidated_on_rollback(self, db, emerse_system) -> None:
+        cached = get_cached_tcf_contents(db)
+
+        emerse_system.name = "Rolled back"
+        db.flush()
+        db.rollback()
+
+        assert get_cached_tcf_contents(db) is cached